@@ -0,0 +1,1198 @@
+"""
+pyAirtable provides an asyncio-compatible client which mirrors the synchronous
+:class:`~pyairtable.Api`, :class:`~pyairtable.Base`, and :class:`~pyairtable.Table`
+classes. It requires the optional `httpx <https://www.python-httpx.org/>`__ library.
+
+.. code-block:: python
+
+    from pyairtable.api.aio import AsyncApi
+
+    async def main():
+        async with AsyncApi(access_token) as api:
+            table = api.table("appNxslc6jG0XedVM", "Table Name")
+            records = await table.all()
+
+The async client builds its URLs and request payloads using the same code as
+the synchronous client, so behavior (such as converting a long GET request
+into a POST) is identical between the two.
+"""
+
+import asyncio
+import base64
+import itertools
+import mimetypes
+import os
+import sys
+import time
+import warnings
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, ProtocolError
+
+from pyairtable.api import hooks, retrying
+from pyairtable.api.api import Api, TimeoutTuple, _get_offset
+from pyairtable.api.base import Base
+from pyairtable.api.circuit import CircuitBreaker, is_failure
+from pyairtable.api.codecs import JSONCodec
+from pyairtable.api.hooks import EventHooks
+from pyairtable.api.metacache import MetadataCache
+from pyairtable.api.ratelimit import RateLimiter, base_id_from_url
+from pyairtable.api.singleflight import AsyncSingleFlight, request_key
+from pyairtable.api.table import Table
+from pyairtable.api.types import (
+    FieldName,
+    RecordDeletedDict,
+    RecordDict,
+    RecordId,
+    UpdateRecordDict,
+    UploadAttachmentResultDict,
+    UpsertResultDict,
+    UserAndScopesDict,
+    WritableFields,
+    assert_typed_dict,
+)
+from pyairtable.api.validation import Validation
+from pyairtable.exceptions import BatchError
+from pyairtable.formulas import Formula, to_formula_str
+from pyairtable.models.comment import Comment
+from pyairtable.models.schema import BaseSchema, TableSchema
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    print(
+        "You are missing the 'httpx' library, which means you did not install\n"
+        "the optional dependencies required for the pyairtable asyncio client.\n"
+        "Try again after running:\n\n"
+        "   % pip install 'pyairtable[async]'",
+        "\n",
+        file=sys.stderr,
+    )
+    raise
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncApi:
+    """
+    Represents an Airtable API, for use with asyncio.
+
+    Usage:
+        >>> api = AsyncApi('auth_token')
+        >>> table = api.table('base_id', 'table_name')
+        >>> records = await table.all()
+        >>> await api.close()
+    """
+
+    #: The synchronous API object used to build URLs and requests.
+    sync: Api
+
+    #: The client used to send requests to the Airtable API.
+    client: httpx.AsyncClient
+
+    #: Coalesces identical concurrent GET requests, if enabled via ``coalesce=``.
+    single_flight: AsyncSingleFlight[requests.Response] | None
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        timeout: TimeoutTuple | None = None,
+        retry_strategy: bool | retrying.Retry | None = True,
+        endpoint_url: str = "https://api.airtable.com",
+        use_field_ids: bool = False,
+        rate_limit: bool | RateLimiter | None = None,
+        json_codec: str | JSONCodec | None = None,
+        validation: str | Validation | None = None,
+        coalesce: bool | AsyncSingleFlight[requests.Response] | None = None,
+        circuit_breaker: bool | CircuitBreaker | None = None,
+        metadata_cache: bool | MetadataCache | None = None,
+        event_hooks: EventHooks | None = None,
+        client: httpx.AsyncClient | None = None,
+    ):
+        """
+        Args:
+            api_key: An Airtable API key or personal access token.
+            timeout: A tuple indicating a connect and read timeout.
+                See :class:`~pyairtable.Api` for details.
+            retry_strategy: An instance of
+                `urllib3.util.Retry <https://urllib3.readthedocs.io/en/stable/reference/urllib3.util.html#urllib3.util.Retry>`_.
+                If ``None`` or ``False``, requests will not be retried.
+                If ``True``, the default strategy will be applied
+                (see :func:`~pyairtable.retry_strategy` for details).
+                Connection and read errors are retried in the same way as
+                the sync client; once retries run out, the httpx error is raised.
+            endpoint_url: The API endpoint to use. Override this if you are using
+                a debugging or caching proxy.
+            use_field_ids: If ``True``, all API requests will return responses
+                with field IDs instead of field names.
+            rate_limit: An instance of :class:`~pyairtable.api.ratelimit.RateLimiter`,
+                which can be shared with other instances of :class:`~pyairtable.Api`
+                or :class:`AsyncApi`. See :class:`~pyairtable.Api` for details.
+            json_codec: The JSON library to use. See :class:`~pyairtable.Api` for details.
+            validation: How thoroughly to check records returned by the API.
+                See :class:`~pyairtable.Api` for details.
+            coalesce: If ``True``, identical GET requests made at the same time from
+                several tasks will share a single response from Airtable.
+                Pass an instance of :class:`~pyairtable.api.singleflight.AsyncSingleFlight`
+                to share it with other instances of :class:`AsyncApi` in the same event loop.
+                See :mod:`pyairtable.api.singleflight` for details.
+            circuit_breaker: An instance of :class:`~pyairtable.api.circuit.CircuitBreaker`,
+                which can be shared with other instances of :class:`~pyairtable.Api`
+                or :class:`AsyncApi`. See :class:`~pyairtable.Api` for details.
+            metadata_cache: An instance of :class:`~pyairtable.api.metacache.MetadataCache`,
+                which can be shared with other instances of :class:`~pyairtable.Api`
+                or :class:`AsyncApi`. See :class:`~pyairtable.Api` for details.
+            event_hooks: An instance of :class:`~pyairtable.api.hooks.EventHooks`,
+                which can be shared with other instances of :class:`~pyairtable.Api`
+                or :class:`AsyncApi`. See :mod:`pyairtable.api.hooks` for details.
+            client: An instance of ``httpx.AsyncClient`` to use for sending requests.
+                If not provided, a new client will be created, which allows up to
+                100 concurrent connections.
+        """
+        if retry_strategy is True:
+            retry_strategy = retrying.retry_strategy()
+        self.retry_strategy = retry_strategy or None
+        self.sync = Api(
+            api_key,
+            timeout=timeout,
+            retry_strategy=None,
+            endpoint_url=endpoint_url,
+            use_field_ids=use_field_ids,
+            rate_limit=rate_limit,
+            json_codec=json_codec,
+            validation=validation,
+            circuit_breaker=circuit_breaker,
+            metadata_cache=metadata_cache,
+            event_hooks=event_hooks,
+        )
+        self.client = client or httpx.AsyncClient()
+        if coalesce is True:
+            coalesce = AsyncSingleFlight()
+        self.single_flight = coalesce or None
+
+    @property
+    def api_key(self) -> str:
+        """
+        Airtable API key or access token to use on all connections.
+        """
+        return self.sync.api_key
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        self.sync.api_key = value
+
+    @property
+    def timeout(self) -> TimeoutTuple | None:
+        return self.sync.timeout
+
+    @property
+    def use_field_ids(self) -> bool:
+        return self.sync.use_field_ids
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """
+        Throttles requests to each base, if enabled via ``rate_limit=``.
+        """
+        return self.sync.rate_limiter
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """
+        Stops sending requests to overloaded bases, if enabled via ``circuit_breaker=``.
+        """
+        return self.sync.circuit_breaker
+
+    @property
+    def validation(self) -> Validation:
+        """
+        Checks the structure of records returned by the API.
+        """
+        return self.sync.validation
+
+    @property
+    def metadata_cache(self) -> MetadataCache | None:
+        """
+        Stores base and schema metadata between processes, if enabled via ``metadata_cache=``.
+        """
+        return self.sync.metadata_cache
+
+    @property
+    def hooks(self) -> EventHooks:
+        """
+        Callbacks which are notified about each request, such as for collecting metrics.
+        """
+        return self.sync.hooks
+
+    def __repr__(self) -> str:
+        return "<pyairtable.AsyncApi>"
+
+    async def __aenter__(self) -> "Self":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close all connections held by the underlying HTTP client.
+        """
+        await self.client.aclose()
+
+    async def whoami(self) -> UserAndScopesDict:
+        """
+        Return the current user ID and (if connected via OAuth) the list of scopes.
+        See :meth:`Api.whoami <pyairtable.Api.whoami>`.
+        """
+        data = await self.request("GET", self.sync.urls.whoami)
+        return assert_typed_dict(UserAndScopesDict, data)
+
+    def base(self, base_id: str) -> "AsyncBase":
+        """
+        Return a new :class:`AsyncBase` instance that uses this instance of :class:`AsyncApi`.
+
+        Args:
+            base_id: |arg_base_id|
+        """
+        return AsyncBase(self, base_id)
+
+    def table(self, base_id: str, table_name: str) -> "AsyncTable":
+        """
+        Build a new :class:`AsyncTable` instance that uses this instance of :class:`AsyncApi`.
+
+        Args:
+            base_id: |arg_base_id|
+            table_name: The Airtable table's ID or name.
+        """
+        return self.base(base_id).table(table_name)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        fallback: tuple[str, str] | None = None,
+        options: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """
+        Make a request to the Airtable API.
+        See :meth:`Api.request <pyairtable.Api.request>` for a description of each argument.
+        """
+        prepared = self.sync._prepare_request(
+            method=method,
+            url=url,
+            fallback=fallback,
+            options=options,
+            params=params,
+            json=json,
+        )
+        with hooks.observe(self.hooks, prepared) as event:
+            with hooks.tracking(event):
+                if (flight := self.single_flight) and prepared.method == "GET":
+                    key = request_key(prepared)
+                    response = await flight.call(key, lambda: self._send(prepared))
+                else:
+                    response = await self._send(prepared)
+            if event:
+                event.received(response)
+            result = self.sync._process_response(response, decode)
+        self.sync._invalidate_metadata(prepared)
+        return result
+
+    async def _send(self, prepared: requests.PreparedRequest) -> requests.Response:
+        """
+        Send a request built by :meth:`Api._prepare_request <pyairtable.Api._prepare_request>`,
+        retrying according to the configured retry strategy, and return the response
+        as a ``requests.Response`` so that it can be handled the same way as the
+        synchronous client would handle it.
+        """
+        if not (breaker := self.circuit_breaker):
+            return await self._send_retrying(prepared)
+
+        key = base_id_from_url(str(prepared.url))
+        while delay := breaker.acquire(key):
+            hooks.record_queued(delay)
+            await asyncio.sleep(delay)
+        success = False
+        try:
+            response = await self._send_retrying(prepared)
+            success = not is_failure(response.status_code)
+            return response
+        finally:
+            breaker.record(key, success)
+
+    async def _send_retrying(
+        self,
+        prepared: requests.PreparedRequest,
+    ) -> requests.Response:
+        """
+        Send a request, retrying according to the configured retry strategy.
+        """
+        method = str(prepared.method)
+        url = str(prepared.url)
+        retry = self.retry_strategy
+        timeout = httpx.Timeout(None)
+        if self.timeout:
+            timeout = httpx.Timeout(None, connect=self.timeout[0], read=self.timeout[1])
+
+        while True:
+            try:
+                response = await self._send_once(prepared, timeout)
+            except httpx.TransportError as exc:
+                if not retry:
+                    raise
+                try:
+                    retry = _increment(retry, method, url, error=_as_urllib3_error(exc))
+                except (MaxRetryError, ConnectTimeoutError, ProtocolError):
+                    raise exc
+                delay = retry.get_backoff_time()
+            else:
+                has_retry_after = "Retry-After" in response.headers
+                if not retry or not retry.is_retry(
+                    method, response.status_code, has_retry_after
+                ):
+                    return _to_requests_response(response, prepared)
+                try:
+                    retry = _increment(
+                        retry, method, url, response=_as_urllib3_response(response)
+                    )
+                except MaxRetryError as exc:
+                    raise requests.exceptions.RetryError(exc, request=prepared)
+                delay = _retry_sleep_time(retry, response)
+            if isinstance(retry, retrying.AdaptiveRetry):
+                retry.stats.record(sleep_time=delay)
+            hooks.record_retry_sleep(delay)
+            await asyncio.sleep(delay)
+
+    async def _send_once(
+        self,
+        prepared: requests.PreparedRequest,
+        timeout: httpx.Timeout,
+    ) -> httpx.Response:
+        """
+        Send a single request, waiting for the rate limiter (if enabled).
+        """
+        waited = 0.0
+        # Claiming a token can block (FileRateLimiter locks a shared file),
+        # so it happens on a worker thread to avoid stalling the event loop.
+        if (limiter := self.rate_limiter) and (
+            waited := await asyncio.to_thread(limiter.reserve_url, str(prepared.url))
+        ):
+            hooks.record_queued(waited)
+            await asyncio.sleep(waited)
+        start = time.monotonic()
+        try:
+            return await self.client.request(
+                str(prepared.method),
+                str(prepared.url),
+                content=prepared.body,
+                headers=dict(prepared.headers),
+                timeout=timeout,
+            )
+        finally:
+            if limiter:
+                limiter.record(waited, time.monotonic() - start)
+
+    async def _metadata(
+        self,
+        name: str,
+        fetch: Callable[[], Awaitable[T]],
+        *,
+        force: bool = False,
+    ) -> T:
+        """
+        Like ``Api._metadata()``, but awaits ``fetch``.
+        """
+        if (cached := self.sync._cached_metadata(name, force=force)) is not None:
+            return cached  # type: ignore[no-any-return]
+        result = await fetch()
+        self.sync._cache_metadata(name, result)
+        return result
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        """
+        Make a GET request to the Airtable API.
+        See :meth:`~AsyncApi.request` for keyword arguments.
+        """
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        """
+        Make a POST request to the Airtable API.
+        See :meth:`~AsyncApi.request` for keyword arguments.
+        """
+        return await self.request("POST", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> Any:
+        """
+        Make a PATCH request to the Airtable API.
+        See :meth:`~AsyncApi.request` for keyword arguments.
+        """
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> Any:
+        """
+        Make a DELETE request to the Airtable API.
+        See :meth:`~AsyncApi.request` for keyword arguments.
+        """
+        return await self.request("DELETE", url, **kwargs)
+
+    async def iterate_requests(
+        self,
+        method: str,
+        url: str,
+        fallback: tuple[str, str] | None = None,
+        options: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        offset_field: str = "offset",
+        prefetch: int = 0,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Make one or more requests and iterates through each result.
+        See :meth:`Api.iterate_requests <pyairtable.Api.iterate_requests>`
+        for a description of each argument. If ``prefetch`` is provided,
+        pages will be retrieved by a background task.
+        """
+        if prefetch:
+            pages = self.iterate_requests(
+                method=method,
+                url=url,
+                fallback=fallback,
+                options=options,
+                params=params,
+                offset_field=offset_field,
+                decode=decode,
+            )
+            async for page in _prefetch(pages, prefetch):
+                yield page
+            return
+
+        options = options or {}
+        params = params or {}
+
+        for page in itertools.count(1):
+            with hooks.paginating(page):
+                response = await self.request(
+                    method=method,
+                    url=url,
+                    fallback=fallback,
+                    options=options,
+                    params=params,
+                    decode=decode,
+                )
+            yield response
+            if not isinstance(response, dict):
+                return
+            if not (offset := _get_offset(response, offset_field)):
+                return
+            options = {**options, offset_field: offset}
+
+    def chunked(self, iterable: Sequence[T]) -> Iterator[Sequence[T]]:
+        """
+        Iterate through chunks of the given sequence that are equal in size
+        to the maximum number of records per request allowed by the API.
+        """
+        return self.sync.chunked(iterable)
+
+
+class AsyncBase:
+    """
+    Represents an Airtable base, for use with asyncio.
+
+    Usage:
+        >>> base = api.base("appNxslc6jG0XedVM")
+        >>> table = base.table("Table Name")
+        >>> records = await table.all()
+    """
+
+    #: The connection to the Airtable API.
+    api: AsyncApi
+
+    #: The synchronous base object used to build URLs.
+    sync: Base
+
+    def __init__(self, api: AsyncApi, base_id: str):
+        """
+        Args:
+            api: An instance of :class:`AsyncApi`.
+            base_id: An Airtable base ID.
+        """
+        self.api = api
+        self.sync = api.sync.base(base_id)
+
+    @property
+    def id(self) -> str:
+        """
+        The base ID, in the format ``appXXXXXXXXXXXXXX``
+        """
+        return self.sync.id
+
+    @property
+    def urls(self) -> Base._urls:
+        """
+        See :data:`Base.urls <pyairtable.Base.urls>`.
+        """
+        return self.sync.urls
+
+    def __repr__(self) -> str:
+        return f"<AsyncBase id={self.id!r}>"
+
+    def table(self, id_or_name: str) -> "AsyncTable":
+        """
+        Build a new :class:`AsyncTable` instance using this instance of :class:`AsyncBase`.
+
+        Args:
+            id_or_name: |arg_table_id_or_name|
+        """
+        return AsyncTable(self, id_or_name)
+
+    async def schema(self, *, force: bool = False) -> BaseSchema:
+        """
+        Retrieve the schema of all tables in the base and caches it.
+        See :meth:`Base.schema <pyairtable.Base.schema>`.
+
+        Args:
+            force: |kwarg_force_metadata|
+        """
+        if force or not self.sync._schema:
+            data = await self.api._metadata(self.id, self._fetch_schema, force=force)
+            self.sync._schema = BaseSchema.from_api(
+                data, self.api.sync, context=self.sync
+            )
+        return self.sync._schema
+
+    async def _fetch_schema(self) -> dict[str, Any]:
+        params = self.sync._schema_params
+        return await self.api.get(self.urls.tables, params=params)  # type: ignore[no-any-return]
+
+
+class AsyncTable:
+    """
+    Represents an Airtable table, for use with asyncio.
+
+    Usage:
+        >>> api = AsyncApi(access_token)
+        >>> table = api.table("base_id", "table_name")
+        >>> records = await table.all()
+    """
+
+    #: The base that this table belongs to.
+    base: AsyncBase
+
+    #: The synchronous table object used to build URLs.
+    sync: Table
+
+    def __init__(self, base: AsyncBase, table_name: str):
+        """
+        Args:
+            base: An instance of :class:`AsyncBase`.
+            table_name: The Airtable table's ID or name.
+        """
+        self.base = base
+        self.sync = base.sync.table(table_name)
+
+    @property
+    def api(self) -> AsyncApi:
+        """
+        The API connection used by the table's :class:`AsyncBase`.
+        """
+        return self.base.api
+
+    @property
+    def name(self) -> str:
+        """
+        Can be either the table name or the table ID (``tblXXXXXXXXXXXXXX``).
+        """
+        return self.sync.name
+
+    @property
+    def urls(self) -> Table._urls:
+        """
+        See :data:`Table.urls <pyairtable.Table.urls>`.
+        """
+        return self.sync.urls
+
+    def __repr__(self) -> str:
+        return f"<AsyncTable base={self.base.id!r} name={self.name!r}>"
+
+    async def schema(self, *, force: bool = False) -> TableSchema:
+        """
+        Retrieve the schema of the current table.
+        See :meth:`Table.schema <pyairtable.Table.schema>`.
+
+        Args:
+            force: |kwarg_force_metadata|
+        """
+        if force or not self.sync._schema:
+            base_schema = await self.base.schema(force=force)
+            self.sync._schema = base_schema.table(self.name)
+        return self.sync._schema
+
+    async def get(self, record_id: RecordId, **options: Any) -> RecordDict:
+        """
+        Retrieve a record by its ID.
+        See :meth:`Table.get <pyairtable.Table.get>`.
+
+        Args:
+            record_id: |arg_record_id|
+
+        Keyword Args:
+            cell_format: |kwarg_cell_format|
+            time_zone: |kwarg_time_zone|
+            user_locale: |kwarg_user_locale|
+            use_field_ids: |kwarg_use_field_ids|
+        """
+        if self.api.use_field_ids:
+            options.setdefault("use_field_ids", self.api.use_field_ids)
+        record = await self.api.get(self.urls.record(record_id), options=options)
+        return self.api.validation.check(RecordDict, record)
+
+    async def iterate(self, **options: Any) -> AsyncIterator[list[RecordDict]]:
+        """
+        Iterate through each page of results from `List records <https://airtable.com/developers/web/api/list-records>`_.
+        See :meth:`Table.iterate <pyairtable.Table.iterate>`.
+
+        >>> async for page in table.iterate():
+        ...     print(page)
+        [{"id": ...}, {"id": ...}, {"id": ...}, ...]
+
+        Keyword Args:
+            view: |kwarg_view|
+            page_size: |kwarg_page_size|
+            max_records: |kwarg_max_records|
+            fields: |kwarg_fields|
+            sort: |kwarg_sort|
+            formula: |kwarg_formula|
+            cell_format: |kwarg_cell_format|
+            user_locale: |kwarg_user_locale|
+            time_zone: |kwarg_time_zone|
+            use_field_ids: |kwarg_use_field_ids|
+            count_comments: |kwarg_count_comments|
+            prefetch: |kwarg_prefetch|
+        """
+        if isinstance(formula := options.get("formula"), Formula):
+            options["formula"] = to_formula_str(formula)
+        if self.api.use_field_ids:
+            options.setdefault("use_field_ids", self.api.use_field_ids)
+        prefetch = options.pop("prefetch", 0)
+        async for page in self.api.iterate_requests(
+            method="get",
+            url=self.urls.records,
+            fallback=("post", self.urls.records_post),
+            options=options,
+            prefetch=prefetch,
+            decode=self.sync._decode_records,
+        ):
+            yield page.get("records", [])
+
+    async def all(self, **options: Any) -> list[RecordDict]:
+        """
+        Retrieve all matching records in a single list.
+        See :meth:`Table.all <pyairtable.Table.all>` for supported keyword arguments.
+        """
+        return [record async for page in self.iterate(**options) for record in page]
+
+    async def first(self, **options: Any) -> RecordDict | None:
+        """
+        Retrieve the first matching record.
+        Returns ``None`` if no records are returned.
+        See :meth:`Table.first <pyairtable.Table.first>` for supported keyword arguments.
+        """
+        options.update(dict(page_size=1, max_records=1))
+        async for page in self.iterate(**options):
+            for record in page:
+                return record
+        return None
+
+    async def create(
+        self,
+        fields: WritableFields,
+        typecast: bool = False,
+        use_field_ids: bool | None = None,
+    ) -> RecordDict:
+        """
+        Create a new record.
+        See :meth:`Table.create <pyairtable.Table.create>`.
+
+        Args:
+            fields: Fields to insert. Must be a dict with field names or IDs as keys.
+            typecast: |kwarg_typecast|
+            use_field_ids: |kwarg_use_field_ids|
+        """
+        if use_field_ids is None:
+            use_field_ids = self.api.use_field_ids
+        created = await self.api.post(
+            url=self.urls.records,
+            json={
+                "fields": fields,
+                "typecast": typecast,
+                "returnFieldsByFieldId": use_field_ids,
+            },
+        )
+        return self.api.validation.check(RecordDict, created)
+
+    async def batch_create(
+        self,
+        records: Iterable[WritableFields],
+        typecast: bool = False,
+        use_field_ids: bool | None = None,
+        max_workers: int = 5,
+    ) -> list[RecordDict]:
+        """
+        Create a number of new records in batches, sending several batches at once.
+        See :meth:`Table.batch_create <pyairtable.Table.batch_create>`.
+
+        Args:
+            records: Iterable of dicts representing records to be created.
+            typecast: |kwarg_typecast|
+            use_field_ids: |kwarg_use_field_ids|
+            max_workers: |kwarg_async_max_workers|
+        """
+        if use_field_ids is None:
+            use_field_ids = self.api.use_field_ids
+
+        async def _create(chunk: Sequence[WritableFields]) -> Any:
+            return await self.api.post(
+                url=self.urls.records,
+                json={
+                    "records": [{"fields": fields} for fields in chunk],
+                    "typecast": typecast,
+                    "returnFieldsByFieldId": use_field_ids,
+                },
+            )
+
+        responses = await self._batch(_create, records, max_workers)
+        return [
+            record
+            for response in responses
+            for record in self.api.validation.check_all(RecordDict, response["records"])
+        ]
+
+    async def update(
+        self,
+        record_id: RecordId,
+        fields: WritableFields,
+        replace: bool = False,
+        typecast: bool = False,
+        use_field_ids: bool | None = None,
+    ) -> RecordDict:
+        """
+        Update a particular record ID with the given fields.
+        See :meth:`Table.update <pyairtable.Table.update>`.
+
+        Args:
+            record_id: |arg_record_id|
+            fields: Fields to update. Must be a dict with column names or IDs as keys.
+            replace: |kwarg_replace|
+            typecast: |kwarg_typecast|
+            use_field_ids: |kwarg_use_field_ids|
+        """
+        if use_field_ids is None:
+            use_field_ids = self.api.use_field_ids
+        updated = await self.api.request(
+            method="put" if replace else "patch",
+            url=self.urls.record(record_id),
+            json={
+                "fields": fields,
+                "typecast": typecast,
+                "returnFieldsByFieldId": use_field_ids,
+            },
+        )
+        return self.api.validation.check(RecordDict, updated)
+
+    async def batch_update(
+        self,
+        records: Iterable[UpdateRecordDict],
+        replace: bool = False,
+        typecast: bool = False,
+        use_field_ids: bool | None = None,
+        max_workers: int = 5,
+    ) -> list[RecordDict]:
+        """
+        Update several records in batches, sending several batches at once.
+        See :meth:`Table.batch_update <pyairtable.Table.batch_update>`.
+
+        Args:
+            records: Records to update.
+            replace: |kwarg_replace|
+            typecast: |kwarg_typecast|
+            use_field_ids: |kwarg_use_field_ids|
+            max_workers: |kwarg_async_max_workers|
+
+        Returns:
+            The list of updated records.
+        """
+        if use_field_ids is None:
+            use_field_ids = self.api.use_field_ids
+
+        async def _update(chunk: Sequence[UpdateRecordDict]) -> Any:
+            return await self.api.request(
+                method="put" if replace else "patch",
+                url=self.urls.records,
+                json={
+                    "records": [{"id": x["id"], "fields": x["fields"]} for x in chunk],
+                    "typecast": typecast,
+                    "returnFieldsByFieldId": use_field_ids,
+                },
+            )
+
+        responses = await self._batch(_update, records, max_workers)
+        return [
+            record
+            for response in responses
+            for record in self.api.validation.check_all(RecordDict, response["records"])
+        ]
+
+    async def batch_upsert(
+        self,
+        records: Iterable[dict[str, Any]],
+        key_fields: list[FieldName],
+        replace: bool = False,
+        typecast: bool = False,
+        use_field_ids: bool | None = None,
+        max_workers: int = 5,
+    ) -> UpsertResultDict:
+        """
+        Update or create records in batches, either using ``id`` (if given) or using a set of
+        fields (``key_fields``) to look for matches, sending several batches at once.
+        See :meth:`Table.batch_upsert <pyairtable.Table.batch_upsert>`.
+
+        Args:
+            records: Records to update.
+            key_fields: List of field names that Airtable should use to match
+                records in the input with existing records on the server.
+            replace: |kwarg_replace|
+            typecast: |kwarg_typecast|
+            use_field_ids: |kwarg_use_field_ids|
+            max_workers: |kwarg_async_max_workers|
+
+        Returns:
+            Lists of created/updated record IDs, along with the list of all records affected.
+        """
+        if use_field_ids is None:
+            use_field_ids = self.api.use_field_ids
+
+        # Raise an exception before any network calls; see Table.batch_upsert.
+        records = list(records)
+        for record in records:
+            if "id" in record:
+                continue
+            missing = set(key_fields) - set(record.get("fields", []))
+            if missing:
+                raise ValueError(f"missing {missing!r} in {record['fields'].keys()!r}")
+
+        async def _upsert(chunk: Sequence[dict[str, Any]]) -> Any:
+            return await self.api.request(
+                method="put" if replace else "patch",
+                url=self.urls.records,
+                json={
+                    "records": [
+                        {k: v for (k, v) in record.items() if k in ("id", "fields")}
+                        for record in chunk
+                    ],
+                    "typecast": typecast,
+                    "returnFieldsByFieldId": use_field_ids,
+                    "performUpsert": {"fieldsToMergeOn": key_fields},
+                },
+            )
+
+        responses = await self._batch(_upsert, records, max_workers)
+        result: UpsertResultDict = {
+            "updatedRecords": [],
+            "createdRecords": [],
+            "records": [],
+        }
+        for response in responses:
+            result["updatedRecords"].extend(response["updatedRecords"])
+            result["createdRecords"].extend(response["createdRecords"])
+            result["records"].extend(
+                self.api.validation.check_all(RecordDict, response["records"])
+            )
+        return result
+
+    async def delete(self, record_id: RecordId) -> RecordDeletedDict:
+        """
+        Delete the given record.
+        See :meth:`Table.delete <pyairtable.Table.delete>`.
+
+        Args:
+            record_id: |arg_record_id|
+
+        Returns:
+            Confirmation that the record was deleted.
+        """
+        return self.api.validation.check(
+            RecordDeletedDict,
+            await self.api.delete(self.urls.record(record_id)),
+        )
+
+    async def batch_delete(
+        self,
+        record_ids: Iterable[RecordId],
+        max_workers: int = 5,
+    ) -> list[RecordDeletedDict]:
+        """
+        Delete the given records in batches, sending several batches at once.
+        See :meth:`Table.batch_delete <pyairtable.Table.batch_delete>`.
+
+        Args:
+            record_ids: Record IDs to delete
+            max_workers: |kwarg_async_max_workers|
+
+        Returns:
+            Confirmation that the records were deleted.
+        """
+
+        async def _delete(chunk: Sequence[RecordId]) -> Any:
+            return await self.api.delete(self.urls.records, params={"records[]": chunk})
+
+        responses = await self._batch(_delete, record_ids, max_workers)
+        return [
+            record
+            for response in responses
+            for record in self.api.validation.check_all(
+                RecordDeletedDict, response["records"]
+            )
+        ]
+
+    async def _batch(
+        self,
+        func: Callable[[Sequence[T]], Awaitable[R]],
+        items: Iterable[T],
+        max_workers: int,
+    ) -> list[R]:
+        """
+        Call ``func`` once for each chunk of ``items``, with no more than
+        ``max_workers`` calls running at once, and return the results in the
+        same order as the chunks. Once every chunk has been sent, any failures
+        are collected into a single :class:`~pyairtable.exceptions.BatchError`,
+        just like ``Table.batch_create(max_workers=...)`` and similar methods.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        chunks = list(self.api.chunked(list(items)))
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def _call(index: int, chunk: Sequence[T]) -> R:
+            async with semaphore:
+                with hooks.chunking(index):
+                    return await func(chunk)
+
+        outcomes = await asyncio.gather(
+            *(_call(index, chunk) for (index, chunk) in enumerate(chunks)),
+            return_exceptions=True,
+        )
+
+        offset = 0
+        results: dict[range, R] = {}
+        errors: dict[range, Exception] = {}
+        for chunk, outcome in zip(chunks, outcomes):
+            positions = range(offset, offset + len(chunk))
+            offset += len(chunk)
+            if isinstance(outcome, Exception):
+                errors[positions] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results[positions] = outcome
+
+        if errors:
+            raise BatchError(errors, results) from next(iter(errors.values()))
+        return list(results.values())
+
+    async def comments(self, record_id: RecordId) -> list[Comment]:
+        """
+        Retrieve all comments on the given record.
+        See :meth:`Table.comments <pyairtable.Table.comments>`.
+
+        The :class:`~pyairtable.models.Comment` instances returned by this method
+        use the synchronous :class:`~pyairtable.Api` for methods like ``save()``.
+
+        Args:
+            record_id: |arg_record_id|
+        """
+        url = self.urls.record_comments(record_id)
+        ctx = {"record_url": self.urls.record(record_id)}
+        return [
+            Comment.from_api(comment, self.api.sync, context=ctx)
+            async for page in self.api.iterate_requests("GET", url)
+            for comment in page["comments"]
+        ]
+
+    async def upload_attachment(
+        self,
+        record_id: RecordId,
+        field: str,
+        filename: str | Path,
+        content: str | bytes | None = None,
+        content_type: str | None = None,
+    ) -> UploadAttachmentResultDict:
+        """
+        Upload an attachment to the Airtable API, either by supplying the path to the file
+        or by providing the content directly as a variable.
+        See :meth:`Table.upload_attachment <pyairtable.Table.upload_attachment>`.
+
+        Args:
+            record_id: |arg_record_id|
+            field: The ID or name of the ``multipleAttachments`` type field.
+            filename: The path to the file to upload. If ``content`` is provided, this
+                argument is still used to tell Airtable what name to give the file.
+            content: The content of the file as a string or bytes object. If no value
+                is provided, pyAirtable will attempt to read the contents of ``filename``.
+            content_type: The MIME type of the file. If not provided, the library will attempt to
+                guess the content type based on ``filename``.
+
+        Returns:
+            A full list of attachments in the given field, including the new attachment.
+        """
+        if content is None:
+            content = await asyncio.to_thread(Path(filename).read_bytes)
+
+        filename = os.path.basename(filename)
+        if content_type is None:
+            if not (content_type := mimetypes.guess_type(filename)[0]):
+                warnings.warn(f"Could not guess content-type for {filename!r}")
+                content_type = "application/octet-stream"
+
+        url = self.urls.upload_attachment(record_id, field)
+        content = content.encode() if isinstance(content, str) else content
+        payload = {
+            "contentType": content_type,
+            "filename": filename,
+            "file": base64.encodebytes(content).decode("utf8"),  # API needs Unicode
+        }
+        response = await self.api.post(url, json=payload)
+        return self.api.validation.check(UploadAttachmentResultDict, response)
+
+
+async def _prefetch(iterable: AsyncIterator[T], depth: int) -> AsyncIterator[T]:
+    """
+    Consume ``iterable`` in a background task, staying up to ``depth`` items
+    ahead of the caller. The task is cancelled if the caller stops iterating early.
+    """
+    if depth < 1:
+        raise ValueError("prefetch depth must be at least 1")
+
+    buffer: asyncio.Queue[tuple[bool, Any]] = asyncio.Queue(maxsize=depth)
+
+    async def _produce() -> None:
+        try:
+            async for item in iterable:
+                await buffer.put((False, item))
+        except Exception as exc:
+            await buffer.put((True, exc))
+        else:
+            await buffer.put((True, None))
+
+    task = asyncio.create_task(_produce())
+    try:
+        while True:
+            done, value = await buffer.get()
+            if not done:
+                yield value
+            elif value is None:
+                return
+            else:
+                raise value
+    finally:
+        task.cancel()
+
+
+def _increment(
+    retry: retrying.Retry,
+    method: str,
+    url: str,
+    **kwargs: Any,
+) -> retrying.Retry:
+    """
+    Increment the retry counters, and report the retry to any event hooks
+    (which :class:`~pyairtable.api.retrying.AdaptiveRetry` does by itself).
+    """
+    retry = retry.increment(method, url, **kwargs)
+    if not isinstance(retry, retrying.AdaptiveRetry):
+        hooks.record_retry(retry.history[-1].status)
+    return retry
+
+
+def _as_urllib3_error(exc: httpx.TransportError) -> Exception:
+    """
+    Translate an httpx transport error into the urllib3 exception which
+    :meth:`Retry.increment <urllib3.util.Retry.increment>` uses to decide
+    whether the request can be retried: errors which happen before the request
+    is sent count as connect errors, and everything else counts as a read error.
+    """
+    if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return ConnectTimeoutError(str(exc))
+    return ProtocolError(str(exc))
+
+
+def _as_urllib3_response(response: httpx.Response) -> urllib3.HTTPResponse:
+    """
+    Build the (bodiless) urllib3 response which ``Retry.increment`` records
+    in its history.
+    """
+    return urllib3.HTTPResponse(
+        headers=dict(response.headers),
+        status=response.status_code,
+        preload_content=False,
+    )
+
+
+def _retry_sleep_time(retry: retrying.Retry, response: httpx.Response) -> float:
+    """
+    Determine how long to wait before retrying, honoring ``Retry-After`` in the
+    same way that urllib3 would for the synchronous client.
+    """
+    if (
+        retry.respect_retry_after_header
+        and response.status_code in retry.RETRY_AFTER_STATUS_CODES
+        and (retry_after := response.headers.get("Retry-After"))
+    ):
+        return retry.parse_retry_after(retry_after)
+    return retry.get_backoff_time()
+
+
+def _to_requests_response(
+    response: httpx.Response,
+    prepared: requests.PreparedRequest,
+) -> requests.Response:
+    """
+    Convert an ``httpx.Response`` into a ``requests.Response``, so that errors
+    raised by the async client are the same as those raised by the sync client.
+    """
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.url = str(prepared.url)
+    converted.reason = response.reason_phrase
+    converted.encoding = response.charset_encoding
+    converted.request = prepared
+    converted._content = response.content
+    return converted
+
+
+__all__ = [
+    "AsyncApi",
+    "AsyncBase",
+    "AsyncTable",
+]
@@ -1,24 +1,35 @@
-from collections.abc import Iterator, Sequence
+import functools
+import hashlib
+import itertools
+import time
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
 from functools import cached_property
 from typing import Any, TypeAlias, TypeVar
 
 import requests
 from requests.sessions import Session
 
-from pyairtable.api import retrying
+from pyairtable.api import hooks, retrying, streaming
 from pyairtable.api.base import Base
+from pyairtable.api.circuit import CircuitBreaker, is_failure
+from pyairtable.api.codecs import JSONCodec, get_codec
 from pyairtable.api.enterprise import Enterprise
+from pyairtable.api.hooks import EventHooks, RequestEvent
+from pyairtable.api.metacache import FileMetadataCache, MetadataCache
 from pyairtable.api.params import options_to_json_and_params, options_to_params
+from pyairtable.api.ratelimit import RateLimiter, base_id_from_url
+from pyairtable.api.singleflight import SingleFlight, request_key
 from pyairtable.api.table import Table
 from pyairtable.api.types import UserAndScopesDict, assert_typed_dict
+from pyairtable.api.validation import Validation, get_validation
 from pyairtable.api.workspace import Workspace
 from pyairtable.models.schema import Bases
 from pyairtable.utils import (
     Url,
     UrlBuilder,
-    cache_unless_forced,
     chunked,
     enterprise_only,
+    prefetched,
 )
 
 T = TypeVar("T")
@@ -37,6 +48,8 @@ class Api:
     """
 
     VERSION = "v0"
+
+    #: Minimum number of seconds between requests to a base, if ``rate_limit=True``.
     API_LIMIT = 1.0 / 5  # 5 per second
 
     #: Airtable-imposed limit on number of records per batch create/update operation.
@@ -47,11 +60,36 @@ class Api:
 
     # Cached metadata to reduce API calls
     _bases: dict[str, "Base"] | None = None
+    _cached_base_info: Bases | None = None
 
     endpoint_url: Url
     session: Session
     use_field_ids: bool
 
+    #: Retries requests which fail due to rate limiting (or other errors).
+    retry_strategy: retrying.Retry | None
+
+    #: Throttles requests to each base, if enabled via ``rate_limit=``.
+    rate_limiter: RateLimiter | None
+
+    #: Stops sending requests to overloaded bases, if enabled via ``circuit_breaker=``.
+    circuit_breaker: CircuitBreaker | None
+
+    #: Encodes request payloads and decodes responses.
+    json_codec: JSONCodec
+
+    #: Checks the structure of records returned by the API.
+    validation: Validation
+
+    #: Coalesces identical concurrent GET requests, if enabled via ``coalesce=``.
+    single_flight: SingleFlight[requests.Response] | None
+
+    #: Stores base and schema metadata between processes, if enabled via ``metadata_cache=``.
+    metadata_cache: MetadataCache | None
+
+    #: Callbacks which are notified about each request, such as for collecting metrics.
+    hooks: EventHooks
+
     class _urls(UrlBuilder):
         whoami = Url("meta/whoami")
         bases = Url("meta/bases")
@@ -66,6 +104,13 @@ class Api:
         retry_strategy: bool | retrying.Retry | None = True,
         endpoint_url: str = "https://api.airtable.com",
         use_field_ids: bool = False,
+        rate_limit: bool | RateLimiter | None = None,
+        json_codec: str | JSONCodec | None = None,
+        validation: str | Validation | None = None,
+        coalesce: bool | SingleFlight[requests.Response] | None = None,
+        circuit_breaker: bool | CircuitBreaker | None = None,
+        metadata_cache: bool | MetadataCache | None = None,
+        event_hooks: EventHooks | None = None,
     ):
         """
         Args:
@@ -83,9 +128,40 @@ class Api:
                 a debugging or caching proxy.
             use_field_ids: If ``True``, all API requests will return responses
                 with field IDs instead of field names.
+            rate_limit: An instance of :class:`~pyairtable.api.ratelimit.RateLimiter`.
+                If ``True``, requests to each base will be limited to
+                :data:`~Api.API_LIMIT` seconds apart.
+                If ``None`` or ``False`` (the default), requests will not be throttled,
+                and will instead rely on ``retry_strategy`` to handle 429 errors.
+            json_codec: The name of a JSON library to use (``"msgspec"``, ``"orjson"``,
+                or ``"json"``), or an instance of :class:`~pyairtable.api.codecs.JSONCodec`.
+                If not provided, pyAirtable will use msgspec if it is installed.
+            validation: How thoroughly to check records returned by the API: ``"full"``
+                (the default), ``"structural"``, ``"sampled"``, or ``"off"``, or an instance
+                of :class:`~pyairtable.api.validation.Validation`.
+                See :mod:`pyairtable.api.validation` for details.
+            coalesce: If ``True``, identical GET requests made at the same time from
+                several threads will share a single response from Airtable.
+                Pass an instance of :class:`~pyairtable.api.singleflight.SingleFlight`
+                to share it with other instances of :class:`Api`.
+                See :mod:`pyairtable.api.singleflight` for details.
+            circuit_breaker: An instance of :class:`~pyairtable.api.circuit.CircuitBreaker`.
+                If ``True``, requests to a base will fail immediately after several
+                consecutive requests to that base have failed with a 429 or 5xx error.
+                See :mod:`pyairtable.api.circuit` for details.
+            metadata_cache: An instance of :class:`~pyairtable.api.metacache.MetadataCache`.
+                If ``True``, the results of :meth:`~Api.bases` and
+                :meth:`Base.schema <pyairtable.Base.schema>` will be cached on disk
+                by :class:`~pyairtable.api.metacache.FileMetadataCache`.
+                See :mod:`pyairtable.api.metacache` for details.
+            event_hooks: An instance of :class:`~pyairtable.api.hooks.EventHooks`,
+                which can be shared with other instances of :class:`Api`.
+                If not provided, each instance will have its own.
+                See :mod:`pyairtable.api.hooks` for details.
         """
         if retry_strategy is True:
             retry_strategy = retrying.retry_strategy()
+        self.retry_strategy = retry_strategy or None
         if not retry_strategy:
             self.session = Session()
         else:
@@ -96,6 +172,22 @@ class Api:
         self.api_key = api_key
         self.use_field_ids = use_field_ids
 
+        if rate_limit is True:
+            rate_limit = RateLimiter(rate=1.0 / self.API_LIMIT)
+        self.rate_limiter = rate_limit or None
+        self.json_codec = get_codec(json_codec)
+        self.validation = get_validation(validation)
+        if coalesce is True:
+            coalesce = SingleFlight()
+        self.single_flight = coalesce or None
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        self.circuit_breaker = circuit_breaker or None
+        if metadata_cache is True:
+            metadata_cache = FileMetadataCache()
+        self.metadata_cache = metadata_cache or None
+        self.hooks = EventHooks() if event_hooks is None else event_hooks
+
     @property
     def api_key(self) -> str:
         """
@@ -145,20 +237,83 @@ class Api:
             return self._base_from_info(info)
         return Base(self, base_id)
 
-    @cache_unless_forced
-    def _base_info(self) -> Bases:
+    def _base_info(self, *, force: bool = False) -> Bases:
         """
         Return a schema object that represents all bases available via the API.
+
+        Args:
+            force: |kwarg_force_metadata|
         """
+        if force or self._cached_base_info is None:
+            data = self._metadata("bases", self._fetch_base_info, force=force)
+            self._cached_base_info = Bases.from_api(data, self)
+        return self._cached_base_info
+
+    def _fetch_base_info(self) -> dict[str, Any]:
         url = self.urls.bases
-        data = {
+        return {
             "bases": [
                 base_info
                 for page in self.iterate_requests("GET", url)
                 for base_info in page["bases"]
             ]
         }
-        return Bases.from_api(data, self)
+
+    def _metadata_key(self, name: str) -> str:
+        """
+        Build a key for :attr:`~Api.metadata_cache` which is unique to
+        this endpoint and access token, without revealing the token.
+        """
+        token = f"{self.endpoint_url} {self.api_key}".encode()
+        return f"{hashlib.sha256(token).hexdigest()[:32]}/{name}"
+
+    def _metadata(
+        self,
+        name: str,
+        fetch: Callable[[], T],
+        *,
+        force: bool = False,
+    ) -> T:
+        """
+        Return the cached response for the given metadata (such as ``"bases"``
+        or a base ID) if :attr:`~Api.metadata_cache` is enabled; otherwise,
+        or if ``force=True``, call ``fetch`` and cache the result.
+        """
+        if (cached := self._cached_metadata(name, force=force)) is not None:
+            return cached  # type: ignore[no-any-return]
+        result = fetch()
+        self._cache_metadata(name, result)
+        return result
+
+    def _cached_metadata(self, name: str, *, force: bool = False) -> Any:
+        """
+        Return the cached response for the given metadata, or ``None`` if it
+        has not been cached, the cache is disabled, or ``force=True``.
+        """
+        if force or not (cache := self.metadata_cache):
+            return None
+        return cache.get(self._metadata_key(name))
+
+    def _cache_metadata(self, name: str, data: Any) -> None:
+        """
+        Store the response for the given metadata, if the cache is enabled.
+        """
+        if cache := self.metadata_cache:
+            cache.set(self._metadata_key(name), data)
+
+    def _invalidate_metadata(self, prepared: requests.PreparedRequest) -> None:
+        """
+        Discard cached metadata that might be affected by a successful request
+        which changed a base, table, or field (or created or deleted a base).
+        """
+        url = str(prepared.url)
+        if not (cache := self.metadata_cache):
+            return
+        if prepared.method == "GET" or "/meta/" not in url:
+            return
+        cache.delete(self._metadata_key("bases"))
+        if base_id := base_id_from_url(url):
+            cache.delete(self._metadata_key(base_id))
 
     def _base_from_info(self, base_info: Bases.Info) -> "Base":
         return Base(
@@ -240,6 +395,7 @@ class Api:
         options: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
+        decode: Callable[[bytes], Any] | None = None,
     ) -> Any:
         """
         Make a request to the Airtable API, optionally converting a GET to a POST if the URL exceeds the
@@ -253,6 +409,44 @@ class Api:
                 See :ref:`Parameters` for valid options.
             params: Additional query params to append to the URL as-is.
             json: The JSON payload for a POST/PUT/PATCH/DELETE request.
+            decode: A function which converts the response body into the return value.
+                Defaults to the ``loads`` method of :attr:`json_codec`.
+        """
+        prepared = self._prepare_request(
+            method=method,
+            url=url,
+            fallback=fallback,
+            options=options,
+            params=params,
+            json=json,
+        )
+        with hooks.observe(self.hooks, prepared) as event:
+            with hooks.tracking(event):
+                if (flight := self.single_flight) and prepared.method == "GET":
+                    key = request_key(prepared)
+                    response = flight.call(key, lambda: self._send(prepared))
+                else:
+                    response = self._send(prepared)
+            if event:
+                event.received(response)
+            result = self._process_response(response, decode)
+        self._invalidate_metadata(prepared)
+        return result
+
+    def _prepare_request(
+        self,
+        method: str,
+        url: str,
+        fallback: tuple[str, str] | None = None,
+        options: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> requests.PreparedRequest:
+        """
+        Build the request that :meth:`~Api.request` will send, converting a GET
+        into a POST (via ``fallback``) if the URL would be too long.
+
+        See :meth:`~Api.request` for a description of each argument.
         """
         # Convert Airtable-specific options to query params, but give priority to query params
         # that are explicitly passed via `params=`. This is to preserve backwards-compatibility for
@@ -268,7 +462,8 @@ class Api:
                 method,
                 url=url,
                 params=request_params,
-                json=json,
+                data=None if json is None else self.json_codec.dumps(json),
+                headers=None if json is None else {"Content-Type": "application/json"},
             )
         )
 
@@ -279,21 +474,61 @@ class Api:
             and len(str(prepared.url)) >= self.MAX_URL_LENGTH
         ):
             json, spare_params = options_to_json_and_params(options or {})
-            return self.request(
+            return self._prepare_request(
                 method=fallback[0],
                 url=fallback[1],
                 params={**spare_params, **(params or {})},
                 json=json,
             )
 
-        response = self.session.request(
-            method=method,
-            url=url,
-            params=request_params,
-            json=json,
-            timeout=self.timeout,
+        return prepared
+
+    def _send(
+        self,
+        prepared: requests.PreparedRequest,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a request built by :meth:`~Api._prepare_request`, applying the same
+        environment settings (proxies, certificates) as ``Session.request()``
+        and waiting for the circuit breaker and rate limiter (if enabled).
+
+        If ``stream=True``, the response body will not be read until it is accessed.
+        """
+        if not (breaker := self.circuit_breaker):
+            return self._send_throttled(prepared, stream)
+
+        key = base_id_from_url(str(prepared.url))
+        while delay := breaker.acquire(key):
+            hooks.record_queued(delay)
+            time.sleep(delay)
+        success = False
+        try:
+            response = self._send_throttled(prepared, stream)
+            success = not is_failure(response.status_code)
+            return response
+        finally:
+            breaker.record(key, success)
+
+    def _send_throttled(
+        self,
+        prepared: requests.PreparedRequest,
+        stream: bool = False,
+    ) -> requests.Response:
+        settings = self.session.merge_environment_settings(
+            prepared.url, {}, stream, None, None
         )
-        return self._process_response(response)
+        if not (limiter := self.rate_limiter):
+            return self.session.send(prepared, timeout=self.timeout, **settings)
+
+        if waited := limiter.reserve_url(str(prepared.url)):
+            hooks.record_queued(waited)
+            time.sleep(waited)
+        start = time.monotonic()
+        try:
+            return self.session.send(prepared, timeout=self.timeout, **settings)
+        finally:
+            limiter.record(waited, time.monotonic() - start)
 
     def get(self, url: str, **kwargs: Any) -> Any:
         """
@@ -323,13 +558,17 @@ class Api:
         """
         return self.request("DELETE", url, **kwargs)
 
-    def _process_response(self, response: requests.Response) -> Any:
+    def _process_response(
+        self,
+        response: requests.Response,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
         try:
             response.raise_for_status()
         except requests.exceptions.HTTPError as exc:
             # Attempt to get Error message from response, Issue #16
             try:
-                error_dict = response.json()
+                error_dict = self.json_codec.loads(response.content)
             except ValueError:
                 pass
             else:
@@ -338,9 +577,44 @@ class Api:
             raise exc
 
         # Some Airtable endpoints will respond with an empty body and a 200.
-        if not response.text:
+        if not response.content:
             return None
-        return response.json()
+        return (decode or self.json_codec.loads)(response.content)
+
+    def _stream_request(
+        self,
+        field: str,
+        method: str,
+        url: str,
+        fallback: tuple[str, str] | None = None,
+        options: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        page: int | None = None,
+    ) -> Generator[Any, None, dict[str, Any]]:
+        """
+        Make a request like :meth:`~Api.request`, but read the response body
+        incrementally and yield each item of the list in ``field`` as it arrives.
+        Returns the remainder of the response payload.
+        """
+        prepared = self._prepare_request(
+            method=method,
+            url=url,
+            fallback=fallback,
+            options=options,
+            params=params,
+        )
+        with hooks.observe(self.hooks, prepared, page=page) as event:
+            with hooks.tracking(event):
+                response = self._send(prepared, stream=True)
+            with response:
+                if event:
+                    event.received(response, stream=True)
+                if not response.ok:
+                    self._process_response(response)
+                chunks = response.iter_content(streaming.CHUNK_SIZE)
+                if event:
+                    chunks = _count_bytes(chunks, event)
+                return (yield from streaming.iter_items(chunks, field, self.json_codec))
 
     def iterate_requests(
         self,
@@ -350,6 +624,10 @@ class Api:
         options: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         offset_field: str = "offset",
+        prefetch: int = 0,
+        stream: str | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+        raw: str | None = None,
     ) -> Iterator[Any]:
         """
         Make one or more requests and iterates through each result.
@@ -370,30 +648,94 @@ class Api:
             params: Additional query params to append to the URL as-is.
             offset_field: The key to use in the API response to determine whether
                 there are additional pages to retrieve.
-        """
-        options = options or {}
-        params = params or {}
-
-        def _get_offset_field(response: dict[str, Any]) -> str | None:
-            value = response.get("pagination") or response  # see Enterprise.audit_log
-            field_names = offset_field.split(".")
-            while field_names:
-                if not (value := value.get(field_names.pop(0))):
-                    return None
-            return str(value)
+            prefetch: |kwarg_prefetch|
+            stream: The name of a list in each response payload (such as ``"records"``).
+                If provided, each response will be parsed incrementally as it is
+                received, and this method will yield each item in that list
+                instead of yielding each response payload.
+                If combined with ``prefetch``, the next page(s) are retrieved in full
+                in the background, and each page's items are decoded as they are yielded.
+                See :mod:`pyairtable.api.streaming` for details.
+            decode: A function which converts each response body into a payload.
+                See :meth:`~Api.request`. Ignored if ``stream`` or ``raw`` is provided.
+            raw: The name of a list in each response payload (such as ``"records"``).
+                If provided, this method will yield a :class:`~pyairtable.api.streaming.RawPage`
+                for each response, without decoding or validating that list.
+                See :func:`~pyairtable.api.streaming.split_page` for details.
+        """
+        if stream and raw:
+            raise ValueError("stream= and raw= cannot be used together")
+        if raw:
+            decode = functools.partial(
+                streaming.split_page, field=raw, codec=self.json_codec
+            )
 
-        while True:
-            response = self.request(
+        if prefetch and stream:
+            # Prefetch whole pages and decode their items one at a time in the
+            # caller's thread, so that the background thread stays ``prefetch``
+            # pages ahead rather than ``prefetch`` items.
+            pages = self.iterate_requests(
                 method=method,
                 url=url,
                 fallback=fallback,
                 options=options,
                 params=params,
+                offset_field=offset_field,
+                prefetch=prefetch,
+                raw=stream,
             )
-            yield response
+            for raw_page in pages:
+                chunks = [raw_page.content]
+                yield from streaming.iter_items(chunks, stream, self.json_codec)
+            return
+
+        if prefetch:
+            yield from prefetched(
+                self.iterate_requests(
+                    method=method,
+                    url=url,
+                    fallback=fallback,
+                    options=options,
+                    params=params,
+                    offset_field=offset_field,
+                    stream=stream,
+                    decode=decode,
+                    raw=raw,
+                ),
+                prefetch,
+            )
+            return
+
+        options = options or {}
+        params = params or {}
+
+        for page in itertools.count(1):
+            if stream:
+                response = yield from self._stream_request(
+                    stream,
+                    method=method,
+                    url=url,
+                    fallback=fallback,
+                    options=options,
+                    params=params,
+                    page=page,
+                )
+            else:
+                with hooks.paginating(page):
+                    response = self.request(
+                        method=method,
+                        url=url,
+                        fallback=fallback,
+                        options=options,
+                        params=params,
+                        decode=decode,
+                    )
+                yield response
+            if isinstance(response, streaming.RawPage):
+                response = response.remainder
             if not isinstance(response, dict):
                 return
-            if not (offset := _get_offset_field(response)):
+            if not (offset := _get_offset(response, offset_field)):
                 return
             options = {**options, offset_field: offset}
 
@@ -410,3 +752,25 @@ class Api:
         Build an object representing an enterprise account.
         """
         return Enterprise(self, enterprise_account_id)
+
+
+def _get_offset(response: dict[str, Any], offset_field: str) -> str | None:
+    """
+    Find the value that :meth:`Api.iterate_requests` should use to request
+    the next page, or ``None`` if there are no more pages.
+    """
+    value = response.get("pagination") or response  # see Enterprise.audit_log
+    field_names = offset_field.split(".")
+    while field_names:
+        if not (value := value.get(field_names.pop(0))):
+            return None
+    return str(value)
+
+
+def _count_bytes(chunks: Iterable[bytes], event: RequestEvent) -> Iterator[bytes]:
+    """
+    Add the size of each chunk of a streamed response body to ``event.bytes_in``.
+    """
+    for chunk in chunks:
+        event.bytes_in += len(chunk)
+        yield chunk
@@ -0,0 +1,342 @@
+"""
+:meth:`Enterprise.audit_log <pyairtable.Enterprise.audit_log>` follows the
+audit log's pagination IDs one page at a time, so retrieving months of events
+from a large enterprise can take hours. :meth:`Enterprise.export_audit_log <pyairtable.Enterprise.export_audit_log>`
+instead splits the requested period into windows (one day each, by default) and
+retrieves several windows at once:
+
+    >>> export = enterprise.export_audit_log(start_time=date(2025, 1, 1), max_workers=8)
+    >>> for event in export.events():
+    ...     handle(event)
+
+:meth:`AuditLogExport.events` yields events in chronological order, as each page
+of the earliest remaining window is retrieved. Later windows are retrieved at the
+same time, but only a few pages ahead of the caller.
+
+:meth:`AuditLogExport.to_ndjson` instead writes each window's events to its own file
+(or "shard") as soon as they are retrieved, along with a ``state.json`` file which records
+each window's progress. If the export is interrupted, calling :meth:`~AuditLogExport.to_ndjson`
+again with the same directory will skip windows which were completed, and continue
+other windows from the last page that was written:
+
+    >>> export.to_ndjson("audit-log/")
+    123456
+    >>> sorted(os.listdir("audit-log"))
+    ['20250101T000000Z.ndjson', '20250102T000000Z.ndjson', ..., 'state.json']
+
+Each line of a shard is one event, exactly as it was returned by the API.
+"""
+
+import contextlib
+import copy
+import json
+import os
+import queue
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pyairtable.api import tracing
+from pyairtable.models.audit import AuditLogEvent
+from pyairtable.utils import datetime_from_iso_str, datetime_to_iso_str
+
+if TYPE_CHECKING:
+    from pyairtable.api.enterprise import Enterprise
+
+#: The number of days of events retained by Airtable.
+RETENTION = timedelta(days=180)
+
+#: The name of the file in which :meth:`AuditLogExport.to_ndjson` records its progress.
+STATE_FILE = "state.json"
+
+#: A period of time, from ``start`` (inclusive) to ``end`` (exclusive).
+Window = tuple[datetime, datetime]
+
+
+class AuditLogExport:
+    """
+    Retrieves audit log events for a period of time, several windows at once.
+    Created by :meth:`Enterprise.export_audit_log <pyairtable.Enterprise.export_audit_log>`.
+    """
+
+    #: The maximum number of events in each page of results.
+    page_size = 100
+
+    #: The maximum number of pages of results that :meth:`events` will hold
+    #: in memory for each window, while waiting for earlier windows.
+    prefetch = 2
+
+    def __init__(
+        self,
+        enterprise: "Enterprise",
+        start_time: str | date | datetime | None = None,
+        end_time: str | date | datetime | None = None,
+        *,
+        window: timedelta = timedelta(days=1),
+        max_workers: int = 4,
+        params: dict[str, Any] | None = None,
+    ):
+        if window <= timedelta(0):
+            raise ValueError("window must be a positive timedelta")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.enterprise = enterprise
+        self.end_time = _to_datetime(end_time) or datetime.now(timezone.utc)
+        self.start_time = _to_datetime(start_time) or (self.end_time - RETENTION)
+        self.window = window
+        self.max_workers = max_workers
+        self.params = params or {}
+        self.windows = split_windows(self.start_time, self.end_time, window)
+        self._defaults = {
+            "start_time": start_time is None,
+            "end_time": end_time is None,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}"
+            f" start_time={datetime_to_iso_str(self.start_time)!r}"
+            f" end_time={datetime_to_iso_str(self.end_time)!r}"
+            f" windows={len(self.windows)}>"
+        )
+
+    @tracing.traced("AuditLogExport.events")
+    def events(self) -> Iterator[AuditLogEvent]:
+        """
+        Retrieve and yield every event in the period, in chronological order.
+
+        Up to ``max_workers`` windows are retrieved at once. Events are yielded as
+        soon as each page of the earliest window is retrieved, while other windows
+        retrieve no more than :attr:`prefetch` pages ahead.
+        """
+        windows = iter(self.windows)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        stopped = threading.Event()
+        pending: deque[tuple[queue.Queue[Any], Future[None]]] = deque()
+
+        def _submit() -> None:
+            if (window := next(windows, None)) is not None:
+                pages: queue.Queue[Any] = queue.Queue(maxsize=self.prefetch)
+                produce = tracing.bind(self._produce)
+                future = executor.submit(produce, window, pages, stopped)
+                pending.append((pages, future))
+
+        try:
+            for _ in range(self.max_workers):
+                _submit()
+            while pending:
+                pages, future = pending[0]
+                while (page := pages.get()) is not None:
+                    for event in page["events"]:
+                        yield AuditLogEvent.from_api(
+                            event, self.enterprise.api, context=self.enterprise
+                        )
+                pending.popleft()
+                future.result()
+                _submit()
+        finally:
+            stopped.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @tracing.traced("AuditLogExport.to_ndjson")
+    def to_ndjson(self, directory: str | os.PathLike[str]) -> int:
+        """
+        Write each window's events to a separate file in the given directory,
+        as newline-delimited JSON, and return the number of events written.
+
+        If the directory contains the progress of an earlier call which
+        was interrupted, the export will resume from where it stopped.
+        This requires both calls to use the same ``start_time``, ``window``,
+        and filters. If ``end_time`` was not provided, the earlier call's
+        ``end_time`` is used, rather than the current time.
+
+        Raises:
+            ValueError: If the directory contains the progress of
+                a different export.
+        """
+        directory = Path(directory)
+        export = self._resuming(_read_state(directory))
+        shards = _Shards(directory, export)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(tracing.bind(shards.write), window)
+                for window in export.windows
+                if not shards.done(window)
+            ]
+        return sum(future.result() for future in futures)
+
+    def _resuming(self, state: dict[str, Any] | None) -> "AuditLogExport":
+        """
+        If ``end_time`` defaulted to the current time, return a copy of this export
+        which ends at the same time as the earlier export recorded in ``state``.
+        """
+        if not (state and state["windows"] and self._defaults["end_time"]):
+            return self
+        export = copy.copy(self)
+        export.end_time = datetime_from_iso_str(state["windows"][-1][1])
+        if self._defaults["start_time"]:
+            export.start_time = export.end_time - RETENTION
+        export.windows = split_windows(export.start_time, export.end_time, self.window)
+        return export
+
+    def _pages(self, window: Window, next: str | None = None) -> Iterator[Any]:
+        """
+        Yield each page of results for the given window,
+        starting from the given pagination ID.
+        """
+        start, end = window
+        params = {
+            **self.params,
+            "startTime": datetime_to_iso_str(start),
+            # the API treats endTime as inclusive, but windows do not overlap
+            "endTime": datetime_to_iso_str(end - timedelta(milliseconds=1)),
+            "sortOrder": "ascending",
+            "pageSize": self.page_size,
+        }
+        for page in self.enterprise.api.iterate_requests(
+            method="GET",
+            url=self.enterprise.urls.audit_log,
+            options={"next": next} if next else None,
+            params=params,
+            offset_field="next",
+        ):
+            yield page
+            if not page["events"]:
+                return
+
+    def _produce(
+        self,
+        window: Window,
+        pages: "queue.Queue[Any]",
+        stopped: threading.Event,
+    ) -> None:
+        """
+        Put each page of results for the given window into ``pages``,
+        followed by ``None``, unless ``stopped`` is set first.
+        """
+
+        def _put(page: Any) -> bool:
+            while not stopped.is_set():
+                with contextlib.suppress(queue.Full):
+                    pages.put(page, timeout=0.1)
+                    return True
+            return False
+
+        try:
+            for page in self._pages(window):
+                if not _put(page):
+                    return
+        finally:
+            _put(None)
+
+
+class _Shards:
+    """
+    Writes windows of events to files in a directory,
+    and records the progress of each window in :data:`STATE_FILE`.
+    """
+
+    def __init__(self, directory: Path, export: AuditLogExport):
+        self.directory = directory
+        self.export = export
+        self.codec = export.enterprise.api.json_codec
+        self.lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.spec = {
+            "params": export.params,
+            "windows": [[_shard_name(w), _shard_end(w)] for w in export.windows],
+        }
+        state = _read_state(directory) or {**self.spec, "progress": {}}
+        if {k: state.get(k) for k in self.spec} != self.spec:
+            raise ValueError(f"{directory} contains a different audit log export")
+        self.progress: dict[str, dict[str, Any]] = state["progress"]
+
+    def done(self, window: Window) -> bool:
+        return bool(self.progress.get(_shard_name(window), {}).get("done"))
+
+    def write(self, window: Window) -> int:
+        name = _shard_name(window)
+        progress = self.progress.get(name, {"next": None, "size": 0})
+        count = 0
+        with open(self.directory / name, "ab") as fp:
+            # discard anything written after the last page that was recorded
+            fp.truncate(progress["size"])
+            for page in self.export._pages(window, progress["next"]):
+                for event in page["events"]:
+                    fp.write(self.codec.dumps(event) + b"\n")
+                fp.flush()
+                count += len(page["events"])
+                next = (page.get("pagination") or {}).get("next")
+                progress = {
+                    "next": next,
+                    "size": fp.tell(),
+                    "done": not (page["events"] and next),
+                }
+                self._save(name, progress)
+        return count
+
+    def _save(self, name: str, progress: dict[str, Any]) -> None:
+        with self.lock:
+            self.progress[name] = progress
+            state = {**self.spec, "progress": self.progress}
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                    json.dump(state, fp)
+                os.replace(tmp, self.directory / STATE_FILE)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+
+def split_windows(start: datetime, end: datetime, length: timedelta) -> list[Window]:
+    """
+    Split the period from ``start`` to ``end`` into consecutive windows
+    no longer than ``length``.
+    """
+    windows = []
+    while start < end:
+        windows.append((start, min(start + length, end)))
+        start += length
+    return windows
+
+
+def _read_state(directory: Path) -> dict[str, Any] | None:
+    try:
+        state: dict[str, Any] = json.loads(
+            (directory / STATE_FILE).read_text(encoding="utf-8")
+        )
+    except FileNotFoundError:
+        return None
+    return state
+
+
+def _to_datetime(value: str | date | datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime_from_iso_str(value)
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _shard_name(window: Window) -> str:
+    return window[0].astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ.ndjson")
+
+
+def _shard_end(window: Window) -> str:
+    return datetime_to_iso_str(window[1].astimezone(timezone.utc))
+
+
+__all__ = [
+    "AuditLogExport",
+    "split_windows",
+]
@@ -196,8 +196,7 @@ class Base:
         response = self.api.post(url, json=payload)
         return self.table(response["id"], validate=True, force=True)
 
-    @cache_unless_forced
-    def schema(self) -> BaseSchema:
+    def schema(self, *, force: bool = False) -> BaseSchema:
         """
         Retrieve the schema of all tables in the base and caches it.
 
@@ -208,11 +207,21 @@ class Base:
             TableSchema(id="tblXXXXXXXXXXXXXX", ...)
             >>> base.schema().table("My Table")
             TableSchema(id="...", name="My Table", ...)
+
+        Args:
+            force: |kwarg_force_metadata|
         """
-        url = self.urls.tables
-        params = {"include": ["visibleFieldIds"]}
-        data = self.api.get(url, params=params)
-        return BaseSchema.from_api(data, self.api, context=self)
+        if force or self._schema is None:
+            data = self.api._metadata(self.id, self._fetch_schema, force=force)
+            self._schema = BaseSchema.from_api(data, self.api, context=self)
+        return self._schema
+
+    #: Query parameters used when retrieving the base schema.
+    _schema_params = {"include": ["visibleFieldIds"]}
+
+    def _fetch_schema(self) -> dict[str, Any]:
+        params = self._schema_params
+        return self.api.get(self.urls.tables, params=params)  # type: ignore[no-any-return]
 
     def webhooks(self) -> list[Webhook]:
         """
@@ -0,0 +1,163 @@
+"""
+Applications which cannot register :ref:`webhooks <Webhooks>` often poll a table
+by retrieving every record every few minutes. :meth:`Table.changes_since <pyairtable.Table.changes_since>`
+instead uses Airtable's ``LAST_MODIFIED_TIME()`` formula function to retrieve only
+records which have been created or modified since the previous poll:
+
+    >>> changes = table.changes_since(None)  # the first poll retrieves everything
+    >>> save(changes.watermark.to_json())
+    ...
+    >>> changes = table.changes_since(Watermark.from_json(load()))
+    >>> for record in changes.records:
+    ...     handle(record)
+    >>> save(changes.watermark.to_json())
+
+Each :class:`Watermark` records when the poll started (according to the local clock).
+To tolerate clock skew, and changes which are still being saved when a poll runs,
+the next poll will also retrieve records modified up to ``overlap`` seconds *before*
+that time. Records retrieved again in this way are skipped if their fields have not
+changed since the previous poll, so each change is normally only returned once.
+
+To keep the watermark small, each poll retrieves records in two requests: those
+modified before the overlap window of the *next* poll, and those modified within it.
+Only the latter can be retrieved again, so only their fingerprints are kept.
+
+``LAST_MODIFIED_TIME()`` only changes when a user (or the API) edits a field,
+so changes to computed fields (such as lookups or formulas) will not be detected.
+"""
+
+import hashlib
+import json
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from pyairtable.api.types import RecordDict, RecordId
+from pyairtable.formulas import AND, IS_AFTER, LAST_MODIFIED_TIME, NOT, Formula
+from pyairtable.utils import datetime_from_iso_str, datetime_to_iso_str
+
+
+@dataclass
+class Watermark:
+    """
+    Records how far a series of calls to :meth:`Table.changes_since <pyairtable.Table.changes_since>`
+    has progressed. Watermarks can be persisted between processes via
+    :meth:`to_json` and :meth:`from_json`.
+    """
+
+    #: The time at which the poll which produced this watermark started.
+    timestamp: datetime
+
+    #: Fingerprints of the records returned by that poll which were modified
+    #: within the overlap window of the next poll. These will be skipped if
+    #: they are retrieved again without having changed.
+    seen: dict[RecordId, str] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        """
+        Serialize the watermark as a JSON string.
+        """
+        return json.dumps(
+            {"timestamp": datetime_to_iso_str(self.timestamp), "seen": self.seen}
+        )
+
+    @classmethod
+    def from_json(cls, value: str | bytes) -> "Watermark":
+        """
+        Load a watermark that was serialized with :meth:`to_json`.
+        """
+        data = json.loads(value)
+        return cls(datetime_from_iso_str(data["timestamp"]), data["seen"])
+
+    def formula(self, overlap: float) -> Formula:
+        """
+        Build a formula which matches records modified after this watermark,
+        less ``overlap`` seconds.
+        """
+        since = self.timestamp - timedelta(seconds=overlap)
+        return IS_AFTER(LAST_MODIFIED_TIME(), since)
+
+
+@dataclass
+class Changes:
+    """
+    Returned by :meth:`Table.changes_since <pyairtable.Table.changes_since>`.
+    """
+
+    #: Records which have been created or modified since the previous watermark.
+    records: list[RecordDict]
+
+    #: The watermark to pass to the next call.
+    watermark: Watermark
+
+
+def now() -> datetime:
+    """
+    Return the current time in UTC.
+    """
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc)
+
+
+def fingerprint(record: RecordDict) -> str:
+    """
+    Return a short string which changes whenever the record's fields change.
+    """
+    data = json.dumps(record["fields"], sort_keys=True, default=str)
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def poll_formulas(
+    previous: Watermark | None,
+    started: datetime,
+    overlap: float,
+    formula: Formula | None = None,
+) -> tuple[Formula, Formula]:
+    """
+    Build the formulas for a poll which starts at ``started``: one which matches
+    records modified before the next poll's overlap window, and one which matches
+    records modified within it. Both only match records modified since the
+    ``previous`` watermark (if any) which also match ``formula`` (if given).
+    """
+    filters = [] if formula is None else [formula]
+    if previous is not None:
+        filters.append(previous.formula(overlap))
+    recent = Watermark(started).formula(overlap)
+    older: Formula = NOT(recent)
+    if filters:
+        older, recent = AND(*filters, older), AND(*filters, recent)
+    return older, recent
+
+
+def collect(
+    older: Iterable[list[RecordDict]],
+    recent: Iterable[list[RecordDict]],
+    previous: Watermark | None,
+    started: datetime,
+) -> Changes:
+    """
+    Build a :class:`Changes` from the pages of records retrieved by a poll
+    which started at ``started``, skipping records which are unchanged
+    since the ``previous`` watermark. Only the ``recent`` records (those
+    which the next poll will retrieve again) are kept in the new watermark.
+    """
+    seen = previous.seen if previous else {}
+    watermark = Watermark(started)
+    records: dict[RecordId, RecordDict] = {}
+    for remember, pages in ((False, older), (True, recent)):
+        for page in pages:
+            for record in page:
+                value = fingerprint(record)
+                if remember:
+                    watermark.seen[record["id"]] = value
+                # A record modified between the two requests will appear in both,
+                # in which case the latest version replaces the earlier one.
+                if seen.get(record["id"]) != value:
+                    records[record["id"]] = record
+    return Changes(list(records.values()), watermark)
+
+
+__all__ = [
+    "Changes",
+    "Watermark",
+]
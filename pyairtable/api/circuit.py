@@ -0,0 +1,202 @@
+"""
+When a base is overloaded, retrying every request (even with backoff) adds
+to the load, and every caller waits through its full retry schedule before
+failing. A :class:`CircuitBreaker` keeps track of requests to each base which
+failed with a 429 or 5xx error (after any retries). After several consecutive
+failures, it "opens" the circuit for that base, and further requests to it will
+fail immediately with :class:`~pyairtable.exceptions.CircuitOpenError`
+(or, if ``wait=True``, wait until the circuit closes) instead of being sent.
+
+After ``cooldown`` seconds, one request is allowed through as a trial. If it succeeds,
+the circuit closes and requests flow normally again; if it fails, the circuit
+stays open for another ``cooldown`` seconds.
+
+    >>> from pyairtable import Api
+    >>> from pyairtable.api.circuit import CircuitBreaker
+    >>> api = Api("auth_token", circuit_breaker=True)
+    >>> api = Api("auth_token", circuit_breaker=CircuitBreaker(threshold=3, wait=True))
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Literal
+
+from pyairtable.api.ratelimit import base_id_from_url
+from pyairtable.exceptions import CircuitOpenError
+
+CircuitState = Literal["closed", "open", "half-open"]
+
+
+def is_failure(status_code: int) -> bool:
+    """
+    Whether a response with the given status code indicates that
+    the API is overloaded or unavailable.
+    """
+    return status_code == 429 or status_code >= 500
+
+
+@dataclass
+class CircuitBreakerStats:
+    """
+    Counters describing how often a :class:`CircuitBreaker` has intervened.
+    """
+
+    #: The number of times a circuit has opened.
+    opened: int = 0
+
+    #: The number of requests which failed immediately because a circuit was open.
+    rejected: int = 0
+
+    #: The number of times a request had to wait for a circuit to close.
+    delayed: int = 0
+
+    #: Total seconds that requests were told to wait for a circuit to close.
+    wait_time: float = 0.0
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    open_until: float | None = None
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker which tracks failures separately for each base.
+    Like :class:`~pyairtable.api.ratelimit.RateLimiter`, it never blocks; instead,
+    :meth:`acquire` tells the caller how long to wait, so the same instance
+    can be shared by threads and by asyncio tasks.
+    Requests which do not refer to a specific base are not tracked.
+    """
+
+    #: How often (in seconds) a waiting request will check whether a trial request
+    #: has finished, when the circuit is half-open.
+    PROBE_INTERVAL = 0.1
+
+    #: Counters for requests that have passed through this circuit breaker.
+    stats: CircuitBreakerStats
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0, wait: bool = False):
+        """
+        Args:
+            threshold: The number of consecutive failed requests to a base
+                which will open its circuit.
+            cooldown: The number of seconds to keep a circuit open
+                before allowing a trial request.
+            wait: If ``True``, requests to a base whose circuit is open will wait
+                until the circuit closes, instead of raising
+                :class:`~pyairtable.exceptions.CircuitOpenError`.
+        """
+        if threshold < 1:
+            raise ValueError("threshold must be at least 1")
+        if cooldown <= 0:
+            raise ValueError("cooldown must be greater than zero")
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.wait = wait
+        self.stats = CircuitBreakerStats()
+        self._lock = threading.Lock()
+        # Only bases which have failed recently are tracked.
+        self._circuits: dict[str, _Circuit] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}"
+            f" threshold={self.threshold!r}"
+            f" cooldown={self.cooldown!r}"
+            f" wait={self.wait!r}>"
+        )
+
+    def state(self, key: str | None) -> CircuitState:
+        """
+        Return the state of the circuit for the given base ID.
+        """
+        with self._lock:
+            return self._state(key, time.monotonic())
+
+    def states(self) -> dict[str, CircuitState]:
+        """
+        Return the state of every circuit which is not closed, keyed by base ID.
+        """
+        with self._lock:
+            now = time.monotonic()
+            states = {key: self._state(key, now) for key in self._circuits}
+        return {key: state for key, state in states.items() if state != "closed"}
+
+    def _state(self, key: str | None, now: float) -> CircuitState:
+        circuit = self._circuits.get(key) if key else None
+        if not circuit or circuit.open_until is None:
+            return "closed"
+        if circuit.probing or now >= circuit.open_until:
+            return "half-open"
+        return "open"
+
+    def acquire(self, key: str | None) -> float:
+        """
+        Check whether a request to the given base may be sent. Returns zero if it
+        may be sent now, or the number of seconds the caller should wait before
+        calling this method again (if ``wait=True``). Callers which are allowed
+        through must report the outcome of their request via :meth:`record`.
+
+        Args:
+            key: The base ID the request will be sent to, or ``None``.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and ``wait=False``.
+        """
+        if key is None:
+            return 0.0
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if not circuit or circuit.open_until is None:
+                return 0.0
+            now = time.monotonic()
+            if now >= circuit.open_until and not circuit.probing:
+                circuit.probing = True
+                return 0.0
+            delay = max(circuit.open_until - now, self.PROBE_INTERVAL)
+            if not self.wait:
+                self.stats.rejected += 1
+                raise CircuitOpenError(key, delay)
+            self.stats.delayed += 1
+            self.stats.wait_time += delay
+            return delay
+
+    def acquire_url(self, url: str) -> float:
+        """
+        Shortcut for calling :meth:`acquire` with the base ID in the given URL.
+        """
+        return self.acquire(base_id_from_url(url))
+
+    def record(self, key: str | None, success: bool) -> None:
+        """
+        Record the outcome of a request that was allowed through by :meth:`acquire`.
+
+        Args:
+            key: The base ID the request was sent to, or ``None``.
+            success: ``False`` if the request failed because the API
+                was overloaded or unavailable; otherwise ``True``.
+        """
+        if key is None:
+            return
+        with self._lock:
+            if success:
+                self._circuits.pop(key, None)
+                return
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.probing or circuit.failures >= self.threshold:
+                if circuit.open_until is None or circuit.probing:
+                    self.stats.opened += 1
+                circuit.open_until = time.monotonic() + self.cooldown
+                circuit.probing = False
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerStats",
+    "CircuitState",
+    "is_failure",
+]
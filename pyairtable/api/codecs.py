@@ -0,0 +1,187 @@
+"""
+pyAirtable encodes request payloads and decodes API responses using a
+:class:`JSONCodec`. By default, it will use `msgspec <https://jcristharif.com/msgspec/>`__
+if it is installed, since it is considerably faster than the standard library's
+:mod:`json` module when reading large pages of records, and decodes JSON into
+exactly the same Python objects.
+
+`orjson <https://github.com/ijl/orjson>`__ is also supported, but must be selected
+explicitly, because it decodes integers too large for 64 bits as floats
+(and cannot encode them at all).
+
+Every codec encodes exactly the same values as the standard library: orjson and msgspec
+would otherwise convert values such as ``datetime``, ``Decimal``, or ``set`` into strings
+or arrays, and ``NaN`` or infinity into ``null`` (which would clear the field). Instead,
+they raise ``TypeError`` or ``ValueError``, just like :func:`json.dumps`.
+
+    >>> from pyairtable import Api
+    >>> Api("auth_token").json_codec
+    <MsgspecCodec>
+    >>> Api("auth_token", json_codec="json").json_codec
+    <StdlibCodec>
+"""
+
+import json
+import math
+from collections.abc import Callable
+from typing import Any
+
+from typing_extensions import Protocol
+
+
+class JSONCodec(Protocol):
+    """
+    Interface for objects which can encode and decode JSON.
+    Implementations must raise ``TypeError`` for values they cannot encode
+    and ``ValueError`` for invalid JSON.
+    """
+
+    #: The name used to select this codec via ``Api(json_codec=...)``.
+    name: str
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode the given object as UTF-8 JSON.
+        """
+
+    def loads(self, data: bytes | str) -> Any:
+        """
+        Decode the given JSON document.
+        """
+
+
+class _Codec:
+    name = ""
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}>"
+
+
+class StdlibCodec(_Codec):
+    """
+    Uses the standard library's :mod:`json` module,
+    encoding payloads in the same way as ``requests``.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(_Codec):
+    """
+    Uses `orjson <https://github.com/ijl/orjson>`__.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        # The standard library converts int/float/bool keys to strings.
+        _check_encodable(obj)
+        data: bytes = self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+        return data
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(_Codec):
+    """
+    Uses `msgspec <https://jcristharif.com/msgspec/>`__.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        _check_encodable(obj)
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+#: Codecs which can be selected by name.
+CODECS: dict[str, Callable[[], JSONCodec]] = {
+    MsgspecCodec.name: MsgspecCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    StdlibCodec.name: StdlibCodec,
+}
+
+
+def get_codec(codec: "str | JSONCodec | None" = None) -> JSONCodec:
+    """
+    Return a :class:`JSONCodec` instance.
+
+    Args:
+        codec: The name of a codec (``"msgspec"``, ``"orjson"``, or ``"json"``),
+            or an object implementing :class:`JSONCodec`. If ``None``, returns
+            :class:`MsgspecCodec` if msgspec is installed, or :class:`StdlibCodec`.
+
+    Raises:
+        ImportError: If the requested codec's library is not installed.
+        ValueError: If the codec name is not recognized.
+    """
+    if isinstance(codec, str):
+        try:
+            return CODECS[codec]()
+        except KeyError:
+            raise ValueError(f"unknown JSON codec {codec!r}") from None
+    if codec is not None:
+        return codec
+    try:
+        return MsgspecCodec()
+    except ImportError:
+        return StdlibCodec()
+
+
+#: The types of dict keys which the standard library will convert to strings.
+_KEY_TYPES = (str, int, float, type(None))
+
+
+def _check_encodable(obj: Any) -> None:
+    """
+    Raise ``TypeError`` if ``obj`` contains anything that :func:`json.dumps`
+    cannot encode, or ``ValueError`` if it contains ``NaN`` or infinity.
+    """
+    if isinstance(obj, (str, int)) or obj is None:
+        return
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            raise ValueError(f"Out of range float values are not JSON compliant: {obj}")
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            if not isinstance(key, _KEY_TYPES):
+                raise TypeError(
+                    f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+                )
+            _check_encodable(value)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _check_encodable(value)
+    else:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+__all__ = [
+    "CODECS",
+    "JSONCodec",
+    "MsgspecCodec",
+    "OrjsonCodec",
+    "StdlibCodec",
+    "get_codec",
+]
@@ -0,0 +1,298 @@
+"""
+:meth:`Table.to_arrow <pyairtable.Table.to_arrow>` retrieves every matching record
+into a `pyarrow.Table`_, and :meth:`Table.to_pandas <pyairtable.Table.to_pandas>`
+converts that into a pandas ``DataFrame``. Both require optional libraries:
+
+.. code-block:: shell
+
+    $ pip install 'pyairtable[arrow]'   # pyarrow only
+    $ pip install 'pyairtable[pandas]'  # pyarrow and pandas
+
+Each page of records is converted into Arrow arrays as soon as it is retrieved,
+so the records for the whole table are never held in memory as Python objects,
+and (when using ``prefetch=``) the next page is retrieved while the previous one
+is converted.
+
+    >>> table.to_arrow(fields=["Name", "Age", "Tags"])
+    pyarrow.Table
+    id: string
+    Name: string
+    Age: double
+    Tags: list<item: string>
+    ...
+
+The first column always contains record IDs, followed by one column per field,
+in the order they appear in the table's schema (or in ``fields=``, if provided).
+Each column's type is chosen from the field's type (see :data:`ARROW_TYPES`), so this
+requires permission to read the base's schema. Number fields with no decimal places
+are stored as ``int64``. Formula, rollup, and lookup fields use the type of their
+result. Values of any other type (such as attachments or collaborators) are stored
+as JSON strings, and values which cannot be converted to their column's type (such
+as a formula which returns an error) are stored as nulls.
+
+If ``cell_format="string"`` is provided, every column contains strings.
+
+.. _pyarrow.Table: https://arrow.apache.org/docs/python/generated/pyarrow.Table.html
+"""
+
+import sys
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from pyairtable.api.codecs import JSONCodec
+from pyairtable.api.types import RecordDict
+from pyairtable.models.schema import FieldSchema
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    print(
+        "You are missing the 'pyarrow' library, which means you did not install\n"
+        "the optional dependencies required for exporting records to Arrow or pandas.\n"
+        "Try again after running:\n\n"
+        "   % pip install 'pyairtable[arrow]'",
+        "\n",
+        file=sys.stderr,
+    )
+    raise
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas
+
+    from pyairtable.api.table import Table
+
+
+#: Field types whose values are stored in their own Arrow type,
+#: rather than as JSON strings.
+ARROW_TYPES: dict[str, "pa.DataType"] = {
+    "autoNumber": pa.int64(),
+    "checkbox": pa.bool_(),
+    "count": pa.int64(),
+    "createdTime": pa.timestamp("ms", tz="UTC"),
+    "currency": pa.float64(),
+    "date": pa.date32(),
+    "dateTime": pa.timestamp("ms", tz="UTC"),
+    "duration": pa.float64(),
+    "email": pa.string(),
+    "lastModifiedTime": pa.timestamp("ms", tz="UTC"),
+    "multilineText": pa.string(),
+    "multipleRecordLinks": pa.list_(pa.string()),
+    "multipleSelects": pa.list_(pa.string()),
+    "number": pa.float64(),
+    "percent": pa.float64(),
+    "phoneNumber": pa.string(),
+    "rating": pa.int64(),
+    "richText": pa.string(),
+    "singleLineText": pa.string(),
+    "singleSelect": pa.string(),
+    "url": pa.string(),
+}
+
+
+class Column:
+    """
+    Converts the values of one field, a page at a time, into Arrow arrays.
+
+    Args:
+        key: The field's ID or name, as it appears in each record's ``fields``.
+        type: The Arrow type of the column, or ``None`` to store values as JSON strings.
+        default: The value to use for records which do not include this field.
+    """
+
+    def __init__(self, key: str, type: "pa.DataType | None", default: Any = None):
+        self.key = key
+        self.type = pa.string() if type is None else type
+        self.json = type is None
+        self.default = default
+        # Arrow will not build timestamps or dates from strings, but it will cast them.
+        self._build_type = _build_type(self.type)
+        # Arrow silently truncates floats when building integers.
+        self._integers = pa.types.is_integer(_value_type(self.type))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} key={self.key!r} type={self.type}>"
+
+    @classmethod
+    def from_field(
+        cls,
+        field: FieldSchema,
+        *,
+        use_field_ids: bool = False,
+        cell_format: str = "json",
+    ) -> "Column":
+        """
+        Build a column for the given field, based on its type.
+        """
+        key = field.id if use_field_ids else field.name
+        if cell_format == "string":
+            return cls(key, pa.string())
+        if field.type == "checkbox":
+            # The API omits checkboxes which are not checked.
+            return cls(key, pa.bool_(), default=False)
+        return cls(key, _field_type(field.type, getattr(field, "options", None)))
+
+    def convert(self, records: Iterable[RecordDict], codec: JSONCodec) -> "pa.Array":
+        """
+        Convert the value of this field in each record into an Arrow array.
+        """
+        values = [record["fields"].get(self.key, self.default) for record in records]
+        if self.json:
+            values = [None if v is None else codec.dumps(v).decode() for v in values]
+        elif self._integers:
+            values = [_whole_number(v) for v in values]
+        try:
+            array = pa.array(values, self._build_type)
+            return array if self._build_type == self.type else array.cast(self.type)
+        except pa.ArrowException:
+            return pa.array([self._convert_one(value) for value in values], self.type)
+
+    def _convert_one(self, value: Any) -> Any:
+        try:
+            return pa.scalar(value, self._build_type).cast(self.type).as_py()
+        except pa.ArrowException:
+            return None
+
+
+class TableBuilder:
+    """
+    Collects pages of records as Arrow arrays, with one column for the record ID
+    and one for each of the given columns, until :meth:`build` is called.
+    """
+
+    def __init__(self, columns: list[Column], codec: JSONCodec):
+        self.columns = columns
+        self.codec = codec
+        self.schema = pa.schema(
+            [("id", pa.string()), *((column.key, column.type) for column in columns)]
+        )
+        self.num_rows = 0
+        self._chunks: list[list[pa.Array]] = [[] for _ in self.schema]
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} columns={len(self.columns)}"
+            f" num_rows={self.num_rows}>"
+        )
+
+    @classmethod
+    def for_table(cls, table: "Table", **options: Any) -> "TableBuilder":
+        """
+        Build columns for the fields in the table's schema (or those in ``fields=``),
+        named and typed according to the same options as
+        :meth:`Table.iterate <pyairtable.Table.iterate>`.
+        """
+        schema = table.schema()
+        fields = options.get("fields")
+        columns = [
+            Column.from_field(
+                field,
+                use_field_ids=options.get("use_field_ids", table.api.use_field_ids),
+                cell_format=options.get("cell_format") or "json",
+            )
+            for field in (
+                [schema.field(f) for f in fields] if fields else schema.fields
+            )
+        ]
+        return cls(columns, table.api.json_codec)
+
+    def append(self, records: list[RecordDict]) -> None:
+        """
+        Convert a page of records into Arrow arrays.
+        """
+        self._chunks[0].append(pa.array([r["id"] for r in records], pa.string()))
+        for column, chunks in zip(self.columns, self._chunks[1:]):
+            chunks.append(column.convert(records, self.codec))
+        self.num_rows += len(records)
+
+    def build(self) -> "pa.Table":
+        """
+        Return every record appended so far as a ``pyarrow.Table``,
+        and start collecting records again from scratch.
+        """
+        arrays = [
+            pa.chunked_array(chunks, field.type)
+            for field, chunks in zip(self.schema, self._chunks)
+        ]
+        self._chunks = [[] for _ in self.schema]
+        self.num_rows = 0
+        return pa.Table.from_arrays(arrays, schema=self.schema)
+
+
+def to_arrow(table: "Table", **options: Any) -> "pa.Table":
+    """
+    Retrieve all matching records from the table into a ``pyarrow.Table``.
+    See :meth:`Table.to_arrow <pyairtable.Table.to_arrow>`.
+    """
+    builder = TableBuilder.for_table(table, **options)
+    for page in table.iterate(stream=False, raw=False, **options):
+        builder.append(page)
+    return builder.build()
+
+
+def to_pandas(arrow: "pa.Table") -> "pandas.DataFrame":
+    """
+    Convert the result of :func:`to_arrow` into a pandas ``DataFrame``
+    whose index is the record ID.
+    """
+    return arrow.to_pandas().set_index("id")
+
+
+def _field_type(field_type: str, options: Any) -> "pa.DataType | None":
+    """
+    Return the Arrow type for values of the given field type,
+    or ``None`` if they should be stored as JSON strings.
+    """
+    if field_type in ("formula", "rollup", "multipleLookupValues"):
+        result = getattr(options, "result", None)
+        result_type = _field_type(result.type, None) if result else None
+        if field_type != "multipleLookupValues" or result_type is None:
+            return result_type
+        if pa.types.is_list(result_type):
+            return None
+        return pa.list_(result_type)
+    if field_type == "number" and getattr(options, "precision", None) == 0:
+        # Airtable only stores whole numbers in these fields.
+        return pa.int64()
+    return ARROW_TYPES.get(field_type)
+
+
+def _build_type(arrow_type: "pa.DataType") -> "pa.DataType":
+    """
+    Return the type to build arrays in, before casting them to ``arrow_type``.
+    """
+    if pa.types.is_list(arrow_type):
+        return pa.list_(_build_type(arrow_type.value_type))
+    if pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+        return pa.string()
+    return arrow_type
+
+
+def _value_type(arrow_type: "pa.DataType") -> "pa.DataType":
+    """
+    Return the type of the items in a list type, or the type itself otherwise.
+    """
+    if pa.types.is_list(arrow_type):
+        return _value_type(arrow_type.value_type)
+    return arrow_type
+
+
+def _whole_number(value: Any) -> Any:
+    """
+    Convert floats (including those in a list) which are whole numbers into ints,
+    and replace any other floats with ``None``, so that Arrow does not truncate them.
+    Integers are left alone, so they are stored exactly no matter how large they are.
+    """
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    if isinstance(value, list):
+        return [_whole_number(v) for v in value]
+    return value
+
+
+__all__ = [
+    "ARROW_TYPES",
+    "Column",
+    "TableBuilder",
+    "to_arrow",
+    "to_pandas",
+]
@@ -0,0 +1,223 @@
+"""
+:meth:`Webhook.payloads <pyairtable.models.Webhook.payloads>` retrieves payloads from
+one webhook, one page at a time, and parses each of them into a
+:class:`~pyairtable.models.WebhookPayload`. Applications which receive notifications
+from many webhooks, or which need to keep up with bulk edits, can use a
+:class:`WebhookConsumer` instead. It retrieves payloads from several webhooks at
+once, passes each page of payloads to a handler function, and saves each webhook's
+cursor after the handler returns, so that a restarted process resumes where
+the previous one stopped:
+
+    >>> from pyairtable.api.consumer import FileCursorStore, WebhookConsumer
+    >>> def handle(webhook, payloads):
+    ...     for payload in payloads:
+    ...         ...
+    ...
+    >>> consumer = WebhookConsumer(
+    ...     base.webhooks(),
+    ...     handle,
+    ...     cursors=FileCursorStore("cursors.json"),
+    ... )
+    >>> consumer.drain()
+    1234
+
+While the handler processes one page, the next page for the same webhook is
+retrieved in the background, but no further (so a slow handler will slow down
+retrieval, rather than letting unprocessed payloads pile up in memory).
+If the handler raises an exception, the cursor is not saved, and the same
+payloads will be passed to the handler again by the next call to :meth:`~WebhookConsumer.drain`.
+
+Handlers which only need a few values from each payload (such as record IDs)
+can pass ``raw=True`` to receive each payload as a ``dict`` with the same structure
+as the API response, which avoids the cost of building nested models. Each ``dict``
+also has a ``cursor`` key (which the API response does not include), with the same
+value as :attr:`WebhookPayload.cursor <pyairtable.models.WebhookPayload.cursor>`:
+
+    >>> def handle(webhook, payloads):
+    ...     for payload in payloads:
+    ...         for table_id, changes in payload.get("changedTablesById", {}).items():
+    ...             refresh(table_id, changes.get("changedRecordsById", {}))
+    ...
+    >>> WebhookConsumer(webhooks, handle, raw=True).drain()
+"""
+
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from pyairtable.api import tracing
+from pyairtable.models.webhook import Webhook, WebhookPayload
+from pyairtable.utils import prefetched
+
+#: A function which receives a webhook and a list of its payloads.
+#: Payloads are instances of :class:`~pyairtable.models.WebhookPayload`,
+#: or ``dict`` if the consumer was created with ``raw=True``.
+Handler = Callable[[Webhook, list[Any]], None]
+
+
+class CursorStore:
+    """
+    Stores the cursor of the next payload to retrieve for each webhook, in memory.
+    Subclasses can override :meth:`get` and :meth:`set` to store cursors elsewhere.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cursors: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}>"
+
+    def get(self, webhook_id: str) -> int | None:
+        """
+        Return the saved cursor for the given webhook, or ``None`` if there is none.
+        """
+        with self._lock:
+            return self._cursors.get(webhook_id)
+
+    def set(self, webhook_id: str, cursor: int) -> None:
+        """
+        Save the cursor for the given webhook.
+        """
+        with self._lock:
+            self._cursors[webhook_id] = cursor
+
+
+class FileCursorStore(CursorStore):
+    """
+    Stores cursors for every webhook in a single JSON file,
+    which is replaced atomically each time a cursor changes.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        super().__init__()
+        self.path = Path(path)
+        try:
+            self._cursors = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={str(self.path)!r}>"
+
+    def set(self, webhook_id: str, cursor: int) -> None:
+        with self._lock:
+            cursors = {**self._cursors, webhook_id: cursor}
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                    json.dump(cursors, fp)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            self._cursors = cursors
+
+
+class WebhookConsumer:
+    """
+    Retrieves payloads from several webhooks concurrently, passes them to a
+    handler one page at a time, and saves each webhook's cursor after each page.
+    See :mod:`pyairtable.api.consumer`.
+
+    Args:
+        webhooks: The webhooks to retrieve payloads from.
+        handler: Called with each webhook and a list of up to 50 of its payloads.
+            Calls for the same webhook are made in order, one at a time, but calls for
+            different webhooks may be made at the same time from different threads.
+        cursors: Where to save each webhook's cursor. Defaults to an in-memory
+            :class:`CursorStore`. Webhooks with no saved cursor start from their first payload.
+        raw: If ``True``, payloads are passed to the handler as ``dict``
+            instead of :class:`~pyairtable.models.WebhookPayload`,
+            with an added ``cursor`` key.
+        max_workers: The maximum number of webhooks to retrieve payloads from at once.
+            Defaults to the number of webhooks.
+    """
+
+    def __init__(
+        self,
+        webhooks: Iterable[Webhook],
+        handler: Handler,
+        *,
+        cursors: CursorStore | None = None,
+        raw: bool = False,
+        max_workers: int | None = None,
+    ):
+        self.webhooks = list(webhooks)
+        self.handler = handler
+        self.cursors = CursorStore() if cursors is None else cursors
+        self.raw = raw
+        self.max_workers = max_workers or max(1, len(self.webhooks))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} webhooks={len(self.webhooks)}>"
+
+    @tracing.traced("WebhookConsumer.drain")
+    def drain(self) -> int:
+        """
+        Retrieve and handle all new payloads for each webhook,
+        and return the number of payloads handled.
+
+        If the handler (or a request) fails for any webhook, the other webhooks
+        will still be drained, and then the first exception will be raised.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(tracing.bind(self._drain), webhook)
+                for webhook in self.webhooks
+            ]
+        count = 0
+        errors = []
+        for future in futures:
+            try:
+                count += future.result()
+            except Exception as exc:
+                errors.append(exc)
+        if errors:
+            raise errors[0]
+        return count
+
+    def _drain(self, webhook: Webhook) -> int:
+        cursor = self.cursors.get(webhook.id) or 1
+        count = 0
+        # Retrieve the next page while the handler processes this one, but no
+        # further; closing the generator stops the background thread promptly
+        # if the handler raises an exception.
+        with closing(prefetched(webhook._pages(cursor), 1)) as pages:
+            for page in pages:
+                if not (payloads := page["payloads"]):
+                    break
+                self.handler(webhook, self._parse(webhook, payloads, cursor))
+                cursor = page["cursor"]
+                self.cursors.set(webhook.id, cursor)
+                count += len(payloads)
+        return count
+
+    def _parse(
+        self,
+        webhook: Webhook,
+        payloads: list[dict[str, Any]],
+        cursor: int,
+    ) -> list[Any]:
+        if self.raw:
+            return [{**p, "cursor": cursor + n} for (n, p) in enumerate(payloads)]
+        parsed = []
+        for n, payload in enumerate(payloads):
+            obj = WebhookPayload.from_api(payload, webhook._api, context=webhook)
+            obj.cursor = cursor + n
+            parsed.append(obj)
+        return parsed
+
+
+__all__ = [
+    "CursorStore",
+    "FileCursorStore",
+    "Handler",
+    "WebhookConsumer",
+]
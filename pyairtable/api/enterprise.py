@@ -1,11 +1,12 @@
 from collections.abc import Iterable, Iterator, Sequence
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from functools import cached_property, partialmethod
 from typing import TYPE_CHECKING, Any, Literal
 
 import pydantic
 from typing_extensions import Self
 
+from pyairtable.api.auditlog import AuditLogExport
 from pyairtable.exceptions import InvalidParameterError, MissingRecordError
 from pyairtable.models._base import AirtableModel, rebuild_models
 from pyairtable.models.audit import AuditLogResponse
@@ -298,6 +299,8 @@ class Enterprise:
                     handle_event(event)
                 persistence["next"] = page.pagination.next
 
+        To retrieve a long period of time more quickly, see :meth:`export_audit_log`.
+
         For more information on any of the keyword parameters below, refer to the
         `audit log events <https://airtable.com/developers/web/api/audit-log-events>`__
         API documentation.
@@ -329,19 +332,16 @@ class Enterprise:
             An object representing a single page of audit log results.
         """
 
-        start_time = coerce_iso_str(start_time)
-        end_time = coerce_iso_str(end_time)
-        user_id = coerce_list_str(user_id)
-        event_type = coerce_list_str(event_type)
-        model_id = coerce_list_str(model_id)
-        category = coerce_list_str(category)
+        params = _audit_log_params(
+            start_time=start_time,
+            end_time=end_time,
+            user_id=user_id,
+            event_type=event_type,
+            model_id=model_id,
+            category=category,
+        )
         params = {
-            "startTime": start_time,
-            "endTime": end_time,
-            "originatingUserId": user_id,
-            "eventType": event_type,
-            "modelId": model_id,
-            "category": category,
+            **params,
             "pageSize": page_size,
             "sortOrder": ("ascending" if sort_asc else "descending"),
             "previous": previous,
@@ -363,6 +363,57 @@ class Enterprise:
             if page_limit is not None and count >= page_limit:
                 return
 
+    def export_audit_log(
+        self,
+        start_time: str | date | datetime | None = None,
+        end_time: str | date | datetime | None = None,
+        *,
+        window: timedelta = timedelta(days=1),
+        max_workers: int = 4,
+        user_id: str | Iterable[str] | None = None,
+        event_type: str | Iterable[str] | None = None,
+        model_id: str | Iterable[str] | None = None,
+        category: str | Iterable[str] | None = None,
+    ) -> AuditLogExport:
+        """
+        Retrieve audit log events between ``start_time`` and ``end_time`` by
+        splitting that period into windows and retrieving several windows at once.
+        See :mod:`pyairtable.api.auditlog` for details.
+
+            >>> export = enterprise.export_audit_log(start_time=date(2025, 1, 1))
+            >>> for event in export.events():
+            ...     print(event.timestamp, event.action)
+            >>> export.to_ndjson("audit-log/")
+            12345
+
+        Args:
+            start_time: Earliest timestamp to retrieve (inclusive).
+                Defaults to 180 days before ``end_time``.
+            end_time: Latest timestamp to retrieve (exclusive). Defaults to the current time,
+                or when resuming :meth:`~pyairtable.api.auditlog.AuditLogExport.to_ndjson`,
+                to the ``end_time`` of the export being resumed.
+            window: The length of time covered by each window.
+            max_workers: The maximum number of windows to retrieve at once.
+            user_id: See :meth:`audit_log`.
+            event_type: See :meth:`audit_log`.
+            model_id: See :meth:`audit_log`.
+            category: See :meth:`audit_log`.
+        """
+
+        return AuditLogExport(
+            self,
+            start_time,
+            end_time,
+            window=window,
+            max_workers=max_workers,
+            params=_audit_log_params(
+                user_id=user_id,
+                event_type=event_type,
+                model_id=model_id,
+                category=category,
+            ),
+        )
+
     def remove_user(
         self,
         user_id: str,
@@ -771,6 +822,29 @@ class Enterprise:
         return UpdateAiAllowlistResponse.from_api(response, self.api, context=self)
 
 
+def _audit_log_params(
+    *,
+    start_time: str | date | datetime | None = None,
+    end_time: str | date | datetime | None = None,
+    user_id: str | Iterable[str] | None = None,
+    event_type: str | Iterable[str] | None = None,
+    model_id: str | Iterable[str] | None = None,
+    category: str | Iterable[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Build the query parameters which filter the audit log.
+    """
+    params = {
+        "startTime": coerce_iso_str(start_time),
+        "endTime": coerce_iso_str(end_time),
+        "originatingUserId": coerce_list_str(user_id),
+        "eventType": coerce_list_str(event_type),
+        "modelId": coerce_list_str(model_id),
+        "category": coerce_list_str(category),
+    }
+    return {k: v for (k, v) in params.items() if v}
+
+
 class UserRemoved(AirtableModel):
     """
     Returned from the `Remove user from enterprise <https://airtable.com/developers/web/api/remove-user-from-enterprise>`__
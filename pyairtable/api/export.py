@@ -0,0 +1,279 @@
+"""
+:meth:`Table.all <pyairtable.Table.all>` holds every record in memory before returning
+them. :func:`export_records` instead writes each page of records to a file as soon as
+it is retrieved, so that tables of any size can be exported using a constant amount
+of memory:
+
+    >>> from pyairtable.api.export import export_records
+    >>> with open("records.csv.gz", "wb") as fp:
+    ...     export_records(table, fp, "csv", compression="gzip", view="Active")
+    ...
+    123456
+
+This is also available from the command line as ``pyairtable base ID table NAME export``.
+The following formats are supported:
+
+``"ndjson"``
+    One record per line, with the same structure as the API response.
+
+``"csv"``
+    One row per record. The header row contains ``id``, followed by each field
+    in the order of the table's schema (or of ``fields=``, if provided).
+    Strings are written as-is, and other values are written as JSON.
+
+``"parquet"``
+    One column per field, typed as described in :mod:`pyairtable.api.columnar`,
+    written in row groups of :attr:`ParquetWriter.row_group_size` records.
+    Requires the optional ``pyarrow`` library.
+
+Output can be compressed with ``"gzip"`` or ``"zstd"`` (which requires the optional
+``zstandard`` library). Parquet files use the same algorithms to compress each column.
+"""
+
+import contextlib
+import csv
+import gzip
+import io
+from collections.abc import Callable
+from typing import IO, TYPE_CHECKING, Any, cast
+
+from pyairtable.api import tracing
+from pyairtable.api.types import RecordDict
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyairtable.api.table import Table
+
+
+#: Compression algorithms supported by :func:`export_records`.
+COMPRESSIONS = ("gzip", "zstd")
+
+
+class RecordWriter:
+    """
+    Base class for writing pages of records to a binary file.
+    Subclasses override :meth:`write` and (optionally) :meth:`close`.
+
+    Args:
+        table: The table which records will be retrieved from.
+        fp: A file opened for writing in binary mode. It will not be closed.
+        compression: ``"gzip"``, ``"zstd"``, or ``None``.
+        options: The options which will be used to retrieve records.
+    """
+
+    #: The name used to select this format via :func:`export_records`.
+    name = ""
+
+    def __init__(
+        self,
+        table: "Table",
+        fp: IO[bytes],
+        *,
+        compression: str | None = None,
+        **options: Any,
+    ):
+        self.table = table
+        self.options = options
+        self._stack = contextlib.ExitStack()
+        self.fp = self._stack.enter_context(_compress(fp, compression))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}>"
+
+    def write(self, records: list[RecordDict]) -> None:
+        """
+        Write a page of records.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Write anything which is still buffered, without closing the file.
+        """
+        self._stack.close()
+
+
+class NDJSONWriter(RecordWriter):
+    """
+    Writes each record as one line of JSON.
+    """
+
+    name = "ndjson"
+
+    def write(self, records: list[RecordDict]) -> None:
+        dumps = self.table.api.json_codec.dumps
+        self.fp.write(b"".join(dumps(record) + b"\n" for record in records))
+
+
+class CSVWriter(RecordWriter):
+    """
+    Writes each record as one row of CSV, after a header row.
+    """
+
+    name = "csv"
+
+    def __init__(self, table: "Table", fp: IO[bytes], **options: Any):
+        super().__init__(table, fp, **options)
+        schema = table.schema()
+        fields = options.get("fields")
+        use_field_ids = options.get("use_field_ids", table.api.use_field_ids)
+        self.keys = [
+            field.id if use_field_ids else field.name
+            for field in (
+                [schema.field(f) for f in fields] if fields else schema.fields
+            )
+        ]
+        self._text = io.TextIOWrapper(self.fp, encoding="utf-8", newline="")
+        self._csv = csv.writer(self._text)
+        self._csv.writerow(["id", *self.keys])
+
+    def write(self, records: list[RecordDict]) -> None:
+        self._csv.writerows(
+            [
+                record["id"],
+                *(self._cell(record["fields"].get(key)) for key in self.keys),
+            ]
+            for record in records
+        )
+
+    def _cell(self, value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return value
+        return self.table.api.json_codec.dumps(value).decode()
+
+    def close(self) -> None:
+        self._text.flush()
+        self._text.detach()
+        super().close()
+
+
+class ParquetWriter(RecordWriter):
+    """
+    Writes records to a Parquet file, in row groups of :attr:`row_group_size` records.
+    Requires the optional ``pyarrow`` library.
+    """
+
+    name = "parquet"
+
+    #: The number of records to collect before writing each row group.
+    row_group_size = 10_000
+
+    def __init__(
+        self,
+        table: "Table",
+        fp: IO[bytes],
+        *,
+        compression: str | None = None,
+        **options: Any,
+    ):
+        import pyarrow.parquet
+
+        from pyairtable.api.columnar import TableBuilder
+
+        super().__init__(table, fp, **options)
+        self._builder = TableBuilder.for_table(table, **options)
+        self._writer = pyarrow.parquet.ParquetWriter(
+            self.fp,
+            self._builder.schema,
+            compression=compression or "snappy",
+        )
+
+    def write(self, records: list[RecordDict]) -> None:
+        self._builder.append(records)
+        if self._builder.num_rows >= self.row_group_size:
+            self._flush()
+
+    def close(self) -> None:
+        if self._builder.num_rows:
+            self._flush()
+        self._writer.close()
+        super().close()
+
+    def _flush(self) -> None:
+        arrow = self._builder.build()
+        self._writer.write_table(arrow, row_group_size=arrow.num_rows)
+
+
+#: Formats which can be selected by name.
+FORMATS: dict[str, type[RecordWriter]] = {
+    NDJSONWriter.name: NDJSONWriter,
+    CSVWriter.name: CSVWriter,
+    ParquetWriter.name: ParquetWriter,
+}
+
+
+@tracing.traced("export_records")
+def export_records(
+    table: "Table",
+    fp: IO[bytes],
+    format: str = "ndjson",
+    *,
+    compression: str | None = None,
+    progress: Callable[[int], None] | None = None,
+    **options: Any,
+) -> int:
+    """
+    Write every matching record in the table to a file, one page at a time,
+    and return the number of records written.
+
+    Args:
+        table: The table to retrieve records from.
+        fp: A file opened for writing in binary mode. It will not be closed.
+        format: ``"ndjson"``, ``"csv"``, or ``"parquet"``.
+        compression: ``"gzip"``, ``"zstd"``, or ``None``.
+        progress: If provided, called after each page with the number of records
+            written so far.
+        options: Any keyword arguments supported by :meth:`Table.iterate <pyairtable.Table.iterate>`,
+            except for ``stream`` and ``raw``. ``prefetch`` defaults to 1, so that the
+            next page is retrieved while the previous one is written.
+
+    Raises:
+        ValueError: If the format or compression is not recognized.
+    """
+    try:
+        writer_cls = FORMATS[format]
+    except KeyError:
+        raise ValueError(f"unknown export format {format!r}") from None
+    options.setdefault("prefetch", 1)
+    writer = writer_cls(table, fp, compression=compression, **options)
+    count = 0
+    try:
+        for page in table.iterate(stream=False, raw=False, **options):
+            writer.write(page)
+            count += len(page)
+            if progress:
+                progress(count)
+    finally:
+        writer.close()
+    return count
+
+
+def _compress(
+    fp: IO[bytes], compression: str | None
+) -> contextlib.AbstractContextManager[IO[bytes]]:
+    """
+    Return a context manager which compresses anything written to it into ``fp``,
+    and does not close ``fp`` on exit.
+    """
+    if compression is None:
+        return contextlib.nullcontext(fp)
+    if compression == "gzip":
+        return cast(IO[bytes], gzip.GzipFile(fileobj=fp, mode="wb"))
+    if compression == "zstd":
+        import zstandard
+
+        writer = zstandard.ZstdCompressor().stream_writer(fp, closefd=False)
+        return cast(IO[bytes], writer)
+    raise ValueError(f"unknown compression {compression!r}")
+
+
+__all__ = [
+    "COMPRESSIONS",
+    "CSVWriter",
+    "FORMATS",
+    "NDJSONWriter",
+    "ParquetWriter",
+    "RecordWriter",
+    "export_records",
+]
@@ -0,0 +1,494 @@
+"""
+pyAirtable can notify your code before and after each request it sends to Airtable,
+so that you can measure where time is spent (waiting for the rate limiter,
+waiting for Airtable, retrying, or decoding JSON) and which endpoints are slowest.
+
+Each :class:`~pyairtable.Api` has an :class:`EventHooks` instance which holds
+lists of callbacks. Every callback receives a :class:`RequestEvent`:
+
+    >>> api = Api("auth_token")
+    >>> api.hooks.after_response.append(lambda event: print(event))
+    >>> api.table("appLkNDICXNqxSDhG", "tblK6MZHez0ZvBChZ").get("rec1234567890abcd")
+    RequestEvent(method='GET', endpoint='{base}/{table}/{record}', status=200, ...)
+
+:class:`LatencyHistogram` is a built-in collector which reports latency percentiles
+for each endpoint:
+
+    >>> from pyairtable.api.hooks import LatencyHistogram
+    >>> histogram = LatencyHistogram()
+    >>> api.hooks.subscribe(histogram)
+    >>> table.all()
+    >>> histogram.summary()
+    {'GET {base}/{table}': LatencySummary(count=12, p50=0.213, p95=0.492, p99=0.871, max=0.871)}
+
+If no callbacks are registered (and :mod:`~pyairtable.api.tracing` is not enabled),
+pyAirtable does not measure anything.
+"""
+
+import contextlib
+import contextvars
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+from pyairtable.api import tracing
+
+Hook = Callable[["RequestEvent"], Any]
+
+#: Names of the events which :class:`EventHooks` supports.
+HOOK_NAMES = ("before_request", "after_response", "on_retry", "on_paginate")
+
+#: Placeholders for each type of ID which might appear in a URL.
+ID_PREFIXES = {
+    "app": "base",
+    "tbl": "table",
+    "rec": "record",
+    "fld": "field",
+    "viw": "view",
+    "ach": "webhook",
+    "usr": "user",
+    "wsp": "workspace",
+    "ent": "enterprise",
+    "shr": "share",
+    "pbd": "interface",
+    "ugp": "group",
+    "com": "comment",
+}
+
+_ID_RE = re.compile(r"^([a-z]{3})[a-zA-Z0-9]{14}$")
+_VERSION_RE = re.compile(r"^v\d+$")
+
+# The request being sent by the current thread or task, if any.
+_current: "contextvars.ContextVar[RequestEvent | None]" = contextvars.ContextVar(
+    "pyairtable_request", default=None
+)
+
+# The page number being retrieved by Api.iterate_requests, if any.
+_page: "contextvars.ContextVar[int | None]" = contextvars.ContextVar(
+    "pyairtable_page", default=None
+)
+
+# The index of the chunk being sent by one of the Table.batch_* methods, if any.
+_chunk: "contextvars.ContextVar[int | None]" = contextvars.ContextVar(
+    "pyairtable_chunk", default=None
+)
+
+
+@dataclass
+class Timing:
+    """
+    Breakdown of the time (in seconds) spent on a single call to the API.
+    ``requests`` does not report the time spent resolving DNS or establishing
+    a TLS connection separately, so those are included in ``send``.
+    If the response was parsed incrementally (via ``stream=``), the time spent
+    receiving its body is included in ``decode``.
+    """
+
+    #: Time spent waiting for the rate limiter or circuit breaker.
+    queued: float = 0.0
+
+    #: Time spent sending the request and receiving the response, including retries.
+    send: float = 0.0
+
+    #: The part of ``send`` which was spent waiting before retrying.
+    retry: float = 0.0
+
+    #: Time spent decoding the response body.
+    decode: float = 0.0
+
+    #: Total time from preparing the request until the response was decoded.
+    total: float = 0.0
+
+
+@dataclass
+class RequestEvent:
+    """
+    Describes a single call to the API, from the moment it is sent until
+    the response has been decoded (or an error has been raised).
+    """
+
+    #: The HTTP method of the request.
+    method: str
+
+    #: The full URL of the request.
+    url: str = field(repr=False)
+
+    #: The path of the request with any IDs or table names replaced by placeholders,
+    #: such as ``"{base}/{table}"``. See :func:`endpoint_template`.
+    endpoint: str
+
+    #: The HTTP status code of the most recent response, if any.
+    status: int | None = None
+
+    #: The number of times the request has been sent (starting at 1).
+    attempt: int = 1
+
+    #: The page number, if the request was made by :meth:`Api.iterate_requests <pyairtable.Api.iterate_requests>`.
+    page: int | None = None
+
+    #: The index of the chunk, if the request was made by one of the ``Table.batch_*`` methods.
+    chunk: int | None = None
+
+    #: The size of the request body.
+    bytes_out: int = 0
+
+    #: The size of the response body.
+    bytes_in: int = 0
+
+    #: How long each stage of the request took.
+    timing: Timing = field(default_factory=Timing)
+
+    #: The exception raised while sending the request or decoding its response, if any.
+    error: BaseException | None = None
+
+    _hooks: "EventHooks | None" = field(default=None, repr=False, compare=False)
+    _span: Any = field(default=None, repr=False, compare=False)
+    _start: float = field(default=0.0, repr=False, compare=False)
+    _received: float = field(default=0.0, repr=False, compare=False)
+
+    def received(self, response: requests.Response, stream: bool = False) -> None:
+        """
+        Record the arrival of a response. Unless ``stream=True``, the body
+        must already have been read.
+        """
+        self.status = response.status_code
+        if not stream:
+            self.bytes_in = len(response.content or b"")
+        self._received = time.perf_counter()
+        self.timing.send = self._received - self._start - self.timing.queued
+
+
+class EventHooks:
+    """
+    Lists of callbacks which will be called while sending requests to the API.
+    Exceptions raised by callbacks are not caught.
+    """
+
+    #: Called before each request is sent (but after it has been prepared).
+    before_request: list[Hook]
+
+    #: Called after each response has been decoded, or after an error was raised.
+    after_response: list[Hook]
+
+    #: Called after each failed attempt which will be retried,
+    #: if the Api uses :class:`~pyairtable.api.retrying.AdaptiveRetry`.
+    on_retry: list[Hook]
+
+    #: Called after each page retrieved by :meth:`Api.iterate_requests <pyairtable.Api.iterate_requests>`.
+    on_paginate: list[Hook]
+
+    def __init__(self) -> None:
+        self.before_request = []
+        self.after_response = []
+        self.on_retry = []
+        self.on_paginate = []
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.before_request
+            or self.after_response
+            or self.on_retry
+            or self.on_paginate
+        )
+
+    def __repr__(self) -> str:
+        counts = " ".join(f"{name}={len(getattr(self, name))}" for name in HOOK_NAMES)
+        return f"<{self.__class__.__name__} {counts}>"
+
+    def subscribe(self, collector: object) -> None:
+        """
+        Register each method of ``collector`` whose name matches one of the events
+        (such as ``after_response``) as a callback for that event.
+        """
+        for name in HOOK_NAMES:
+            if callable(method := getattr(collector, name, None)):
+                getattr(self, name).append(method)
+
+    def unsubscribe(self, collector: object) -> None:
+        """
+        Remove each callback that was registered by :meth:`subscribe`.
+        """
+        for name in HOOK_NAMES:
+            if callable(method := getattr(collector, name, None)):
+                callbacks = getattr(self, name)
+                while method in callbacks:
+                    callbacks.remove(method)
+
+    def _emit(self, name: str, event: RequestEvent) -> None:
+        for callback in getattr(self, name):
+            callback(event)
+
+    def _start(
+        self,
+        prepared: requests.PreparedRequest,
+        page: int | None = None,
+    ) -> RequestEvent:
+        """
+        Create an event for the given request and call ``before_request`` callbacks.
+        """
+        url = str(prepared.url)
+        event = RequestEvent(
+            method=str(prepared.method),
+            url=url,
+            endpoint=endpoint_template(url),
+            page=page,
+            chunk=_chunk.get(),
+            bytes_out=len(prepared.body or b""),
+            _hooks=self,
+            _start=time.perf_counter(),
+        )
+        if tracing.ENABLED:
+            event._span = tracing.start_request_span(event)
+        self._emit("before_request", event)
+        return event
+
+    def _finish(self, event: RequestEvent) -> None:
+        """
+        Complete the timing of the event and call ``after_response`` callbacks
+        (and ``on_paginate``, if it represents a page of results).
+        """
+        now = time.perf_counter()
+        if event._received:
+            event.timing.decode = now - event._received
+        else:
+            event.timing.send = now - event._start - event.timing.queued
+        event.timing.total = now - event._start
+        if event._span is not None:
+            tracing.end_request_span(event._span, event)
+        self._emit("after_response", event)
+        if event.page:
+            self._emit("on_paginate", event)
+
+
+@contextlib.contextmanager
+def observe(
+    hooks: EventHooks,
+    prepared: requests.PreparedRequest,
+    page: int | None = None,
+) -> Iterator[RequestEvent | None]:
+    """
+    Notify ``hooks`` about a request that is about to be sent, and yield the event
+    that describes it (or ``None`` if no hooks are registered and tracing is not
+    enabled; see :mod:`pyairtable.api.tracing`). The caller should
+    send the request within :func:`tracking` and then call
+    :meth:`RequestEvent.received` once it has read the response.
+
+    If ``page`` is not provided, the page number set by :func:`paginating` is used.
+    """
+    if not hooks and not tracing.ENABLED:
+        yield None
+        return
+    event = hooks._start(prepared, page or _page.get())
+    try:
+        yield event
+    except BaseException as exc:
+        event.error = exc
+        raise
+    finally:
+        hooks._finish(event)
+
+
+@contextlib.contextmanager
+def tracking(event: RequestEvent | None) -> Iterator[None]:
+    """
+    Attribute any time spent waiting or retrying within this block
+    (in the current thread or task) to the given event.
+    """
+    if event is None:
+        yield
+        return
+    token = _current.set(event)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+@contextlib.contextmanager
+def paginating(page: int) -> Iterator[None]:
+    """
+    Mark any requests sent within this block as retrieving the given page number.
+    """
+    token = _page.set(page)
+    try:
+        yield
+    finally:
+        _page.reset(token)
+
+
+@contextlib.contextmanager
+def chunking(index: int) -> Iterator[None]:
+    """
+    Mark any requests sent within this block as sending the chunk with the given index.
+    """
+    token = _chunk.set(index)
+    try:
+        yield
+    finally:
+        _chunk.reset(token)
+
+
+def current_event() -> RequestEvent | None:
+    """
+    Return the event for the request being sent by the current thread or task, if any.
+    """
+    return _current.get()
+
+
+def record_queued(seconds: float) -> None:
+    """
+    Record time spent waiting for the rate limiter or circuit breaker.
+    """
+    if event := current_event():
+        event.timing.queued += seconds
+
+
+def record_retry(status: int | None = None) -> None:
+    """
+    Record a failed attempt which will be retried, and call ``on_retry`` callbacks.
+    """
+    if not (event := _current.get()):
+        return
+    if status is not None:
+        event.status = status
+    if event._hooks:
+        event._hooks._emit("on_retry", event)
+    event.attempt += 1
+
+
+def record_retry_sleep(seconds: float) -> None:
+    """
+    Record time spent waiting before retrying a request.
+    """
+    if event := current_event():
+        event.timing.retry += seconds
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Return the path of the given API URL without its version prefix or query string,
+    and with any IDs or table names replaced by placeholders, so that requests
+    to the same endpoint can be grouped together.
+
+    >>> endpoint_template("https://api.airtable.com/v0/appLkNDICXNqxSDhG/My%20Table?view=x")
+    '{base}/{table}'
+    >>> endpoint_template("https://api.airtable.com/v0/meta/bases/appLkNDICXNqxSDhG/tables")
+    'meta/bases/{base}/tables'
+    """
+    parts = [part for part in urlsplit(url).path.split("/") if part]
+    if parts and _VERSION_RE.match(parts[0]):
+        parts = parts[1:]
+    result: list[str] = []
+    for index, part in enumerate(parts):
+        if match := _ID_RE.match(part):
+            part = "{%s}" % ID_PREFIXES.get(match.group(1), "id")
+        elif index == 1 and result[0] == "{base}":
+            part = "{table}"  # table names in record URLs
+        result.append(part)
+    return "/".join(result)
+
+
+@dataclass
+class LatencySummary:
+    """
+    Latency percentiles (in seconds) for a single endpoint.
+    """
+
+    count: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class LatencyHistogram:
+    """
+    Collects the total duration of each request, grouped by method and endpoint,
+    and reports percentiles via :meth:`summary`. Register it with :meth:`EventHooks.subscribe`.
+
+    Only the most recent ``samples`` durations are kept for each endpoint,
+    so memory use stays constant in long-running processes.
+    """
+
+    def __init__(self, samples: int = 10_000):
+        """
+        Args:
+            samples: The number of recent durations to keep for each endpoint.
+        """
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+        self.samples = samples
+        self._lock = threading.Lock()
+        self._durations: dict[str, deque[float]] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} endpoints={len(self._durations)}>"
+
+    def after_response(self, event: RequestEvent) -> None:
+        key = f"{event.method} {event.endpoint}"
+        with self._lock:
+            if (durations := self._durations.get(key)) is None:
+                durations = self._durations[key] = deque(maxlen=self.samples)
+            durations.append(event.timing.total)
+
+    def summary(self) -> dict[str, LatencySummary]:
+        """
+        Return latency percentiles for each endpoint, keyed by method and endpoint
+        (such as ``"GET {base}/{table}"``).
+        """
+        with self._lock:
+            snapshot = {
+                key: sorted(values) for (key, values) in self._durations.items()
+            }
+        return {
+            key: LatencySummary(
+                count=len(values),
+                p50=_percentile(values, 50),
+                p95=_percentile(values, 95),
+                p99=_percentile(values, 99),
+                max=values[-1],
+            )
+            for (key, values) in sorted(snapshot.items())
+        }
+
+    def clear(self) -> None:
+        """
+        Discard all recorded durations.
+        """
+        with self._lock:
+            self._durations.clear()
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    """
+    Return the given percentile of a sorted list, using the nearest-rank method.
+    """
+    rank = -(-len(values) * percent // 100)  # ceil without floats
+    return values[max(rank, 1) - 1]
+
+
+__all__ = [
+    "EventHooks",
+    "Hook",
+    "HOOK_NAMES",
+    "LatencyHistogram",
+    "LatencySummary",
+    "RequestEvent",
+    "Timing",
+    "chunking",
+    "current_event",
+    "endpoint_template",
+    "observe",
+    "paginating",
+    "record_queued",
+    "record_retry",
+    "record_retry_sleep",
+    "tracking",
+]
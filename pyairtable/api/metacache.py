@@ -0,0 +1,229 @@
+"""
+Retrieving metadata such as :meth:`Base.schema <pyairtable.Base.schema>` or
+:meth:`Api.bases <pyairtable.Api.bases>` can take several seconds for a large base,
+and pyAirtable normally only remembers it for the lifetime of each object.
+A :class:`MetadataCache` keeps the API responses for these calls, so that
+a new :class:`~pyairtable.Api` (or a new process) can reuse them until they expire.
+
+    >>> from pyairtable import Api
+    >>> from pyairtable.api.metacache import FileMetadataCache, MetadataCache
+    >>> api = Api("auth_token", metadata_cache=True)
+    >>> api = Api("auth_token", metadata_cache=FileMetadataCache("/tmp/airtable", ttl=600))
+    >>> api = Api("auth_token", metadata_cache=MetadataCache(ttl=60))
+
+Cached responses are keyed by base ID and a fingerprint of the access token
+(so that two tokens with different permissions never share metadata).
+Passing ``force=True`` to any method that retrieves metadata will bypass the cache
+and replace the cached response. Changes to a base's schema made through pyAirtable
+will discard any cached metadata for that base; changes made elsewhere will not be seen
+until the cached response expires, or until :meth:`MetadataCache.clear` is called.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+#: Matches a valid cache key, such as ``"<fingerprint>/appLkNDICXNqxSDhG"``.
+KEY_RE = re.compile(r"^[A-Za-z0-9_-]+(/[A-Za-z0-9_-]+)*$")
+
+
+@dataclass
+class MetadataCacheStats:
+    """
+    Counters describing how often a :class:`MetadataCache` was used.
+    """
+
+    #: The number of times a cached response was returned.
+    hits: int = 0
+
+    #: The number of times a response was not cached, or had expired.
+    misses: int = 0
+
+
+class MetadataCache:
+    """
+    Thread-safe cache which keeps metadata in memory. One instance can be shared
+    by several instances of :class:`~pyairtable.Api` in the same process.
+
+    Subclasses can store metadata elsewhere by overriding :meth:`_load`,
+    :meth:`_store`, :meth:`_remove`, and :meth:`_remove_all`.
+    """
+
+    #: Counters for lookups performed by this cache.
+    stats: MetadataCacheStats
+
+    def __init__(self, ttl: float | None = 3600):
+        """
+        Args:
+            ttl: The number of seconds to keep each cached response.
+                If ``None``, cached responses never expire.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than zero")
+        self.ttl = ttl
+        self.stats = MetadataCacheStats()
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} ttl={self.ttl!r}>"
+
+    def get(self, key: str) -> Any | None:
+        """
+        Return the cached value for the given key, or ``None`` if it is not cached
+        or has expired.
+        """
+        _check_key(key)
+        with self._lock:
+            entry = self._load(key)
+            if entry is not None and self._expired(entry[0]):
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value (which must be serializable as JSON) for the given key.
+        """
+        _check_key(key)
+        with self._lock:
+            self._store(key, (time.time(), value))
+
+    def delete(self, key: str) -> None:
+        """
+        Discard the cached value for the given key, if there is one.
+        """
+        _check_key(key)
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Discard all cached values.
+        """
+        with self._lock:
+            self._remove_all()
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created >= self.ttl
+
+    def _load(self, key: str) -> tuple[float, Any] | None:
+        return self._entries.get(key)
+
+    def _store(self, key: str, entry: tuple[float, Any]) -> None:
+        self._entries[key] = entry
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def _remove_all(self) -> None:
+        self._entries.clear()
+
+
+class FileMetadataCache(MetadataCache):
+    """
+    Cache which stores each response as a JSON file, so that it can be reused
+    by other processes on the same host (or by the next run of a script).
+    Files are only readable by the current user, and are replaced atomically,
+    so several processes can safely share the same directory.
+
+    Files are kept in the :attr:`subdirectory` of the given directory, and their
+    names end with :attr:`suffix`, so that :meth:`~MetadataCache.clear` will not
+    delete anything else, even if the directory is shared with other files.
+    """
+
+    #: The name of the directory (within ``directory``) which holds cached responses.
+    subdirectory = "metadata"
+
+    #: The suffix of each file which holds a cached response.
+    suffix = ".cache.json"
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        ttl: float | None = 3600,
+    ):
+        """
+        Args:
+            directory: Where to store cached responses. It will be created if it does not exist.
+                Defaults to ``$XDG_CACHE_HOME/pyairtable`` (or ``~/.cache/pyairtable``).
+            ttl: The number of seconds to keep each cached response.
+                If ``None``, cached responses never expire.
+        """
+        super().__init__(ttl=ttl)
+        self.directory = Path(directory or default_cache_dir())
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}"
+            f" directory={str(self.directory)!r}"
+            f" ttl={self.ttl!r}>"
+        )
+
+    @property
+    def _files(self) -> Path:
+        return self.directory / self.subdirectory
+
+    def _path(self, key: str) -> Path:
+        # Keys cannot contain ".", so each key has its own file in one directory.
+        return self._files / (key.replace("/", ".") + self.suffix)
+
+    def _load(self, key: str) -> tuple[float, Any] | None:
+        try:
+            with open(self._path(key), encoding="utf-8") as fp:
+                entry = json.load(fp)
+            return (float(entry["created"]), entry["value"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store(self, key: str, entry: tuple[float, Any]) -> None:
+        path = self._path(key)
+        self._files.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump({"created": entry[0], "value": entry[1]}, fp)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _remove(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _remove_all(self) -> None:
+        if not self._files.is_dir():
+            return
+        for path in self._files.glob("*" + self.suffix):
+            path.unlink(missing_ok=True)
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the directory used by :class:`FileMetadataCache` if none is provided.
+    """
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "pyairtable"
+
+
+def _check_key(key: str) -> None:
+    if not KEY_RE.match(key):
+        raise ValueError(f"invalid cache key: {key!r}")
+
+
+__all__ = [
+    "FileMetadataCache",
+    "MetadataCache",
+    "MetadataCacheStats",
+    "default_cache_dir",
+]
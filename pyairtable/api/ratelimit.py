@@ -0,0 +1,225 @@
+"""
+pyAirtable can throttle requests on the client side, so that an application
+stays below Airtable's `rate limit <https://airtable.com/developers/web/api/rate-limits>`__
+of five requests per second per base instead of relying on retrying 429 errors.
+
+    >>> from pyairtable import Api
+    >>> from pyairtable.api.ratelimit import RateLimiter
+    >>> api = Api("auth_token", rate_limit=True)
+    >>> api = Api("auth_token", rate_limit=RateLimiter(rate=4, burst=2))
+
+Applications which run several worker processes on the same host can use
+:class:`FileRateLimiter` to share one set of buckets between all of them:
+
+    >>> from pyairtable.api.ratelimit import FileRateLimiter
+    >>> api = Api("auth_token", rate_limit=FileRateLimiter("/tmp/airtable.lock"))
+"""
+
+import contextlib
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+#: Matches the base ID in any URL that refers to a specific base.
+BASE_ID_RE = re.compile(r"/(app[a-zA-Z0-9]{14})(?=[/?]|$)")
+
+
+def base_id_from_url(url: str) -> str | None:
+    """
+    Return the base ID referenced by the given API URL, or ``None``
+    if the URL does not refer to a specific base.
+
+    >>> base_id_from_url("https://api.airtable.com/v0/appLkNDICXNqxSDhG/Contacts")
+    'appLkNDICXNqxSDhG'
+    >>> base_id_from_url("https://api.airtable.com/v0/meta/whoami")
+    """
+    if match := BASE_ID_RE.search(url):
+        return match[1]
+    return None
+
+
+@dataclass
+class RateLimitStats:
+    """
+    Counters describing how much time an :class:`~pyairtable.Api`
+    has spent waiting on its rate limiter versus sending requests.
+    """
+
+    #: The number of requests that passed through the rate limiter.
+    requests: int = 0
+
+    #: The number of requests which had to wait before being sent.
+    delayed: int = 0
+
+    #: Total seconds spent waiting for the rate limiter.
+    wait_time: float = 0.0
+
+    #: Total seconds spent sending requests and waiting for responses.
+    send_time: float = 0.0
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket which limits how often requests can be sent to each base.
+
+    Each base gets its own bucket, which holds up to ``burst`` tokens and refills
+    at ``rate`` tokens per second. Rather than blocking, :meth:`reserve` claims the
+    next available token and tells the caller how long to wait before using it,
+    which allows the same limiter to be used by threads and by asyncio tasks.
+    Requests which do not refer to a specific base are not limited.
+    """
+
+    #: Counters for requests that have passed through this limiter.
+    stats: RateLimitStats
+
+    def __init__(self, rate: float = 5, burst: int = 1):
+        """
+        Args:
+            rate: The maximum sustained number of requests per second, per base.
+            burst: The number of requests that may be sent at once
+                before ``rate`` takes effect.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than zero")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.stats = RateLimitStats()
+        self._lock = threading.Lock()
+        # Maps each key to the time at which its bucket will be completely full,
+        # a.k.a. the "theoretical arrival time" of the generic cell rate algorithm.
+        self._full_at: dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} rate={self.rate!r} burst={self.burst!r}>"
+
+    @property
+    def interval(self) -> float:
+        """
+        The number of seconds it takes for one token to be replenished.
+        """
+        return 1.0 / self.rate
+
+    def reserve(self, key: str | None) -> float:
+        """
+        Claim a token for the given key and return the number of seconds
+        that the caller must wait before sending its request.
+
+        Args:
+            key: The base ID the request will be sent to, or ``None``.
+        """
+        if key is None:
+            return 0.0
+        with self._lock:
+            return self._claim(self._full_at, key, time.monotonic())
+
+    def _claim(self, state: dict[str, float], key: str, now: float) -> float:
+        """
+        Claim a token for the given key, updating ``state`` in place,
+        and return the number of seconds until the token can be used.
+        """
+        full_at = max(state.get(key, now), now)
+        state[key] = full_at + self.interval
+        return max(full_at - (self.burst - 1) * self.interval - now, 0.0)
+
+    def reserve_url(self, url: str) -> float:
+        """
+        Shortcut for calling :meth:`reserve` with the base ID in the given URL.
+        """
+        return self.reserve(base_id_from_url(url))
+
+    def record(self, waited: float, sent: float) -> None:
+        """
+        Update :attr:`stats` with the time spent on one request.
+
+        Args:
+            waited: The number of seconds spent waiting for a token.
+            sent: The number of seconds spent sending the request.
+        """
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.delayed += bool(waited)
+            self.stats.wait_time += waited
+            self.stats.send_time += sent
+
+
+def _open_or_create(path: str, flags: int) -> int:
+    return os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+
+
+class FileRateLimiter(RateLimiter):
+    """
+    Rate limiter which shares its buckets with every other process on the same host
+    that uses the same ``path``, such as the workers of a gunicorn or celery deployment.
+
+    The state of each bucket is stored in a small JSON file, which is locked with
+    ``fcntl.flock()`` for the brief moment it takes to claim a token. Each process
+    then waits for its own token, so the combined rate of all processes stays at
+    ``rate`` per base no matter how many are running. Requires a POSIX platform.
+
+    :attr:`~RateLimiter.stats` only counts requests made by the current process.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], rate: float = 5, burst: int = 1):
+        """
+        Args:
+            path: Location of the file used to coordinate between processes.
+                It will be created if it does not exist.
+            rate: The maximum sustained number of requests per second, per base.
+            burst: The number of requests that may be sent at once
+                before ``rate`` takes effect.
+        """
+        super().__init__(rate=rate, burst=burst)
+        self.path = os.fspath(path)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} path={self.path!r}"
+            f" rate={self.rate!r} burst={self.burst!r}>"
+        )
+
+    def reserve(self, key: str | None) -> float:
+        if key is None:
+            return 0.0
+        with self._lock, self._shared_state() as state:
+            # time.time() is used because it is comparable across processes.
+            return self._claim(state, key, time.time())
+
+    @contextlib.contextmanager
+    def _shared_state(self) -> Iterator[dict[str, float]]:
+        """
+        Lock the shared file and yield its contents, then write back any changes.
+        Buckets which have completely refilled are discarded.
+        """
+        import fcntl  # not available on Windows
+
+        with open(self.path, "r+", encoding="utf-8", opener=_open_or_create) as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            try:
+                fp.seek(0)
+                try:
+                    state = dict(json.loads(fp.read() or "{}"))
+                except ValueError:
+                    state = {}
+                yield state
+                now = time.time()
+                state = {k: v for (k, v) in state.items() if v > now}
+                fp.seek(0)
+                fp.truncate()
+                fp.write(json.dumps(state))
+                fp.flush()
+            finally:
+                fcntl.flock(fp, fcntl.LOCK_UN)
+
+
+__all__ = [
+    "FileRateLimiter",
+    "RateLimitStats",
+    "RateLimiter",
+    "base_id_from_url",
+]
@@ -0,0 +1,380 @@
+"""
+Applications which look up records in the same few tables many times per second
+can keep a local copy of each table in a SQLite database, and answer those lookups
+without sending any requests. A :class:`TableReplica` copies every record in a table
+(using the table's schema to choose column types), then applies changes from a
+:class:`~pyairtable.models.Webhook` as they happen:
+
+    >>> from pyairtable.api.replica import TableReplica
+    >>> table = api.table("appLkNDICXNqxSDhG", "tblK6MZHez0ZvBChZ")
+    >>> webhook = table.base.webhook("achYDhQqbHMm7kDe4")
+    >>> replica = TableReplica(table, "reference.db")
+    >>> replica.bootstrap(webhook)
+    >>> replica.first({"SKU": "A-100"})
+    {'id': 'recwPQIfs4wKPyc9D', 'createdTime': '...', 'fields': {'SKU': 'A-100', ...}}
+
+Each time the webhook sends a notification (or on a schedule), call :meth:`TableReplica.sync`
+to apply any new payloads. The webhook's cursor is stored in the same database,
+so a replica can be reopened by another process and brought up to date:
+
+    >>> replica = TableReplica(table, "reference.db")
+    >>> replica.sync(webhook)
+    3
+
+The webhook must include cell values for every field in the table;
+:meth:`TableReplica.webhook_spec` returns a suitable specification
+for :meth:`Base.add_webhook <pyairtable.Base.add_webhook>`.
+If a field is changed in a way that affects how its values are stored,
+:meth:`~TableReplica.sync` will copy the whole table again.
+"""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pyairtable.api.types import FieldName, RecordDict, RecordId
+from pyairtable.models.webhook import Webhook, WebhookPayload
+from pyairtable.utils import datetime_to_iso_str
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyairtable.api.table import Table
+
+
+#: Field types whose values are stored in their own SQLite type, rather than as JSON.
+#: Numbers use ``NUMERIC`` affinity, which stores whole numbers as integers,
+#: so that values read back with the same Python type Airtable returned.
+SCALAR_TYPES: dict[str, str] = {
+    "autoNumber": "INTEGER",
+    "checkbox": "INTEGER",
+    "count": "INTEGER",
+    "createdTime": "TEXT",
+    "currency": "NUMERIC",
+    "date": "TEXT",
+    "dateTime": "TEXT",
+    "duration": "NUMERIC",
+    "email": "TEXT",
+    "lastModifiedTime": "TEXT",
+    "multilineText": "TEXT",
+    "number": "NUMERIC",
+    "percent": "NUMERIC",
+    "phoneNumber": "TEXT",
+    "rating": "INTEGER",
+    "richText": "TEXT",
+    "singleLineText": "TEXT",
+    "singleSelect": "TEXT",
+    "url": "TEXT",
+}
+
+_META_TABLE = "_pyairtable_replicas"
+
+
+class TableReplica:
+    """
+    A copy of one Airtable table in a local SQLite database.
+    See :mod:`pyairtable.api.replica`.
+
+    Instances can be shared between threads.
+
+    Args:
+        table: The table to copy.
+        path: The SQLite database to store records in. Several tables can be
+            stored in the same database. Defaults to an in-memory database.
+    """
+
+    table: "Table"
+
+    def __init__(self, table: "Table", path: str | Path = ":memory:"):
+        self.table = table
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {_META_TABLE}"
+            " (table_id TEXT PRIMARY KEY, cursor INTEGER, fields TEXT)"
+        )
+        self._cursor = 0
+        self._fields: dict[str, tuple[FieldName, str]] = {}
+        row = self._conn.execute(
+            f"SELECT cursor, fields FROM {_META_TABLE} WHERE table_id = ?",
+            [self.table.id],
+        ).fetchone()
+        if row:
+            self._cursor = row[0]
+            self._fields = {k: (v[0], v[1]) for (k, v) in json.loads(row[1]).items()}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} table={self.table.id!r} path={str(self.path)!r}>"
+
+    @staticmethod
+    def webhook_spec(table_id: str) -> dict[str, Any]:
+        """
+        Build a webhook specification which will send every change
+        a replica of the given table needs.
+        """
+        return {
+            "options": {
+                "filters": {
+                    "dataTypes": ["tableData", "tableFields"],
+                    "recordChangeScope": table_id,
+                },
+                "includes": {"includeCellValuesInFieldIds": "all"},
+            }
+        }
+
+    @property
+    def cursor(self) -> int:
+        """
+        The cursor of the next webhook payload to apply, or 0 if the
+        replica has not been bootstrapped.
+        """
+        return self._cursor
+
+    def bootstrap(self, webhook: Webhook) -> None:
+        """
+        Copy every record in the table into the database, replacing any previous copy,
+        and start applying payloads from the webhook's current cursor.
+        """
+        # Retrieve the cursor before the records, so that any changes made while
+        # retrieving records will be applied (again) by the next call to sync().
+        base = self.table.base
+        cursor = base.webhook(webhook.id).cursor_for_next_payload
+        schema = self.table.schema(force=True)
+        fields = {f.id: (f.name, f.type) for f in schema.fields}
+        records = [
+            record for page in self.table.iterate(use_field_ids=True) for record in page
+        ]
+        with self._lock, self._conn:
+            indexes = [
+                [info[2] for info in self._conn.execute(f'PRAGMA index_info("{name}")')]
+                for (_, name, _, origin, *_) in self._conn.execute(
+                    f"PRAGMA index_list({self._name})"
+                )
+                if origin == "c"
+            ]
+            self._fields = fields
+            self._conn.execute(f"DROP TABLE IF EXISTS {self._name}")
+            columns = "".join(
+                f", {self._column(field_id)}" for field_id in self._fields
+            )
+            self._conn.execute(
+                f"CREATE TABLE {self._name}"
+                f" (id TEXT PRIMARY KEY, created_time TEXT{columns})"
+            )
+            for record in records:
+                self._upsert(record["id"], record["fields"], record["createdTime"])
+            for field_ids in indexes:
+                if set(field_ids).issubset(self._fields):
+                    self._create_index(field_ids)
+            self._save(cursor)
+
+    def sync(self, webhook: Webhook) -> int:
+        """
+        Apply any webhook payloads which have not yet been applied,
+        and return the number of payloads applied.
+
+        Raises:
+            RuntimeError: If the replica has not been bootstrapped.
+        """
+        if not self._cursor:
+            raise RuntimeError("bootstrap() must be called before sync()")
+        count = 0
+        refresh = False
+        for payload in webhook.payloads(cursor=self._cursor):
+            assert payload.cursor is not None
+            with self._lock, self._conn:
+                refresh = self._apply(payload) or refresh
+                self._save(payload.cursor + 1)
+            count += 1
+        if refresh:
+            self.bootstrap(webhook)
+        return count
+
+    def get(self, record_id: RecordId) -> RecordDict | None:
+        """
+        Retrieve a record from the database, or ``None`` if it does not exist.
+        """
+        rows = self._select("WHERE id = ?", [record_id])
+        return rows[0] if rows else None
+
+    def all(self, match: dict[FieldName, Any] | None = None) -> list[RecordDict]:
+        """
+        Retrieve all records from the database whose fields are equal to
+        the values in ``match``.
+
+        >>> replica.all({"Status": "Active", "Region": "EU"})
+        [{'id': ..., 'createdTime': ..., 'fields': {...}}, ...]
+        """
+        clauses, params = [], []
+        for name, value in (match or {}).items():
+            field_id = self._field_id(name)
+            if value is None:
+                clauses.append(f'"{field_id}" IS NULL')
+            else:
+                clauses.append(f'"{field_id}" = ?')
+                params.append(self._encode(field_id, value))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._select(where, params)
+
+    def first(self, match: dict[FieldName, Any]) -> RecordDict | None:
+        """
+        Retrieve one record from the database whose fields are equal to
+        the values in ``match``, or ``None`` if there are none.
+        """
+        records = self.all(match)
+        return records[0] if records else None
+
+    def create_index(self, *fields: FieldName) -> None:
+        """
+        Add an index on the given fields, to speed up calls to :meth:`all` or :meth:`first`
+        which match on those fields. Indexes are kept when the table is bootstrapped again.
+        """
+        field_ids = [self._field_id(name) for name in fields]
+        with self._lock, self._conn:
+            self._create_index(field_ids)
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+    @property
+    def _name(self) -> str:
+        return f'"{self.table.id}"'
+
+    def _column(self, field_id: str) -> str:
+        return f'"{field_id}" {SCALAR_TYPES.get(self._fields[field_id][1], "TEXT")}'
+
+    def _field_id(self, name: FieldName) -> str:
+        if name in self._fields:
+            return name
+        for field_id, (field_name, _) in self._fields.items():
+            if field_name == name:
+                return field_id
+        raise KeyError(name)
+
+    def _create_index(self, field_ids: list[str]) -> None:
+        name = "_".join(["idx", self.table.id, *field_ids])
+        columns = ", ".join(f'"{field_id}"' for field_id in field_ids)
+        self._conn.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON {self._name} ({columns})'
+        )
+
+    def _encode(self, field_id: str, value: Any) -> Any:
+        if value is None or self._fields[field_id][1] in SCALAR_TYPES:
+            return value
+        return json.dumps(value)
+
+    def _decode(self, field_id: str, value: Any) -> Any:
+        field_type = self._fields[field_id][1]
+        if field_type == "checkbox":
+            return bool(value)
+        if field_type in SCALAR_TYPES:
+            return value
+        return json.loads(value)
+
+    def _select(self, where: str, params: list[Any]) -> list[RecordDict]:
+        field_ids = list(self._fields)
+        columns = "".join(f', "{field_id}"' for field_id in field_ids)
+        use_field_ids = self.table.api.use_field_ids
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, created_time{columns} FROM {self._name} {where}",
+                params,
+            ).fetchall()
+        records: list[RecordDict] = []
+        for record_id, created_time, *values in rows:
+            fields = {
+                (field_id if use_field_ids else self._fields[field_id][0]): (
+                    self._decode(field_id, value)
+                )
+                for (field_id, value) in zip(field_ids, values)
+                if value is not None
+            }
+            records.append(
+                {"id": record_id, "createdTime": created_time, "fields": fields}
+            )
+        return records
+
+    def _upsert(
+        self,
+        record_id: RecordId,
+        cells: dict[str, Any],
+        created_time: str | None = None,
+    ) -> None:
+        names = ["id", *(k for k in cells if k in self._fields)]
+        values = [record_id, *(self._encode(k, cells[k]) for k in names[1:])]
+        if created_time:
+            names.append("created_time")
+            values.append(created_time)
+        columns = ", ".join(f'"{name}"' for name in names)
+        updates = ", ".join(f'"{name}" = excluded."{name}"' for name in names[1:])
+        self._conn.execute(
+            f"INSERT INTO {self._name} ({columns})"
+            f" VALUES ({', '.join('?' for _ in names)})"
+            f" ON CONFLICT(id) DO {f'UPDATE SET {updates}' if updates else 'NOTHING'}",
+            values,
+        )
+
+    def _apply(self, payload: WebhookPayload) -> bool:
+        """
+        Apply one payload to the database. Returns ``True`` if the payload
+        changed the table's fields in a way that requires copying the table again.
+        """
+        if self.table.id in payload.destroyed_table_ids:
+            self._conn.execute(f"DELETE FROM {self._name}")
+            return False
+        if not (changes := payload.changed_tables_by_id.get(self.table.id)):
+            return False
+
+        refresh = False
+        for field_id, info in changes.created_fields_by_id.items():
+            self._fields[field_id] = (info.name or field_id, info.type or "")
+            self._conn.execute(
+                f"ALTER TABLE {self._name} ADD COLUMN {self._column(field_id)}"
+            )
+        for field_id, field_changed in changes.changed_fields_by_id.items():
+            if field_id not in self._fields:
+                continue
+            name, old_type = self._fields[field_id]
+            new_type = field_changed.current.type or old_type
+            self._fields[field_id] = (field_changed.current.name or name, new_type)
+            if SCALAR_TYPES.get(new_type) != SCALAR_TYPES.get(old_type):
+                refresh = True
+        for field_id in changes.destroyed_field_ids:
+            if self._fields.pop(field_id, None):
+                self._conn.execute(f'UPDATE {self._name} SET "{field_id}" = NULL')
+
+        for record_id, created in changes.created_records_by_id.items():
+            self._upsert(
+                record_id,
+                created.cell_values_by_field_id,
+                datetime_to_iso_str(created.created_time),
+            )
+        for record_id, changed in changes.changed_records_by_id.items():
+            self._upsert(record_id, changed.current.cell_values_by_field_id)
+        self._delete(changes.destroyed_record_ids)
+        return refresh
+
+    def _delete(self, record_ids: Iterable[RecordId]) -> None:
+        self._conn.executemany(
+            f"DELETE FROM {self._name} WHERE id = ?",
+            [[record_id] for record_id in record_ids],
+        )
+
+    def _save(self, cursor: int) -> None:
+        self._cursor = cursor
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO {_META_TABLE} VALUES (?, ?, ?)",
+            [self.table.id, cursor, json.dumps(self._fields)],
+        )
+
+
+__all__ = [
+    "SCALAR_TYPES",
+    "TableReplica",
+]
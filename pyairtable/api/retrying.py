@@ -1,23 +1,126 @@
+import random
+import threading
+import time
 from collections.abc import Collection
+from dataclasses import dataclass, field
+from itertools import takewhile
 from typing import Any
 
 from requests import Session
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from pyairtable.api import hooks
+
 DEFAULT_RETRIABLE_STATUS_CODES = (429,)
-DEFAULT_BACKOFF_FACTOR = 0.1  # retry after 0.1, 0.2, 0.4, 0.8, 1.6 seconds
+DEFAULT_BACKOFF_FACTOR = 0.1  # retry after 0.2, 0.4, 0.8, 1.6, 3.2 seconds (at most)
 DEFAULT_MAX_RETRIES = 5
 
 
+@dataclass
+class RetryStats:
+    """
+    Counters describing how often an :class:`AdaptiveRetry` strategy has retried
+    requests, and how long it spent waiting between attempts.
+    """
+
+    #: The number of times a request was retried.
+    retries: int = 0
+
+    #: Total seconds spent waiting before retrying requests.
+    sleep_time: float = 0.0
+
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock,
+        repr=False,
+        compare=False,
+    )
+
+    def record(self, retries: int = 0, sleep_time: float = 0.0) -> None:
+        with self._lock:
+            self.retries += retries
+            self.sleep_time += sleep_time
+
+
+class AdaptiveRetry(Retry):
+    """
+    A `Retry`_ strategy which adds "full jitter" to its exponential backoff,
+    and records :class:`RetryStats`.
+
+    Without jitter, every client which receives a 429 error at the same moment
+    will retry at the same moment, and is likely to be rate limited again. With jitter,
+    each retry waits a random amount of time between zero and
+    ``backoff_factor * (2 ** retry_count)`` seconds (up to ``backoff_max``),
+    which spreads retries out while keeping the same average delay.
+    If the response has a ``Retry-After`` header, it is always respected instead.
+
+    Use :func:`retry_strategy` to create an instance with pyAirtable's defaults.
+    """
+
+    #: Counters shared by this strategy and all of the copies that
+    #: urllib3 makes of it while retrying individual requests.
+    stats: RetryStats
+
+    def __init__(
+        self,
+        *args: Any,
+        jitter: bool = True,
+        stats: RetryStats | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.jitter = jitter
+        self.stats = stats or RetryStats()
+
+    def new(self, **kwargs: Any) -> "AdaptiveRetry":
+        kwargs.setdefault("jitter", self.jitter)
+        kwargs.setdefault("stats", self.stats)
+        return super().new(**kwargs)
+
+    def get_backoff_time(self) -> float:
+        if not self.jitter:
+            return super().get_backoff_time()
+        # Only count consecutive errors, ignoring redirects (as urllib3 does).
+        history = reversed(self.history)
+        errors = len(list(takewhile(lambda h: h.redirect_location is None, history)))
+        if not errors:
+            return 0.0
+        backoff_max = getattr(self, "backoff_max", Retry.DEFAULT_BACKOFF_MAX)
+        return random.uniform(0, min(backoff_max, self.backoff_factor * 2**errors))
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: Any = None,
+        error: Exception | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> "AdaptiveRetry":
+        retry = super().increment(method, url, response, error, *args, **kwargs)
+        self.stats.record(retries=1)
+        hooks.record_retry(retry.history[-1].status)
+        return retry
+
+    def sleep(self, response: Any = None) -> None:
+        start = time.monotonic()
+        try:
+            super().sleep(response)
+        finally:
+            elapsed = time.monotonic() - start
+            self.stats.record(sleep_time=elapsed)
+            hooks.record_retry_sleep(elapsed)
+
+
 def retry_strategy(
     *,
     status_forcelist: tuple[int, ...] = DEFAULT_RETRIABLE_STATUS_CODES,
     backoff_factor: int | float = DEFAULT_BACKOFF_FACTOR,
     total: int = DEFAULT_MAX_RETRIES,
     allowed_methods: Collection[str] | None = None,
+    jitter: bool = True,
     **kwargs: Any,
-) -> Retry:
+) -> AdaptiveRetry:
     """
     Create a `Retry <https://urllib3.readthedocs.io/en/stable/reference/urllib3.util.html#urllib3.util.Retry>`_
     instance with adjustable default values. :class:`~pyairtable.Api` accepts this via the
@@ -46,19 +149,27 @@ def retry_strategy(
         allowed_methods: HTTP methods which can be retried.
             If ``None``, then all HTTP methods will be retried.
         backoff_factor:
-            A backoff factor to apply between attempts after the second try.
-            Sleep time between each request will be calculated as
-            ``backoff_factor * (2 ** (retry_count - 1))``
+            A backoff factor to apply between attempts.
+            If ``jitter=True``, the sleep time before each retry will be a random value
+            between zero and ``backoff_factor * (2 ** retry_count)``. Otherwise,
+            the sleep time after the second try will be ``backoff_factor * (2 ** (retry_count - 1))``.
         total:
             Maximum number of retries. Note that ``0`` means no retries,
             whereas ``1`` will execute a total of two requests (original + 1 retry).
+        jitter: Whether to randomize the sleep time between retries.
+            See :class:`AdaptiveRetry` for details.
         **kwargs: Accepts any valid parameter to `Retry`_.
+
+    .. versionchanged:: 3.5.0
+
+        Returns an instance of :class:`AdaptiveRetry`, which adds jitter by default.
     """
-    return Retry(
+    return AdaptiveRetry(
         total=total,
         backoff_factor=backoff_factor,
         status_forcelist=status_forcelist,
         allowed_methods=allowed_methods,
+        jitter=jitter,
         **kwargs,
     )
 
@@ -74,6 +185,8 @@ class _RetryingSession(Session):
 
 
 __all__ = [
+    "AdaptiveRetry",
     "Retry",
+    "RetryStats",
     "retry_strategy",
 ]
@@ -0,0 +1,137 @@
+"""
+When many threads (or tasks) ask for the same resource at the same moment, such as
+several web requests calling ``table.get(record_id)`` for one popular record,
+it is wasteful for each of them to send an identical request to Airtable.
+If coalescing is enabled via ``Api(coalesce=True)``, the first caller sends the
+request, and any identical GET requests made before it finishes will wait for
+and share its response instead of sending their own.
+
+    >>> api = Api("auth_token", coalesce=True)
+    >>> api.single_flight
+    <SingleFlight in_flight=0>
+
+Requests are only considered identical if they use the same method, URL
+(including query parameters), and access token. Only ``GET`` requests are
+coalesced. Each caller decodes the shared response separately, so no two callers
+will receive the same ``dict`` object, and each caller will raise its own
+exception if Airtable returns an error.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+import requests
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """
+    Records how many calls were made through a :class:`SingleFlight`.
+    """
+
+    #: The number of calls which performed the underlying operation.
+    leaders: int = 0
+
+    #: The number of calls which waited for another caller's result instead.
+    followers: int = 0
+
+
+class SingleFlight(Generic[T]):
+    """
+    Ensures that only one call for a given key is in progress at a time.
+    Other threads which make a call with the same key while it is in progress
+    will receive the same result (or exception) rather than repeating the call.
+
+    A single instance can be shared between several instances of :class:`~pyairtable.Api`.
+    """
+
+    stats: SingleFlightStats
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[T]] = {}
+        self.stats = SingleFlightStats()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} in_flight={len(self._calls)}>"
+
+    def call(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Call ``func`` and return its result, unless another thread is already
+        calling a function with the same key; in that case, wait for that call
+        to finish and return its result instead.
+        """
+        with self._lock:
+            if follow := key in self._calls:
+                future = self._calls[key]
+                self.stats.followers += 1
+            else:
+                future = self._calls[key] = Future()
+                self.stats.leaders += 1
+        if follow:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight(Generic[T]):
+    """
+    Like :class:`SingleFlight`, but for coroutines running in one event loop.
+    """
+
+    stats: SingleFlightStats
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[T]] = {}
+        self.stats = SingleFlightStats()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} in_flight={len(self._calls)}>"
+
+    async def call(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``func()`` and return its result, unless another task is already
+        awaiting a call with the same key; in that case, wait for that call
+        to finish and return its result instead.
+
+        The underlying call runs in its own task, so it will not be
+        interrupted if the caller which started it is cancelled.
+        """
+        if task := self._calls.get(key):
+            self.stats.followers += 1
+        else:
+            self.stats.leaders += 1
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
+
+
+def request_key(prepared: requests.PreparedRequest) -> Hashable:
+    """
+    Return a value which identifies requests that would receive identical responses.
+    """
+    return (prepared.method, prepared.url, prepared.headers.get("Authorization"))
+
+
+__all__ = [
+    "AsyncSingleFlight",
+    "SingleFlight",
+    "SingleFlightStats",
+    "request_key",
+]
@@ -0,0 +1,269 @@
+"""
+Airtable returns up to 100 records per page, and for tables with long text,
+rich text, or many attachments each page can be several megabytes. Rather than
+reading the whole response body into memory and decoding it at once,
+:func:`iter_items` reads a JSON object from a stream of chunks and decodes the
+items in one of its arrays one at a time, as soon as each item has been received.
+
+Each item (and every other value in the object) is decoded by a
+:class:`~pyairtable.api.codecs.JSONCodec`, so the result is identical
+to decoding the entire document at once.
+
+    >>> chunks = [b'{"records": [{"id": "rec1"}, {"id"', b': "rec2"}], "offset": "itr"}']
+    >>> items = iter_items(chunks, "records")
+    >>> list(items)
+    [{'id': 'rec1'}, {'id': 'rec2'}]
+"""
+
+import functools
+import re
+from collections.abc import Generator, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from pyairtable.api.codecs import JSONCodec, get_codec
+
+#: Number of bytes to read from the response at a time.
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = b" \t\n\r"
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+_SKIP = re.compile(rb'(?:[^"\[\]{}]+|' + _STRING.pattern + rb")*")
+_SCALAR_END = re.compile(rb"[\s,:\]}]")
+
+
+class _Reader:
+    """
+    Splits a stream of bytes into complete JSON values, without decoding them.
+    Only data which has not yet been consumed is kept in memory.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+        self._pos = 0
+
+    def _read(self) -> bool:
+        """
+        Append the next chunk to the buffer, discarding anything already consumed.
+        Returns ``False`` if the stream is exhausted.
+        """
+        for chunk in self._chunks:
+            if chunk:
+                del self._buffer[: self._pos]
+                self._pos = 0
+                self._buffer += chunk
+                return True
+        return False
+
+    def peek(self) -> int | None:
+        """
+        Skip whitespace and return the next byte without consuming it,
+        or ``None`` if the stream is exhausted.
+        """
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._read():
+                return None
+
+    def expect(self, chars: bytes) -> int:
+        """
+        Consume and return the next byte, which must be one of ``chars``.
+        """
+        char = self.peek()
+        if char is None or char not in chars:
+            found = "end of data" if char is None else repr(chr(char))
+            raise ValueError(f"expected one of {chars.decode()!r}, found {found}")
+        self._pos += 1
+        return char
+
+    def value(self) -> bytes:
+        """
+        Consume and return the bytes of the next complete JSON value.
+        """
+        first = self.peek()
+        if first is None:
+            raise ValueError("unexpected end of data")
+        if first == ord('"'):
+            return self._string()
+        if first not in b"[{":
+            return self._scalar()
+
+        depth = 0
+        end = 0  # relative to self._pos, which may change when reading
+        while True:
+            buffer, pos = self._buffer, self._pos
+            # skip past any strings and anything else that isn't a bracket
+            match = _SKIP.match(buffer, pos + end)
+            assert match is not None  # the pattern can match an empty string
+            index = match.end()
+            if index < len(buffer) and buffer[index] != ord('"'):
+                end = index + 1 - pos
+                depth += 1 if buffer[index] in b"[{" else -1
+                if not depth:
+                    return self._consume(end)
+                continue
+            # the buffer ends in the middle of a container or string
+            end = index - pos
+            if not self._read():
+                raise ValueError("unexpected end of data")
+
+    def _string(self) -> bytes:
+        """
+        Consume and return the bytes of the next string, including quotes.
+        """
+        while not (match := _STRING.match(self._buffer, self._pos)):
+            if not self._read():
+                raise ValueError("unexpected end of data")
+        return self._consume(match.end() - self._pos)
+
+    def _scalar(self) -> bytes:
+        """
+        Consume and return the bytes of the next number, ``true``, ``false``, or ``null``.
+        """
+        end = 1
+        while not (match := _SCALAR_END.search(self._buffer, self._pos + end)):
+            end = len(self._buffer) - self._pos
+            if not self._read():
+                return self._consume(end)
+        return self._consume(match.start() - self._pos)
+
+    def _consume(self, length: int) -> bytes:
+        value = bytes(self._buffer[self._pos : self._pos + length])
+        self._pos += length
+        return value
+
+
+def iter_items(
+    chunks: Iterable[bytes],
+    field: str,
+    codec: JSONCodec | None = None,
+) -> Generator[Any, None, dict[str, Any]]:
+    """
+    Read a JSON object from ``chunks`` and yield each item of the array
+    stored under ``field``. When the generator finishes, it returns
+    the rest of the object (with ``field`` omitted), so that callers
+    can still find values like ``offset``.
+
+    Args:
+        chunks: Bytes of a JSON document, split at arbitrary boundaries.
+        field: The key of the array whose items should be yielded.
+        codec: Used to decode each item. Defaults to :func:`~pyairtable.api.codecs.get_codec`.
+
+    Raises:
+        ValueError: If the data is not a valid JSON object.
+    """
+    codec = codec or get_codec()
+    reader = _Reader(chunks)
+    remainder: dict[str, Any] = {}
+    reader.expect(b"{")
+    if reader.peek() == ord("}"):
+        reader.expect(b"}")
+    else:
+        while True:
+            key = codec.loads(reader.value())
+            if not isinstance(key, str):
+                raise ValueError(f"expected a string key, found {key!r}")
+            reader.expect(b":")
+            if key == field and reader.peek() == ord("["):
+                reader.expect(b"[")
+                if reader.peek() == ord("]"):
+                    reader.expect(b"]")
+                else:
+                    while True:
+                        yield codec.loads(reader.value())
+                        if reader.expect(b",]") == ord("]"):
+                            break
+            else:
+                remainder[key] = codec.loads(reader.value())
+            if reader.expect(b",}") == ord("}"):
+                break
+    if reader.peek() is not None:
+        raise ValueError("unexpected data after JSON object")
+    return remainder
+
+
+@dataclass
+class RawPage:
+    """
+    A page of results which has not been decoded or validated. Returned by
+    :meth:`Table.iterate <pyairtable.Table.iterate>` when called with ``raw=True``.
+    """
+
+    #: The response body, exactly as it was received.
+    content: bytes
+
+    #: Every value in the response except the list of items (such as ``offset``).
+    remainder: dict[str, Any] = field(default_factory=dict)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} content={len(self.content)} bytes"
+            f" offset={self.offset!r}>"
+        )
+
+    @property
+    def offset(self) -> str | None:
+        """
+        The value used to request the next page, or ``None`` if this is the last page.
+        """
+        return self.remainder.get("offset")
+
+
+def split_page(data: bytes, field: str, codec: JSONCodec | None = None) -> RawPage:
+    """
+    Decode every value in a JSON object except the list stored under ``field``.
+
+    If `msgspec <https://jcristharif.com/msgspec/>`__ is installed, the list is
+    skipped without being decoded at all. Otherwise, the whole object is decoded
+    by ``codec`` and the list is discarded.
+
+    >>> page = split_page(b'{"records": [{"id": "rec1"}], "offset": "itr"}', "records")
+    >>> page.offset
+    'itr'
+
+    Args:
+        data: Bytes of a JSON document.
+        field: The key of the list which should not be decoded.
+        codec: Used to decode other values. Defaults to :func:`~pyairtable.api.codecs.get_codec`.
+
+    Raises:
+        ValueError: If the data is not a valid JSON object.
+    """
+    codec = codec or get_codec()
+    if decoder := _raw_decoder():
+        values = decoder.decode(data)
+        values.pop(field, None)
+        remainder = {key: codec.loads(bytes(v)) for (key, v) in values.items()}
+        return RawPage(data, remainder)
+    payload = codec.loads(data)
+    if not isinstance(payload, dict):
+        raise ValueError(f"expected a JSON object, found {type(payload)}")
+    payload.pop(field, None)
+    return RawPage(data, payload)
+
+
+@functools.cache
+def _raw_decoder() -> Any:
+    """
+    Return a msgspec decoder which leaves each value in an object undecoded,
+    or ``None`` if msgspec is not installed.
+    """
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    return msgspec.json.Decoder(dict[str, msgspec.Raw])
+
+
+__all__ = [
+    "CHUNK_SIZE",
+    "RawPage",
+    "iter_items",
+    "split_page",
+]
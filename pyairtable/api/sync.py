@@ -0,0 +1,147 @@
+"""
+:meth:`Table.batch_upsert <pyairtable.Table.batch_upsert>` sends every record it is given,
+even if most of them already match what is in Airtable. When a job pushes the same
+large dataset on a schedule and only a few rows change each time,
+:meth:`Table.sync <pyairtable.Table.sync>` will instead retrieve the table's current
+contents (only the fields being synced), compare them to the input, and send
+only the records and fields which have actually changed.
+
+    >>> result = table.sync(rows, key_fields=["SKU"], delete=True)
+    >>> result
+    SyncResult(created=2, updated=14, deleted=1, unchanged=79983)
+
+Airtable omits empty fields from its responses, so a missing field is
+considered equal to ``None``, ``False``, ``""``, or ``[]`` in the input.
+"""
+
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from pyairtable.api.types import (
+    FieldName,
+    RecordDeletedDict,
+    RecordDict,
+    RecordId,
+    UpdateRecordDict,
+    WritableFields,
+)
+
+
+@dataclass(repr=False)
+class SyncResult:
+    """
+    Describes the changes made by :meth:`Table.sync <pyairtable.Table.sync>`.
+    """
+
+    #: Records which did not match any existing record, and were created.
+    created: list[RecordDict] = field(default_factory=list)
+
+    #: Records which had at least one changed field, as returned after the update.
+    updated: list[RecordDict] = field(default_factory=list)
+
+    #: Records which did not match any input record, and were deleted.
+    deleted: list[RecordDeletedDict] = field(default_factory=list)
+
+    #: IDs of existing records which already matched the input.
+    unchanged: list[RecordId] = field(default_factory=list)
+
+    def __repr__(self) -> str:
+        counts = ", ".join(
+            f"{name}={len(getattr(self, name))}"
+            for name in ("created", "updated", "deleted", "unchanged")
+        )
+        return f"{self.__class__.__name__}({counts})"
+
+
+@dataclass
+class SyncPlan:
+    """
+    The requests which :meth:`Table.sync <pyairtable.Table.sync>` needs to send.
+    """
+
+    create: list[WritableFields] = field(default_factory=list)
+    update: list[UpdateRecordDict] = field(default_factory=list)
+    delete: list[RecordId] = field(default_factory=list)
+    unchanged: list[RecordId] = field(default_factory=list)
+
+
+def diff_records(
+    existing: Iterable[RecordDict],
+    records: list[WritableFields],
+    key_fields: list[FieldName],
+    delete: bool = False,
+) -> SyncPlan:
+    """
+    Compare existing records to the desired records, matching them by the values of
+    ``key_fields``, and return the smallest set of changes which will make them equal.
+    Updates only include the fields whose values have changed.
+
+    If several existing records have the same key, only the first is updated,
+    and the rest are treated as unmatched (and deleted, if ``delete=True``).
+
+    Raises:
+        ValueError: If any input record is missing one of ``key_fields``,
+            or if two input records have the same key.
+    """
+    wanted: dict[Hashable, WritableFields] = {}
+    for fields in records:
+        if missing := set(key_fields) - set(fields):
+            raise ValueError(f"missing {missing!r} in {fields.keys()!r}")
+        key = _key(fields, key_fields)
+        if key in wanted:
+            raise ValueError(f"duplicate key {key!r}")
+        wanted[key] = fields
+
+    result = SyncPlan()
+    matched: set[Hashable] = set()
+    for record in existing:
+        key = _key(record["fields"], key_fields)
+        if key not in wanted or key in matched:
+            if delete:
+                result.delete.append(record["id"])
+            continue
+        matched.add(key)
+        if changes := {
+            name: value
+            for (name, value) in wanted[key].items()
+            if not _equal(record["fields"].get(name), value)
+        }:
+            result.update.append({"id": record["id"], "fields": changes})
+        else:
+            result.unchanged.append(record["id"])
+
+    result.create = [fields for (key, fields) in wanted.items() if key not in matched]
+    return result
+
+
+def _key(fields: WritableFields, key_fields: list[FieldName]) -> Hashable:
+    return tuple(_freeze(_empty_to_none(fields.get(name))) for name in key_fields)
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a field value into something which can be used as a dict key.
+    """
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for (k, v) in value.items()))
+    return value  # type: ignore[no-any-return]
+
+
+def _empty_to_none(value: Any) -> Any:
+    if value is None or value is False or value == "" or value == []:
+        return None
+    return value
+
+
+def _equal(current: Any, wanted: Any) -> bool:
+    return bool(_empty_to_none(current) == _empty_to_none(wanted))
+
+
+__all__ = [
+    "SyncPlan",
+    "SyncResult",
+    "diff_records",
+]
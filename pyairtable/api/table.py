@@ -1,14 +1,23 @@
 import base64
 import mimetypes
 import os
+import queue
+import string
+import threading
 import urllib.parse
 import warnings
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, overload
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 
 import pyairtable.models
+from pyairtable.api import hooks, tracing
+from pyairtable.api.changes import Changes, Watermark, collect, now, poll_formulas
+from pyairtable.api.streaming import RawPage
+from pyairtable.api.sync import SyncResult, diff_records
 from pyairtable.api.types import (
     FieldName,
     RecordDeletedDict,
@@ -18,19 +27,26 @@ from pyairtable.api.types import (
     UploadAttachmentResultDict,
     UpsertResultDict,
     WritableFields,
-    assert_typed_dict,
-    assert_typed_dicts,
 )
-from pyairtable.formulas import Formula, to_formula_str
+from pyairtable.api.writer import BatchWriter
+from pyairtable.exceptions import BatchError, InvalidParameterError
+from pyairtable.formulas import AND, RECORD_ID, REGEX_MATCH, Formula, to_formula_str
 from pyairtable.models.schema import FieldSchema, TableSchema, parse_field_schema
 from pyairtable.utils import Url, UrlBuilder, is_table_id
 
 if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
     from pyairtable.api.api import Api, TimeoutTuple
     from pyairtable.api.base import Base
     from pyairtable.api.retrying import Retry
 
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
 class Table:
     """
     Represents an Airtable table.
@@ -236,9 +252,32 @@ class Table:
         if self.api.use_field_ids:
             options.setdefault("use_field_ids", self.api.use_field_ids)
         record = self.api.get(self.urls.record(record_id), options=options)
-        return assert_typed_dict(RecordDict, record)
+        return self.api.validation.check(RecordDict, record)
+
+    @overload
+    def iterate(
+        self,
+        *,
+        stream: Literal[False] = False,
+        raw: Literal[False] = False,
+        **options: Any,
+    ) -> Iterator[list[RecordDict]]: ...
+
+    @overload
+    def iterate(
+        self, *, stream: Literal[True], **options: Any
+    ) -> Iterator[RecordDict]: ...
 
-    def iterate(self, **options: Any) -> Iterator[list[RecordDict]]:
+    @overload
+    def iterate(self, *, raw: Literal[True], **options: Any) -> Iterator[RawPage]: ...
+
+    def iterate(
+        self,
+        *,
+        stream: bool = False,
+        raw: bool = False,
+        **options: Any,
+    ) -> Iterator[Any]:
         """
         Iterate through each page of results from `List records <https://airtable.com/developers/web/api/list-records>`_.
         To get all records at once, use :meth:`all`.
@@ -266,20 +305,54 @@ class Table:
             time_zone: |kwarg_time_zone|
             use_field_ids: |kwarg_use_field_ids|
             count_comments: |kwarg_count_comments|
+            prefetch: |kwarg_prefetch|
+            stream: |kwarg_stream|
+            raw: |kwarg_raw|
         """
         if isinstance(formula := options.get("formula"), Formula):
             options["formula"] = to_formula_str(formula)
         if self.api.use_field_ids:
             options.setdefault("use_field_ids", self.api.use_field_ids)
-        for page in self.api.iterate_requests(
+        prefetch = options.pop("prefetch", 0)
+        results = self.api.iterate_requests(
             method="get",
             url=self.urls.records,
             fallback=("post", self.urls.records_post),
             options=options,
-        ):
-            yield assert_typed_dicts(RecordDict, page.get("records", []))
+            prefetch=prefetch,
+            stream="records" if stream else None,
+            decode=None if raw else self._decode_records,
+            raw="records" if raw else None,
+        )
+        if raw:
+            yield from results
+            return
+        if stream:
+            for record in results:
+                yield self.api.validation.check(RecordDict, record)
+            return
+        for page in results:
+            yield page.get("records", [])
+
+    def _decode_records(self, data: bytes) -> dict[str, Any]:
+        """
+        Decode a page of records from the API and validate them,
+        according to the :class:`~pyairtable.api.validation.Validation` policy.
+        """
+        return self.api.validation.decode_page(
+            RecordDict, "records", data, self.api.json_codec
+        )
 
-    def all(self, **options: Any) -> list[RecordDict]:
+    @overload
+    def all(
+        self, *, raw: Literal[False] = False, **options: Any
+    ) -> list[RecordDict]: ...
+
+    @overload
+    def all(self, *, raw: Literal[True], **options: Any) -> list[RawPage]: ...
+
+    @tracing.traced("Table.all")
+    def all(self, *, raw: bool = False, **options: Any) -> list[Any]:
         """
         Retrieve all matching records in a single list.
 
@@ -301,9 +374,156 @@ class Table:
             time_zone: |kwarg_time_zone|
             use_field_ids: |kwarg_use_field_ids|
             count_comments: |kwarg_count_comments|
+            prefetch: |kwarg_prefetch|
+            stream: |kwarg_stream|
+            raw: |kwarg_raw|
         """
+        if raw:
+            return list(self.iterate(raw=True, **options))
+        if options.pop("stream", False):
+            return list(self.iterate(stream=True, **options))
         return [record for page in self.iterate(**options) for record in page]
 
+    @tracing.traced("Table.to_arrow")
+    def to_arrow(self, **options: Any) -> "pyarrow.Table":
+        """
+        Retrieve all matching records into a ``pyarrow.Table``, with one column
+        for the record ID and one for each field, typed according to the table's schema.
+        Requires the optional ``pyarrow`` library. See :mod:`pyairtable.api.columnar`.
+
+        >>> table.to_arrow(fields=["Name", "Age"], prefetch=1)
+        pyarrow.Table
+        id: string
+        Name: string
+        Age: double
+        ...
+
+        Keyword Args:
+            view: |kwarg_view|
+            page_size: |kwarg_page_size|
+            max_records: |kwarg_max_records|
+            fields: |kwarg_fields|
+            sort: |kwarg_sort|
+            formula: |kwarg_formula|
+            cell_format: |kwarg_cell_format|
+            user_locale: |kwarg_user_locale|
+            time_zone: |kwarg_time_zone|
+            use_field_ids: |kwarg_use_field_ids|
+            prefetch: |kwarg_prefetch|
+        """
+        from pyairtable.api import columnar
+
+        return columnar.to_arrow(self, **options)
+
+    def to_pandas(self, **options: Any) -> "pandas.DataFrame":
+        """
+        Retrieve all matching records into a pandas ``DataFrame`` indexed by record ID,
+        with one column for each field. Requires the optional ``pandas`` and ``pyarrow``
+        libraries. Accepts the same keyword arguments as :meth:`to_arrow`.
+
+        >>> table.to_pandas(fields=["Name", "Age"])
+                               Name   Age
+        id
+        rec3zQ0XMnVYc2x1P     Alice  30.0
+        ...
+        """
+        from pyairtable.api import columnar
+
+        return columnar.to_pandas(self.to_arrow(**options))
+
+    def scan(
+        self,
+        shards: int = 4,
+        max_shards: int | None = None,
+        **options: Any,
+    ) -> Iterator[list[RecordDict]]:
+        """
+        Retrieve all matching records by dividing the table into slices based on
+        the first characters of each record ID, then paginating through up to
+        ``shards`` slices at the same time. Pages are yielded as soon as they are
+        retrieved, so records will *not* be returned in any particular order.
+
+        >>> for page in table.scan(shards=8, fields=["Name"]):
+        ...     print(len(page))
+
+        If a slice contains more than one page of records, it may be split into
+        two smaller slices (until there are ``max_shards`` slices in total) so that
+        threads which finish early can share the remaining work. The first page
+        retrieved for a slice that gets split is discarded.
+
+        Args:
+            shards: The number of slices to retrieve concurrently.
+            max_shards: The maximum number of slices to divide the table into.
+                Defaults to four times the value of ``shards``.
+
+        Keyword Args:
+            view: |kwarg_view|
+            page_size: |kwarg_page_size|
+            fields: |kwarg_fields|
+            formula: |kwarg_formula|
+            cell_format: |kwarg_cell_format|
+            user_locale: |kwarg_user_locale|
+            time_zone: |kwarg_time_zone|
+            use_field_ids: |kwarg_use_field_ids|
+            count_comments: |kwarg_count_comments|
+        """
+        if not 1 <= shards <= len(RECORD_ID_CHARS):
+            raise ValueError(f"shards must be between 1 and {len(RECORD_ID_CHARS)}")
+        if unsupported := {"max_records", "sort"}.intersection(options):
+            raise InvalidParameterError(f"scan() does not support {unsupported!r}")
+        if self.api.use_field_ids:
+            options.setdefault("use_field_ids", self.api.use_field_ids)
+        if (formula := options.pop("formula", None)) is not None:
+            formula = formula if isinstance(formula, Formula) else Formula(formula)
+
+        max_shards = shards * 4 if max_shards is None else max_shards
+        return iter(_ShardedScan(self, options, formula, shards, max_shards))
+
+    @tracing.traced("Table.changes_since")
+    def changes_since(
+        self,
+        watermark: Watermark | None,
+        overlap: float = 60,
+        **options: Any,
+    ) -> Changes:
+        """
+        Retrieve records which have been created or modified since the poll
+        that produced ``watermark``, along with a new watermark for the next poll.
+        If ``watermark`` is ``None``, all records are retrieved.
+        See :mod:`pyairtable.api.changes`.
+
+        >>> changes = table.changes_since(watermark)
+        >>> changes.records
+        [{"id": ...}, {"id": ...}]
+        >>> watermark = changes.watermark
+
+        Args:
+            watermark: The watermark returned by the previous call, or ``None``.
+            overlap: The number of seconds before the previous poll which will be
+                checked again, to allow for clock skew.
+
+        Keyword Args:
+            view: |kwarg_view|
+            fields: |kwarg_fields|
+            formula: |kwarg_formula|
+            cell_format: |kwarg_cell_format|
+            user_locale: |kwarg_user_locale|
+            time_zone: |kwarg_time_zone|
+            use_field_ids: |kwarg_use_field_ids|
+        """
+        if overlap < 0:
+            raise ValueError("overlap cannot be negative")
+        if (formula := options.pop("formula", None)) is not None:
+            formula = formula if isinstance(formula, Formula) else Formula(formula)
+        started = now()
+        older, recent = poll_formulas(watermark, started, overlap, formula)
+        return collect(
+            self.iterate(formula=older, **options),
+            self.iterate(formula=recent, **options),
+            watermark,
+            started,
+        )
+
     def first(self, **options: Any) -> RecordDict | None:
         """
         Retrieve the first matching record.
@@ -323,8 +543,10 @@ class Table:
             use_field_ids: |kwarg_use_field_ids|
             count_comments: |kwarg_count_comments|
         """
+        if unsupported := {"stream", "raw"}.intersection(options):
+            raise InvalidParameterError(f"first() does not support {unsupported!r}")
         options.update(dict(page_size=1, max_records=1))
-        for page in self.iterate(**options):
+        for page in self.iterate(stream=False, raw=False, **options):
             for record in page:
                 return record
         return None
@@ -357,13 +579,15 @@ class Table:
                 "returnFieldsByFieldId": use_field_ids,
             },
         )
-        return assert_typed_dict(RecordDict, created)
+        return self.api.validation.check(RecordDict, created)
 
+    @tracing.traced("Table.batch_create")
     def batch_create(
         self,
         records: Iterable[WritableFields],
         typecast: bool = False,
         use_field_ids: bool | None = None,
+        max_workers: int | None = None,
     ) -> list[RecordDict]:
         """
         Create a number of new records in batches.
@@ -386,15 +610,12 @@ class Table:
             records: Iterable of dicts representing records to be created.
             typecast: |kwarg_typecast|
             use_field_ids: |kwarg_use_field_ids|
+            max_workers: |kwarg_max_workers|
         """
-        inserted_records = []
         if use_field_ids is None:
             use_field_ids = self.api.use_field_ids
 
-        # If we got an iterator, exhaust it and collect it into a list.
-        records = list(records)
-
-        for chunk in self.api.chunked(records):
+        def _create(chunk: Sequence[WritableFields]) -> list[RecordDict]:
             new_records = [{"fields": fields} for fields in chunk]
             response = self.api.post(
                 url=self.urls.records,
@@ -404,9 +625,13 @@ class Table:
                     "returnFieldsByFieldId": use_field_ids,
                 },
             )
-            inserted_records += assert_typed_dicts(RecordDict, response["records"])
+            return self.api.validation.check_all(RecordDict, response["records"])
 
-        return inserted_records
+        return [
+            record
+            for created in self._batch(_create, records, max_workers)
+            for record in created
+        ]
 
     def update(
         self,
@@ -443,14 +668,16 @@ class Table:
                 "returnFieldsByFieldId": use_field_ids,
             },
         )
-        return assert_typed_dict(RecordDict, updated)
+        return self.api.validation.check(RecordDict, updated)
 
+    @tracing.traced("Table.batch_update")
     def batch_update(
         self,
         records: Iterable[UpdateRecordDict],
         replace: bool = False,
         typecast: bool = False,
         use_field_ids: bool | None = None,
+        max_workers: int | None = None,
     ) -> list[RecordDict]:
         """
         Update several records in batches.
@@ -460,19 +687,16 @@ class Table:
             replace: |kwarg_replace|
             typecast: |kwarg_typecast|
             use_field_ids: |kwarg_use_field_ids|
+            max_workers: |kwarg_max_workers|
 
         Returns:
             The list of updated records.
         """
-        updated_records = []
         method = "put" if replace else "patch"
         if use_field_ids is None:
             use_field_ids = self.api.use_field_ids
 
-        # If we got an iterator, exhaust it and collect it into a list.
-        records = list(records)
-
-        for chunk in self.api.chunked(records):
+        def _update(chunk: Sequence[UpdateRecordDict]) -> list[RecordDict]:
             chunk_records = [{"id": x["id"], "fields": x["fields"]} for x in chunk]
             response = self.api.request(
                 method=method,
@@ -483,10 +707,15 @@ class Table:
                     "returnFieldsByFieldId": use_field_ids,
                 },
             )
-            updated_records += assert_typed_dicts(RecordDict, response["records"])
+            return self.api.validation.check_all(RecordDict, response["records"])
 
-        return updated_records
+        return [
+            record
+            for updated in self._batch(_update, records, max_workers)
+            for record in updated
+        ]
 
+    @tracing.traced("Table.batch_upsert")
     def batch_upsert(
         self,
         records: Iterable[dict[str, Any]],
@@ -494,6 +723,7 @@ class Table:
         replace: bool = False,
         typecast: bool = False,
         use_field_ids: bool | None = None,
+        max_workers: int | None = None,
     ) -> UpsertResultDict:
         """
         Update or create records in batches, either using ``id`` (if given) or using a set of
@@ -509,6 +739,7 @@ class Table:
             replace: |kwarg_replace|
             typecast: |kwarg_typecast|
             use_field_ids: |kwarg_use_field_ids|
+            max_workers: |kwarg_max_workers|
 
         Returns:
             Lists of created/updated record IDs, along with the list of all records affected.
@@ -537,12 +768,12 @@ class Table:
             "records": [],
         }
 
-        for chunk in self.api.chunked(records):
+        def _upsert(chunk: Sequence[dict[str, Any]]) -> Any:
             formatted_records = [
                 {k: v for (k, v) in record.items() if k in ("id", "fields")}
                 for record in chunk
             ]
-            response = self.api.request(
+            return self.api.request(
                 method=method,
                 url=self.urls.records,
                 json={
@@ -552,10 +783,12 @@ class Table:
                     "performUpsert": {"fieldsToMergeOn": key_fields},
                 },
             )
+
+        for response in self._batch(_upsert, records, max_workers):
             result["updatedRecords"].extend(response["updatedRecords"])
             result["createdRecords"].extend(response["createdRecords"])
             result["records"].extend(
-                assert_typed_dicts(RecordDict, response["records"])
+                self.api.validation.check_all(RecordDict, response["records"])
             )
 
         return result
@@ -573,12 +806,17 @@ class Table:
         Returns:
             Confirmation that the record was deleted.
         """
-        return assert_typed_dict(
+        return self.api.validation.check(
             RecordDeletedDict,
             self.api.delete(self.urls.record(record_id)),
         )
 
-    def batch_delete(self, record_ids: Iterable[RecordId]) -> list[RecordDeletedDict]:
+    @tracing.traced("Table.batch_delete")
+    def batch_delete(
+        self,
+        record_ids: Iterable[RecordId],
+        max_workers: int | None = None,
+    ) -> list[RecordDeletedDict]:
         """
         Delete the given records, operating in batches.
 
@@ -590,20 +828,170 @@ class Table:
 
         Args:
             record_ids: Record IDs to delete
+            max_workers: |kwarg_max_workers|
 
         Returns:
             Confirmation that the records were deleted.
         """
-        deleted_records = []
 
+        def _delete(chunk: Sequence[RecordId]) -> list[RecordDeletedDict]:
+            result = self.api.delete(self.urls.records, params={"records[]": chunk})
+            return self.api.validation.check_all(RecordDeletedDict, result["records"])
+
+        return [
+            record
+            for deleted in self._batch(_delete, record_ids, max_workers)
+            for record in deleted
+        ]
+
+    @tracing.traced("Table.sync")
+    def sync(
+        self,
+        records: Iterable[WritableFields],
+        key_fields: list[FieldName],
+        *,
+        delete: bool = False,
+        view: str | None = None,
+        formula: str | Formula | None = None,
+        typecast: bool = False,
+        use_field_ids: bool | None = None,
+        max_workers: int | None = None,
+    ) -> SyncResult:
+        """
+        Make the table's contents match the given records, sending only the
+        records and fields which have changed. Existing records are matched to the
+        input using the values of ``key_fields``, in the same way as
+        :meth:`~pyairtable.Table.batch_upsert`.
+
+        This retrieves every record in the table (or in ``view``, or matching ``formula``)
+        but only the fields which appear in the input, then creates any input records
+        which have no match, updates only the changed fields of records which do,
+        and (if ``delete=True``) deletes existing records which have no match.
+        See :mod:`pyairtable.api.sync`.
+
+        >>> table.sync(
+        ...     [{"SKU": "A-1", "Price": 10}, {"SKU": "B-2", "Price": 12}],
+        ...     key_fields=["SKU"],
+        ... )
+        SyncResult(created=0, updated=1, deleted=0, unchanged=1)
+
+        Args:
+            records: The desired contents of each record. Every record must include
+                a value for each of ``key_fields``, and no two records can share the same key.
+            key_fields: List of field names used to match input records with existing records.
+            delete: Whether to delete existing records which do not match any input record.
+            view: |kwarg_view|
+            formula: |kwarg_formula|
+            typecast: |kwarg_typecast|
+            use_field_ids: |kwarg_use_field_ids|
+            max_workers: |kwarg_max_workers|
+        """
+        if use_field_ids is None:
+            use_field_ids = self.api.use_field_ids
+
+        records = list(records)
+        field_names = list(
+            dict.fromkeys([*key_fields, *(k for r in records for k in r)])
+        )
+        options: dict[str, Any] = {"fields": field_names}
+        if view is not None:
+            options["view"] = view
+        if formula is not None:
+            options["formula"] = formula
+        if use_field_ids:
+            options["use_field_ids"] = use_field_ids
+
+        existing = (record for page in self.iterate(**options) for record in page)
+        changes = diff_records(existing, records, key_fields, delete=delete)
+        result = SyncResult(unchanged=changes.unchanged)
+        kwargs = {"typecast": typecast, "use_field_ids": use_field_ids}
+        if changes.create:
+            result.created = self.batch_create(
+                changes.create, max_workers=max_workers, **kwargs
+            )
+        if changes.update:
+            result.updated = self.batch_update(
+                changes.update, max_workers=max_workers, **kwargs
+            )
+        if changes.delete:
+            result.deleted = self.batch_delete(changes.delete, max_workers=max_workers)
+        return result
+
+    def batch_writer(
+        self,
+        *,
+        typecast: bool = False,
+        replace: bool = False,
+        use_field_ids: bool | None = None,
+        flush_interval: float | None = None,
+    ) -> BatchWriter:
+        """
+        Build a :class:`~pyairtable.api.writer.BatchWriter` which buffers
+        individual changes to this table and sends them in batches.
+
+        >>> with table.batch_writer() as writer:
+        ...     writer.create({"Name": "Alice"})
+        ...     writer.update("recwPQIfs4wKPyc9D", {"Status": "Done"})
+        ...     writer.delete("recwDxIfs3wDPyc3F")
+        ...
+
+        Args:
+            typecast: |kwarg_typecast|
+            replace: |kwarg_replace|
+            use_field_ids: |kwarg_use_field_ids|
+            flush_interval: If provided, buffered changes will be sent
+                in the background this many seconds after the previous flush.
+        """
+        return BatchWriter(
+            self,
+            typecast=typecast,
+            replace=replace,
+            use_field_ids=use_field_ids,
+            flush_interval=flush_interval,
+        )
+
+    def _batch(
+        self,
+        func: Callable[[Sequence[T]], R],
+        items: Iterable[T],
+        max_workers: int | None,
+    ) -> list[R]:
+        """
+        Call ``func`` once for each chunk of ``items`` and return the results
+        in the same order as the chunks. If ``max_workers`` is provided, chunks
+        are sent concurrently in that many threads, and any failures are
+        collected into a single :class:`~pyairtable.exceptions.BatchError`.
+        """
         # If we got an iterator, exhaust it and collect it into a list.
-        record_ids = list(record_ids)
+        chunks = list(self.api.chunked(list(items)))
 
-        for chunk in self.api.chunked(record_ids):
-            result = self.api.delete(self.urls.records, params={"records[]": chunk})
-            deleted_records += assert_typed_dicts(RecordDeletedDict, result["records"])
+        def _call(index: int, chunk: Sequence[T]) -> R:
+            with hooks.chunking(index):
+                return func(chunk)
 
-        return deleted_records
+        if not max_workers:
+            return [_call(index, chunk) for (index, chunk) in enumerate(chunks)]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(tracing.bind(_call), index, chunk)
+                for (index, chunk) in enumerate(chunks)
+            ]
+
+        offset = 0
+        results: dict[range, R] = {}
+        errors: dict[range, Exception] = {}
+        for chunk, future in zip(chunks, futures):
+            positions = range(offset, offset + len(chunk))
+            offset += len(chunk)
+            try:
+                results[positions] = future.result()
+            except Exception as exc:
+                errors[positions] = exc
+
+        if errors:
+            raise BatchError(errors, results) from next(iter(errors.values()))
+        return list(results.values())
 
     def comments(self, record_id: RecordId) -> list["pyairtable.models.Comment"]:
         """
@@ -810,4 +1198,140 @@ class Table:
             "file": base64.encodebytes(content).decode("utf8"),  # API needs Unicode
         }
         response = self.api.post(url, json=payload)
-        return assert_typed_dict(UploadAttachmentResultDict, response)
+        return self.api.validation.check(UploadAttachmentResultDict, response)
+
+
+#: Characters which can appear in a record ID after the ``rec`` prefix.
+RECORD_ID_CHARS = string.digits + string.ascii_uppercase + string.ascii_lowercase
+
+
+@dataclass(frozen=True)
+class _Shard:
+    """
+    A slice of a table used by :meth:`Table.scan`, containing all records whose
+    IDs start with ``rec``, then ``prefix``, then any one of ``chars``.
+    """
+
+    prefix: str = ""
+    chars: str = RECORD_ID_CHARS
+
+    @classmethod
+    def divide(cls, count: int, prefix: str = "") -> list["_Shard"]:
+        """
+        Divide all records starting with ``prefix`` into ``count`` slices.
+        """
+        size, extra = divmod(len(RECORD_ID_CHARS), count)
+        shards, start = [], 0
+        for n in range(count):
+            end = start + size + (n < extra)
+            shards.append(cls(prefix, RECORD_ID_CHARS[start:end]))
+            start = end
+        return shards
+
+    @property
+    def formula(self) -> Formula:
+        return REGEX_MATCH(RECORD_ID(), f"^rec{self.prefix}[{self.chars}]")
+
+    def split(self) -> list["_Shard"]:
+        """
+        Divide this slice in half.
+        """
+        if len(self.chars) == 1:
+            return self.divide(2, prefix=self.prefix + self.chars)
+        half = len(self.chars) // 2
+        return [
+            _Shard(self.prefix, self.chars[:half]),
+            _Shard(self.prefix, self.chars[half:]),
+        ]
+
+
+class _ShardedScan:
+    """
+    Implements :meth:`Table.scan` by retrieving each slice of a table in a thread pool
+    and passing pages back to the caller's thread through a queue.
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        options: dict[str, Any],
+        formula: Formula | None,
+        shards: int,
+        max_shards: int,
+    ):
+        self.table = table
+        self.options = options
+        self.formula = formula
+        self.shards = shards
+        self.splits = max(0, max_shards - shards)
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.output: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=shards)
+
+    def __iter__(self) -> Iterator[list[RecordDict]]:
+        executor = ThreadPoolExecutor(self.shards, thread_name_prefix="pyairtable-scan")
+        outstanding = 0
+        try:
+            for shard in _Shard.divide(self.shards):
+                executor.submit(tracing.bind(self._scan), shard)
+                outstanding += 1
+            while outstanding:
+                kind, value = self.output.get()
+                if kind == "page":
+                    yield value
+                elif kind == "error":
+                    raise value
+                else:
+                    outstanding -= 1
+                    for shard in value:
+                        executor.submit(tracing.bind(self._scan), shard)
+                        outstanding += 1
+        finally:
+            self.stopped.set()
+            executor.shutdown(cancel_futures=True)
+
+    def _put(self, kind: str, value: Any) -> None:
+        """
+        Wait for the caller to catch up, unless it has stopped iterating.
+        """
+        while not self.stopped.is_set():
+            try:
+                return self.output.put((kind, value), timeout=0.1)
+            except queue.Full:
+                continue
+
+    def _split(self, shard: _Shard) -> list[_Shard]:
+        """
+        Split the given slice in half, unless we have already reached ``max_shards``.
+        """
+        with self.lock:
+            if not self.splits:
+                return []
+            self.splits -= 1
+        return shard.split()
+
+    def _scan(self, shard: _Shard) -> None:
+        """
+        Retrieve every page of records in the given slice, unless it is split
+        into smaller slices; those get reported back to the caller's thread.
+        """
+        children: list[_Shard] = []
+        formula = AND(self.formula, shard.formula) if self.formula else shard.formula
+        pages = self.table.api.iterate_requests(
+            method="get",
+            url=self.table.urls.records,
+            fallback=("post", self.table.urls.records_post),
+            options={**self.options, "formula": to_formula_str(formula)},
+            decode=self.table._decode_records,
+        )
+        try:
+            for n, page in enumerate(pages):
+                if n == 0 and page.get("offset") and (children := self._split(shard)):
+                    return
+                self._put("page", page.get("records", []))
+                if self.stopped.is_set():
+                    return
+        except Exception as exc:
+            self._put("error", exc)
+        finally:
+            self._put("done", children)
@@ -0,0 +1,148 @@
+"""
+If `OpenTelemetry <https://opentelemetry.io/docs/languages/python/>`__ is installed
+(``pip install 'pyairtable[tracing]'``), pyAirtable will create a span for each
+request it sends to Airtable, and a parent span for each logical operation which
+might send several requests, such as :meth:`Table.all <pyairtable.Table.all>`,
+:meth:`Table.batch_upsert <pyairtable.Table.batch_upsert>`, or
+:meth:`Model.from_ids <pyairtable.orm.Model.from_ids>`.
+
+Request spans are named after the method and endpoint (such as ``GET {base}/{table}``)
+and have the following attributes, where applicable:
+
+* ``http.request.method``
+* ``url.full``
+* ``url.template``
+* ``http.response.status_code``
+* ``http.request.resend_count`` (the number of times the request was retried)
+* ``airtable.page`` (the page number, when retrieving several pages of results)
+* ``airtable.chunk`` (the index of the chunk, when sending records in batches)
+
+Spans are only recorded if your application configures an OpenTelemetry SDK.
+If OpenTelemetry is not installed, none of this has any effect.
+"""
+
+import contextvars
+import functools
+import inspect
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyairtable.api.hooks import RequestEvent
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore[assignment]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+#: Whether OpenTelemetry is installed.
+ENABLED = trace is not None
+
+#: The tracer used for all spans created by pyAirtable, if OpenTelemetry is installed.
+TRACER = trace.get_tracer("pyairtable") if ENABLED else None
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """
+    Decorate a function (or generator function) so that each call creates a span
+    with the given name, which becomes the parent of any requests sent during the call.
+    If OpenTelemetry is not installed, the function is returned unchanged.
+    """
+
+    def _decorator(func: F) -> F:
+        if not TRACER:
+            return func
+
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def _traced_iter(*args: Any, **kwargs: Any) -> Iterator[Any]:
+                return _iter_in_span(name, func(*args, **kwargs))
+
+            return cast(F, _traced_iter)
+
+        @functools.wraps(func)
+        def _traced(*args: Any, **kwargs: Any) -> Any:
+            assert TRACER
+            with TRACER.start_as_current_span(name):
+                return func(*args, **kwargs)
+
+        return cast(F, _traced)
+
+    return _decorator
+
+
+def _iter_in_span(name: str, iterator: Iterator[Any]) -> Iterator[Any]:
+    """
+    Yield from ``iterator`` within a span which is only the current span while
+    the iterator is running, so that it does not leak into the caller's code
+    between items. The span ends when the iterator is exhausted or closed.
+    """
+    assert TRACER
+    span = TRACER.start_span(name)
+    try:
+        while True:
+            with trace.use_span(span):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        if hasattr(iterator, "close"):
+            iterator.close()
+        span.end()
+
+
+def bind(func: F) -> F:
+    """
+    Return a callable which will run ``func`` in a copy of the current context,
+    so that any spans it creates in another thread will have the correct parent.
+    """
+    return cast(F, functools.partial(contextvars.copy_context().run, func))
+
+
+def start_request_span(event: "RequestEvent") -> Any:
+    """
+    Start a span for the request described by the given event, as a child of the current span.
+    """
+    if not TRACER:  # pragma: no cover
+        return None
+    attributes: dict[str, Any] = {
+        "http.request.method": event.method,
+        "url.full": event.url,
+        "url.template": event.endpoint,
+    }
+    if event.page is not None:
+        attributes["airtable.page"] = event.page
+    if event.chunk is not None:
+        attributes["airtable.chunk"] = event.chunk
+    return TRACER.start_span(
+        f"{event.method} {event.endpoint}",
+        kind=trace.SpanKind.CLIENT,
+        attributes=attributes,
+    )
+
+
+def end_request_span(span: Any, event: "RequestEvent") -> None:
+    """
+    Record the outcome of a request on its span, and end the span.
+    """
+    if event.status is not None:
+        span.set_attribute("http.response.status_code", event.status)
+    if event.attempt > 1:
+        span.set_attribute("http.request.resend_count", event.attempt - 1)
+    if event.error is not None:
+        span.record_exception(event.error)
+        span.set_status(trace.StatusCode.ERROR, str(event.error))
+    span.end()
+
+
+__all__ = [
+    "ENABLED",
+    "TRACER",
+    "bind",
+    "traced",
+]
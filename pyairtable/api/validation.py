@@ -0,0 +1,275 @@
+"""
+Before returning records from methods like :meth:`Table.all <pyairtable.Table.all>`
+or :meth:`Table.batch_update <pyairtable.Table.batch_update>`, pyAirtable checks that
+each one has the structure described by :class:`~pyairtable.api.types.RecordDict`,
+and raises ``pydantic.ValidationError`` if it does not. Applications which retrieve
+very large numbers of records can choose a cheaper policy via ``Api(validation=...)``:
+
+``"full"`` (the default)
+    Validate every record against its TypedDict, including the type of every value.
+
+``"structural"``
+    Only check that every record has the required keys (``id``, ``createdTime``, and ``fields``).
+
+``"sampled"``
+    Fully validate one in every 100 records and skip the others.
+    Use :class:`SampledValidation` directly to choose a different rate.
+
+``"off"``
+    Do not check records at all.
+
+    >>> from pyairtable import Api
+    >>> Api("auth_token").validation
+    <FullValidation>
+    >>> Api("auth_token", validation="structural").validation
+    <StructuralValidation>
+
+Every policy returns the same objects it was given, rather than copies.
+
+Pages of records are validated as soon as they are decoded, so when using
+``prefetch=`` (see :meth:`Table.iterate <pyairtable.Table.iterate>`), validation
+happens in the background thread along with the request itself.
+"""
+
+import threading
+import types
+from collections.abc import Callable
+from typing import Any, TypeVar, Union, cast
+
+import pydantic
+
+from pyairtable.api.codecs import JSONCodec
+from pyairtable.api.types import _create_model_from_typeddict, assert_typed_dict
+
+T = TypeVar("T")
+
+
+class Validation:
+    """
+    Base class for validation policies. Subclasses override :meth:`check`
+    and (optionally) :meth:`check_all`.
+    """
+
+    #: The name used to select this policy via ``Api(validation=...)``.
+    name = ""
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}>"
+
+    def check(self, cls: type[T], obj: Any) -> T:
+        """
+        Check that the given object conforms to the given TypedDict, and return it.
+
+        Raises:
+            TypeError: If the object is not a ``dict``.
+            pydantic.ValidationError: If the object does not conform to the TypedDict.
+        """
+        raise NotImplementedError
+
+    def check_all(self, cls: type[T], objects: Any) -> list[T]:
+        """
+        Check that the given object is a list of objects which conform to
+        the given TypedDict, and return it.
+
+        Raises:
+            TypeError: If the object is not a ``list`` of ``dict``.
+            pydantic.ValidationError: If an object does not conform to the TypedDict.
+        """
+        _check_list(objects)
+        for obj in objects:
+            self.check(cls, obj)
+        return cast(list[T], objects)
+
+    def decode_page(
+        self,
+        cls: type[Any],
+        field: str,
+        data: bytes,
+        codec: JSONCodec,
+    ) -> dict[str, Any]:
+        """
+        Decode a JSON response body, check the list of objects in ``field``
+        (if present) as :meth:`check_all` would, and return the decoded payload.
+        Subclasses can override this to decode and validate in a single step.
+
+        Raises:
+            TypeError: If the payload is not a ``dict``, or ``field`` is not a list of ``dict``.
+            ValueError: If the response body is not valid JSON.
+            pydantic.ValidationError: If an object does not conform to the TypedDict.
+        """
+        payload = codec.loads(data)
+        _check_dict(payload)
+        self.check_all(cls, payload.get(field, []))
+        return cast(dict[str, Any], payload)
+
+
+class FullValidation(Validation):
+    """
+    Validates every object, and the type of every value, via pydantic.
+    """
+
+    name = "full"
+
+    def check(self, cls: type[T], obj: Any) -> T:
+        return assert_typed_dict(cls, obj)
+
+    def check_all(self, cls: type[T], objects: Any) -> list[T]:
+        _check_list(objects)
+        if _is_union(cls):
+            return super().check_all(cls, objects)
+        # validating the list in one call is faster than validating each item
+        for obj in objects:
+            _check_dict(obj)
+        _list_adapter(cls).validate_python(objects)
+        return cast(list[T], objects)
+
+
+class StructuralValidation(Validation):
+    """
+    Checks that every object is a ``dict`` with the keys required by the TypedDict,
+    without checking the values.
+    """
+
+    name = "structural"
+
+    def check(self, cls: type[T], obj: Any) -> T:
+        _check_dict(obj)
+        members = _union_members(cls)
+        for member in members:
+            if member.__required_keys__ <= obj.keys():
+                return cast(T, obj)
+        missing = members[-1].__required_keys__ - obj.keys()
+        raise pydantic.ValidationError.from_exception_data(
+            members[-1].__name__,
+            [{"type": "missing", "loc": (key,), "input": obj} for key in missing],
+        )
+
+    def check_all(self, cls: type[T], objects: Any) -> list[T]:
+        _check_list(objects)
+        if _is_union(cls):
+            return super().check_all(cls, objects)
+        required = cast(Any, cls).__required_keys__
+        for obj in objects:
+            if not (isinstance(obj, dict) and required <= obj.keys()):
+                self.check(cls, obj)  # raises an appropriate exception
+        return cast(list[T], objects)
+
+
+class SampledValidation(Validation):
+    """
+    Fully validates one in every ``every`` objects, and does not check the others.
+    The sample is taken across all calls, so this is also useful when
+    retrieving records one at a time.
+    """
+
+    name = "sampled"
+
+    def __init__(self, every: int = 100):
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.every = every
+        self._full = FullValidation()
+        self._seen = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} every={self.every}>"
+
+    def check(self, cls: type[T], obj: Any) -> T:
+        if self._advance(1) == 0:
+            return self._full.check(cls, obj)
+        return cast(T, obj)
+
+    def check_all(self, cls: type[T], objects: Any) -> list[T]:
+        _check_list(objects)
+        first = -self._advance(len(objects)) % self.every
+        self._full.check_all(cls, objects[first :: self.every])
+        return cast(list[T], objects)
+
+    def _advance(self, count: int) -> int:
+        """
+        Reserve the next ``count`` positions in the sample, and return the first
+        position's offset from the most recent object that was validated.
+        """
+        with self._lock:
+            start = self._seen
+            self._seen += count
+        return start % self.every
+
+
+class NoValidation(Validation):
+    """
+    Does not check objects at all.
+    """
+
+    name = "off"
+
+    def check(self, cls: type[T], obj: Any) -> T:
+        return cast(T, obj)
+
+    def check_all(self, cls: type[T], objects: Any) -> list[T]:
+        return cast(list[T], objects)
+
+
+#: Validation policies which can be selected by name.
+POLICIES: dict[str, Callable[[], Validation]] = {
+    FullValidation.name: FullValidation,
+    StructuralValidation.name: StructuralValidation,
+    SampledValidation.name: SampledValidation,
+    NoValidation.name: NoValidation,
+}
+
+
+def get_validation(validation: "str | Validation | None" = None) -> Validation:
+    """
+    Return a :class:`Validation` instance.
+
+    Args:
+        validation: The name of a policy (``"full"``, ``"structural"``, ``"sampled"``,
+            or ``"off"``), or an instance of :class:`Validation`.
+            If ``None``, returns :class:`FullValidation`.
+
+    Raises:
+        ValueError: If the policy name is not recognized.
+    """
+    if isinstance(validation, str):
+        try:
+            return POLICIES[validation]()
+        except KeyError:
+            raise ValueError(f"unknown validation policy {validation!r}") from None
+    if validation is not None:
+        return validation
+    return FullValidation()
+
+
+def _check_dict(obj: Any) -> None:
+    if not isinstance(obj, dict):
+        raise TypeError(f"expected dict, got {type(obj)}")
+
+
+def _check_list(objects: Any) -> None:
+    if not isinstance(objects, list):
+        raise TypeError(f"expected list, got {type(objects)}")
+
+
+def _is_union(cls: Any) -> bool:
+    return getattr(cls, "__origin__", None) is Union or isinstance(cls, types.UnionType)
+
+
+def _union_members(cls: Any) -> list[Any]:
+    return list(cls.__args__) if _is_union(cls) else [cls]
+
+
+def _list_adapter(cls: type[T]) -> pydantic.TypeAdapter[Any]:
+    return _create_model_from_typeddict(list[cls])  # type: ignore[valid-type]
+
+
+__all__ = [
+    "FullValidation",
+    "NoValidation",
+    "POLICIES",
+    "SampledValidation",
+    "StructuralValidation",
+    "Validation",
+    "get_validation",
+]
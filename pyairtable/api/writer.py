@@ -0,0 +1,368 @@
+"""
+Applications which create, update, or delete records one at a time from many places
+(such as web request handlers or event consumers) send one request per change, even
+though Airtable accepts up to ten records per request. A :class:`BatchWriter`
+buffers those changes and sends them in batches, without requiring the
+application to collect records into lists first.
+
+    >>> with table.batch_writer() as writer:
+    ...     for row in rows:
+    ...         writer.create({"Name": row.name})
+    ...
+
+Each method returns a :class:`~concurrent.futures.Future` which will receive the
+record returned by Airtable once its batch has been sent, so callers can wait for
+the result or attach a callback with :meth:`~concurrent.futures.Future.add_done_callback`.
+
+Buffered changes are sent whenever ten changes of the same kind are waiting,
+whenever :meth:`BatchWriter.flush` is called, every ``flush_interval`` seconds
+(if provided), and when the writer is closed. A writer can be shared between
+threads, which makes it suitable for keeping open for the lifetime of an application:
+
+    >>> writer = table.batch_writer(flush_interval=2.0)
+    >>> writer.update("recwPQIfs4wKPyc9D", {"Status": "Done"})
+    <Future at 0x... state=pending>
+    >>> writer.close()
+"""
+
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from pyairtable.api.types import (
+    RecordDeletedDict,
+    RecordDict,
+    RecordId,
+    UpdateRecordDict,
+    WritableFields,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyairtable.api.table import Table
+
+
+@dataclass
+class BatchWriterStats:
+    """
+    Counters describing how many requests a :class:`BatchWriter` has saved.
+    """
+
+    #: The number of changes passed to the writer.
+    operations: int = 0
+
+    #: The number of updates which were merged into an earlier update to the same record.
+    merged: int = 0
+
+    #: The number of requests sent to the API.
+    requests: int = 0
+
+
+class BatchWriter:
+    """
+    Buffers calls to create, update, or delete records in one table,
+    and sends them to the API in batches. See :mod:`pyairtable.api.writer`.
+
+    Usually created via :meth:`Table.batch_writer <pyairtable.Table.batch_writer>`.
+
+    Args:
+        table: The table to write to.
+        typecast: |kwarg_typecast|
+        replace: |kwarg_replace|
+        use_field_ids: |kwarg_use_field_ids|
+        flush_interval: If provided, a background thread will send any buffered
+            changes this many seconds after the previous flush.
+    """
+
+    table: "Table"
+    stats: BatchWriterStats
+
+    def __init__(
+        self,
+        table: "Table",
+        *,
+        typecast: bool = False,
+        replace: bool = False,
+        use_field_ids: bool | None = None,
+        flush_interval: float | None = None,
+    ):
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("flush_interval must be greater than zero")
+        self.table = table
+        self.typecast = typecast
+        self.replace = replace
+        self.use_field_ids = use_field_ids
+        self.flush_interval = flush_interval
+        self.stats = BatchWriterStats()
+        self._creates: list[tuple[WritableFields, Future[RecordDict]]] = []
+        self._updates: dict[RecordId, tuple[WritableFields, Future[RecordDict]]] = {}
+        self._deletes: dict[RecordId, Future[RecordDeletedDict]] = {}
+        self._errors: list[Exception] = []
+        # _lock guards the buffers; _flush_lock ensures batches are sent in order.
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread: threading.Thread | None = None
+        if flush_interval is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} table={self.table.name!r}"
+            f" pending={self.pending}>"
+        )
+
+    def __enter__(self) -> "BatchWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of changes which have not yet been sent.
+        """
+        with self._lock:
+            return len(self._creates) + len(self._updates) + len(self._deletes)
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether :meth:`close` has been called.
+        """
+        return self._closed.is_set()
+
+    def create(self, fields: WritableFields) -> "Future[RecordDict]":
+        """
+        Buffer a new record to be created.
+
+        Args:
+            fields: Fields to insert. Must be a dict with field names or IDs as keys.
+
+        Returns:
+            A future which will receive the newly created record.
+        """
+        future: Future[RecordDict] = Future()
+        with self._lock:
+            self._check_open()
+            self._creates.append((dict(fields), future))
+            self.stats.operations += 1
+            full = len(self._creates) >= self.table.api.MAX_RECORDS_PER_REQUEST
+        if full:
+            self._flush(full_only=True)
+        return future
+
+    def update(
+        self, record_id: RecordId, fields: WritableFields
+    ) -> "Future[RecordDict]":
+        """
+        Buffer changes to an existing record. If changes to the same record are
+        already waiting to be sent, the new values are merged into them and
+        sent as a single update.
+
+        Args:
+            record_id: |arg_record_id|
+            fields: Fields to update. Must be a dict with field names or IDs as keys.
+
+        Returns:
+            A future which will receive the updated record. If this update was
+            merged into another, both calls return the same future.
+
+        Raises:
+            ValueError: if the record is waiting to be deleted.
+        """
+        with self._lock:
+            self._check_open()
+            if record_id in self._deletes:
+                raise ValueError(f"{record_id} is waiting to be deleted")
+            self.stats.operations += 1
+            if record_id in self._updates:
+                self._updates[record_id][0].update(fields)
+                self.stats.merged += 1
+                return self._updates[record_id][1]
+            future: Future[RecordDict] = Future()
+            self._updates[record_id] = (dict(fields), future)
+            full = len(self._updates) >= self.table.api.MAX_RECORDS_PER_REQUEST
+        if full:
+            self._flush(full_only=True)
+        return future
+
+    def delete(self, record_id: RecordId) -> "Future[RecordDeletedDict]":
+        """
+        Buffer a record to be deleted. Any changes to the same record which
+        are waiting to be sent will be discarded, and their futures cancelled.
+
+        Args:
+            record_id: |arg_record_id|
+
+        Returns:
+            A future which will receive confirmation that the record was deleted.
+        """
+        with self._lock:
+            self._check_open()
+            self.stats.operations += 1
+            discarded = self._updates.pop(record_id, None)
+            if record_id in self._deletes:
+                future = self._deletes[record_id]
+                full = False
+            else:
+                future = self._deletes[record_id] = Future()
+                full = len(self._deletes) >= self.table.api.MAX_RECORDS_PER_REQUEST
+        # Cancelling runs callbacks, which might call this writer again.
+        if discarded:
+            discarded[1].cancel()
+        if full:
+            self._flush(full_only=True)
+        return future
+
+    def flush(self) -> None:
+        """
+        Send all buffered changes to the API. Creates are sent first,
+        then updates, then deletes.
+
+        If any batch failed, either during this call or during a previous flush
+        in the background, the first failure is raised once every batch has been
+        attempted. The futures for each failed batch will also raise it.
+        """
+        self._flush()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        """
+        Stop the background thread (if there is one) and send all buffered changes.
+        After this is called, the writer will not accept any more changes.
+        """
+        self._closed.set()
+        if self._thread:
+            self._thread.join()
+        self.flush()
+
+    def _check_open(self) -> None:
+        if self._closed.is_set():
+            raise RuntimeError(f"{self.__class__.__name__} is closed")
+
+    def _run(self) -> None:
+        assert self.flush_interval
+        while not self._closed.wait(self.flush_interval):
+            self._flush()
+
+    def _take(self, full_only: bool) -> tuple[list[Any], list[Any], list[Any]]:
+        """
+        Remove and return buffered changes which are ready to be sent,
+        skipping any whose futures have been cancelled.
+        """
+        size = self.table.api.MAX_RECORDS_PER_REQUEST
+
+        def _count(n: int) -> int:
+            return n - n % size if full_only else n
+
+        with self._lock:
+            creates = self._creates[: _count(len(self._creates))]
+            del self._creates[: len(creates)]
+            updates = [
+                (record_id, self._updates.pop(record_id))
+                for record_id in list(self._updates)[: _count(len(self._updates))]
+            ]
+            deletes = [
+                (record_id, self._deletes.pop(record_id))
+                for record_id in list(self._deletes)[: _count(len(self._deletes))]
+            ]
+
+        return (
+            [
+                (f, future)
+                for (f, future) in creates
+                if future.set_running_or_notify_cancel()
+            ],
+            [
+                (r, f, future)
+                for (r, (f, future)) in updates
+                if future.set_running_or_notify_cancel()
+            ],
+            [
+                (r, future)
+                for (r, future) in deletes
+                if future.set_running_or_notify_cancel()
+            ],
+        )
+
+    def _flush(self, full_only: bool = False) -> None:
+        # Futures are resolved after releasing _flush_lock, because their callbacks
+        # might buffer more changes and fill a batch, which flushes again.
+        outcomes: list[tuple[Future[Any], Any, Exception | None]] = []
+        with self._flush_lock:
+            creates, updates, deletes = self._take(full_only)
+            for chunk in self._chunked(creates):
+                outcomes += self._send(
+                    [future for (_, future) in chunk],
+                    self.table.batch_create,
+                    [fields for (fields, _) in chunk],
+                    typecast=self.typecast,
+                    use_field_ids=self.use_field_ids,
+                )
+            for chunk in self._chunked(updates):
+                records: list[UpdateRecordDict] = [
+                    {"id": record_id, "fields": fields}
+                    for (record_id, fields, _) in chunk
+                ]
+                outcomes += self._send(
+                    [future for (*_, future) in chunk],
+                    self.table.batch_update,
+                    records,
+                    replace=self.replace,
+                    typecast=self.typecast,
+                    use_field_ids=self.use_field_ids,
+                )
+            for chunk in self._chunked(deletes):
+                outcomes += self._send(
+                    [future for (_, future) in chunk],
+                    self.table.batch_delete,
+                    [record_id for (record_id, _) in chunk],
+                )
+        for future, result, exc in outcomes:
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def _chunked(self, items: list[Any]) -> Iterator[Any]:
+        return self.table.api.chunked(items)
+
+    def _send(
+        self,
+        futures: list["Future[Any]"],
+        method: Any,
+        records: list[Any],
+        **kwargs: Any,
+    ) -> list[tuple["Future[Any]", Any, Exception | None]]:
+        """
+        Send one batch of changes and return the outcome for each future in it,
+        as a ``(future, result, exception)`` tuple.
+        """
+        with self._lock:
+            self.stats.requests += 1
+        try:
+            results = method(records, **kwargs)
+        except Exception as exc:
+            with self._lock:
+                self._errors.append(exc)
+            return [(future, None, exc) for future in futures]
+        return [(future, result, None) for future, result in zip(futures, results)]
+
+
+__all__ = [
+    "BatchWriter",
+    "BatchWriterStats",
+]
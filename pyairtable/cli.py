@@ -10,13 +10,14 @@ import sys
 from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, ParamSpec, TypeVar
+from typing import Any, BinaryIO, ParamSpec, TypeVar
 
 from click import Context, HelpFormatter
 
 from pyairtable.api.api import Api
 from pyairtable.api.base import Base
 from pyairtable.api.enterprise import Enterprise
+from pyairtable.api.export import COMPRESSIONS, FORMATS, export_records
 from pyairtable.api.table import Table
 from pyairtable.models._base import AirtableModel
 from pyairtable.orm.generate import ModelFileBuilder
@@ -232,6 +233,60 @@ def base_table_records(
     )
 
 
+@base_table.command("export")
+@needs_context
+# fmt: off
+@click.option("-o", "--output", type=click.File("wb"), default="-", help="File to write (default: stdout).")
+@click.option("--format", "format_", type=click.Choice(list(FORMATS)), help="Output format (default: from the file name, or ndjson).")
+@click.option("-z", "--compress", "compression", type=click.Choice(COMPRESSIONS), help="Compression (default: from the file name).")
+@click.option("-f", "--formula", help="Filter records with a formula.")
+@click.option("-v", "--view", help="Filter records by a view.")
+@click.option("-n", "--limit", "max_records", type=int, help="Limit the number of records returned.")
+@click.option("-S", "--sort", help="Sort records by field(s).", multiple=True)
+@click.option("-F", "--field", "fields", help="Limit output to certain field(s).", multiple=True)
+@click.option("-q", "--quiet", is_flag=True, help="Do not print progress.")
+# fmt: on
+def base_table_export(
+    ctx: CliContext,
+    output: BinaryIO,
+    format_: str | None,
+    compression: str | None,
+    formula: str | None,
+    view: str | None,
+    max_records: int | None,
+    fields: Sequence[str],
+    sort: Sequence[str],
+    quiet: bool,
+) -> None:
+    """
+    Write records to a file, one page at a time.
+    """
+    guessed_format, guessed_compression = _guess_export_format(
+        getattr(output, "name", "")
+    )
+    format_ = format_ or guessed_format or "ndjson"
+    compression = compression or guessed_compression
+
+    def _progress(count: int) -> None:
+        if not quiet:
+            click.echo(f"\rExported {count:,} records", nl=False, err=True)
+
+    export_records(
+        ctx.table,
+        output,
+        format_,
+        compression=compression,
+        progress=_progress,
+        formula=formula,
+        view=view,
+        max_records=max_records,
+        fields=list(fields),
+        sort=list(sort),
+    )
+    if not quiet:
+        click.echo(err=True)
+
+
 @base_table.command("schema")
 @needs_context
 def base_table_schema(ctx: CliContext) -> None:
@@ -416,6 +471,19 @@ def _dump(obj: Any) -> None:
     print(json.dumps(obj, cls=JSONEncoder))
 
 
+def _guess_export_format(filename: str) -> tuple[str | None, str | None]:
+    """
+    Guess the export format and compression from a file name like ``records.csv.gz``.
+    """
+    suffixes = os.path.basename(filename).lower().split(".")[1:]
+    compression = {"gz": "gzip", "zst": "zstd"}.get(suffixes[-1] if suffixes else "")
+    if compression:
+        suffixes.pop()
+    suffix = suffixes[-1] if suffixes else ""
+    format = "ndjson" if suffix == "jsonl" else suffix if suffix in FORMATS else None
+    return format, compression
+
+
 def _gather_commands(
     command: click.Command | click.Group = cli,
     prefix: str = "",
@@ -1,9 +1,57 @@
+from typing import Any
+
+
 class PyAirtableError(Exception):
     """
     Base class for all exceptions raised by PyAirtable.
     """
 
 
+class BatchError(PyAirtableError):
+    """
+    One or more requests failed during a concurrent batch operation,
+    such as :meth:`Table.batch_create(max_workers=...) <pyairtable.Table.batch_create>`.
+
+    Requests which succeeded have already been applied in Airtable, so callers
+    can use :attr:`errors` to retry only the records that failed.
+    """
+
+    #: Maps the positions (within the input) of each failed chunk of records
+    #: to the exception that was raised while sending it.
+    errors: dict[range, Exception]
+
+    #: Maps the positions (within the input) of each successful chunk of records
+    #: to the value returned for that chunk.
+    results: dict[range, Any]
+
+    def __init__(self, errors: dict[range, Exception], results: dict[range, Any]):
+        self.errors = errors
+        self.results = results
+        count = len(errors) + len(results)
+        failed = ", ".join(f"{r.start}-{r.stop - 1}" for r in errors)
+        super().__init__(f"{len(errors)} of {count} batches failed (records {failed})")
+
+
+class CircuitOpenError(PyAirtableError):
+    """
+    A request was not sent because too many recent requests to the same base
+    have failed. See :class:`~pyairtable.api.circuit.CircuitBreaker`.
+    """
+
+    #: The ID of the base whose circuit is open.
+    base_id: str
+
+    #: The number of seconds until a request to this base might be allowed.
+    retry_after: float
+
+    def __init__(self, base_id: str, retry_after: float):
+        self.base_id = base_id
+        self.retry_after = retry_after
+        super().__init__(
+            f"circuit breaker for {base_id} is open; retry in {retry_after:.1f}s"
+        )
+
+
 class CircularFormulaError(PyAirtableError, RecursionError):
     """
     A circular dependency was encountered when flattening nested conditions.
@@ -1,7 +1,7 @@
+import functools
 from collections.abc import Iterable, Mapping
 from datetime import datetime
-from functools import partial
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, ForwardRef, get_args
 
 import inflection
 import pydantic
@@ -24,27 +24,37 @@ class AirtableModel(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         extra="ignore",
-        alias_generator=partial(inflection.camelize, uppercase_first_letter=False),
+        alias_generator=functools.partial(
+            inflection.camelize, uppercase_first_letter=False
+        ),
         populate_by_name=True,
     )
 
     _raw: dict[str, Any] = pydantic.PrivateAttr()
 
-    def __init__(self, **data: Any) -> None:
-        raw = data.copy()
+    @pydantic.model_validator(mode="wrap")
+    @classmethod
+    def _validate_raw(
+        cls,
+        data: Any,
+        handler: pydantic.ModelWrapValidatorHandler[SelfType],
+    ) -> SelfType:
+        if not isinstance(data, dict):
+            return handler(data)
+        raw = data
 
         # Convert JSON-serializable input data to the types expected by our model.
         # For now this only converts ISO 8601 strings to datetime objects.
-        for field_name, field_model in self.__class__.model_fields.items():
-            for name in {field_name, field_model.alias}:
-                if not name or not (value := data.get(name)):
-                    continue
-                if isinstance(value, str) and field_model.annotation is datetime:
-                    data[name] = datetime_from_iso_str(value)
-
-        super().__init__(**data)
-
-        self._raw = raw  # must happen *after* __init__
+        if keys := _datetime_keys(cls):
+            for key in keys.intersection(data):
+                if isinstance(value := data[key], str) and value:
+                    data = {**data, key: datetime_from_iso_str(value)}
+
+        # This is a wrap validator (rather than an override of __init__) so that
+        # pydantic does not need to call back into Python to build nested models.
+        instance = handler(data)
+        instance._raw = dict(raw)
+        return instance
 
     @classmethod
     def from_api(
@@ -71,10 +81,6 @@ class AirtableModel(pydantic.BaseModel):
         return instance
 
 
-def _context_name(obj: Any) -> str:
-    return inflection.underscore(type(obj).__name__)
-
-
 def cascade_api(
     obj: Any,
     api: "Api",
@@ -119,12 +125,66 @@ def cascade_api(
         # This is what we came here for; set the API and URL on the RESTful model.
         obj._set_api(api, context=context)
 
-    # Find and apply API/context to nested models in every Pydantic field.
-    for field_name in type(obj).model_fields:
+    # Find and apply API/context to nested models, skipping any fields
+    # whose type means they cannot contain a RestfulModel.
+    for field_name in _cascade_fields(type(obj)):
         if field_value := getattr(obj, field_name, None):
             cascade_api(field_value, api, context=context)
 
 
+def _context_name(obj: Any) -> str:
+    return _underscore(type(obj).__name__)
+
+
+_underscore = functools.cache(inflection.underscore)
+
+
+@functools.cache
+def _datetime_keys(cls: type[AirtableModel]) -> frozenset[str]:
+    """
+    Return the names and aliases of all fields on the model which expect a datetime.
+    """
+    return frozenset(
+        name
+        for field_name, field_info in cls.model_fields.items()
+        if field_info.annotation is datetime
+        for name in (field_name, field_info.alias)
+        if name
+    )
+
+
+@functools.cache
+def _cascade_fields(cls: type[AirtableModel]) -> tuple[str, ...]:
+    """
+    Return the names of all fields on the model which might contain a RestfulModel.
+    """
+    return tuple(
+        field_name
+        for field_name, field_info in cls.model_fields.items()
+        if _may_contain_restful(field_info.annotation, {cls})
+    )
+
+
+def _may_contain_restful(annotation: Any, memo: set[type]) -> bool:
+    """
+    Determine whether a value of the given type might be (or contain) a RestfulModel.
+    Unresolved forward references are assumed to, just in case.
+    """
+    if isinstance(annotation, (str, ForwardRef)):
+        return True
+    if isinstance(annotation, type) and issubclass(annotation, AirtableModel):
+        if issubclass(annotation, RestfulModel):
+            return True
+        if annotation in memo:
+            return False
+        memo.add(annotation)
+        return any(
+            _may_contain_restful(field_info.annotation, memo)
+            for field_info in annotation.model_fields.values()
+        )
+    return any(_may_contain_restful(arg, memo) for arg in get_args(annotation))
+
+
 class RestfulModel(AirtableModel):
     """
     Base model for any data structures that wrap around a REST API endpoint.
@@ -137,29 +197,47 @@ class RestfulModel(AirtableModel):
     __url_pattern: ClassVar[str] = ""
 
     _api: "Api" = pydantic.PrivateAttr()
-    _url: str = pydantic.PrivateAttr(default="")
+    _url: str = pydantic.PrivateAttr()
     _url_context: Any = pydantic.PrivateAttr(default=None)
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         cls.__url_pattern = kwargs.pop("url", cls.__url_pattern)
         super().__init_subclass__()
 
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            # Most models retrieved from the API are never saved or deleted,
+            # so we wait until the URL is needed before building it.
+            if name == "_url":
+                self._url = url = self._build_url()
+                return url
+            return super().__getattr__(name)
+
     def _set_api(self, api: "Api", context: dict[str, Any]) -> None:
         """
-        Set a link to the API and build the REST URL used for this resource.
+        Set a link to the API and the context used to build the REST URL for this resource.
+        The URL itself is built the first time it is accessed.
         """
         self._api = api
         self._url_context = context
+        if self.__pydantic_private__:
+            self.__pydantic_private__.pop("_url", None)
+
+    def _build_url(self) -> str:
+        if (context := self._url_context) is None:
+            return ""
         try:
-            self._url = self.__url_pattern.format(**context, self=self)
+            url = self.__url_pattern.format(**context, self=self)
         except (KeyError, AttributeError) as exc:
             exc.args = (
                 *exc.args,
                 {k: v for (k, v) in context.items() if k != "__visited__"},
             )
             raise
-        if self._url and not self._url.startswith("http"):
-            self._url = api.build_url(self._url)
+        if url and not url.startswith("http"):
+            url = self._api.build_url(url)
+        return url
 
     def _reload(self, obj: dict[str, Any] | None = None) -> None:
         """
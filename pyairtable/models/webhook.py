@@ -8,6 +8,7 @@ from typing import Any, Literal
 import pydantic
 from typing_extensions import Self as SelfType
 
+from pyairtable.api import tracing
 from pyairtable.api.types import RecordId
 from pyairtable.models._base import AirtableModel, CanDeleteModel, rebuild_models
 
@@ -88,6 +89,7 @@ class Webhook(CanDeleteModel, url="bases/{base.id}/webhooks/{self.id}"):
         response = self._api.request("POST", f"{self._url}/refresh")
         self.expiration_time = response.get("expirationTime")
 
+    @tracing.traced("Webhook.payloads")
     def payloads(
         self, cursor: int = 1, *, limit: int | None = None
     ) -> Iterator["WebhookPayload"]:
@@ -137,27 +139,31 @@ class Webhook(CanDeleteModel, url="bases/{base.id}/webhooks/{self.id}"):
         if limit is not None and limit < 1:
             raise ValueError("limit must be non-zero")
 
-        url = f"{self._url}/payloads"
-        options = {"cursor": cursor}
         count = 0
-        for page in self._api.iterate_requests(
-            method="GET",
-            url=url,
-            options=options,
-            offset_field="cursor",
-        ):
-            payloads = page["payloads"]
-            for index, payload in enumerate(payloads):
+        for page in self._pages(cursor):
+            for index, payload in enumerate(page["payloads"]):
                 payload = WebhookPayload.from_api(payload, self._api, context=self)
                 payload.cursor = cursor + index
                 yield payload
                 count += 1
                 if limit is not None and count >= limit:
                     return
+            cursor = page["cursor"]
 
-            if not (payloads and page.get("mightHaveMore")):
+    def _pages(self, cursor: int) -> Iterator[dict[str, Any]]:
+        """
+        Iterate through each page of unparsed payloads on or after the given cursor,
+        stopping once the API indicates there are no more payloads to retrieve.
+        """
+        for page in self._api.iterate_requests(
+            method="GET",
+            url=f"{self._url}/payloads",
+            options={"cursor": cursor},
+            offset_field="cursor",
+        ):
+            yield page
+            if not (page["payloads"] and page.get("mightHaveMore")):
                 return
-            cursor = page["cursor"]
 
 
 class _NestedId(AirtableModel):
@@ -46,6 +46,7 @@ from typing import (
 from typing_extensions import Self as SelfType
 
 from pyairtable import formulas, utils
+from pyairtable.api import tracing
 from pyairtable.api.types import (
     AITextDict,
     AttachmentDict,
@@ -852,6 +853,7 @@ class LinkField(
             ("lazy", self._lazy),
         ]
 
+    @tracing.traced("LinkField.populate")
     def populate(
         self,
         instance: "Model",
@@ -885,6 +887,17 @@ class LinkField(
                 author = Author.from_id("reculZ6qSLw0OCA61")
                 Author.books.populate(author, lazy=True, memoize=False)
         """
+        self._populate(instance, lazy=lazy, memoize=memoize)
+
+    def _populate(
+        self,
+        instance: "Model",
+        *,
+        lazy: bool | None = None,
+        memoize: bool | None = None,
+    ) -> None:
+        # Called by populate() and also whenever the field's value is read,
+        # so it is not traced separately from the operation which reads it.
         if self._model and not isinstance(instance, self._model):
             raise RuntimeError(
                 f"populate() got {type(instance)}; expected {self._model}"
@@ -929,7 +942,7 @@ class LinkField(
         We defer creating Model objects until they're requested for the first
         time, so we can avoid infinite recursion during to_internal_value().
         """
-        self.populate(instance)
+        self._populate(instance)
         return super()._get_list_value(instance)
 
     def to_record_value(self, value: list[str | T_Linked]) -> list[str]:
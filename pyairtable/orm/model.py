@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from typing_extensions import Self as SelfType
 
-from pyairtable.api import retrying
+from pyairtable.api import retrying, tracing
 from pyairtable.api.api import Api, TimeoutTuple
 from pyairtable.api.base import Base
 from pyairtable.api.table import Table
@@ -28,6 +28,9 @@ from pyairtable.utils import datetime_from_iso_str, datetime_to_iso_str
 if TYPE_CHECKING:
     from builtins import _ClassInfo
 
+    import pandas
+    import pyarrow
+
 
 class Model:
     """
@@ -312,6 +315,36 @@ class Model:
             return cls.from_record(record, memoize=memoize)
         return None
 
+    @classmethod
+    def to_arrow(cls, **kwargs: Any) -> "pyarrow.Table":
+        """
+        Retrieve all records for this model into a ``pyarrow.Table``, with one
+        column for the record ID and one for each of the model's fields,
+        named after the model's attributes. For all supported keyword arguments,
+        see :meth:`Table.to_arrow <pyairtable.Table.to_arrow>`.
+        """
+        kwargs.update(cls.meta.request_kwargs)
+        attributes = {
+            field.field_name: attr
+            for attr, field in cls._attribute_descriptor_map().items()
+        }
+        kwargs.setdefault("fields", list(attributes))
+        arrow = cls.meta.table.to_arrow(**kwargs)
+        return arrow.rename_columns(
+            [attributes.get(name, name) for name in arrow.column_names]
+        )
+
+    @classmethod
+    def to_pandas(cls, **kwargs: Any) -> "pandas.DataFrame":
+        """
+        Retrieve all records for this model into a pandas ``DataFrame`` indexed
+        by record ID, with one column for each of the model's fields.
+        Accepts the same keyword arguments as :meth:`to_arrow`.
+        """
+        from pyairtable.api import columnar
+
+        return columnar.to_pandas(cls.to_arrow(**kwargs))
+
     @classmethod
     def _maybe_memoize(cls, instance: SelfType, memoize: bool | None) -> None:
         """
@@ -416,6 +449,7 @@ class Model:
         self.created_time = unused.created_time
 
     @classmethod
+    @tracing.traced("Model.from_ids")
     def from_ids(
         cls,
         record_ids: Iterable[RecordId],
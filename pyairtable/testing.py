@@ -250,6 +250,7 @@ class MockAirtable:
     mocked = [
         "Api.request",
         "Table.iterate",
+        "Table.scan",
         "Table.get",
         "Table.create",
         "Table.update",
@@ -451,8 +452,17 @@ class MockAirtable:
         mocked = self._mocks["Api.request"]
         return mocked.temp_original(api, method, url, **kwargs)
 
-    def _table_iterate(self, table: Table, **options: Any) -> list[list[RecordDict]]:
-        return [list(self.records[(table.base.id, table.name)].values())]
+    def _table_iterate(
+        self,
+        table: Table,
+        stream: bool = False,
+        **options: Any,
+    ) -> list[Any]:
+        records = list(self.records[(table.base.id, table.name)].values())
+        return records if stream else [records]
+
+    def _table_scan(self, table: Table, **options: Any) -> list[list[RecordDict]]:
+        return self._table_iterate(table, **options)
 
     def _table_get(self, table: Table, record_id: str, **options: Any) -> RecordDict:
         return self.records[(table.base.id, table.name)][record_id]
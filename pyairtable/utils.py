@@ -1,9 +1,11 @@
 import inspect
+import queue
 import re
 import textwrap
+import threading
 import urllib.parse
 import warnings
-from collections.abc import Callable, Iterable, Iterator, Sequence
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
 from datetime import date, datetime
 from functools import partial, wraps
 from typing import TYPE_CHECKING, Any, Generic, ParamSpec, TypeVar, cast
@@ -11,6 +13,7 @@ from typing import TYPE_CHECKING, Any, Generic, ParamSpec, TypeVar, cast
 import requests
 from typing_extensions import Protocol, Self
 
+from pyairtable.api import tracing
 from pyairtable.api.types import AnyRecordDict, CreateAttachmentByUrl, FieldValue
 
 if TYPE_CHECKING:
@@ -121,6 +124,68 @@ def chunked(iterable: Sequence[T], chunk_size: int) -> Iterator[Sequence[T]]:
         yield iterable[i : i + chunk_size]
 
 
+def prefetched(iterable: Iterable[T], depth: int) -> Generator[T, None, None]:
+    """
+    Consume ``iterable`` in a background thread, staying up to ``depth`` items
+    ahead of the caller. Exceptions are re-raised in the caller's thread.
+    If the caller stops iterating early (or closes the generator), the background
+    thread will stop after it finishes retrieving its current item.
+
+    >>> pages = prefetched(table.iterate(), 2)
+    >>> for page in pages:
+    ...     process(page)  # while the next two pages are retrieved
+
+    Args:
+        iterable: Any iterable, such as a generator which sends requests.
+        depth: The maximum number of items to retrieve ahead of the caller.
+    """
+    if depth < 1:
+        raise ValueError("prefetch depth must be at least 1")
+
+    buffer: queue.Queue[tuple[bool, Any]] = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def _put(done: bool, value: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put((done, value), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not _put(False, item):
+                    return
+            _put(True, None)
+        except Exception as exc:
+            _put(True, exc)
+        finally:
+            if isinstance(iterator, Generator):
+                iterator.close()
+
+    thread = threading.Thread(
+        target=tracing.bind(_produce),
+        name="pyairtable-prefetch",
+        daemon=True,
+    )
+    thread.start()
+    try:
+        while True:
+            done, value = buffer.get()
+            if not done:
+                yield value
+            elif value is None:
+                return
+            else:
+                raise value
+    finally:
+        stopped.set()
+
+
 def is_airtable_id(value: Any, prefix: str = "") -> bool:
     """
     Check whether the given value is an Airtable ID.
@@ -529,6 +594,7 @@ __all__ = [
     "is_record_id",
     "is_table_id",
     "is_user_id",
+    "prefetched",
     "Url",
     "UrlBuilder",
 ]
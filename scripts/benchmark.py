@@ -0,0 +1,415 @@
+"""
+Micro-benchmarks for performance-sensitive code paths in pyAirtable.
+Each subcommand generates realistic data locally and does not use the network.
+
+    $ python scripts/benchmark.py json --pages 50
+    $ python scripts/benchmark.py stream
+    $ python scripts/benchmark.py models --tables 20 --fields 200
+    $ python scripts/benchmark.py validation --records 100000
+    $ python scripts/benchmark.py decode
+    $ python scripts/benchmark.py columnar --records 100000
+"""
+
+import random
+import string
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import click
+import pydantic
+from typing_extensions import TypedDict
+
+from pyairtable import Api
+from pyairtable.api.codecs import CODECS, JSONCodec, get_codec
+from pyairtable.api.streaming import CHUNK_SIZE, iter_items, split_page
+from pyairtable.api.types import RecordDict, assert_typed_dicts
+from pyairtable.api.validation import POLICIES, FullValidation
+from pyairtable.models.audit import AuditLogResponse
+from pyairtable.models.schema import BaseSchema
+from pyairtable.testing import fake_id
+
+
+def fake_page(records: int = 100, offset: bool = True) -> dict[str, Any]:
+    """
+    Build a page of results that resembles what Airtable returns from
+    `List records <https://airtable.com/developers/web/api/list-records>`__
+    for a table with a mix of long text, lookup, and attachment fields.
+    """
+    rand = random.Random(records)
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def _text(words: int) -> str:
+        return " ".join(
+            "".join(rand.choices(string.ascii_lowercase, k=rand.randint(2, 10)))
+            for _ in range(words)
+        )
+
+    def _record(n: int) -> dict[str, Any]:
+        timestamp = created + timedelta(minutes=n)
+        return {
+            "id": fake_id(value=n),
+            "createdTime": timestamp.isoformat(timespec="milliseconds")[:-6] + "Z",
+            "fields": {
+                "Name": _text(3),
+                "Notes": _text(rand.randint(50, 400)) + " — ünïcødé ✓",
+                "Count": rand.randint(0, 10_000),
+                "Price": round(rand.uniform(0, 1000), 2),
+                "Done": rand.random() > 0.5,
+                "Tags": rand.sample(["red", "green", "blue", "cyan", "pink"], k=3),
+                "Related": [fake_id(value=rand.randint(0, 10**6)) for _ in range(5)],
+                "Lookup": [_text(5) for _ in range(5)],
+                "Attachments": [
+                    {
+                        "id": fake_id("att", rand.randint(0, 10**6)),
+                        "url": f"https://dl.airtable.com/{_text(1)}.png",
+                        "filename": f"{_text(1)}.png",
+                        "size": rand.randint(10**3, 10**7),
+                        "type": "image/png",
+                    }
+                ],
+                "Collaborator": {
+                    "id": fake_id("usr", n),
+                    "email": f"user{n}@example.com",
+                    "name": _text(2),
+                },
+            },
+        }
+
+    page: dict[str, Any] = {"records": [_record(n) for n in range(records)]}
+    if offset:
+        page["offset"] = f"itr{fake_id()[3:]}/{fake_id()}"
+    return page
+
+
+def available_codecs() -> dict[str, JSONCodec]:
+    codecs = {}
+    for name, codec_cls in CODECS.items():
+        try:
+            codecs[name] = codec_cls()
+        except ImportError:
+            click.echo(f"skipping {name} (not installed)", err=True)
+    return codecs
+
+
+def measure(func: Callable[[], Any], number: int) -> float:
+    """
+    Return the best average time (in seconds) per call to ``func``.
+    """
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def report(rows: list[tuple[str, float]]) -> None:
+    baseline = rows[-1][1]
+    for label, elapsed in rows:
+        ratio = baseline / elapsed
+        click.echo(f"  {label:<12} {elapsed * 1000:9.3f} ms   {ratio:5.1f}x")
+
+
+@click.group()
+def cli() -> None:
+    pass
+
+
+@cli.command("json")
+@click.option("--pages", default=20, show_default=True, help="Pages per round.")
+@click.option("--page-size", default=100, show_default=True, help="Records per page.")
+def json_codecs(pages: int, page_size: int) -> None:
+    """
+    Compare JSON codecs on pages of records.
+    """
+    codecs = available_codecs()
+    page = fake_page(page_size)
+    stdlib = CODECS["json"]()
+    encoded = stdlib.dumps(page)
+    payload = {
+        "records": [{"fields": r["fields"]} for r in page["records"][:10]],
+        "typecast": False,
+    }
+    click.echo(f"page: {len(encoded):,} bytes, {page_size} records")
+
+    for codec in codecs.values():
+        assert codec.loads(encoded) == page, f"{codec!r} produced different output"
+
+    click.echo("decode one page (response):")
+    report(
+        [
+            (name, measure(lambda: codec.loads(encoded), pages))
+            for name, codec in codecs.items()
+        ]
+    )
+    click.echo("encode ten records (batch_create payload):")
+    report(
+        [
+            (name, measure(lambda: codec.dumps(payload), pages * 10))
+            for name, codec in codecs.items()
+        ]
+    )
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """
+    Return the peak number of bytes allocated while calling ``func``.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@cli.command("stream")
+@click.option("--page-size", default=100, show_default=True, help="Records per page.")
+def stream(page_size: int) -> None:
+    """
+    Compare decoding a page at once with decoding it incrementally.
+    """
+    codec = get_codec()
+    encoded = CODECS["json"]().dumps(fake_page(page_size))
+    chunks = [encoded[n : n + CHUNK_SIZE] for n in range(0, len(encoded), CHUNK_SIZE)]
+    click.echo(f"page: {len(encoded):,} bytes, {page_size} records, {codec!r}")
+
+    def _whole() -> None:
+        for _ in codec.loads(b"".join(chunks))["records"]:
+            pass
+
+    def _streamed() -> None:
+        for _ in iter_items(chunks, "records", codec):
+            pass
+
+    rows = [("stream", _streamed), ("whole page", _whole)]
+    click.echo("peak memory while decoding:")
+    for label, func in rows:
+        click.echo(f"  {label:<12} {peak_memory(func) / 1024:9.1f} KiB")
+    click.echo("time to decode one page:")
+    report([(label, measure(func, 20)) for label, func in rows])
+
+
+def fake_base_schema(tables: int, fields: int) -> dict[str, Any]:
+    """
+    Build a response from `Get base schema <https://airtable.com/developers/web/api/get-base-schema>`__
+    with the given number of tables, each with the given number of fields.
+    """
+    choices = [
+        {"id": fake_id("sel", n), "name": f"Choice {n}", "color": "blueLight2"}
+        for n in range(10)
+    ]
+    options: list[tuple[str, dict[str, Any] | None]] = [
+        ("singleLineText", None),
+        ("number", {"precision": 2}),
+        ("checkbox", {"icon": "check", "color": "greenBright"}),
+        ("singleSelect", {"choices": choices}),
+        (
+            "formula",
+            {
+                "formula": "{fld} * 2",
+                "isValid": True,
+                "referencedFieldIds": [fake_id("fld")],
+                "result": {"type": "number", "options": {"precision": 0}},
+            },
+        ),
+    ]
+
+    def _field(n: int) -> dict[str, Any]:
+        field_type, field_options = options[n % len(options)]
+        field: dict[str, Any] = {
+            "id": fake_id("fld", n),
+            "name": f"Field {n}",
+            "type": field_type,
+        }
+        if field_options:
+            field["options"] = field_options
+        return field
+
+    return {
+        "tables": [
+            {
+                "id": fake_id("tbl", t),
+                "name": f"Table {t}",
+                "primaryFieldId": fake_id("fld", 0),
+                "fields": [_field(n) for n in range(fields)],
+                "views": [
+                    {"id": fake_id("viw", v), "name": f"View {v}", "type": "grid"}
+                    for v in range(5)
+                ],
+            }
+            for t in range(tables)
+        ]
+    }
+
+
+def fake_audit_log_page(events: int = 100) -> dict[str, Any]:
+    """
+    Build a page of results from `Audit log events <https://airtable.com/developers/web/api/audit-log-events>`__.
+    """
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return {
+        "events": [
+            {
+                "id": fake_id("evt", n),
+                "timestamp": (start + timedelta(seconds=n)).isoformat()[:-6] + "Z",
+                "action": "updateRecordValues",
+                "actor": {
+                    "type": "user",
+                    "user": {"id": fake_id("usr", n), "email": f"u{n}@example.com"},
+                },
+                "modelId": fake_id("app"),
+                "modelType": "base",
+                "payload": {"records": [{"id": fake_id(), "fields": {"Name": "x"}}]},
+                "payloadVersion": "1.0",
+                "context": {
+                    "baseId": fake_id("app"),
+                    "actionId": fake_id("act"),
+                    "enterpriseAccountId": fake_id("ent"),
+                },
+                "origin": {"ipAddress": "1.2.3.4", "userAgent": "Mozilla/5.0"},
+            }
+            for n in range(events)
+        ],
+        "pagination": {"next": "MDFHUk5OMlM4MFhTNkY0R0M2QVlZTVZNNDQ="},
+    }
+
+
+@cli.command("models")
+@click.option("--tables", default=20, show_default=True, help="Tables in the schema.")
+@click.option("--fields", default=200, show_default=True, help="Fields per table.")
+@click.option("--events", default=100, show_default=True, help="Audit log page size.")
+def models(tables: int, fields: int, events: int) -> None:
+    """
+    Measure the cost of building API models from large responses.
+    """
+    api = Api("patFakePersonalAccessToken")
+    base = api.base(fake_id("app"))
+    schema = fake_base_schema(tables, fields)
+    page = fake_audit_log_page(events)
+    click.echo(f"schema: {tables} tables, {tables * fields:,} fields")
+    click.echo(f"audit log: {events} events per page")
+    rows = [
+        ("schema", lambda: BaseSchema.from_api(schema, api, context=base), 5),
+        ("audit page", lambda: AuditLogResponse.model_validate(page), 50),
+    ]
+    for label, func, number in rows:
+        click.echo(f"  {label:<12} {measure(func, number) * 1000:9.3f} ms")
+
+
+@cli.command("validation")
+@click.option("--records", default=100_000, show_default=True, help="Total records.")
+def validation(records: int) -> None:
+    """
+    Compare validation policies on pages of records.
+    """
+    page = fake_page(100)["records"]
+    pages = [list(page) for _ in range(max(1, records // len(page)))]
+    click.echo(f"{len(pages) * len(page):,} records in {len(pages):,} pages")
+
+    def _policy(name: str) -> Callable[[], None]:
+        policy = POLICIES[name]()
+
+        def _run() -> None:
+            for records in pages:
+                policy.check_all(RecordDict, records)
+
+        return _run
+
+    def _per_record() -> None:
+        for records in pages:
+            assert_typed_dicts(RecordDict, records)
+
+    rows = [(name, measure(_policy(name), 1)) for name in POLICIES]
+    rows.append(("per record", measure(_per_record, 1)))
+    click.echo("time to validate all records:")
+    report(rows)
+
+
+@cli.command("decode")
+@click.option("--page-size", default=100, show_default=True, help="Records per page.")
+def decode(page_size: int) -> None:
+    """
+    Compare decoding and then validating a page of records with doing both
+    in a single pass through pydantic-core, or skipping both (``raw=True``).
+    """
+    encoded = CODECS["json"]().dumps(fake_page(page_size))
+    policy = FullValidation()
+    click.echo(f"page: {len(encoded):,} bytes, {page_size} records")
+
+    @pydantic.with_config(pydantic.ConfigDict(extra="allow"))
+    class Page(TypedDict):
+        records: list[RecordDict]
+
+    adapter = pydantic.TypeAdapter(Page)
+
+    def _two_passes(codec: JSONCodec) -> Callable[[], None]:
+        def _run() -> None:
+            policy.decode_page(RecordDict, "records", encoded, codec)
+
+        return _run
+
+    def _one_pass() -> None:
+        adapter.validate_json(encoded)
+
+    def _raw() -> None:
+        split_page(encoded, "records", get_codec())
+
+    rows = [(name, _two_passes(c)) for name, c in available_codecs().items()]
+    rows.append(("one pass", _one_pass))
+    rows.insert(0, ("raw", _raw))
+    click.echo("time to decode and validate one page:")
+    report([(label, measure(func, 20)) for label, func in rows])
+
+
+@cli.command("columnar")
+@click.option("--records", default=100_000, show_default=True, help="Total records.")
+def columnar(records: int) -> None:
+    """
+    Compare decoding each page of records and converting it into Arrow columns
+    (as ``Table.to_pandas`` does) with decoding every record and then building
+    a pandas DataFrame from the list.
+    """
+    import pandas
+    import pyarrow as pa
+
+    from pyairtable.api.columnar import Column
+
+    codec = get_codec()
+    encoded = codec.dumps(fake_page(100))
+    pages = max(1, records // 100)
+    click.echo(f"{pages * 100:,} records in {pages:,} pages, {codec!r}")
+    columns = [
+        Column("Name", pa.string()),
+        Column("Notes", pa.string()),
+        Column("Count", pa.float64()),
+        Column("Price", pa.float64()),
+        Column("Done", pa.bool_(), default=False),
+        Column("Tags", pa.list_(pa.string())),
+        Column("Related", pa.list_(pa.string())),
+        Column("Lookup", pa.list_(pa.string())),
+        Column("Attachments", None),
+        Column("Collaborator", None),
+    ]
+
+    def _columnar() -> None:
+        chunks: list[list[Any]] = [[] for _ in columns]
+        for _ in range(pages):
+            page = codec.loads(encoded)["records"]
+            for column, column_chunks in zip(columns, chunks):
+                column_chunks.append(column.convert(page, codec))
+        pa.Table.from_arrays(
+            [pa.chunked_array(c, col.type) for col, c in zip(columns, chunks)],
+            names=[col.key for col in columns],
+        ).to_pandas()
+
+    def _records() -> None:
+        all_records = [
+            record for _ in range(pages) for record in codec.loads(encoded)["records"]
+        ]
+        pandas.DataFrame.from_records([record["fields"] for record in all_records])
+
+    click.echo("time to decode records and build a DataFrame:")
+    report([("columnar", measure(_columnar, 1)), ("records", measure(_records, 1))])
+
+
+if __name__ == "__main__":
+    cli()
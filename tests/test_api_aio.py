@@ -0,0 +1,649 @@
+import asyncio
+import json
+from collections import defaultdict
+
+import pytest
+import requests
+import urllib3
+
+from pyairtable.api.retrying import retry_strategy
+from pyairtable.api.validation import get_validation
+from pyairtable.exceptions import BatchError
+from pyairtable.models.comment import Comment
+from pyairtable.testing import fake_id, fake_record
+
+httpx = pytest.importorskip("httpx")
+
+from pyairtable.api.aio import AsyncApi, AsyncBase, AsyncTable  # noqa: E402
+
+
+class MockTransport(httpx.MockTransport):
+    """
+    Returns canned responses for a given method and URL (without query string),
+    in the order they were added, and records every request it receives.
+    """
+
+    def __init__(self):
+        super().__init__(self.handle)
+        self.responses = defaultdict(list)
+        self.requests = []
+
+    def add(self, method, url, json=None, status_code=200, headers=None):
+        self.responses[(method.upper(), str(url))].append(
+            (status_code, json, headers or {})
+        )
+
+    def handle(self, request):
+        self.requests.append(request)
+        url = str(request.url.copy_with(query=None))
+        try:
+            status_code, data, headers = self.responses[(request.method, url)].pop(0)
+        except IndexError:
+            return httpx.Response(404, json={"error": "NOT_FOUND"})
+        return httpx.Response(status_code, json=data, headers=headers)
+
+    @property
+    def last_request(self):
+        return self.requests[-1]
+
+
+@pytest.fixture
+def transport():
+    return MockTransport()
+
+
+@pytest.fixture
+def async_api(constants, transport):
+    client = httpx.AsyncClient(transport=transport)
+    return AsyncApi(constants["API_KEY"], client=client, retry_strategy=None)
+
+
+@pytest.fixture
+def async_table(async_api, constants) -> AsyncTable:
+    return async_api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_constructors(async_api, constants):
+    base = async_api.base(constants["BASE_ID"])
+    assert isinstance(base, AsyncBase)
+    assert base.id == constants["BASE_ID"]
+    assert repr(base) == f"<AsyncBase id={constants['BASE_ID']!r}>"
+    table = base.table(constants["TABLE_NAME"])
+    assert table.api is async_api
+    assert table.name == constants["TABLE_NAME"]
+    assert table.urls.records == base.sync.table(constants["TABLE_NAME"]).urls.records
+    assert repr(async_api) == "<pyairtable.AsyncApi>"
+    assert "AsyncTable" in repr(table)
+
+
+def test_api_key(async_api, async_table, transport):
+    """
+    Test that requests are authorized with the API key, and that changing
+    the API key changes the header used for subsequent requests.
+    """
+    record = fake_record()
+    transport.add("GET", async_table.urls.record(record["id"]), record)
+    transport.add("GET", async_table.urls.record(record["id"]), record)
+    run(async_table.get(record["id"]))
+    assert transport.last_request.headers["Authorization"] == "Bearer FakeApiKey"
+    async_api.api_key = "other"
+    assert async_api.api_key == "other"
+    run(async_table.get(record["id"]))
+    assert transport.last_request.headers["Authorization"] == "Bearer other"
+
+
+def test_validation(constants, async_table, transport):
+    """
+    Test that the validation policy is shared with the sync client.
+    """
+    record = {"id": fake_id(), "fields": {}}
+    transport.add("GET", async_table.urls.record(record["id"]), record)
+    async_table.api.sync.validation = get_validation("off")
+    assert async_table.api.validation is async_table.api.sync.validation
+    assert run(async_table.get(record["id"])) == record
+    api = AsyncApi(constants["API_KEY"], validation="structural")
+    assert repr(api.validation) == "<StructuralValidation>"
+
+
+def test_whoami(async_api, transport):
+    payload = {"id": fake_id("usr"), "scopes": ["data.records:read"]}
+    transport.add("GET", async_api.sync.urls.whoami, payload)
+    assert run(async_api.whoami()) == payload
+
+
+def test_iterate(async_table, transport, mock_response_list, mock_records):
+    for page in mock_response_list:
+        transport.add("GET", async_table.urls.records, page)
+
+    async def _pages():
+        return [page async for page in async_table.iterate(view="Grid view")]
+
+    pages = run(_pages())
+    assert pages == [page["records"] for page in mock_response_list]
+    assert transport.requests[0].url.params["view"] == "Grid view"
+    assert transport.requests[1].url.params["offset"] == "recuOeLpF6TQpArJi"
+
+
+def test_all(async_table, transport, mock_response_list, mock_records):
+    for page in mock_response_list:
+        transport.add("GET", async_table.urls.records, page)
+    assert run(async_table.all()) == mock_records
+
+
+def test_first(async_table, transport, mock_records):
+    transport.add("GET", async_table.urls.records, {"records": mock_records[:1]})
+    transport.add("GET", async_table.urls.records, {"records": []})
+    assert run(async_table.first(formula="{Name}")) == mock_records[0]
+    assert transport.last_request.url.params["maxRecords"] == "1"
+    assert transport.last_request.url.params["filterByFormula"] == "{Name}"
+    assert run(async_table.first()) is None
+
+
+def test_first__via_post(async_table, transport, mock_records):
+    """
+    Test that the async client shares the GET-to-POST fallback of the sync client.
+    """
+    formula = f"RECORD_ID() != '{'x' * 17000}'"
+    transport.add("POST", async_table.urls.records_post, {"records": mock_records})
+    assert run(async_table.first(formula=formula)) == mock_records[0]
+    assert json.loads(transport.last_request.content) == {
+        "filterByFormula": formula,
+        "maxRecords": 1,
+        "pageSize": 1,
+    }
+
+
+def test_get(async_table, transport, mock_response_single):
+    record_id = mock_response_single["id"]
+    transport.add("GET", async_table.urls.record(record_id), mock_response_single)
+    assert run(async_table.get(record_id)) == mock_response_single
+
+
+def test_get__use_field_ids(constants, transport, mock_response_single):
+    client = httpx.AsyncClient(transport=transport)
+    api = AsyncApi(constants["API_KEY"], client=client, use_field_ids=True)
+    table = api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+    record_id = mock_response_single["id"]
+    transport.add("GET", table.urls.record(record_id), mock_response_single)
+    run(table.get(record_id))
+    assert transport.last_request.url.params["returnFieldsByFieldId"] == "1"
+
+
+def test_get__error(async_table):
+    """
+    Test that the async client raises the same exceptions as the sync client.
+    """
+    with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+        run(async_table.get("recMissing"))
+    assert exc_info.value.response.status_code == 404
+    assert "NOT_FOUND" in str(exc_info.value)
+
+
+def test_create_update_delete(async_table, transport):
+    record = fake_record(Name="Alice")
+    transport.add("POST", async_table.urls.records, record)
+    transport.add("PATCH", async_table.urls.record(record["id"]), record)
+    transport.add("PUT", async_table.urls.record(record["id"]), record)
+    transport.add(
+        "DELETE",
+        async_table.urls.record(record["id"]),
+        {"id": record["id"], "deleted": True},
+    )
+    assert run(async_table.create({"Name": "Alice"}, typecast=True)) == record
+    assert json.loads(transport.last_request.content) == {
+        "fields": {"Name": "Alice"},
+        "typecast": True,
+        "returnFieldsByFieldId": False,
+    }
+    assert run(async_table.update(record["id"], {"Name": "Alice"})) == record
+    assert run(async_table.update(record["id"], {}, replace=True)) == record
+    assert transport.last_request.method == "PUT"
+    assert run(async_table.delete(record["id"])) == {
+        "id": record["id"],
+        "deleted": True,
+    }
+
+
+def test_batch_create(async_table, transport):
+    records = [fake_record(n=n) for n in range(25)]
+    for chunk in (records[:10], records[10:20], records[20:]):
+        transport.add("POST", async_table.urls.records, {"records": chunk})
+    result = run(async_table.batch_create([r["fields"] for r in records]))
+    assert result == records
+    assert len(transport.requests) == 3
+
+
+def test_batch_update(async_table, transport):
+    records = [fake_record(n=n) for n in range(15)]
+    for chunk in (records[:10], records[10:]):
+        transport.add("PATCH", async_table.urls.records, {"records": chunk})
+    assert run(async_table.batch_update(records)) == records
+    sent = json.loads(transport.requests[0].content)
+    assert sent["records"] == [
+        {"id": r["id"], "fields": r["fields"]} for r in records[:10]
+    ]
+
+
+def test_batch_upsert(async_table, transport):
+    records = [fake_record(Name=f"Name {n}") for n in range(12)]
+    for chunk in (records[:10], records[10:]):
+        transport.add(
+            "PATCH",
+            async_table.urls.records,
+            {
+                "createdRecords": [chunk[0]["id"]],
+                "updatedRecords": [r["id"] for r in chunk[1:]],
+                "records": chunk,
+            },
+        )
+    result = run(
+        async_table.batch_upsert(
+            [{"fields": r["fields"]} for r in records], key_fields=["Name"]
+        )
+    )
+    assert result["records"] == records
+    assert result["createdRecords"] == [records[0]["id"], records[10]["id"]]
+    assert len(result["updatedRecords"]) == 10
+    sent = json.loads(transport.last_request.content)
+    assert sent["performUpsert"] == {"fieldsToMergeOn": ["Name"]}
+
+    with pytest.raises(ValueError):
+        run(async_table.batch_upsert([{"fields": {}}], key_fields=["Name"]))
+
+
+def test_batch_delete(async_table, transport):
+    ids = [fake_id() for _ in range(11)]
+    for chunk in (ids[:10], ids[10:]):
+        transport.add(
+            "DELETE",
+            async_table.urls.records,
+            {"records": [{"id": i, "deleted": True} for i in chunk]},
+        )
+    result = run(async_table.batch_delete(ids))
+    assert [r["id"] for r in result] == ids
+    assert transport.requests[1].url.params.get_list("records[]") == ids[10:]
+
+
+def test_batch__max_workers(async_table, monkeypatch):
+    """
+    Test that no more than max_workers batches are sent at once,
+    and that results are returned in the same order as the input.
+    """
+    active = []
+    most_active = 0
+
+    async def _post(url, json):
+        nonlocal most_active
+        active.append(url)
+        most_active = max(most_active, len(active))
+        await asyncio.sleep(0.001 * (len(active) % 3))
+        active.pop()
+        return {"records": [fake_record(r["fields"]) for r in json["records"]]}
+
+    monkeypatch.setattr(async_table.api, "post", _post)
+    records = [{"n": n} for n in range(95)]
+    result = run(async_table.batch_create(records, max_workers=3))
+    assert [r["fields"] for r in result] == records
+    assert most_active == 3
+
+    with pytest.raises(ValueError):
+        run(async_table.batch_create(records, max_workers=0))
+
+
+def test_batch__errors(async_table, transport):
+    """
+    Test that if any batch fails, the others are still sent,
+    and the results of each are reported in BatchError.
+    """
+    ids = [fake_id() for _ in range(25)]
+    deleted = [{"id": i, "deleted": True} for i in ids]
+    transport.add("DELETE", async_table.urls.records, {"records": deleted[:10]})
+    transport.add("DELETE", async_table.urls.records, {"error": "NO"}, 422)
+    transport.add("DELETE", async_table.urls.records, {"records": deleted[20:]})
+    with pytest.raises(BatchError) as exc_info:
+        run(async_table.batch_delete(ids, max_workers=1))
+    assert len(transport.requests) == 3
+    assert list(exc_info.value.errors) == [range(10, 20)]
+    assert isinstance(exc_info.value.errors[range(10, 20)], requests.HTTPError)
+    assert exc_info.value.results == {
+        range(0, 10): {"records": deleted[:10]},
+        range(20, 25): {"records": deleted[20:]},
+    }
+
+
+def test_batch__cancelled(async_table):
+    """
+    Test that a cancelled batch is not reported as a failure.
+    """
+
+    async def _cancel(chunk):
+        raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        run(async_table._batch(_cancel, range(5), max_workers=1))
+
+
+def test_comments(async_table, transport, sample_json):
+    record_id = fake_id()
+    comment = sample_json("Comment")
+    transport.add(
+        "GET",
+        async_table.urls.record_comments(record_id),
+        {"comments": [comment], "offset": "abc"},
+    )
+    transport.add(
+        "GET",
+        async_table.urls.record_comments(record_id),
+        {"comments": [comment]},
+    )
+    comments = run(async_table.comments(record_id))
+    assert len(comments) == 2
+    assert all(isinstance(c, Comment) for c in comments)
+    assert comments[0]._api is async_table.api.sync
+    assert transport.last_request.url.params["offset"] == "abc"
+
+
+def test_upload_attachment(async_table, transport, tmp_path):
+    record_id = fake_id()
+    url = async_table.urls.upload_attachment(record_id, "Attachments")
+    response = {"id": record_id, "createdTime": "", "fields": {"Attachments": []}}
+    transport.add("POST", url, response)
+    transport.add("POST", url, response)
+    path = tmp_path / "hello.txt"
+    path.write_text("Hello, world!")
+
+    assert run(async_table.upload_attachment(record_id, "Attachments", path))
+    assert json.loads(transport.last_request.content) == {
+        "contentType": "text/plain",
+        "filename": "hello.txt",
+        "file": "SGVsbG8sIHdvcmxkIQ==\n",
+    }
+
+    with pytest.warns(UserWarning, match="Could not guess content-type"):
+        run(async_table.upload_attachment(record_id, "Attachments", "x", "content"))
+    assert json.loads(transport.last_request.content)["contentType"] == (
+        "application/octet-stream"
+    )
+
+
+def test_schema(async_api, constants, transport, sample_json):
+    base = async_api.base(constants["BASE_ID"])
+    transport.add("GET", base.urls.tables, sample_json("BaseSchema"))
+    table = base.table("Apartments")
+    schema = run(table.schema())
+    assert schema.id == "tbltp8DGLhqbUmjK1"
+    assert run(base.schema()) is base.sync._schema
+    assert len(transport.requests) == 1
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_retry(constants, transport, mock_response_single, status_code):
+    client = httpx.AsyncClient(transport=transport)
+    api = AsyncApi(
+        constants["API_KEY"],
+        client=client,
+        retry_strategy=retry_strategy(
+            total=2,
+            backoff_factor=0,
+            status_forcelist=(429, 503),
+        ),
+    )
+    table = api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+    url = table.urls.record(mock_response_single["id"])
+    transport.add("GET", url, status_code=status_code, headers={"Retry-After": "0"})
+    transport.add("GET", url, mock_response_single)
+    assert run(table.get(mock_response_single["id"])) == mock_response_single
+
+    transport.add("GET", url, status_code=status_code)
+    transport.add("GET", url, status_code=status_code)
+    transport.add("GET", url, status_code=status_code)
+    with pytest.raises(requests.exceptions.RetryError):
+        run(table.get(mock_response_single["id"]))
+
+
+def test_retry__history(constants, transport, mock_response_single):
+    """
+    Test that the response is passed along when a status code is retried,
+    so that urllib3 counts it and reports it when retries are exhausted.
+    """
+    strategy = retry_strategy(total=2, backoff_factor=0, status_forcelist=(503,))
+    client = httpx.AsyncClient(transport=transport)
+    api = AsyncApi(constants["API_KEY"], client=client, retry_strategy=strategy)
+    table = api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+    url = table.urls.record(mock_response_single["id"])
+    for _ in range(3):
+        transport.add("GET", url, status_code=503)
+    with pytest.raises(requests.exceptions.RetryError) as exc_info:
+        run(table.get(mock_response_single["id"]))
+    reason = exc_info.value.args[0].reason
+    assert str(reason) == "too many 503 error responses"
+    assert strategy.stats.retries == 2
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        httpx.ConnectError("refused"),
+        httpx.ConnectTimeout("timed out"),
+        httpx.ReadTimeout("timed out"),
+        httpx.RemoteProtocolError("disconnected"),
+    ],
+)
+def test_retry__transport_error(constants, mock_response_single, error):
+    """
+    Test that connection and read errors are retried like the sync client does,
+    and that the original error is raised once retries are exhausted.
+    """
+    outcomes = [error, mock_response_single, error, error, error]
+
+    def _handler(request):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(200, json=outcome)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    api = AsyncApi(
+        constants["API_KEY"],
+        client=client,
+        retry_strategy=retry_strategy(total=2, backoff_factor=0),
+    )
+    table = api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+    assert run(table.get(mock_response_single["id"])) == mock_response_single
+    with pytest.raises(type(error)):
+        run(table.get(mock_response_single["id"]))
+    assert not outcomes
+
+
+def test_retry__transport_error__post(constants):
+    """
+    Test that read errors are not retried for methods which the retry strategy
+    does not allow, and that transport errors are not retried without a retry strategy.
+    """
+    attempts = []
+
+    def _handler(request):
+        attempts.append(request)
+        raise httpx.ReadTimeout("timed out")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    strategy = retry_strategy(backoff_factor=0, allowed_methods=("GET",))
+    api = AsyncApi(constants["API_KEY"], client=client, retry_strategy=strategy)
+    table = api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+    with pytest.raises(httpx.ReadTimeout):
+        run(table.create({}))
+    assert len(attempts) == 1
+
+    api = AsyncApi(constants["API_KEY"], client=client, retry_strategy=None)
+    with pytest.raises(httpx.ReadTimeout):
+        run(api.whoami())
+    assert len(attempts) == 2
+
+
+def test_retry__hooks(constants, transport):
+    """
+    Test that retries made with a plain urllib3 strategy are reported to event hooks.
+    """
+    client = httpx.AsyncClient(transport=transport)
+    strategy = urllib3.Retry(total=2, backoff_factor=0, status_forcelist=(503,))
+    api = AsyncApi(constants["API_KEY"], client=client, retry_strategy=strategy)
+    retried = []
+    api.hooks.on_retry.append(lambda event: retried.append(event.status))
+    transport.add("GET", api.sync.urls.whoami, status_code=503)
+    transport.add("GET", api.sync.urls.whoami, {"id": "usrFake"})
+    assert run(api.whoami()) == {"id": "usrFake"}
+    assert retried == [503]
+
+
+def test_timeout(constants, transport):
+    """
+    Test that the connect/read timeout tuple is passed along to httpx.
+    """
+    seen = []
+
+    async def _handler(request):
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"id": "usrFake"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    api = AsyncApi(constants["API_KEY"], client=client, timeout=(1, 2))
+    assert api.timeout == (1, 2)
+    run(api.whoami())
+    assert seen[0]["connect"] == 1
+    assert seen[0]["read"] == 2
+
+
+def test_context_manager(async_api):
+    async def _use():
+        async with async_api as api:
+            assert api is async_api
+        return async_api.client.is_closed
+
+    assert run(_use()) is True
+
+
+def test_concurrent_requests(async_table, transport):
+    """
+    Test that many requests can be in flight at once on a single event loop.
+    """
+    in_flight = 0
+    peak = 0
+
+    async def _handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        record_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json=fake_record(id=record_id))
+
+    async_table.api.client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    ids = [fake_id() for _ in range(50)]
+
+    async def _fetch_all():
+        return await asyncio.gather(*(async_table.get(i) for i in ids))
+
+    records = run(_fetch_all())
+    assert [r["id"] for r in records] == ids
+    assert peak == 50
+
+
+def test_iterate__formula_and_field_ids(constants, transport):
+    """
+    Test that iterate() converts Formula objects and applies use_field_ids.
+    """
+    from pyairtable.formulas import EQ, Field
+
+    client = httpx.AsyncClient(transport=transport)
+    api = AsyncApi(constants["API_KEY"], client=client, use_field_ids=True)
+    table = api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+    transport.add("GET", table.urls.records, {"records": []})
+    assert run(table.all(formula=EQ(Field("Name"), "Alice"))) == []
+    assert transport.last_request.url.params["filterByFormula"] == "{Name}='Alice'"
+    assert transport.last_request.url.params["returnFieldsByFieldId"] == "1"
+
+
+def test_iterate_requests__non_dict(async_api, transport):
+    """
+    Test that iterate_requests() stops if the response is not a dict.
+    """
+    url = async_api.sync.build_url("whatever")
+    transport.add("PATCH", url, [1, 2, 3])
+
+    async def _responses():
+        return [r async for r in async_api.iterate_requests("PATCH", url)]
+
+    assert run(_responses()) == [[1, 2, 3]]
+    transport.add("PATCH", url, {"ok": True})
+    assert run(async_api.patch(url)) == {"ok": True}
+
+
+def test_batch_upsert__with_id(async_table, transport):
+    record = fake_record()
+    transport.add(
+        "PATCH",
+        async_table.urls.records,
+        {"createdRecords": [], "updatedRecords": [record["id"]], "records": [record]},
+    )
+    result = run(async_table.batch_upsert([record], key_fields=["Name"]))
+    assert result["updatedRecords"] == [record["id"]]
+
+
+def test_iterate__prefetch(async_table, transport, mock_response_list):
+    for page in mock_response_list:
+        transport.add("GET", async_table.urls.records, page)
+
+    async def _pages():
+        return [page async for page in async_table.iterate(prefetch=2)]
+
+    pages = run(_pages())
+    assert pages == [page["records"] for page in mock_response_list]
+    assert all("prefetch" not in str(r.url) for r in transport.requests)
+
+
+def test_iterate__prefetch__cancel(async_api, transport):
+    """
+    Test that the background task is cancelled when the caller stops iterating.
+    """
+    url = async_api.sync.build_url("appLkNDICXNqxSDhG/table")
+    for _ in range(10):
+        transport.add("GET", url, {"offset": "again"})
+
+    async def _first():
+        pages = async_api.iterate_requests("GET", url, prefetch=1)
+        async for page in pages:
+            break
+        await pages.aclose()
+        await asyncio.sleep(0.01)
+        return page
+
+    assert run(_first()) == {"offset": "again"}
+    assert len(transport.requests) <= 3
+
+
+def test_iterate__prefetch__error(async_api, transport):
+    url = async_api.sync.build_url("appLkNDICXNqxSDhG/table")
+    transport.add("GET", url, {"offset": "1"})
+    transport.add("GET", url, {"error": "oops"}, status_code=500)
+
+    async def _pages():
+        pages = []
+        with pytest.raises(requests.exceptions.HTTPError):
+            async for page in async_api.iterate_requests("GET", url, prefetch=2):
+                pages.append(page)
+        return pages
+
+    assert run(_pages()) == [{"offset": "1"}]
+
+
+def test_iterate__prefetch__invalid(async_api):
+    async def _pages():
+        return [p async for p in async_api.iterate_requests("GET", "x", prefetch=-1)]
+
+    with pytest.raises(ValueError):
+        run(_pages())
@@ -1,6 +1,9 @@
+import threading
+import time
 from unittest import mock
 
 import pytest
+import requests
 
 from pyairtable import Api, Base, Table
 
@@ -182,6 +185,157 @@ def test_iterate_requests__invalid_type(api: Api, requests_mock):
     assert responses == [response["json"] for response in response_list]
 
 
+@pytest.mark.parametrize("prefetch", [0, 1])
+def test_iterate_requests__decode(api: Api, requests_mock, prefetch):
+    """
+    Test that decode= is called with each response body, and that its return
+    value is used to find the next page.
+    """
+    url = "https://example.com"
+    response_list = [{"json": {"offset": "x"}}, {"json": {}}]
+    requests_mock.get(url, response_list=response_list)
+
+    def _decode(data):
+        return {**api.json_codec.loads(data), "size": len(data)}
+
+    pages = api.iterate_requests("GET", url, prefetch=prefetch, decode=_decode)
+    assert list(pages) == [{"offset": "x", "size": 15}, {"size": 2}]
+    assert api.request("GET", url, decode=bytes.decode) == "{}"
+
+
+def test_iterate_requests__prefetch(api: Api, requests_mock):
+    """
+    Test that prefetch=N retrieves the next page in a background thread
+    while the caller is still working on the current page.
+    """
+    url = "https://example.com"
+    second_page_requested = threading.Event()
+    thread_names = []
+
+    def _respond(request, context):
+        thread_names.append(threading.current_thread().name)
+        page = int(request.qs.get("offset", ["0"])[0])
+        if page == 1:
+            second_page_requested.set()
+        return {"page": page, "offset": page + 1} if page < 3 else {"page": page}
+
+    requests_mock.get(url, json=_respond)
+    pages = []
+    for page in api.iterate_requests("GET", url, prefetch=2):
+        if not pages:
+            assert second_page_requested.wait(timeout=5)
+        pages.append(page)
+
+    assert [page["page"] for page in pages] == [0, 1, 2, 3]
+    assert set(thread_names) == {"pyairtable-prefetch"}
+
+
+def test_iterate_requests__prefetch__cancel(api: Api, requests_mock):
+    """
+    Test that the background thread stops once the caller stops iterating.
+    """
+    url = "https://example.com"
+    m = requests_mock.get(url, json={"offset": "forever"})
+    pages = api.iterate_requests("GET", url, prefetch=1)
+    assert next(pages) == {"offset": "forever"}
+    # wait until the background thread is blocked on a full buffer
+    for _ in range(500):
+        if m.call_count >= 3:
+            break
+        time.sleep(0.01)
+    pages.close()
+    for thread in threading.enumerate():
+        if thread.name == "pyairtable-prefetch":
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+    # one page consumed, one page buffered, one page that was never delivered
+    assert m.call_count == 3
+
+
+def test_iterate_requests__prefetch__error(api: Api, requests_mock):
+    """
+    Test that an error in the background thread is raised to the caller,
+    after the pages that were retrieved before the error.
+    """
+    url = "https://example.com"
+    requests_mock.get(
+        url,
+        response_list=[
+            {"json": {"page": 0, "offset": 1}},
+            {"status_code": 500},
+        ],
+    )
+    pages = api.iterate_requests("GET", url, prefetch=3)
+    assert next(pages) == {"page": 0, "offset": 1}
+    with pytest.raises(requests.exceptions.HTTPError):
+        next(pages)
+
+
+def test_iterate_requests__prefetch__invalid(api: Api):
+    with pytest.raises(ValueError):
+        list(api.iterate_requests("GET", "https://example.com", prefetch=-1))
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iterate_requests__stream(api: Api, requests_mock, prefetch):
+    """
+    Test that stream= yields each item of the named list, across all pages,
+    and uses the rest of each response payload to find the next page.
+    """
+    url = "https://example.com"
+    m = requests_mock.get(
+        url,
+        response_list=[
+            {"json": {"items": [{"n": 0}, {"n": 1}], "offset": 1}},
+            {"json": {"offset": 2, "items": [{"n": 2}]}},
+            {"json": {"items": []}},
+        ],
+    )
+    items = api.iterate_requests("GET", url, prefetch=prefetch, stream="items")
+    assert list(items) == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert [r.qs.get("offset") for r in m.request_history] == [None, ["1"], ["2"]]
+
+
+def test_iterate_requests__stream__prefetch(api: Api, requests_mock):
+    """
+    Test that stream= with prefetch=N retrieves whole pages in the background,
+    rather than staying N items ahead of the caller.
+    """
+    url = "https://example.com"
+    requested = []
+    third_page_requested = threading.Event()
+
+    def _respond(request, context):
+        page = int(request.qs.get("offset", ["0"])[0])
+        requested.append((page, threading.current_thread().name))
+        if page == 2:
+            third_page_requested.set()
+        items = [{"page": page, "n": n} for n in range(5)]
+        return {"items": items, "offset": page + 1} if page < 3 else {"items": items}
+
+    requests_mock.get(url, json=_respond)
+    items = api.iterate_requests("GET", url, prefetch=2, stream="items")
+    assert next(items) == {"page": 0, "n": 0}
+    # pages 1 and 2 are retrieved while the caller is still on the first item
+    assert third_page_requested.wait(timeout=5)
+    rest = list(items)
+    assert len(rest) == 19
+    assert rest[-1] == {"page": 3, "n": 4}
+    assert requested == [(n, "pyairtable-prefetch") for n in range(4)]
+
+
+def test_iterate_requests__stream__error(api: Api, requests_mock):
+    url = "https://example.com"
+    requests_mock.get(
+        url,
+        status_code=422,
+        json={"error": {"type": "INVALID_REQUEST", "message": "Bad"}},
+    )
+    with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+        list(api.iterate_requests("GET", url, stream="records"))
+    assert "INVALID_REQUEST" in str(exc_info.value)
+
+
 def test_workspace(api):
     assert api.workspace("wspFake").id == "wspFake"
 
@@ -0,0 +1,278 @@
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from pyairtable.api.auditlog import AuditLogExport, split_windows
+from pyairtable.models.audit import AuditLogEvent
+from pyairtable.testing import fake_id
+from pyairtable.utils import datetime_from_iso_str, datetime_to_iso_str
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def fake_event(n, timestamp):
+    return {
+        "id": f"evt{n:014d}",
+        "timestamp": datetime_to_iso_str(timestamp),
+        "action": "viewBase",
+        "actor": {"type": "anonymousUser"},
+        "modelId": (base_id := fake_id("app")),
+        "modelType": "base",
+        "payload": {"name": "The Base Name"},
+        "payloadVersion": "1.0",
+        "context": {
+            "baseId": base_id,
+            "actionId": fake_id("act"),
+            "enterpriseAccountId": fake_id("ent"),
+        },
+        "origin": {"ipAddress": "8.8.8.8", "userAgent": "Internet Explorer"},
+    }
+
+
+#: One event every six hours for four days, including one at the very end.
+EVENTS = [fake_event(n, START + timedelta(hours=6 * n)) for n in range(17)]
+
+
+@pytest.fixture
+def audit_log(enterprise, requests_mock):
+    """
+    Mock the audit log endpoint, filtering EVENTS by time and returning pages of two.
+    """
+    fail_at = set()
+
+    def _respond(request, context):
+        if m.call_count in fail_at:
+            raise ValueError("interrupted")
+        query = request.qs
+        assert query["sortOrder"] == ["ascending"]
+        start = datetime_from_iso_str(query["startTime"][0])
+        end = datetime_from_iso_str(query["endTime"][0])
+        matches = [
+            event
+            for event in EVENTS
+            if start <= datetime_from_iso_str(event["timestamp"]) <= end
+        ]
+        offset = int(query.get("next", ["0"])[0])
+        page = matches[offset : offset + 2]
+        more = offset + 2 < len(matches)
+        return {
+            "events": page,
+            "pagination": {"next": str(offset + 2) if more else None},
+        }
+
+    m = requests_mock.get(enterprise.urls.audit_log, json=_respond)
+    m.fail_at = fail_at
+    return m
+
+
+def test_split_windows():
+    day = timedelta(days=1)
+    assert split_windows(START, START + 2 * day, day) == [
+        (START, START + day),
+        (START + day, START + 2 * day),
+    ]
+    assert split_windows(START, START + day, timedelta(hours=16)) == [
+        (START, START + timedelta(hours=16)),
+        (START + timedelta(hours=16), START + day),
+    ]
+    assert split_windows(START, START, day) == []
+
+
+def test_export_audit_log(enterprise):
+    export = enterprise.export_audit_log(
+        date(2025, 1, 1),
+        "2025-01-03T00:00:00.000Z",
+        user_id="usrX",
+        category=["tableManagement"],
+    )
+    assert isinstance(export, AuditLogExport)
+    assert repr(export) == (
+        "<AuditLogExport start_time='2025-01-01T00:00:00.000Z'"
+        " end_time='2025-01-03T00:00:00.000Z' windows=2>"
+    )
+    assert export.params == {
+        "originatingUserId": ["usrX"],
+        "category": ["tableManagement"],
+    }
+
+    # defaults to the most recent 180 days
+    export = enterprise.export_audit_log()
+    assert export.end_time - export.start_time == timedelta(days=180)
+    assert len(export.windows) == 180
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"window": timedelta(0)},
+        {"max_workers": 0},
+    ],
+)
+def test_export_audit_log__invalid(enterprise, kwargs):
+    with pytest.raises(ValueError):
+        enterprise.export_audit_log(**kwargs)
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_events(enterprise, audit_log, max_workers):
+    """
+    Test that events() yields each event exactly once, in chronological order,
+    regardless of how many windows are retrieved at once.
+    """
+    export = enterprise.export_audit_log(
+        START, START + timedelta(days=4, hours=1), max_workers=max_workers
+    )
+    events = list(export.events())
+    assert all(isinstance(event, AuditLogEvent) for event in events)
+    assert [event.id for event in events] == [event["id"] for event in EVENTS]
+    # four windows have two pages; the last window has a single event
+    assert audit_log.call_count == 4 * 2 + 1
+
+
+def test_events__stop_early(enterprise, audit_log):
+    """
+    Test that events() yields the first page of events before retrieving the rest
+    of the window, and that each window only retrieves ``prefetch`` pages ahead.
+    """
+    export = enterprise.export_audit_log(
+        START, START + timedelta(days=4), window=timedelta(days=2)
+    )
+    export.prefetch = 1
+    iterator = export.events()
+    assert next(iterator).id == EVENTS[0]["id"]
+    iterator.close()
+    # each window has four pages, but neither gets more than two pages ahead
+    assert audit_log.call_count <= 3 + 2
+
+
+def test_events__error(enterprise, audit_log):
+    """
+    Test that events() raises an error from any window once it is reached,
+    after yielding all events from the earlier windows.
+    """
+    audit_log.fail_at.add(3)
+    export = enterprise.export_audit_log(
+        START, START + timedelta(days=4), max_workers=1
+    )
+    events = []
+    with pytest.raises(ValueError, match="interrupted"):
+        for event in export.events():
+            events.append(event)
+    assert [event.id for event in events] == [event["id"] for event in EVENTS[:4]]
+
+
+def test_events__no_loop(enterprise, requests_mock):
+    """
+    Test that an empty page of events does not cause an infinite loop.
+    """
+    m = requests_mock.get(
+        enterprise.urls.audit_log,
+        json={"events": [], "pagination": {"next": "dummy"}},
+    )
+    export = enterprise.export_audit_log(START, START + timedelta(days=2))
+    assert list(export.events()) == []
+    assert m.call_count == 2
+
+
+def test_to_ndjson(enterprise, audit_log, tmp_path):
+    export = enterprise.export_audit_log(
+        START, START + timedelta(days=4, hours=1), user_id="usrX"
+    )
+    assert export.to_ndjson(tmp_path) == len(EVENTS)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "20250101T000000Z.ndjson",
+        "20250102T000000Z.ndjson",
+        "20250103T000000Z.ndjson",
+        "20250104T000000Z.ndjson",
+        "20250105T000000Z.ndjson",
+        "state.json",
+    ]
+    lines = (tmp_path / "20250102T000000Z.ndjson").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == EVENTS[4:8]
+    for request in audit_log.request_history:
+        assert request.qs["originatingUserId"] == ["usrX"]
+
+    # running it again does nothing
+    assert export.to_ndjson(tmp_path) == 0
+    assert audit_log.call_count == 4 * 2 + 1
+
+
+def test_to_ndjson__resume(enterprise, audit_log, tmp_path):
+    """
+    Test that an interrupted export resumes each window from the last page written,
+    discarding anything written after that.
+    """
+    export = enterprise.export_audit_log(START, START + timedelta(days=1))
+    audit_log.fail_at.add(2)
+    with pytest.raises(ValueError, match="interrupted"):
+        export.to_ndjson(tmp_path)
+    state = json.loads((tmp_path / "state.json").read_text())
+    assert state["progress"]["20250101T000000Z.ndjson"]["next"] == "2"
+
+    # simulate a crash while writing the second page
+    shard = tmp_path / "20250101T000000Z.ndjson"
+    shard.write_bytes(shard.read_bytes() + b'{"partial": ')
+
+    assert export.to_ndjson(tmp_path) == 2
+    lines = shard.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == EVENTS[:4]
+    assert audit_log.last_request.qs["next"] == ["2"]
+
+
+@pytest.mark.parametrize("start_time", [START, None])
+def test_to_ndjson__resume__default_end_time(
+    enterprise, audit_log, tmp_path, monkeypatch, start_time
+):
+    """
+    Test that an export which ends at the current time can be resumed later,
+    by continuing the export recorded in the directory.
+    """
+    now = START + timedelta(days=2, microseconds=1234)
+
+    class _datetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr("pyairtable.api.auditlog.datetime", _datetime)
+    audit_log.fail_at.add(2)
+    with pytest.raises(ValueError, match="interrupted"):
+        enterprise.export_audit_log(start_time, max_workers=1).to_ndjson(tmp_path)
+    windows = json.loads((tmp_path / "state.json").read_text())["windows"]
+    assert windows[-1][1] == "2025-01-03T00:00:00.001Z"
+
+    now += timedelta(hours=12)
+    enterprise.export_audit_log(start_time, max_workers=1).to_ndjson(tmp_path)
+    state = json.loads((tmp_path / "state.json").read_text())
+    assert state["windows"] == windows
+    assert all(progress["done"] for progress in state["progress"].values())
+    lines = [
+        line
+        for path in sorted(tmp_path.glob("*.ndjson"))
+        for line in path.read_text().splitlines()
+    ]
+    assert [json.loads(line) for line in lines] == EVENTS[:9]
+
+    # an explicit end_time must still match the earlier export
+    export = enterprise.export_audit_log(start_time, now)
+    with pytest.raises(ValueError, match="different audit log export"):
+        export.to_ndjson(tmp_path)
+
+
+def test_to_ndjson__save_error(enterprise, audit_log, tmp_path, monkeypatch):
+    """
+    Test that a failure to save progress leaves the previous state in place.
+    """
+    export = enterprise.export_audit_log(START, START + timedelta(days=1))
+    monkeypatch.setattr("json.dump", lambda *_: exec("raise OSError('disk full')"))
+    with pytest.raises(OSError):
+        export.to_ndjson(tmp_path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["20250101T000000Z.ndjson"]
+
+
+def test_to_ndjson__different_export(enterprise, audit_log, tmp_path):
+    enterprise.export_audit_log(START, START + timedelta(days=1)).to_ndjson(tmp_path)
+    other = enterprise.export_audit_log(START, START + timedelta(days=2))
+    with pytest.raises(ValueError, match="different audit log export"):
+        other.to_ndjson(tmp_path)
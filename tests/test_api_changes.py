@@ -0,0 +1,104 @@
+import urllib.parse
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+
+from pyairtable.api.changes import Watermark
+from pyairtable.testing import fake_record
+
+T0 = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def clock():
+    with mock.patch("pyairtable.api.changes.time.time") as m:
+        m.return_value = T0.timestamp()
+        yield m
+
+
+def _formula(request):
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+    return query.get("filterByFormula", [None])[0]
+
+
+def _respond(requests_mock, table, *pages):
+    """
+    Respond to the two requests made by each poll: the first for records modified
+    before the next poll's overlap window, and the second for those within it.
+    """
+    return requests_mock.get(
+        table.urls.records,
+        response_list=[{"json": {"records": page}} for page in pages],
+    )
+
+
+def test_changes_since(table, requests_mock, clock):
+    """
+    Test that each poll only retrieves records modified since the previous one,
+    and skips records retrieved again during the overlap window if unchanged.
+    """
+    alice = fake_record(Name="Alice")
+    bob = fake_record(Name="Bob")
+    m = _respond(requests_mock, table, [alice], [bob])
+
+    changes = table.changes_since(None, overlap=30)
+    assert [_formula(r) for r in m.request_history] == [
+        "NOT(IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('2024-01-01T11:59:30.000Z')))",
+        "IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('2024-01-01T11:59:30.000Z'))",
+    ]
+    assert changes.records == [alice, bob]
+    assert changes.watermark.timestamp == T0
+    # alice cannot be retrieved by the next poll, so she is not remembered
+    assert set(changes.watermark.seen) == {bob["id"]}
+
+    # the next poll overlaps the previous one
+    clock.return_value += 300
+    alice["fields"]["Name"] = "Alicia"
+    carol = fake_record(Name="Carol")
+    m = _respond(requests_mock, table, [alice, bob, carol], [])
+    changes = table.changes_since(changes.watermark, overlap=30)
+    since = "IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('2024-01-01T11:59:30.000Z'))"
+    boundary = (
+        "IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('2024-01-01T12:04:30.000Z'))"
+    )
+    assert [_formula(r) for r in m.request_history] == [
+        f"AND({since}, NOT({boundary}))",
+        f"AND({since}, {boundary})",
+    ]
+    assert changes.records == [alice, carol]
+    assert changes.watermark.timestamp.timestamp() == T0.timestamp() + 300
+    assert changes.watermark.seen == {}
+
+
+def test_changes_since__modified_during_poll(table, requests_mock, clock):
+    """
+    Test that a record which is modified between the two requests of a poll
+    is only returned once (in its latest version), and is remembered.
+    """
+    before = fake_record(Name="Alice")
+    after = {**before, "fields": {"Name": "Alicia"}}
+    _respond(requests_mock, table, [before], [after])
+    changes = table.changes_since(Watermark(T0, {before["id"]: "abc"}))
+    assert changes.records == [after]
+    assert list(changes.watermark.seen) == [after["id"]]
+
+
+def test_changes_since__formula(table, requests_mock, clock):
+    m = requests_mock.get(table.urls.records, json={"records": []})
+    watermark = Watermark(T0)
+    table.changes_since(watermark, overlap=0, formula="{Status}='Open'", view="Open")
+    assert _formula(m.last_request) == (
+        "AND({Status}='Open', "
+        "IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('2024-01-01T12:00:00.000Z')), "
+        "IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('2024-01-01T12:00:00.000Z')))"
+    )
+    assert m.call_count == 2
+    with pytest.raises(ValueError):
+        table.changes_since(watermark, overlap=-1)
+
+
+def test_watermark__json():
+    watermark = Watermark(T0, {"rec": "abc"})
+    assert Watermark.from_json(watermark.to_json()) == watermark
+    assert Watermark.from_json(watermark.to_json().encode()) == watermark
@@ -0,0 +1,204 @@
+import asyncio
+
+import pytest
+import requests
+
+from pyairtable import Api
+from pyairtable.api.circuit import CircuitBreaker, CircuitBreakerStats, is_failure
+from pyairtable.exceptions import CircuitOpenError
+from pyairtable.testing import fake_record
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replaces the clock used by the circuit breaker, so tests can move time forward.
+    """
+
+    class Clock:
+        now = 1000.0
+
+        def __call__(self):
+            return self.now
+
+    clock = Clock()
+    monkeypatch.setattr("pyairtable.api.circuit.time.monotonic", clock)
+    return clock
+
+
+@pytest.mark.parametrize(
+    "status_code,expected",
+    [(200, False), (404, False), (422, False), (429, True), (500, True), (503, True)],
+)
+def test_is_failure(status_code, expected):
+    assert is_failure(status_code) is expected
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"threshold": 0}, {"cooldown": 0}, {"cooldown": -1}],
+)
+def test_invalid(kwargs):
+    with pytest.raises(ValueError):
+        CircuitBreaker(**kwargs)
+
+
+def test_repr():
+    assert repr(CircuitBreaker()) == (
+        "<CircuitBreaker threshold=5 cooldown=30.0 wait=False>"
+    )
+
+
+def test_open(clock):
+    """
+    Test that the circuit opens after consecutive failures, and that
+    a success resets the count.
+    """
+    breaker = CircuitBreaker(threshold=3, cooldown=10)
+    for success in (False, False, True, False, False):
+        assert breaker.acquire("app1") == 0
+        breaker.record("app1", success)
+    assert breaker.state("app1") == "closed"
+    assert breaker.states() == {}
+
+    breaker.record("app1", False)
+    assert breaker.state("app1") == "open"
+    assert breaker.state("app2") == "closed"
+    assert breaker.states() == {"app1": "open"}
+
+    clock.now += 4
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.acquire("app1")
+    assert exc_info.value.base_id == "app1"
+    assert exc_info.value.retry_after == 6
+    assert str(exc_info.value) == "circuit breaker for app1 is open; retry in 6.0s"
+    assert breaker.acquire("app2") == 0
+    assert breaker.stats == CircuitBreakerStats(opened=1, rejected=1)
+
+
+def test_half_open(clock):
+    """
+    Test that after the cooldown, only one trial request is allowed through.
+    """
+    breaker = CircuitBreaker(threshold=1, cooldown=10)
+    breaker.record("app1", False)
+    clock.now += 10
+    assert breaker.state("app1") == "half-open"
+    assert breaker.acquire("app1") == 0
+    assert breaker.state("app1") == "half-open"
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.acquire("app1")
+    assert exc_info.value.retry_after == CircuitBreaker.PROBE_INTERVAL
+
+    # a failed trial opens the circuit again
+    breaker.record("app1", False)
+    assert breaker.state("app1") == "open"
+    assert breaker.stats.opened == 2
+
+    # a successful trial closes it
+    clock.now += 10
+    assert breaker.acquire("app1") == 0
+    breaker.record("app1", True)
+    assert breaker.state("app1") == "closed"
+    assert breaker.acquire("app1") == 0
+
+
+def test_wait(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=10, wait=True)
+    breaker.record("app1", False)
+    clock.now += 3
+    assert breaker.acquire("app1") == 7
+    assert breaker.stats == CircuitBreakerStats(opened=1, delayed=1, wait_time=7)
+
+
+def test_no_base(clock):
+    breaker = CircuitBreaker(threshold=1)
+    breaker.record(None, False)
+    assert breaker.acquire(None) == 0
+    assert breaker.state(None) == "closed"
+    assert breaker.acquire_url("https://api.airtable.com/v0/meta/whoami") == 0
+
+
+def test_api(api, table, requests_mock, clock):
+    """
+    Test that the Api stops sending requests to a base once its circuit opens.
+    """
+    assert api.circuit_breaker is None
+    assert isinstance(
+        Api("apikey", circuit_breaker=True).circuit_breaker, CircuitBreaker
+    )
+    breaker = CircuitBreaker(threshold=2, cooldown=5)
+    assert Api("apikey", circuit_breaker=breaker).circuit_breaker is breaker
+
+    api.circuit_breaker = breaker
+    m = requests_mock.get(table.urls.record("rec"), status_code=503)
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.HTTPError):
+            table.get("rec")
+    with pytest.raises(CircuitOpenError):
+        table.get("rec")
+    assert m.call_count == 2
+
+    # a request that fails without a response also counts as a failure
+    clock.now += 5
+    m = requests_mock.get(table.urls.record("rec"), exc=requests.ConnectionError)
+    with pytest.raises(requests.ConnectionError):
+        table.get("rec")
+    assert breaker.state(table.base.id) == "open"
+
+    # client errors mean the API is available
+    clock.now += 5
+    m = requests_mock.get(table.urls.record("rec"), status_code=404)
+    with pytest.raises(requests.exceptions.HTTPError):
+        table.get("rec")
+    assert breaker.state(table.base.id) == "closed"
+
+
+def test_api__wait(table, requests_mock, clock, monkeypatch):
+    sleeps = []
+
+    def _sleep(delay):
+        sleeps.append(delay)
+        clock.now += delay
+
+    monkeypatch.setattr("pyairtable.api.api.time.sleep", _sleep)
+    breaker = table.api.circuit_breaker = CircuitBreaker(threshold=1, wait=True)
+    breaker.record(table.base.id, False)
+    clock.now += 20
+    record = fake_record()
+    requests_mock.get(table.urls.record(record["id"]), json=record)
+    assert table.get(record["id"]) == record
+    assert sleeps == [10]
+
+
+def test_async_api(constants, clock, monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    from pyairtable.api.aio import AsyncApi
+
+    sleeps = []
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+        clock.now += delay
+
+    def _handler(request):
+        status_code = 500 if "fail" in str(request.url) else 200
+        return httpx.Response(status_code, json=fake_record())
+
+    monkeypatch.setattr("pyairtable.api.aio.asyncio.sleep", _sleep)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    breaker = CircuitBreaker(threshold=1, cooldown=5, wait=True)
+    api = AsyncApi(constants["API_KEY"], client=client, circuit_breaker=breaker)
+    table = api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+    assert api.circuit_breaker is breaker
+    assert AsyncApi(constants["API_KEY"]).circuit_breaker is None
+
+    async def _main():
+        with pytest.raises(requests.exceptions.HTTPError):
+            await table.get("recfail")
+        assert breaker.state(table.base.id) == "open"
+        await table.get("rec")
+
+    asyncio.run(_main())
+    assert sleeps == [5]
+    assert breaker.state(table.base.id) == "closed"
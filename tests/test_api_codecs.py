@@ -0,0 +1,197 @@
+import datetime
+import decimal
+import enum
+import json
+import math
+import uuid
+from unittest import mock
+
+import pytest
+
+from pyairtable import Api
+from pyairtable.api.codecs import (
+    CODECS,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibCodec,
+    get_codec,
+)
+
+DOCUMENT = """
+{
+    "records": [
+        {
+            "id": "recAdw9EjV90xbZ",
+            "createdTime": "2023-05-22T21:24:15.000Z",
+            "fields": {
+                "Name": "Alice \\u00e9\\ud83d\\ude00 \\"quoted\\" \\\\ \\/ \\n",
+                "Notes": "Long text with unicode: 日本語",
+                "Count": 9007199254740993,
+                "Negative": -12,
+                "Ratio": 0.1,
+                "Exponent": 1.5e-10,
+                "Zero": -0.0,
+                "Done": true,
+                "Missing": null,
+                "Lookup": [1, "two", 3.0, [], {}],
+                "Attachments": [{"id": "att123", "url": "https://example.com/a.png"}]
+            }
+        }
+    ],
+    "offset": "itr123/rec456"
+}
+"""
+
+
+@pytest.fixture(params=list(CODECS))
+def codec(request):
+    return get_codec(request.param)
+
+
+def test_repr(codec):
+    assert repr(codec) == f"<{type(codec).__name__}>"
+
+
+def test_loads(codec):
+    """
+    Test that every codec decodes JSON into exactly the same objects as the stdlib.
+    """
+    expected = json.loads(DOCUMENT)
+    for data in (DOCUMENT, DOCUMENT.encode()):
+        result = codec.loads(data)
+        assert result == expected
+        assert json.dumps(result) == json.dumps(expected)
+
+
+def test_loads__invalid(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_dumps(codec):
+    payload = json.loads(DOCUMENT)
+    assert json.loads(codec.dumps(payload)) == payload
+    assert json.loads(codec.dumps({1: "one"})) == {"1": "one"}
+    assert json.loads(codec.dumps(("a", "b"))) == ["a", "b"]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        object(),
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        datetime.date(2024, 1, 2),
+        decimal.Decimal("1.5"),
+        {1, 2},
+        frozenset([1]),
+        b"bytes",
+        uuid.UUID(int=0),
+        enum.Enum("Color", "RED").RED,
+        {(1, 2): "tuple key"},
+    ],
+)
+def test_dumps__invalid(codec, value):
+    """
+    Test that every codec refuses to encode the same values as the stdlib,
+    rather than converting them into strings or arrays.
+    """
+    with pytest.raises(TypeError):
+        json.dumps(value)
+    with pytest.raises(TypeError):
+        codec.dumps({"records": [{"fields": {"Value": value}}]})
+
+
+def test_dumps__subclasses(codec):
+    """
+    Test that subclasses of str and int (such as enums) are encoded by value.
+    """
+    payload = {
+        "Status": enum.Enum("Status", {"DONE": "done"}, type=str).DONE,
+        "Level": enum.IntEnum("Level", "LOW").LOW,
+    }
+    assert json.loads(codec.dumps(payload)) == {"Status": "done", "Level": 1}
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+@pytest.mark.parametrize(
+    "payload",
+    [
+        lambda v: v,
+        lambda v: {"fields": {"Score": v}},
+        lambda v: {"records": [{"fields": {"Name": "null", "Scores": (1.0, v)}}]},
+    ],
+)
+def test_dumps__non_finite(codec, payload, value):
+    """
+    Test that every codec refuses to encode NaN or infinity,
+    rather than sending null and clearing the field.
+    """
+    with pytest.raises(ValueError):
+        json.dumps(payload(value), allow_nan=False)
+    with pytest.raises(ValueError):
+        codec.dumps(payload(value))
+    assert json.loads(codec.dumps(payload(1.5))) == json.loads(json.dumps(payload(1.5)))
+
+
+def test_loads__big_int():
+    """
+    Test that the default codecs decode integers wider than 64 bits
+    in the same way as the stdlib, unlike orjson.
+    """
+    data = b'{"a": 123456789012345678901234567890, "b": -9223372036854775809}'
+    expected = json.loads(data)
+    assert get_codec().loads(data) == expected
+    assert get_codec("msgspec").loads(data) == expected
+    assert get_codec("orjson").loads(data) != expected
+
+
+def test_get_codec():
+    assert isinstance(get_codec("json"), StdlibCodec)
+    assert isinstance(get_codec("orjson"), OrjsonCodec)
+    assert isinstance(get_codec("msgspec"), MsgspecCodec)
+    custom = StdlibCodec()
+    assert get_codec(custom) is custom
+    with pytest.raises(ValueError):
+        get_codec("simplejson")
+
+
+@pytest.mark.parametrize(
+    "unavailable,expected",
+    [
+        ([], MsgspecCodec),
+        (["orjson"], MsgspecCodec),
+        (["msgspec"], StdlibCodec),
+    ],
+)
+def test_get_codec__default(unavailable, expected):
+    """
+    Test that get_codec() prefers msgspec, then the stdlib,
+    and does not select orjson unless asked to.
+    """
+    with mock.patch.dict("sys.modules", {name: None for name in unavailable}):
+        assert isinstance(get_codec(), expected)
+
+
+def test_api__default():
+    assert isinstance(Api("apikey").json_codec, MsgspecCodec)
+    assert isinstance(Api("apikey", json_codec="json").json_codec, StdlibCodec)
+
+
+def test_api__request(table, requests_mock, codec):
+    """
+    Test that Api uses its codec to encode payloads and decode responses.
+    """
+    table.api.json_codec = codec = mock.Mock(wraps=codec)
+    record = json.loads(DOCUMENT)["records"][0]
+    requests_mock.post(table.urls.records, text=DOCUMENT)
+    requests_mock.patch(table.urls.record(record["id"]), content=b"")
+
+    result = table.api.post(table.urls.records, json={"fields": record["fields"]})
+    assert result == json.loads(DOCUMENT)
+    request = requests_mock.last_request
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.json()["fields"] == record["fields"]
+    assert table.api.patch(table.urls.record(record["id"])) is None
+    assert "Content-Type" not in requests_mock.last_request.headers
+    codec.dumps.assert_called_once()
+    codec.loads.assert_called_once()
@@ -0,0 +1,324 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from pyairtable.models.schema import parse_field_schema
+from pyairtable.testing import fake_id, fake_record
+
+pa = pytest.importorskip("pyarrow")
+columnar = pytest.importorskip("pyairtable.api.columnar")
+
+TABLE_ID = fake_id("tbl")
+DATETIME_OPTIONS = {
+    "timeZone": "utc",
+    "dateFormat": {"name": "iso", "format": "YYYY-MM-DD"},
+    "timeFormat": {"name": "24hour", "format": "HH:mm"},
+}
+FIELDS = [
+    {"id": "fldName", "name": "Name", "type": "singleLineText"},
+    {"id": "fldAge", "name": "Age", "type": "number", "options": {"precision": 0}},
+    {
+        "id": "fldHeight",
+        "name": "Height",
+        "type": "number",
+        "options": {"precision": 2},
+    },
+    {
+        "id": "fldRating",
+        "name": "Rating",
+        "type": "rating",
+        "options": {"max": 5, "icon": "star", "color": "yellowBright"},
+    },
+    {
+        "id": "fldDone",
+        "name": "Done",
+        "type": "checkbox",
+        "options": {"icon": "check", "color": "greenBright"},
+    },
+    {
+        "id": "fldBorn",
+        "name": "Born",
+        "type": "date",
+        "options": {"dateFormat": {"name": "iso", "format": "YYYY-MM-DD"}},
+    },
+    {"id": "fldSeen", "name": "Seen", "type": "dateTime", "options": DATETIME_OPTIONS},
+    {
+        "id": "fldTags",
+        "name": "Tags",
+        "type": "multipleSelects",
+        "options": {"choices": []},
+    },
+    {
+        "id": "fldLinks",
+        "name": "Links",
+        "type": "multipleRecordLinks",
+        "options": {
+            "linkedTableId": fake_id("tbl"),
+            "isReversed": False,
+            "prefersSingleRecordLink": False,
+        },
+    },
+    {
+        "id": "fldCalc",
+        "name": "Calc",
+        "type": "formula",
+        "options": {
+            "isValid": True,
+            "referencedFieldIds": [],
+            "formula": "{Age} / 2",
+            "result": {"type": "number", "options": {"precision": 1}},
+        },
+    },
+    {
+        "id": "fldVisits",
+        "name": "Visits",
+        "type": "multipleLookupValues",
+        "options": {
+            "isValid": True,
+            "recordLinkFieldId": "fldLinks",
+            "fieldIdInLinkedTable": "fldWhen",
+            "result": {"type": "dateTime", "options": DATETIME_OPTIONS},
+        },
+    },
+    {
+        "id": "fldFiles",
+        "name": "Files",
+        "type": "multipleAttachments",
+        "options": {"isReversed": False},
+    },
+]
+
+ALICE = fake_record(
+    {
+        "Name": "Alice",
+        "Age": 30,
+        "Height": 1.65,
+        "Rating": 4,
+        "Done": True,
+        "Born": "1994-05-01",
+        "Seen": "2024-01-02T03:04:05.000Z",
+        "Tags": ["a", "b"],
+        "Links": ["recA", "recB"],
+        "Calc": 15.0,
+        "Visits": ["2024-01-01T00:00:00.000Z"],
+        "Files": [{"id": "att1", "url": "https://example.com"}],
+    }
+)
+BOB = fake_record(
+    {
+        "Name": "Bob",
+        "Age": 40.5,
+        "Height": 2,
+        "Born": "not a date",
+        "Calc": {"specialValue": "NaN"},
+    }
+)
+
+
+@pytest.fixture
+def table(api, base_id, requests_mock):
+    table = api.table(base_id, TABLE_ID)
+    requests_mock.get(
+        table.base.urls.tables,
+        json={
+            "tables": [
+                {
+                    "id": TABLE_ID,
+                    "name": "People",
+                    "primaryFieldId": "fldName",
+                    "fields": FIELDS,
+                    "views": [],
+                }
+            ]
+        },
+    )
+    return table
+
+
+@pytest.fixture
+def records_mock(table, requests_mock):
+    return requests_mock.get(
+        table.urls.records,
+        [
+            {"json": {"records": [ALICE], "offset": "page2"}},
+            {"json": {"records": [BOB]}},
+        ],
+    )
+
+
+def test_to_arrow(table, records_mock):
+    """
+    Test that each column's type comes from the field's type, and that
+    values which do not fit that type become null.
+    """
+    arrow = table.to_arrow()
+    assert records_mock.call_count == 2
+    assert arrow.column_names == ["id", *(f["name"] for f in FIELDS)]
+    assert arrow.schema.types == [
+        pa.string(),
+        pa.string(),
+        pa.int64(),
+        pa.float64(),
+        pa.int64(),
+        pa.bool_(),
+        pa.date32(),
+        pa.timestamp("ms", tz="UTC"),
+        pa.list_(pa.string()),
+        pa.list_(pa.string()),
+        pa.float64(),
+        pa.list_(pa.timestamp("ms", tz="UTC")),
+        pa.string(),
+    ]
+    assert arrow.to_pylist() == [
+        {
+            "id": ALICE["id"],
+            "Name": "Alice",
+            "Age": 30,
+            "Height": 1.65,
+            "Rating": 4,
+            "Done": True,
+            "Born": date(1994, 5, 1),
+            "Seen": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "Tags": ["a", "b"],
+            "Links": ["recA", "recB"],
+            "Calc": 15.0,
+            "Visits": [datetime(2024, 1, 1, tzinfo=timezone.utc)],
+            "Files": '[{"id":"att1","url":"https://example.com"}]',
+        },
+        {
+            "id": BOB["id"],
+            "Name": "Bob",
+            "Age": None,
+            "Height": 2.0,
+            "Rating": None,
+            "Done": False,
+            "Born": None,
+            "Seen": None,
+            "Tags": None,
+            "Links": None,
+            "Calc": None,
+            "Visits": None,
+            "Files": None,
+        },
+    ]
+
+
+def test_to_arrow__fields(table, records_mock):
+    """
+    Test that fields= and use_field_ids= control which columns are returned,
+    and what they are called.
+    """
+    arrow = table.to_arrow(fields=["Tags", "fldName"], use_field_ids=True)
+    assert arrow.column_names == ["id", "fldTags", "fldName"]
+    assert records_mock.last_request.qs["fields[]"] == ["Tags", "fldName"]
+    assert records_mock.last_request.qs["returnFieldsByFieldId"] == ["1"]
+
+
+def test_to_arrow__string_format(table, requests_mock):
+    requests_mock.get(
+        table.urls.records,
+        json={"records": [fake_record({"Age": "30", "Done": "checked"})]},
+    )
+    arrow = table.to_arrow(
+        cell_format="string", user_locale="en-us", time_zone="utc", fields=["Age"]
+    )
+    assert arrow.schema.types == [pa.string(), pa.string()]
+    assert arrow.column("Age").to_pylist() == ["30"]
+
+
+def test_to_arrow__empty(table, requests_mock):
+    requests_mock.get(table.urls.records, json={"records": []})
+    arrow = table.to_arrow()
+    assert arrow.num_rows == 0
+    assert arrow.schema.field("Seen").type == pa.timestamp("ms", tz="UTC")
+
+
+def test_table_builder(table, records_mock):
+    """
+    Test that build() returns the records appended so far, then starts again.
+    """
+    builder = columnar.TableBuilder.for_table(table, fields=["Name"])
+    builder.append([fake_record(Name="Alice"), fake_record(Name="Bob")])
+    assert repr(builder) == "<TableBuilder columns=1 num_rows=2>"
+    assert builder.build().column("Name").to_pylist() == ["Alice", "Bob"]
+    assert builder.num_rows == 0
+    assert builder.build().num_rows == 0
+
+
+def test_column__integers():
+    """
+    Test that integers are stored exactly (even beyond the precision of a float),
+    that whole-number floats are stored as integers, and that other floats
+    become null instead of being truncated.
+    """
+    column = columnar.Column("Count", pa.int64())
+    values = [2**53 + 1, 3.0, 40.5, float("nan"), True, None]
+    records = [fake_record(Count=value) for value in values]
+    assert column.convert(records, codec=None).to_pylist() == [
+        2**53 + 1,
+        3,
+        None,
+        None,
+        None,
+        None,
+    ]
+
+    column = columnar.Column("Counts", pa.list_(pa.int64()))
+    records = [fake_record(Counts=[2**53 + 1, 3.0, 40.5]), fake_record()]
+    assert column.convert(records, codec=None).to_pylist() == [
+        [2**53 + 1, 3, None],
+        None,
+    ]
+
+
+def test_to_pandas(table, records_mock):
+    pytest.importorskip("pandas")
+    df = table.to_pandas(fields=["Name", "Height"])
+    assert list(df.index) == [ALICE["id"], BOB["id"]]
+    assert list(df.columns) == ["Name", "Height"]
+    assert list(df["Height"]) == [1.65, 2.0]
+    assert str(df["Height"].dtype) == "float64"
+
+
+@pytest.mark.parametrize(
+    "field_type,options,expected",
+    [
+        ("autoNumber", None, pa.int64()),
+        ("number", {"precision": 0}, pa.int64()),
+        ("number", {"precision": 1}, pa.float64()),
+        (
+            "formula",
+            {
+                "formula": "{Age}",
+                "result": {"type": "number", "options": {"precision": 0}},
+            },
+            pa.float64(),
+        ),
+        ("multipleCollaborators", None, None),
+        ("rollup", {"result": None}, None),
+        ("rollup", {"result": {"type": "singleCollaborator"}}, None),
+        ("multipleLookupValues", {"result": {"type": "rating"}}, pa.list_(pa.int64())),
+        ("multipleLookupValues", {"result": {"type": "multipleSelects"}}, None),
+    ],
+)
+def test_field_type(field_type, options, expected):
+    """
+    Test how column types are chosen for fields whose values are not scalars,
+    or whose type depends on the type of their result.
+    """
+    if options and "result" in options:
+        options = {
+            "isValid": True,
+            "referencedFieldIds": [],
+            "recordLinkFieldId": "fldLinks",
+            "fieldIdInLinkedTable": "fldOther",
+            **options,
+        }
+    field = parse_field_schema(
+        {"id": "fldX", "name": "X", "type": field_type, "options": options}
+    )
+    assert field.type == field_type
+    column = columnar.Column.from_field(field)
+    assert column.json == (expected is None)
+    assert column.type == (expected or pa.string())
+    assert repr(column) == f"<Column key='X' type={column.type}>"
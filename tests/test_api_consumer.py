@@ -0,0 +1,151 @@
+import json
+import threading
+
+import pytest
+
+from pyairtable.api.consumer import CursorStore, FileCursorStore, WebhookConsumer
+from pyairtable.models import Webhook, WebhookPayload
+
+
+def _payload(n):
+    return {
+        "timestamp": "2024-01-01T00:00:00.000Z",
+        "baseTransactionNumber": n,
+        "payloadFormat": "v0",
+    }
+
+
+def _pages(requests_mock, webhook, *sizes, start=1):
+    """
+    Mock one response for each page size given, followed by an empty page.
+    """
+    cursor = start
+    for size in sizes:
+        requests_mock.get(
+            f"{webhook._url}/payloads?cursor={cursor}",
+            json={
+                "payloads": [_payload(cursor + n) for n in range(size)],
+                "cursor": cursor + size,
+                "mightHaveMore": True,
+            },
+        )
+        cursor += size
+    return requests_mock.get(
+        f"{webhook._url}/payloads?cursor={cursor}",
+        json={"payloads": [], "cursor": cursor, "mightHaveMore": False},
+    )
+
+
+@pytest.fixture
+def webhooks(sample_json, base):
+    return [
+        Webhook.from_api(
+            {**sample_json("Webhook"), "id": f"ach{n:014d}"}, base.api, context=base
+        )
+        for n in range(3)
+    ]
+
+
+def test_drain(webhooks, requests_mock):
+    """
+    Test that each page of payloads for each webhook is passed to the handler,
+    and that the cursor is saved after each page.
+    """
+    _pages(requests_mock, webhooks[0], 2, 1)
+    _pages(requests_mock, webhooks[1], 3)
+    _pages(requests_mock, webhooks[2])
+    received = []
+    lock = threading.Lock()
+
+    def handler(webhook, payloads):
+        with lock:
+            received.append((webhook.id, [p.cursor for p in payloads]))
+        assert all(isinstance(p, WebhookPayload) for p in payloads)
+
+    consumer = WebhookConsumer(webhooks, handler)
+    assert repr(consumer) == "<WebhookConsumer webhooks=3>"
+    assert consumer.drain() == 6
+    assert sorted(received) == [
+        (webhooks[0].id, [1, 2]),
+        (webhooks[0].id, [3]),
+        (webhooks[1].id, [1, 2, 3]),
+    ]
+    assert consumer.cursors.get(webhooks[0].id) == 4
+    assert consumer.cursors.get(webhooks[1].id) == 4
+    assert consumer.cursors.get(webhooks[2].id) is None
+
+    # draining again starts from the saved cursors
+    received.clear()
+    _pages(requests_mock, webhooks[0], 1, start=4)
+    assert consumer.drain() == 1
+    assert received == [(webhooks[0].id, [4])]
+
+
+def test_drain__raw(webhooks, requests_mock):
+    _pages(requests_mock, webhooks[0], 2, start=10)
+    received = []
+    cursors = CursorStore()
+    assert repr(cursors) == "<CursorStore>"
+    cursors.set(webhooks[0].id, 10)
+    consumer = WebhookConsumer(
+        webhooks[:1],
+        lambda webhook, payloads: received.extend(payloads),
+        cursors=cursors,
+        raw=True,
+    )
+    assert consumer.drain() == 2
+    assert received == [
+        {**_payload(10), "cursor": 10},
+        {**_payload(11), "cursor": 11},
+    ]
+
+
+def test_drain__handler_error(webhooks, requests_mock):
+    """
+    Test that a failing handler does not prevent other webhooks from being drained,
+    and that the failed page will be passed to the handler again next time.
+    """
+    _pages(requests_mock, webhooks[0], 1, 1)
+    _pages(requests_mock, webhooks[1], 1)
+    calls = []
+
+    def handler(webhook, payloads):
+        calls.append((webhook.id, payloads[0].cursor))
+        if webhook is webhooks[0] and payloads[0].cursor == 2:
+            raise ValueError("oops")
+
+    consumer = WebhookConsumer(webhooks[:2], handler, max_workers=1)
+    with pytest.raises(ValueError, match="oops"):
+        consumer.drain()
+    assert calls == [(webhooks[0].id, 1), (webhooks[0].id, 2), (webhooks[1].id, 1)]
+    assert consumer.cursors.get(webhooks[0].id) == 2
+    assert consumer.cursors.get(webhooks[1].id) == 2
+
+
+def test_file_cursor_store(tmp_path, webhooks, requests_mock):
+    path = tmp_path / "cursors.json"
+    store = FileCursorStore(path)
+    assert repr(store) == f"<FileCursorStore path={str(path)!r}>"
+    assert store.get("achX") is None
+    assert not path.exists()
+
+    _pages(requests_mock, webhooks[0], 2)
+    WebhookConsumer(webhooks[:1], lambda *_: None, cursors=store).drain()
+    assert json.loads(path.read_text()) == {webhooks[0].id: 3}
+    assert FileCursorStore(path).get(webhooks[0].id) == 3
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_file_cursor_store__error(tmp_path, monkeypatch):
+    """
+    Test that a failed write leaves the previous file in place.
+    """
+    path = tmp_path / "cursors.json"
+    store = FileCursorStore(path)
+    store.set("achA", 5)
+    monkeypatch.setattr("json.dump", lambda *_: exec("raise OSError('disk full')"))
+    with pytest.raises(OSError):
+        store.set("achA", 6)
+    assert store.get("achA") == 5
+    assert json.loads(path.read_text()) == {"achA": 5}
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,129 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from pyairtable.api.export import FORMATS, ParquetWriter, RecordWriter, export_records
+from pyairtable.testing import fake_record
+
+RECORDS = [
+    fake_record({"Name": "Alice", "District": ["recA"]}),
+    fake_record(
+        {
+            "Name": "Bob, Jr.",
+            "Pictures": [{"id": "att1", "url": "https://example.com"}],
+        }
+    ),
+    fake_record({}),
+]
+
+
+@pytest.fixture
+def table(base, mock_base_metadata):
+    return base.table("Apartments")
+
+
+@pytest.fixture
+def records_mock(table, requests_mock):
+    return requests_mock.get(
+        table.urls.records,
+        [
+            {"json": {"records": RECORDS[:2], "offset": "page2"}},
+            {"json": {"records": RECORDS[2:]}},
+        ],
+    )
+
+
+def _decompress(data, compression):
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        zstandard = pytest.importorskip("zstandard")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_export_records__ndjson(table, records_mock, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    fp = io.BytesIO()
+    progress = []
+    count = export_records(
+        table, fp, compression=compression, progress=progress.append, view="Active"
+    )
+    assert count == 3
+    assert progress == [2, 3]
+    assert records_mock.last_request.qs["view"] == ["Active"]
+    lines = _decompress(fp.getvalue(), compression).splitlines()
+    assert [json.loads(line) for line in lines] == RECORDS
+    assert not fp.closed
+
+
+def test_export_records__csv(table, records_mock):
+    fp = io.BytesIO()
+    assert export_records(table, fp, "csv") == 3
+    rows = list(csv.reader(io.StringIO(fp.getvalue().decode())))
+    assert rows == [
+        ["id", "Name", "Pictures", "District"],
+        [RECORDS[0]["id"], "Alice", "", '["recA"]'],
+        [
+            RECORDS[1]["id"],
+            "Bob, Jr.",
+            '[{"id":"att1","url":"https://example.com"}]',
+            "",
+        ],
+        [RECORDS[2]["id"], "", "", ""],
+    ]
+
+
+def test_export_records__csv__fields(table, records_mock):
+    """
+    Test that fields= and use_field_ids= control the header row.
+    """
+    fp = io.BytesIO()
+    export_records(table, fp, "csv", fields=["District", "Name"], use_field_ids=True)
+    header = fp.getvalue().decode().splitlines()[0]
+    assert header == "id,fldumZe00w09RYTW6,fld1VnoyuotSTyxW1"
+
+
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_export_records__parquet(table, records_mock, monkeypatch, compression):
+    """
+    Test that records are written in row groups of (at least) row_group_size.
+    """
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(ParquetWriter, "row_group_size", 2)
+    fp = io.BytesIO()
+    assert export_records(table, fp, "parquet", compression=compression) == 3
+    fp.seek(0)
+    parquet = pq.ParquetFile(fp)
+    assert parquet.num_row_groups == 2
+    assert parquet.metadata.row_group(0).column(0).compression == (
+        (compression or "snappy").upper()
+    )
+    arrow = parquet.read()
+    assert arrow.column_names == ["id", "Name", "Pictures", "District"]
+    assert arrow.column("District").to_pylist() == [["recA"], None, None]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"format": "xml"},
+        {"compression": "bz2"},
+    ],
+)
+def test_export_records__invalid(table, kwargs):
+    with pytest.raises(ValueError):
+        export_records(table, io.BytesIO(), **kwargs)
+
+
+def test_record_writer(table):
+    writer = RecordWriter(table, io.BytesIO())
+    assert repr(writer) == "<RecordWriter>"
+    with pytest.raises(NotImplementedError):
+        writer.write(RECORDS)
+    assert list(FORMATS) == ["ndjson", "csv", "parquet"]
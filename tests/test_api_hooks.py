@@ -0,0 +1,259 @@
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+import requests
+
+from pyairtable import Api
+from pyairtable.api.hooks import (
+    EventHooks,
+    LatencyHistogram,
+    LatencySummary,
+    RequestEvent,
+    endpoint_template,
+)
+from pyairtable.api.ratelimit import RateLimiter
+from pyairtable.testing import fake_record
+
+
+class Recorder:
+    """
+    Records every event it receives, along with the name of the hook.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, event):
+        self.calls.append(("before_request", event.method, event.endpoint))
+
+    def after_response(self, event):
+        self.calls.append(("after_response", event.method, event.endpoint))
+
+    def on_retry(self, event):
+        self.calls.append(("on_retry", event.attempt, event.status))
+
+    def on_paginate(self, event):
+        self.calls.append(("on_paginate", event.page))
+
+
+@pytest.fixture
+def recorder(api):
+    recorder = Recorder()
+    api.hooks.subscribe(recorder)
+    return recorder
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://api.airtable.com/v0/appLkNDICXNqxSDhG/My%20Table", "{base}/{table}"),
+        (
+            "https://api.airtable.com/v0/appLkNDICXNqxSDhG/tblK6MZHez0ZvBChZ?x=1",
+            "{base}/{table}",
+        ),
+        (
+            "https://api.airtable.com/v0/appLkNDICXNqxSDhG/Table/rec1234567890abcd",
+            "{base}/{table}/{record}",
+        ),
+        (
+            "https://api.airtable.com/v0/appLkNDICXNqxSDhG/Table/rec1234567890abcd/comments",
+            "{base}/{table}/{record}/comments",
+        ),
+        (
+            "https://api.airtable.com/v0/meta/bases/appLkNDICXNqxSDhG/tables",
+            "meta/bases/{base}/tables",
+        ),
+        (
+            "https://api.airtable.com/v0/bases/appLkNDICXNqxSDhG/webhooks/achAbCdEfGhIjKlMn/payloads",
+            "bases/{base}/webhooks/{webhook}/payloads",
+        ),
+        ("https://api.airtable.com/v0/meta/whoami", "meta/whoami"),
+        ("https://example.com/xyzAbCdEfGhIjKlMn", "{id}"),
+    ],
+)
+def test_endpoint_template(url, expected):
+    assert endpoint_template(url) == expected
+
+
+def test_subscribe():
+    hooks = EventHooks()
+    assert not hooks
+    recorder = Recorder()
+    hooks.subscribe(recorder)
+    assert hooks
+    assert repr(hooks) == (
+        "<EventHooks before_request=1 after_response=1 on_retry=1 on_paginate=1>"
+    )
+    hooks.unsubscribe(recorder)
+    assert not hooks
+
+    histogram = LatencyHistogram()
+    hooks.subscribe(histogram)
+    assert hooks.after_response == [histogram.after_response]
+    assert hooks.before_request == []
+
+
+def test_histogram():
+    histogram = LatencyHistogram(samples=100)
+    for n in range(1, 201):
+        event = RequestEvent(method="GET", url="", endpoint="{base}/{table}")
+        event.timing.total = n / 100
+        histogram.after_response(event)
+    event = RequestEvent(method="POST", url="", endpoint="{base}/{table}")
+    histogram.after_response(event)
+    assert repr(histogram) == "<LatencyHistogram endpoints=2>"
+    assert histogram.summary() == {
+        # only the most recent 100 samples are kept
+        "GET {base}/{table}": LatencySummary(
+            count=100, p50=1.5, p95=1.95, p99=1.99, max=2.0
+        ),
+        "POST {base}/{table}": LatencySummary(count=1, p50=0, p95=0, p99=0, max=0),
+    }
+    histogram.clear()
+    assert histogram.summary() == {}
+
+    with pytest.raises(ValueError):
+        LatencyHistogram(samples=0)
+
+
+def test_request(api, table, requests_mock, recorder):
+    """
+    Test that each request produces a pair of events describing it.
+    """
+    events = []
+    api.hooks.after_response.append(events.append)
+    record = fake_record()
+    requests_mock.get(table.urls.record(record["id"]), json=record)
+    requests_mock.patch(table.urls.record(record["id"]), json=record)
+
+    table.get(record["id"])
+    table.update(record["id"], {"Name": "Alice"})
+    assert recorder.calls == [
+        ("before_request", "GET", "{base}/{table}/{record}"),
+        ("after_response", "GET", "{base}/{table}/{record}"),
+        ("before_request", "PATCH", "{base}/{table}/{record}"),
+        ("after_response", "PATCH", "{base}/{table}/{record}"),
+    ]
+    get, patch = events
+    assert get.status == 200
+    assert get.attempt == 1
+    assert get.page is None
+    assert get.bytes_out == 0
+    assert get.bytes_in == len(json.dumps(record))
+    assert patch.bytes_out == len(requests_mock.request_history[1].body)
+    assert get.error is None
+    timing = get.timing
+    assert timing.total >= timing.queued + timing.send + timing.decode
+    assert timing.send > 0
+    assert timing.decode > 0
+
+
+def test_request__error(api, table, requests_mock):
+    events = []
+    api.hooks.after_response.append(events.append)
+    requests_mock.get(table.urls.record("rec"), status_code=404, json={})
+    with pytest.raises(requests.HTTPError) as exc_info:
+        table.get("rec")
+    assert events[0].status == 404
+    assert events[0].error is exc_info.value
+
+    requests_mock.get(table.urls.record("rec"), exc=requests.ConnectionError)
+    with pytest.raises(requests.ConnectionError):
+        table.get("rec")
+    assert events[1].status is None
+    assert isinstance(events[1].error, requests.ConnectionError)
+
+
+def test_request__queued(api, table, requests_mock, monkeypatch):
+    """
+    Test that time spent waiting for the rate limiter is recorded separately.
+    """
+    events = []
+    api.hooks.after_response.append(events.append)
+    api.rate_limiter = RateLimiter()
+    monkeypatch.setattr(api.rate_limiter, "reserve_url", lambda url: 0.5)
+    monkeypatch.setattr("pyairtable.api.api.time.sleep", lambda delay: None)
+    requests_mock.get(table.urls.record("rec"), json=fake_record())
+    table.get("rec")
+    assert events[0].timing.queued == 0.5
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_iterate(api, table, requests_mock, recorder, stream):
+    """
+    Test that each page retrieved while iterating produces an on_paginate event.
+    """
+    events = []
+    api.hooks.on_paginate.append(events.append)
+    pages = [
+        {"records": [fake_record()], "offset": "x"},
+        {"records": [fake_record()]},
+    ]
+    requests_mock.get(table.urls.records, [{"json": page} for page in pages])
+    assert len(table.all(stream=stream)) == 2
+    assert recorder.calls == [
+        ("before_request", "GET", "{base}/{table}"),
+        ("after_response", "GET", "{base}/{table}"),
+        ("on_paginate", 1),
+        ("before_request", "GET", "{base}/{table}"),
+        ("after_response", "GET", "{base}/{table}"),
+        ("on_paginate", 2),
+    ]
+    assert [event.bytes_in for event in events] == [
+        len(json.dumps(page)) for page in pages
+    ]
+
+    # requests made outside of pagination are not given a page number
+    requests_mock.get(table.urls.record("rec"), json=fake_record())
+    table.get("rec")
+    assert recorder.calls[-1] == ("after_response", "GET", "{base}/{table}/rec")
+
+
+def test_no_hooks(api, table, requests_mock, monkeypatch):
+    """
+    Test that no events are created if no hooks are registered
+    and tracing is not enabled.
+    """
+    monkeypatch.setattr("pyairtable.api.tracing.ENABLED", False)
+    requests_mock.get(table.urls.record("rec"), json=fake_record())
+    with mock.patch("pyairtable.api.hooks.RequestEvent") as m:
+        table.get("rec")
+    m.assert_not_called()
+
+
+def test_shared_hooks(api):
+    hooks = EventHooks()
+    assert Api("apikey", event_hooks=hooks).hooks is hooks
+    assert api.hooks is not Api("apikey").hooks
+
+
+def test_async_api(constants, monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    from pyairtable.api.aio import AsyncApi
+
+    responses = [httpx.Response(429), httpx.Response(200, json=fake_record())]
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda r: responses.pop(0))
+    )
+    monkeypatch.setattr("pyairtable.api.retrying.random.uniform", lambda a, b: 0.25)
+    monkeypatch.setattr("pyairtable.api.aio.asyncio.sleep", mock.AsyncMock())
+    hooks = EventHooks()
+    recorder = Recorder()
+    hooks.subscribe(recorder)
+    events = []
+    hooks.after_response.append(events.append)
+    api = AsyncApi(constants["API_KEY"], client=client, event_hooks=hooks)
+    assert api.hooks is hooks
+
+    table = api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+    asyncio.run(table.get(fake_record()["id"]))
+    assert recorder.calls == [
+        ("before_request", "GET", "{base}/{table}/{record}"),
+        ("on_retry", 1, 429),
+        ("after_response", "GET", "{base}/{table}/{record}"),
+    ]
+    assert events[0].attempt == 2
+    assert events[0].status == 200
+    assert events[0].timing.retry == 0.25
@@ -0,0 +1,206 @@
+import asyncio
+import os
+import stat
+from unittest import mock
+
+import pytest
+
+from pyairtable import Api
+from pyairtable.api.metacache import (
+    FileMetadataCache,
+    MetadataCache,
+    MetadataCacheStats,
+    default_cache_dir,
+)
+
+
+@pytest.fixture
+def clock():
+    """
+    Replaces time.time() in the metadata cache with a manually advanced value.
+    """
+    with mock.patch("pyairtable.api.metacache.time.time", return_value=100.0) as m:
+        yield m
+
+
+@pytest.fixture(params=["memory", "file"])
+def cache(request, tmp_path) -> MetadataCache:
+    if request.param == "file":
+        return FileMetadataCache(tmp_path, ttl=10)
+    return MetadataCache(ttl=10)
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        MetadataCache(ttl=0)
+    with pytest.raises(ValueError):
+        MetadataCache().get("../etc/passwd")
+
+
+def test_repr(tmp_path):
+    assert repr(MetadataCache()) == "<MetadataCache ttl=3600>"
+    assert repr(FileMetadataCache(tmp_path, ttl=None)) == (
+        f"<FileMetadataCache directory={str(tmp_path)!r} ttl=None>"
+    )
+
+
+def test_default_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_dir() == tmp_path / "pyairtable"
+    assert FileMetadataCache().directory == tmp_path / "pyairtable"
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    assert default_cache_dir().name == "pyairtable"
+
+
+def test_get_set(cache, clock):
+    assert cache.get("abc/bases") is None
+    cache.set("abc/bases", {"bases": []})
+    assert cache.get("abc/bases") == {"bases": []}
+    assert cache.get("xyz/bases") is None
+    assert cache.stats == MetadataCacheStats(hits=1, misses=2)
+
+    # values expire after the ttl
+    clock.return_value += 10
+    assert cache.get("abc/bases") is None
+
+
+def test_delete_clear(cache):
+    cache.set("abc/bases", 1)
+    cache.set("abc/app1", 2)
+    cache.delete("abc/bases")
+    cache.delete("abc/missing")
+    assert cache.get("abc/bases") is None
+    assert cache.get("abc/app1") == 2
+    cache.clear()
+    assert cache.get("abc/app1") is None
+
+
+def test_file_cache(tmp_path):
+    """
+    Test that two instances sharing a directory see each other's values,
+    and that files are only accessible to the current user.
+    """
+    FileMetadataCache(tmp_path).set("abc/app1", {"tables": []})
+    assert FileMetadataCache(tmp_path).get("abc/app1") == {"tables": []}
+    path = tmp_path / "metadata" / "abc.app1.cache.json"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert os.listdir(tmp_path / "metadata") == ["abc.app1.cache.json"]
+
+    # unreadable files are treated as missing
+    path.write_text("{not json")
+    assert FileMetadataCache(tmp_path).get("abc/app1") is None
+    FileMetadataCache(tmp_path / "missing").clear()
+
+
+def test_file_cache__clear(tmp_path):
+    """
+    Test that clear() only deletes files created by the cache,
+    even if the directory is shared with other files.
+    """
+    others = [
+        tmp_path / "settings.json",
+        tmp_path / "abc" / "app1.json",
+        tmp_path / "metadata" / "notes.json",
+        tmp_path / "metadata" / "nested" / "abc.app2.cache.json",
+    ]
+    for path in others:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{}")
+    cache = FileMetadataCache(tmp_path)
+    cache.set("abc/app1", 1)
+    cache.set("bases", 2)
+    cache.clear()
+    assert sorted(os.listdir(tmp_path / "metadata")) == ["nested", "notes.json"]
+    assert all(path.exists() for path in others)
+
+
+def test_api(api, base, requests_mock, sample_json, tmp_path):
+    """
+    Test that a new Api instance with the same cache and token
+    does not need to retrieve metadata again.
+    """
+    assert api.metadata_cache is None
+    with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmp_path)}):
+        cache = Api("apikey", metadata_cache=True).metadata_cache
+    assert isinstance(cache, FileMetadataCache)
+    assert cache.directory == tmp_path / "pyairtable"
+
+    m_bases = requests_mock.get(api.urls.bases, json=sample_json("Bases"))
+    m_tables = requests_mock.get(base.urls.tables, json=sample_json("BaseSchema"))
+    api.metadata_cache = MetadataCache()
+    api.bases()
+    base.schema()
+    assert (m_bases.call_count, m_tables.call_count) == (1, 1)
+
+    api2 = Api(api.api_key, metadata_cache=api.metadata_cache)
+    assert api2.bases()[0].id == api.bases()[0].id
+    schema = api2.base(base.id).schema()
+    assert [t.id for t in schema.tables] == [t.id for t in base.schema().tables]
+    assert (m_bases.call_count, m_tables.call_count) == (1, 1)
+
+    # force=True bypasses (and refreshes) the cache
+    api2.base(base.id).schema(force=True)
+    api2.bases(force=True)
+    assert (m_bases.call_count, m_tables.call_count) == (2, 2)
+
+    # a different token does not share cached metadata
+    Api("other", metadata_cache=api.metadata_cache).bases()
+    assert m_bases.call_count == 3
+
+
+def test_api__invalidate(api, base, requests_mock, sample_json):
+    """
+    Test that changing a base's schema discards cached metadata for that base.
+    """
+    api.metadata_cache = cache = MetadataCache()
+    requests_mock.get(base.urls.tables, json=sample_json("BaseSchema"))
+    requests_mock.post(base.urls.tables, json=sample_json("TableSchema"))
+    requests_mock.get(base.table("tbl").urls.records, json={"records": []})
+    base.schema()
+    key = api._metadata_key(base.id)
+    assert cache.get(key) is not None
+
+    # record changes do not affect metadata
+    base.table("tbl").all()
+    assert cache.get(key) is not None
+
+    api.post(base.urls.tables, json={"name": "New Table", "fields": []})
+    assert cache.get(key) is None
+    assert cache.get(api._metadata_key("bases")) is None
+
+
+def test_async_api(constants, sample_json):
+    httpx = pytest.importorskip("httpx")
+    from pyairtable.api.aio import AsyncApi
+
+    calls = []
+
+    def _handler(request):
+        calls.append(request)
+        return httpx.Response(200, json=sample_json("BaseSchema"))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    cache = MetadataCache()
+    api = AsyncApi(constants["API_KEY"], client=client, metadata_cache=cache)
+    assert api.metadata_cache is cache
+
+    async def _main():
+        await api.base(constants["BASE_ID"]).schema()
+        await api.base(constants["BASE_ID"]).schema()
+        await api.base(constants["BASE_ID"]).schema(force=True)
+
+    asyncio.run(_main())
+    assert len(calls) == 2
+    assert calls[0].url.params["include"] == "visibleFieldIds"
+    sync_api = Api(constants["API_KEY"], metadata_cache=cache)
+    assert sync_api.base(constants["BASE_ID"]).schema().tables
+
+
+def test_file_cache__write_error(tmp_path):
+    """
+    Test that a failed write does not leave a temporary file behind.
+    """
+    cache = FileMetadataCache(tmp_path)
+    with pytest.raises(TypeError):
+        cache.set("abc/app1", {"not": object()})
+    assert os.listdir(tmp_path / "metadata") == []
@@ -0,0 +1,370 @@
+import asyncio
+import json
+import multiprocessing
+import sys
+import threading
+import time
+from unittest import mock
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+import pytest
+import requests
+
+from pyairtable import Api
+from pyairtable.api.ratelimit import (
+    FileRateLimiter,
+    RateLimiter,
+    RateLimitStats,
+    base_id_from_url,
+)
+
+
+@pytest.fixture
+def clock():
+    """
+    Replaces time.monotonic() in the rate limiter with a manually advanced value.
+    """
+    with mock.patch("pyairtable.api.ratelimit.time.monotonic", return_value=100.0) as m:
+        yield m
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://api.airtable.com/v0/appLkNDICXNqxSDhG/Table", "appLkNDICXNqxSDhG"),
+        ("https://api.airtable.com/v0/appLkNDICXNqxSDhG", "appLkNDICXNqxSDhG"),
+        ("https://api.airtable.com/v0/appLkNDICXNqxSDhG?x=1", "appLkNDICXNqxSDhG"),
+        (
+            "https://api.airtable.com/v0/meta/bases/appLkNDICXNqxSDhG/tables",
+            "appLkNDICXNqxSDhG",
+        ),
+        ("https://api.airtable.com/v0/meta/whoami", None),
+        ("https://api.airtable.com/v0/meta/bases", None),
+        ("https://api.airtable.com/v0/appTooShort/Table", None),
+    ],
+)
+def test_base_id_from_url(url, expected):
+    assert base_id_from_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "kwargs,message",
+    [
+        ({"rate": 0}, "rate must be greater than zero"),
+        ({"rate": -1}, "rate must be greater than zero"),
+        ({"burst": 0}, "burst must be at least 1"),
+    ],
+)
+def test_invalid_arguments(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        RateLimiter(**kwargs)
+
+
+def test_repr():
+    assert repr(RateLimiter(2.5, 3)) == "<RateLimiter rate=2.5 burst=3>"
+
+
+def test_reserve(clock):
+    """
+    Test that consecutive reservations are spaced out by the limiter's interval,
+    and that the bucket refills while time passes.
+    """
+    limiter = RateLimiter(rate=5)
+    assert limiter.interval == 0.2
+    assert [limiter.reserve("app1") for _ in range(3)] == pytest.approx([0, 0.2, 0.4])
+    # buckets for different keys are independent
+    assert limiter.reserve("app2") == 0
+    # once enough time has passed, requests no longer need to wait
+    clock.return_value = 101.0
+    assert limiter.reserve("app1") == 0
+    assert limiter.reserve("app1") == pytest.approx(0.2)
+
+
+def test_reserve__burst(clock):
+    limiter = RateLimiter(rate=5, burst=3)
+    delays = [limiter.reserve("app1") for _ in range(5)]
+    assert delays == pytest.approx([0, 0, 0, 0.2, 0.4])
+    # tokens reserved above are used up at t+0.2 and t+0.4; the next is at t+0.6
+    clock.return_value += 0.5
+    assert limiter.reserve("app1") == pytest.approx(0.1)
+
+
+def test_reserve__no_key(clock):
+    limiter = RateLimiter(rate=1)
+    assert [limiter.reserve(None) for _ in range(3)] == [0, 0, 0]
+    assert limiter.reserve_url("https://api.airtable.com/v0/meta/whoami") == 0
+
+
+def test_reserve__threads():
+    """
+    Test that reservations made concurrently from many threads are all distinct.
+    """
+    limiter = RateLimiter(rate=1000)
+    delays = []
+
+    def _reserve():
+        for _ in range(50):
+            delays.append(limiter.reserve("app1"))
+
+    threads = [threading.Thread(target=_reserve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(delays) == 400
+    assert max(delays) == pytest.approx(0.399, abs=0.05)
+
+
+def test_record():
+    limiter = RateLimiter()
+    limiter.record(0.0, 0.5)
+    limiter.record(0.25, 0.5)
+    assert limiter.stats == RateLimitStats(
+        requests=2,
+        delayed=1,
+        wait_time=0.25,
+        send_time=1.0,
+    )
+
+
+def test_api__default(api):
+    assert api.rate_limiter is None
+
+
+@pytest.mark.parametrize("value", [None, False])
+def test_api__disabled(value):
+    assert Api("apikey", rate_limit=value).rate_limiter is None
+
+
+def test_api__enabled():
+    api = Api("apikey", rate_limit=True)
+    assert isinstance(api.rate_limiter, RateLimiter)
+    assert api.rate_limiter.interval == Api.API_LIMIT
+    assert api.rate_limiter.burst == 1
+
+
+def test_api__shared():
+    limiter = RateLimiter(rate=2)
+    assert Api("a", rate_limit=limiter).rate_limiter is limiter
+    assert Api("b", rate_limit=limiter).rate_limiter is limiter
+
+
+def test_api__request(table, requests_mock, mock_response_list):
+    """
+    Test that Api.request() waits for the rate limiter before each request
+    and records how long it spent waiting and sending.
+    """
+    limiter = table.api.rate_limiter = RateLimiter()
+    for page in mock_response_list:
+        requests_mock.get(table.urls.records, json=page)
+    with (
+        mock.patch.object(limiter, "reserve", side_effect=[0.0, 0.5]) as m_reserve,
+        mock.patch("pyairtable.api.api.time.sleep") as m_sleep,
+    ):
+        table.first()
+        table.first()
+
+    assert m_reserve.mock_calls == [mock.call(table.base.id)] * 2
+    m_sleep.assert_called_once_with(0.5)
+    assert limiter.stats.requests == 2
+    assert limiter.stats.delayed == 1
+    assert limiter.stats.wait_time == 0.5
+    assert limiter.stats.send_time > 0
+
+
+def test_api__request_error(api, requests_mock):
+    """
+    Test that stats are recorded even if a request fails.
+    """
+    limiter = api.rate_limiter = RateLimiter()
+    requests_mock.get(api.urls.whoami, exc=requests.exceptions.ConnectionError)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        api.whoami()
+    assert limiter.stats.requests == 1
+    assert limiter.stats.delayed == 0
+
+
+def test_async_api__request(constants):
+    httpx = pytest.importorskip("httpx")
+    from pyairtable.api.aio import AsyncApi
+
+    def _handler(request):
+        if request.url.path.endswith("/error"):
+            raise httpx.ConnectError("oops", request=request)
+        return httpx.Response(200, json={"records": []})
+
+    limiter = RateLimiter()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    api = AsyncApi(
+        constants["API_KEY"],
+        client=client,
+        rate_limit=limiter,
+        retry_strategy=None,
+    )
+    table = api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+    assert api.rate_limiter is limiter
+
+    async def _main():
+        await api.get(api.sync.urls.whoami)
+        await table.first()
+        await table.first()
+        with pytest.raises(httpx.ConnectError):
+            await api.get(table.urls.records / "error")
+
+    with (
+        mock.patch.object(limiter, "reserve", side_effect=[0, 0, 0.5, 0]) as m_reserve,
+        mock.patch("pyairtable.api.aio.asyncio.sleep") as m_sleep,
+    ):
+        asyncio.run(_main())
+
+    assert m_reserve.mock_calls == [
+        mock.call(None),
+        mock.call(constants["BASE_ID"]),
+        mock.call(constants["BASE_ID"]),
+        mock.call(constants["BASE_ID"]),
+    ]
+    m_sleep.assert_called_once_with(0.5)
+    assert limiter.stats.requests == 4
+    assert limiter.stats.delayed == 1
+
+
+def test_async_api__reserve_in_thread(constants, lock_path):
+    """
+    Test that AsyncApi claims tokens on a worker thread, since
+    FileRateLimiter blocks while it waits for the lock on its file.
+    """
+    httpx = pytest.importorskip("httpx")
+    from pyairtable.api.aio import AsyncApi
+
+    limiter = FileRateLimiter(lock_path)
+    threads = []
+    reserve = limiter.reserve
+
+    def _reserve(key):
+        threads.append(threading.current_thread())
+        return reserve(key)
+
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, json={}))
+    )
+    api = AsyncApi(constants["API_KEY"], client=client, rate_limit=limiter)
+    with mock.patch.object(limiter, "reserve", side_effect=_reserve):
+        asyncio.run(api.get(api.base(constants["BASE_ID"]).urls.tables))
+
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
+    assert limiter.stats.requests == 1
+
+
+@pytest.fixture
+def lock_path(tmp_path):
+    return tmp_path / "ratelimit.json"
+
+
+@pytest.fixture
+def wall_clock():
+    """
+    Replaces time.time() in the rate limiter with a manually advanced value.
+    """
+    with mock.patch("pyairtable.api.ratelimit.time.time", return_value=100.0) as m:
+        yield m
+
+
+def test_file_limiter__repr(lock_path):
+    limiter = FileRateLimiter(lock_path, rate=2)
+    assert repr(limiter) == f"<FileRateLimiter path={str(lock_path)!r} rate=2 burst=1>"
+
+
+def test_file_limiter__reserve(lock_path, wall_clock):
+    """
+    Test that separate FileRateLimiter instances using the same path
+    behave as if they were a single limiter.
+    """
+    limiter1 = FileRateLimiter(lock_path, rate=5, burst=2)
+    limiter2 = FileRateLimiter(lock_path, rate=5, burst=2)
+    delays = [limiter.reserve("app1") for limiter in [limiter1, limiter2] * 2]
+    assert delays == pytest.approx([0, 0, 0.2, 0.4])
+    assert limiter1.reserve("app2") == 0
+    assert limiter1.reserve(None) == 0
+    assert json.loads(lock_path.read_text()) == pytest.approx(
+        {"app1": 100.8, "app2": 100.2}
+    )
+    # buckets which have completely refilled are removed from the file
+    wall_clock.return_value = 100.5
+    assert limiter2.reserve("app1") == pytest.approx(0.1)
+    assert json.loads(lock_path.read_text()) == pytest.approx({"app1": 101.0})
+
+
+@pytest.mark.parametrize("content", ["", "not json", "[]"])
+def test_file_limiter__invalid_file(lock_path, wall_clock, content):
+    lock_path.write_text(content)
+    limiter = FileRateLimiter(lock_path)
+    assert limiter.reserve("app1") == 0
+    assert json.loads(lock_path.read_text()) == pytest.approx({"app1": 100.2})
+
+
+class _RecordingApp:
+    """
+    WSGI app which records the time at which each request was received.
+    """
+
+    def __init__(self):
+        self.timestamps = []
+
+    def __call__(self, environ, start_response):
+        self.timestamps.append(time.time())
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [b'{"records": []}']
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args, **kwargs):
+        return
+
+
+def _send_requests(endpoint_url, lock_path, rate, count):
+    api = Api(
+        "apikey", endpoint_url=endpoint_url, rate_limit=FileRateLimiter(lock_path, rate)
+    )
+    table = api.table("appLkNDICXNqxSDhG", "Table Name")
+    for _ in range(count):
+        table.first()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires fork()")
+def test_file_limiter__processes(lock_path):
+    """
+    Test that several processes sharing a FileRateLimiter stay under its rate
+    when they are all sending requests to the same base.
+    """
+    rate, processes, count = 25, 4, 12
+    app = _RecordingApp()
+    server = make_server("127.0.0.1", 0, app, handler_class=_QuietHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        ctx = multiprocessing.get_context("fork")
+        workers = [
+            ctx.Process(target=_send_requests, args=(url, lock_path, rate, count))
+            for _ in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+            assert worker.exitcode == 0
+    finally:
+        server.shutdown()
+        thread.join()
+        server.server_close()
+
+    timestamps = sorted(app.timestamps)
+    assert len(timestamps) == processes * count
+    # the aggregate rate across all processes should not exceed the limit...
+    elapsed = timestamps[-1] - timestamps[0]
+    assert elapsed >= (len(timestamps) - 1) / rate * 0.9
+    # ...even within any one-second window
+    for n, start in enumerate(timestamps[:-rate]):
+        assert timestamps[n + rate] - start >= 0.9
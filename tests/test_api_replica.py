@@ -0,0 +1,297 @@
+import threading
+
+import pytest
+
+from pyairtable.api.replica import TableReplica
+from pyairtable.models import Webhook
+from pyairtable.testing import fake_id, fake_record
+
+TABLE_ID = fake_id("tbl")
+FIELDS = [
+    {"id": "fldName", "name": "Name", "type": "singleLineText"},
+    {"id": "fldAge", "name": "Age", "type": "number", "options": {"precision": 0}},
+    {"id": "fldDone", "name": "Done", "type": "checkbox", "options": {}},
+    {
+        "id": "fldTags",
+        "name": "Tags",
+        "type": "multipleSelects",
+        "options": {"choices": []},
+    },
+]
+
+
+@pytest.fixture
+def table(api, base_id):
+    return api.table(base_id, TABLE_ID)
+
+
+@pytest.fixture
+def webhook(sample_json, base, requests_mock):
+    data = {**sample_json("Webhook"), "cursorForNextPayload": 5}
+    requests_mock.get(base.urls.webhooks, json={"webhooks": [data]})
+    return Webhook.from_api(data, base.api, context=base)
+
+
+@pytest.fixture
+def alice():
+    return fake_record(
+        {"fldName": "Alice", "fldAge": 30, "fldDone": True, "fldTags": ["a", "b"]}
+    )
+
+
+@pytest.fixture
+def bob():
+    return fake_record({"fldName": "Bob", "fldAge": 40})
+
+
+@pytest.fixture
+def replica(table, base, webhook, requests_mock, alice, bob, tmp_path):
+    schema = {
+        "id": TABLE_ID,
+        "name": "People",
+        "primaryFieldId": "fldName",
+        "fields": FIELDS,
+        "views": [],
+    }
+    requests_mock.get(base.urls.tables, json={"tables": [schema]})
+    requests_mock.get(table.urls.records, json={"records": [alice, bob]})
+    replica = TableReplica(table, tmp_path / "replica.db")
+    replica.bootstrap(webhook)
+    return replica
+
+
+def _payloads(requests_mock, webhook, *changes, cursor=5, table_id=TABLE_ID):
+    payloads = [
+        {
+            "timestamp": "2024-01-01T00:00:00.000Z",
+            "baseTransactionNumber": n,
+            "payloadFormat": "v0",
+            "changedTablesById": {table_id: changed},
+        }
+        for (n, changed) in enumerate(changes)
+    ]
+    return requests_mock.get(
+        f"{webhook._url}/payloads?cursor={cursor}",
+        json={
+            "payloads": payloads,
+            "cursor": cursor + len(payloads),
+            "mightHaveMore": False,
+        },
+    )
+
+
+def test_bootstrap(replica, table, alice, bob):
+    assert repr(replica) == (
+        f"<TableReplica table={TABLE_ID!r} path={str(replica.path)!r}>"
+    )
+    assert replica.cursor == 5
+    assert replica.get(alice["id"]) == {
+        "id": alice["id"],
+        "createdTime": alice["createdTime"],
+        "fields": {"Name": "Alice", "Age": 30, "Done": True, "Tags": ["a", "b"]},
+    }
+    assert replica.get("recMissing") is None
+    assert [r["id"] for r in replica.all()] == [alice["id"], bob["id"]]
+    assert replica.first({"Name": "Bob"})["fields"] == {"Name": "Bob", "Age": 40}
+    assert replica.first({"Tags": ["a", "b"], "Done": True})["id"] == alice["id"]
+    assert replica.first({"fldDone": None})["id"] == bob["id"]
+    assert replica.first({"Name": "Carol"}) is None
+    with pytest.raises(KeyError):
+        replica.all({"Missing": 1})
+
+    table.api.use_field_ids = True
+    assert replica.get(bob["id"])["fields"] == {"fldName": "Bob", "fldAge": 40}
+
+
+def test_numbers(replica, webhook, requests_mock, alice, bob):
+    """
+    Test that whole numbers are read back as integers, and fractions as floats.
+    """
+    assert type(replica.get(alice["id"])["fields"]["Age"]) is int
+    _payloads(
+        requests_mock,
+        webhook,
+        {
+            "changedRecordsById": {
+                bob["id"]: {"current": {"cellValuesByFieldId": {"fldAge": 40.5}}}
+            }
+        },
+    )
+    replica.sync(webhook)
+    assert type(replica.get(bob["id"])["fields"]["Age"]) is float
+    assert replica.get(bob["id"])["fields"]["Age"] == 40.5
+    assert replica.first({"Age": 30.0})["id"] == alice["id"]
+    assert replica.first({"Age": 40.5})["id"] == bob["id"]
+
+
+def test_reopen(replica, table, alice):
+    """
+    Test that another instance using the same database sees the same records.
+    """
+    replica.create_index("Name")
+    other = TableReplica(table, replica.path)
+    assert other.cursor == 5
+    assert other.first({"Name": "Alice"})["id"] == alice["id"]
+    plan = other._conn.execute(
+        f'EXPLAIN QUERY PLAN SELECT id FROM "{TABLE_ID}" WHERE "fldName" = \'x\''
+    ).fetchall()
+    assert "INDEX" in str(plan)
+    replica.close()
+    other.close()
+
+
+def test_sync(replica, webhook, requests_mock, alice, bob):
+    """
+    Test that records created, changed, and destroyed in webhook payloads
+    are applied to the database.
+    """
+    carol_id = fake_id()
+    m = _payloads(
+        requests_mock,
+        webhook,
+        {
+            "createdRecordsById": {
+                carol_id: {
+                    "createdTime": "2024-01-01T00:00:00.000Z",
+                    "cellValuesByFieldId": {"fldName": "Carol", "fldTags": ["c"]},
+                }
+            },
+            "changedRecordsById": {
+                alice["id"]: {
+                    "current": {"cellValuesByFieldId": {"fldAge": 31, "fldTags": None}}
+                }
+            },
+        },
+        {"destroyedRecordIds": [bob["id"]]},
+    )
+    assert replica.sync(webhook) == 2
+    assert m.call_count == 1
+    assert replica.cursor == 7
+    assert replica.get(alice["id"])["fields"] == {
+        "Name": "Alice",
+        "Age": 31,
+        "Done": True,
+    }
+    assert replica.get(carol_id) == {
+        "id": carol_id,
+        "createdTime": "2024-01-01T00:00:00.000Z",
+        "fields": {"Name": "Carol", "Tags": ["c"]},
+    }
+    assert replica.get(bob["id"]) is None
+
+    # payloads for other tables, or without changes, are ignored
+    _payloads(requests_mock, webhook, {}, cursor=7, table_id=fake_id("tbl"))
+    assert replica.sync(webhook) == 1
+    assert len(replica.all()) == 2
+
+
+def test_sync__fields(replica, webhook, requests_mock, alice):
+    """
+    Test that fields which are created, renamed, or destroyed are reflected
+    in the database without copying the whole table again.
+    """
+    _payloads(
+        requests_mock,
+        webhook,
+        {
+            "createdFieldsById": {"fldNotes": {"name": "Notes", "type": "richText"}},
+            "changedFieldsById": {
+                "fldName": {"current": {"name": "Full Name"}},
+                "fldUnknown": {"current": {"name": "Ignored"}},
+            },
+            "destroyedFieldIds": ["fldTags"],
+            "changedRecordsById": {
+                alice["id"]: {
+                    "current": {"cellValuesByFieldId": {"fldNotes": "**hi**"}}
+                }
+            },
+        },
+    )
+    replica.sync(webhook)
+    assert replica.get(alice["id"])["fields"] == {
+        "Full Name": "Alice",
+        "Age": 30,
+        "Done": True,
+        "Notes": "**hi**",
+    }
+
+
+def test_sync__refresh(replica, webhook, requests_mock, table):
+    """
+    Test that changing a field's type so that its values are stored differently
+    causes the whole table to be copied again.
+    """
+    _payloads(
+        requests_mock,
+        webhook,
+        {"changedFieldsById": {"fldAge": {"current": {"type": "singleLineText"}}}},
+    )
+    requests_mock.get(table.urls.records, json={"records": []})
+    requests_mock.get(
+        table.base.urls.tables,
+        json={
+            "tables": [
+                {
+                    "id": TABLE_ID,
+                    "name": "People",
+                    "primaryFieldId": "fldName",
+                    "fields": FIELDS[:3],
+                    "views": [],
+                }
+            ]
+        },
+    )
+    replica.create_index("Age")
+    replica.create_index("Tags")
+    replica.sync(webhook)
+    assert replica.all() == []
+    indexes = replica._conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+    ).fetchall()
+    assert indexes == [(f"idx_{TABLE_ID}_fldAge",)]
+
+
+def test_sync__destroyed_table(replica, webhook, requests_mock):
+    requests_mock.get(
+        f"{webhook._url}/payloads?cursor=5",
+        json={
+            "payloads": [
+                {
+                    "timestamp": "2024-01-01T00:00:00.000Z",
+                    "baseTransactionNumber": 1,
+                    "payloadFormat": "v0",
+                    "destroyedTableIds": [TABLE_ID],
+                }
+            ],
+            "cursor": 6,
+            "mightHaveMore": False,
+        },
+    )
+    replica.sync(webhook)
+    assert replica.all() == []
+
+
+def test_sync__not_bootstrapped(table, webhook):
+    with pytest.raises(RuntimeError):
+        TableReplica(table).sync(webhook)
+
+
+def test_threads(replica, alice):
+    results = []
+
+    def _read():
+        for _ in range(100):
+            results.append(replica.get(alice["id"])["id"])
+
+    threads = [threading.Thread(target=_read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [alice["id"]] * 400
+
+
+def test_webhook_spec():
+    spec = TableReplica.webhook_spec(TABLE_ID)
+    assert spec["options"]["filters"]["recordChangeScope"] == TABLE_ID
+    assert spec["options"]["includes"] == {"includeCellValuesInFieldIds": "all"}
@@ -9,6 +9,7 @@ import threading
 import time
 from collections import deque
 from http import HTTPStatus
+from unittest import mock
 from urllib.parse import urljoin
 from wsgiref.simple_server import WSGIRequestHandler, make_server
 
@@ -16,7 +17,7 @@ import pytest
 import requests
 
 from pyairtable.api import Api
-from pyairtable.api.retrying import retry_strategy
+from pyairtable.api.retrying import AdaptiveRetry, RetryStats, retry_strategy
 from pyairtable.testing import fake_record
 
 
@@ -154,7 +155,9 @@ def table_with_retry_strategy(constants, mock_endpoint_server):
     def _table_with_retry(retry_strategy):
         api = Api(
             api_key=constants["API_KEY"],
-            timeout=(0.1, 0.1),
+            # Long enough that a garbage collection pause in the test process
+            # can't cause a read timeout (and a retry which skips a page).
+            timeout=(1, 1),
             retry_strategy=retry_strategy,
             endpoint_url=mock_endpoint_server.url,
         )
@@ -240,12 +243,14 @@ def test_retry_eventual_success(
     assert table.get("record") == mock_response_single
 
 
-def test_retry_during_iterate(table_with_retry_strategy, mock_endpoint):
+def test_retry_during_iterate(table_with_retry_strategy, mock_endpoint, monkeypatch):
     """
     Test that our default retry logic will be enough to get through several pages of data.
     Relies on ``mock_endpoint`` to return 429s whenever QPS goes over the limit.
     """
     table = table_with_retry_strategy(retry_strategy())
+    # Always wait for the longest jittered delay, so the test is deterministic.
+    monkeypatch.setattr("pyairtable.api.retrying.random.uniform", lambda a, b: b)
 
     page_count = 10
     per_page = 5  # real world number is 100, but we don't need that much data here
@@ -255,3 +260,57 @@ def test_retry_during_iterate(table_with_retry_strategy, mock_endpoint):
 
     records = table.all()
     assert len(records) == page_count * per_page
+
+
+def test_retry_strategy__jitter():
+    strategy = retry_strategy(backoff_factor=0.5)
+    assert isinstance(strategy, AdaptiveRetry)
+    assert strategy.get_backoff_time() == 0
+    with mock.patch("pyairtable.api.retrying.random.uniform") as m:
+        m.return_value = 0.123
+        retry = strategy.increment("GET", "/").increment("GET", "/")
+        assert retry.get_backoff_time() == 0.123
+    m.assert_called_once_with(0, 2.0)
+    # redirects do not count towards the backoff time
+    retry = strategy.increment("GET", "/", response=mock.Mock(status=301))
+    assert retry.history[-1].redirect_location is not None
+    assert retry.get_backoff_time() == 0
+
+
+def test_retry_strategy__without_jitter():
+    strategy = retry_strategy(backoff_factor=0.5, jitter=False)
+    retry = strategy.increment("GET", "/").increment("GET", "/")
+    assert retry.jitter is False
+    assert retry.get_backoff_time() == 1.0
+
+
+def test_retry_strategy__stats(table_with_retry_strategy, mock_endpoint):
+    """
+    Test that every copy of a retry strategy records into the same stats.
+    """
+    stats = RetryStats()
+    strategy = retry_strategy(backoff_factor=0.01, stats=stats)
+    table = table_with_retry_strategy(strategy)
+    mock_endpoint.canned_responses = [(429, None), (429, None), (200, fake_record())]
+    table.get("record")
+    assert stats.retries == 2
+    assert 0 < stats.sleep_time < 1
+    assert strategy.stats is stats
+    assert stats == RetryStats(retries=2, sleep_time=stats.sleep_time)
+
+
+def test_retry_strategy__hooks(table_with_retry_strategy, mock_endpoint):
+    """
+    Test that retries performed by urllib3 are reported to the Api's hooks.
+    """
+    table = table_with_retry_strategy(retry_strategy(backoff_factor=0.01))
+    retries = []
+    events = []
+    table.api.hooks.on_retry.append(lambda event: retries.append(event.attempt))
+    table.api.hooks.after_response.append(events.append)
+    mock_endpoint.canned_responses = [(429, None), (429, None), (200, fake_record())]
+    table.get("record")
+    assert retries == [1, 2]
+    assert events[0].attempt == 3
+    assert events[0].status == 200
+    assert 0 < events[0].timing.retry <= events[0].timing.send
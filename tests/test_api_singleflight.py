@@ -0,0 +1,229 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from pyairtable import Api
+from pyairtable.api.singleflight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    SingleFlightStats,
+    request_key,
+)
+from pyairtable.testing import fake_record
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_call():
+    """
+    Test that concurrent calls with the same key only call the function once,
+    and every caller receives its result.
+    """
+    flight = SingleFlight()
+    calls = []
+
+    def _func():
+        calls.append(1)
+        # wait until every other thread is waiting on this call
+        _wait_for(lambda: flight.stats.followers == 4)
+        return "result"
+
+    with ThreadPoolExecutor(5) as executor:
+        leader = executor.submit(flight.call, "key", _func)
+        _wait_for(lambda: calls)
+        assert repr(flight) == "<SingleFlight in_flight=1>"
+        followers = [executor.submit(flight.call, "key", _func) for _ in range(4)]
+        results = [f.result() for f in [leader, *followers]]
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert flight.stats == SingleFlightStats(leaders=1, followers=4)
+    assert repr(flight) == "<SingleFlight in_flight=0>"
+    # once the call has finished, the next call with the same key starts over
+    assert flight.call("key", lambda: "again") == "again"
+    assert flight.stats.leaders == 2
+
+
+def test_call__error():
+    """
+    Test that an exception raised by the leader is raised to every follower.
+    """
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def _func():
+        started.set()
+        _wait_for(lambda: flight.stats.followers == 1)
+        raise ValueError("oops")
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(flight.call, "key", _func)
+        started.wait()
+        follower = executor.submit(flight.call, "key", _func)
+        for future in (leader, follower):
+            with pytest.raises(ValueError, match="oops"):
+                future.result()
+
+    assert flight.call("key", lambda: 1) == 1
+
+
+def test_call__different_keys():
+    flight = SingleFlight()
+    assert flight.call("a", lambda: 1) == 1
+    assert flight.call("b", lambda: 2) == 2
+    assert flight.stats == SingleFlightStats(leaders=2, followers=0)
+
+
+def test_request_key(api):
+    def _key(api, method, url, **kwargs):
+        return request_key(api._prepare_request(method, url, **kwargs))
+
+    url = api.build_url("appFake/tblFake")
+    key = _key(api, "GET", url, options={"view": "Grid"})
+    assert key == _key(api, "GET", url, options={"view": "Grid"})
+    assert key != _key(api, "GET", url, options={"view": "Other"})
+    assert key != _key(api, "GET", url + "/recFake", options={"view": "Grid"})
+    assert key != _key(Api("other"), "GET", url, options={"view": "Grid"})
+
+
+def test_api__default(api):
+    assert api.single_flight is None
+    assert Api("apikey", coalesce=False).single_flight is None
+    assert isinstance(Api("apikey", coalesce=True).single_flight, SingleFlight)
+
+
+def test_api__shared():
+    flight = SingleFlight()
+    assert Api("a", coalesce=flight).single_flight is flight
+    assert Api("b", coalesce=flight).single_flight is flight
+
+
+def test_api__coalesce(table, requests_mock):
+    """
+    Test that concurrent identical GET requests are sent once, but each caller
+    still receives its own copy of the response.
+    """
+    flight = table.api.single_flight = SingleFlight()
+    record = fake_record()
+
+    def _respond(request, context):
+        _wait_for(lambda: flight.stats.followers == 4)
+        return record
+
+    m = requests_mock.get(table.urls.record(record["id"]), json=_respond)
+    with ThreadPoolExecutor(5) as executor:
+        futures = [executor.submit(table.get, record["id"]) for _ in range(5)]
+        results = [future.result() for future in futures]
+
+    assert m.call_count == 1
+    assert results == [record] * 5
+    assert len({id(result) for result in results}) == 5
+
+
+def test_api__coalesce_error(table, requests_mock):
+    """
+    Test that each caller raises its own exception for an error response.
+    """
+    flight = table.api.single_flight = SingleFlight()
+
+    def _respond(request, context):
+        _wait_for(lambda: flight.stats.followers == 1)
+        context.status_code = 404
+        return {"error": "NOT_FOUND"}
+
+    m = requests_mock.get(table.urls.record("recFake"), json=_respond)
+    with ThreadPoolExecutor(2) as executor:
+        futures = [executor.submit(table.get, "recFake") for _ in range(2)]
+        errors = [future.exception() for future in futures]
+
+    assert m.call_count == 1
+    assert all(isinstance(exc, requests.exceptions.HTTPError) for exc in errors)
+    assert errors[0] is not errors[1]
+
+
+def test_api__not_get(api, requests_mock):
+    """
+    Test that requests other than GET are never coalesced.
+    """
+    api.single_flight = SingleFlight()
+    requests_mock.post("https://example.com", json={})
+    api.post("https://example.com")
+    assert api.single_flight.stats == SingleFlightStats()
+
+
+def test_async_single_flight():
+    """
+    Test that concurrent tasks with the same key only await the function once,
+    and that cancelling the first caller does not cancel the shared call.
+    """
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def _func():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def _main():
+        leader = asyncio.create_task(flight.call("key", _func))
+        await asyncio.sleep(0)
+        followers = [flight.call("key", _func) for _ in range(3)]
+        assert repr(flight) == "<AsyncSingleFlight in_flight=1>"
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return results
+
+    assert asyncio.run(_main()) == ["result"] * 3
+    assert len(calls) == 1
+    assert flight.stats == SingleFlightStats(leaders=1, followers=3)
+    assert repr(flight) == "<AsyncSingleFlight in_flight=0>"
+
+
+def test_async_api__coalesce(constants):
+    httpx = pytest.importorskip("httpx")
+    from pyairtable.api.aio import AsyncApi
+
+    record = fake_record()
+    received = []
+
+    async def _handler(request):
+        received.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=record)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    api = AsyncApi(constants["API_KEY"], client=client, coalesce=True)
+    table = api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+    assert AsyncApi(constants["API_KEY"]).single_flight is None
+
+    async def _main():
+        results = await asyncio.gather(*[table.get(record["id"]) for _ in range(5)])
+        await table.create({})  # not coalesced
+        return results
+
+    results = asyncio.run(_main())
+    assert results == [record] * 5
+    assert len({id(result) for result in results}) == 5
+    assert [r.method for r in received] == ["GET", "POST"]
+    assert api.single_flight.stats == SingleFlightStats(leaders=1, followers=4)
+
+
+def test_async_api__shared():
+    pytest.importorskip("httpx")
+    from pyairtable.api.aio import AsyncApi
+
+    flight = AsyncSingleFlight()
+    assert AsyncApi("a", coalesce=flight).single_flight is flight
+    assert AsyncApi("b", coalesce=flight).single_flight is flight
+    assert AsyncApi("c", coalesce=False).single_flight is None
@@ -0,0 +1,159 @@
+import json
+from unittest import mock
+
+import pytest
+
+from pyairtable.api import streaming
+from pyairtable.api.codecs import CODECS, get_codec
+from pyairtable.api.streaming import RawPage, iter_items, split_page
+
+DOCUMENT = {
+    "before": {"nested": [1, {"a": "]}"}]},
+    "records": [
+        {
+            "id": "recAdw9EjV90xbZ",
+            "fields": {
+                "Name": 'Alice \\ "quoted" \\" ] } [ { é 日本語 😀',
+                "Numbers": [1, -2.5e10, 0.1, 9007199254740993, -0.0],
+                "Values": [True, False, None, "", [], {}],
+            },
+        },
+        {"id": "recX", "fields": {}},
+        12,
+        "string",
+        None,
+    ],
+    "offset": "itr123/rec456",
+    "empty": [],
+}
+
+
+def _split(data, size):
+    return [data[n : n + size] for n in range(0, len(data), size)]
+
+
+def _consume(items):
+    """
+    Return everything yielded by iter_items(), along with its return value.
+    """
+    results = []
+    while True:
+        try:
+            results.append(next(items))
+        except StopIteration as stop:
+            return results, stop.value
+
+
+@pytest.fixture(params=list(CODECS))
+def codec(request):
+    return get_codec(request.param)
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100_000])
+def test_iter_items(codec, indent, ensure_ascii, size):
+    """
+    Test that items are decoded identically regardless of how the document is split,
+    including when chunks end in the middle of strings, numbers, or escape sequences.
+    """
+    data = json.dumps(DOCUMENT, indent=indent, ensure_ascii=ensure_ascii).encode()
+    items, rest = _consume(iter_items(_split(data, size), "records", codec))
+    assert items == json.loads(data)["records"]
+    assert rest == {k: v for k, v in json.loads(data).items() if k != "records"}
+
+
+def test_iter_items__lazy():
+    """
+    Test that each item is yielded before later chunks are read.
+    """
+    received = []
+
+    def _chunks():
+        for chunk in (b'{"records": [{"id": 1},', b' {"id": 2}', b"]}"):
+            received.append(chunk)
+            yield chunk
+
+    items = iter_items(_chunks(), "records")
+    assert next(items) == {"id": 1}
+    assert len(received) == 1
+    assert next(items) == {"id": 2}
+    assert len(received) == 2
+
+
+@pytest.mark.parametrize(
+    "data,expected_items,expected_rest",
+    [
+        (b"{}", [], {}),
+        (b' { "records" : [ ] } ', [], {}),
+        (b'{"records": [true, 1.5]}', [True, 1.5], {}),
+        (b'{"offset": 1}', [], {"offset": 1}),
+        (b'{"records": null}', [], {"records": None}),
+        (b'{"records": {"id": 1}}', [], {"records": {"id": 1}}),
+    ],
+)
+def test_iter_items__edge_cases(data, expected_items, expected_rest):
+    items, rest = _consume(iter_items([data], "records"))
+    assert items == expected_items
+    assert rest == expected_rest
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"[]",
+        b'{"records": [1, 2}',
+        b'{"records": [1, 2',
+        b'{"records": [{"id": 1',
+        b'{"records": ["abc',
+        b'{"records": [tru]}',
+        b'{"offset" "abc"}',
+        b'{"offset": }',
+        b"{1: 2}",
+        b'{"offset": 1} {}',
+        b'{"offset": 1',
+        b'{"offset":',
+    ],
+)
+@pytest.mark.parametrize("size", [1, 100])
+def test_iter_items__invalid(codec, data, size):
+    with pytest.raises(ValueError):
+        _consume(iter_items(_split(data, size), "records", codec))
+
+
+@pytest.fixture(params=["msgspec", "codec"])
+def raw_decoder(request, monkeypatch):
+    """
+    Run each test with and without msgspec's raw decoder.
+    """
+    if request.param == "codec":
+        monkeypatch.setattr(streaming, "_raw_decoder", lambda: None)
+
+
+@pytest.mark.usefixtures("raw_decoder")
+@pytest.mark.parametrize("indent", [None, 2])
+def test_split_page(codec, indent):
+    data = json.dumps(DOCUMENT, indent=indent).encode()
+    page = split_page(data, "records", codec)
+    assert page.content is data
+    assert page.remainder == {k: v for k, v in DOCUMENT.items() if k != "records"}
+    assert page.offset == "itr123/rec456"
+    assert repr(page) == f"<RawPage content={len(data)} bytes offset='itr123/rec456'>"
+    assert split_page(b"{}", "records").offset is None
+
+
+@pytest.mark.usefixtures("raw_decoder")
+@pytest.mark.parametrize("data", [b"", b"[]", b'{"records": [1, 2}', b"{} {}"])
+def test_split_page__invalid(data):
+    with pytest.raises(ValueError):
+        split_page(data, "records")
+
+
+def test_raw_page():
+    assert RawPage(b"{}").remainder == {}
+
+
+def test_raw_decoder__not_installed():
+    with mock.patch.dict("sys.modules", {"msgspec": None}):
+        assert streaming._raw_decoder.__wrapped__() is None
@@ -0,0 +1,134 @@
+import urllib.parse
+
+import pytest
+
+from pyairtable.api.sync import SyncResult, diff_records
+from pyairtable.testing import fake_id, fake_record
+
+recA, recB, recC, recD = (fake_id(value=c) for c in "ABCD")
+rec1, rec2, rec3 = (fake_id(value=c) for c in "123")
+
+
+def _echo(request, context):
+    return {
+        "records": [
+            fake_record(record["fields"], id=record.get("id"))
+            for record in request.json()["records"]
+        ]
+    }
+
+
+@pytest.fixture
+def existing():
+    return [
+        fake_record({"SKU": "A-1", "Price": 10, "Tags": ["x"]}, id=recA),
+        fake_record({"SKU": "B-2", "Price": 12}, id=recB),
+        fake_record({"SKU": "C-3", "Price": 15}, id=recC),
+        fake_record({"SKU": "C-3", "Price": 15}, id=recD),
+    ]
+
+
+def test_diff_records(existing):
+    records = [
+        {"SKU": "A-1", "Price": 10, "Tags": ["x"], "Discontinued": False},
+        {"SKU": "B-2", "Price": 13, "Notes": ""},
+        {"SKU": "E-5", "Price": 20},
+    ]
+    plan = diff_records(existing, records, ["SKU"])
+    assert plan.create == [{"SKU": "E-5", "Price": 20}]
+    assert plan.update == [{"id": recB, "fields": {"Price": 13}}]
+    assert plan.unchanged == [recA]
+    assert plan.delete == []
+
+    # records which do not match, or which duplicate an earlier match, are deleted
+    plan = diff_records(existing, records[:2], ["SKU"], delete=True)
+    assert plan.delete == [recC, recD]
+    plan = diff_records(existing, [{"SKU": "C-3", "Price": 15}], ["SKU"], delete=True)
+    assert plan.unchanged == [recC]
+    assert plan.delete == [recA, recB, recD]
+
+
+def test_diff_records__compound_key():
+    existing = [
+        fake_record({"Name": "Alice", "Team": ["recX"], "Age": 30}, id=rec1),
+        fake_record({"Name": "Alice", "Team": ["recY"], "Age": 31}, id=rec2),
+        fake_record({"Name": "Alice", "Meta": {"a": 1}}, id=rec3),
+    ]
+    records = [
+        {"Name": "Alice", "Team": ["recY"], "Age": 32},
+        {"Name": "Alice", "Team": [], "Meta": {"a": 1}},
+    ]
+    plan = diff_records(existing, records, ["Name", "Team"])
+    assert plan.update == [{"id": rec2, "fields": {"Age": 32}}]
+    assert plan.unchanged == [rec3]
+    assert plan.create == []
+
+    # dict values (such as barcodes) can also be used as keys
+    plan = diff_records(existing, [{"Meta": {"a": 1}, "Name": "Bob"}], ["Meta"])
+    assert plan.update == [{"id": rec3, "fields": {"Name": "Bob"}}]
+
+
+def test_diff_records__invalid():
+    with pytest.raises(ValueError, match="missing"):
+        diff_records([], [{"Name": "Alice"}], ["SKU"])
+    with pytest.raises(ValueError, match="duplicate"):
+        diff_records([], [{"SKU": "A"}, {"SKU": "A"}], ["SKU"])
+
+
+def test_sync(table, requests_mock, existing):
+    """
+    Test that Table.sync() retrieves only the relevant fields,
+    and only sends the records which have changed.
+    """
+    m_get = requests_mock.get(table.urls.records, json={"records": existing})
+    m_create = requests_mock.post(table.urls.records, json=_echo)
+    m_update = requests_mock.patch(table.urls.records, json=_echo)
+    m_delete = requests_mock.delete(
+        table.urls.records,
+        json={"records": [{"id": recD, "deleted": True}]},
+    )
+    records = [
+        {"SKU": "A-1", "Price": 10},
+        {"SKU": "B-2", "Price": 13},
+        {"SKU": "C-3", "Price": 15},
+        {"SKU": "E-5", "Price": 20},
+    ]
+    result = table.sync(
+        iter(records),
+        key_fields=["SKU"],
+        delete=True,
+        view="Active",
+        formula="{Price} > 0",
+        typecast=True,
+    )
+    assert repr(result) == "SyncResult(created=1, updated=1, deleted=1, unchanged=2)"
+    assert result.unchanged == [recA, recC]
+    assert result.updated[0]["id"] == recB
+    assert result.created[0]["fields"] == {"SKU": "E-5", "Price": 20}
+    assert result.deleted == [{"id": recD, "deleted": True}]
+
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(m_get.last_request.url).query)
+    assert query["fields[]"] == ["SKU", "Price"]
+    assert query["view"] == ["Active"]
+    assert query["filterByFormula"] == ["{Price} > 0"]
+    assert m_create.last_request.json()["typecast"] is True
+    assert m_update.last_request.json()["records"] == [
+        {"id": recB, "fields": {"Price": 13}}
+    ]
+    assert m_delete.call_count == 1
+
+
+def test_sync__no_changes(table, requests_mock, existing):
+    requests_mock.get(table.urls.records, json={"records": existing[:1]})
+    result = table.sync([{"SKU": "A-1", "Price": 10}], key_fields=["SKU"])
+    assert result == SyncResult(unchanged=[recA])
+    assert requests_mock.call_count == 1
+
+
+def test_sync__use_field_ids(table, requests_mock):
+    table.api.use_field_ids = True
+    m_get = requests_mock.get(table.urls.records, json={"records": []})
+    requests_mock.post(table.urls.records, json=_echo)
+    table.sync([{"fldSKU": "A-1"}], key_fields=["fldSKU"])
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(m_get.last_request.url).query)
+    assert query["returnFieldsByFieldId"] == ["1"]
@@ -1,11 +1,20 @@
+import json
+import random
+import re
+import threading
+import time
 from datetime import datetime, timezone
 from unittest import mock
 
+import pydantic
 import pytest
+import requests
 from requests import Request
 from requests_mock import Mocker
 
 from pyairtable import Api, Base, Table
+from pyairtable.api.table import RECORD_ID_CHARS
+from pyairtable.exceptions import BatchError, InvalidParameterError
 from pyairtable.formulas import AND, EQ, Field
 from pyairtable.models.schema import TableSchema
 from pyairtable.testing import fake_attachment, fake_id, fake_record
@@ -192,6 +201,12 @@ def test_first_via_post(table: Table, mock_response_single):
     assert rv == mock_response_single
 
 
+@pytest.mark.parametrize("kwargs", [{"stream": True}, {"raw": False}])
+def test_first__unsupported(table: Table, kwargs):
+    with pytest.raises(InvalidParameterError, match="first\\(\\) does not support"):
+        table.first(**kwargs)
+
+
 def test_first_none(table: Table, mock_response_single):
     mock_response = {"records": []}
     with Mocker() as mock:
@@ -291,6 +306,202 @@ def test_iterate(table: Table, mock_response_list, mock_records):
         assert seq_equals(pages[n], response["records"])
 
 
+def test_iterate__prefetch(table: Table, requests_mock, mock_response_list):
+    """
+    Test that Table.iterate(prefetch=N) passes through to Api.iterate_requests
+    and is not sent to the API as a query parameter.
+    """
+    requests_mock.get(
+        table.urls.records,
+        response_list=[{"json": page} for page in mock_response_list],
+    )
+    pages = list(table.iterate(prefetch=2))
+    assert pages == [page["records"] for page in mock_response_list]
+    assert all("prefetch" not in r.qs for r in requests_mock.request_history)
+
+
+def test_iterate__stream(table: Table, requests_mock, mock_response_list):
+    """
+    Test that Table.iterate(stream=True) returns one record at a time
+    and is not sent to the API as a query parameter.
+    """
+    expected = [record for page in mock_response_list for record in page["records"]]
+    requests_mock.get(
+        table.urls.records,
+        response_list=[{"json": page} for page in mock_response_list],
+    )
+    records = table.iterate(stream=True)
+    assert next(records) == expected[0]
+    assert list(records) == expected[1:]
+    requests_mock.get(
+        table.urls.records,
+        response_list=[{"json": page} for page in mock_response_list],
+    )
+    assert table.all(stream=True) == expected
+    assert all("stream" not in r.qs for r in requests_mock.request_history)
+
+
+def test_iterate__stream__invalid(table: Table, requests_mock):
+    requests_mock.get(table.urls.records, json={"records": [{"id": "recFake"}]})
+    with pytest.raises(pydantic.ValidationError):
+        list(table.iterate(stream=True))
+
+
+@pytest.mark.parametrize("prefetch", [0, 1])
+def test_iterate__raw(table: Table, requests_mock, mock_response_list, prefetch):
+    """
+    Test that Table.iterate(raw=True) yields each response body without
+    validating it, and is not sent to the API as a query parameter.
+    """
+    mock_response_list[1]["records"].append({"id": "recInvalid"})
+    bodies = [json.dumps(page).encode() for page in mock_response_list]
+    requests_mock.get(
+        table.urls.records,
+        response_list=[{"content": body} for body in bodies],
+    )
+    pages = list(table.iterate(raw=True, prefetch=prefetch))
+    assert [page.content for page in pages] == bodies
+    assert [page.offset for page in pages] == ["recuOeLpF6TQpArJi", None]
+    assert requests_mock.last_request.qs == {"offset": ["recuOeLpF6TQpArJi"]}
+    assert all("raw" not in r.qs for r in requests_mock.request_history)
+
+    requests_mock.get(
+        table.urls.records,
+        response_list=[{"content": body} for body in bodies],
+    )
+    assert [page.content for page in table.all(raw=True)] == bodies
+
+
+def test_iterate__raw__stream(table: Table):
+    with pytest.raises(ValueError):
+        list(table.iterate(raw=True, stream=True))
+
+
+@pytest.fixture
+def scannable(table, requests_mock):
+    """
+    Simulates a table which responds to the formulas that Table.scan() uses
+    to divide a table into slices. Tests should populate the returned dict.
+    """
+    records = {}
+    shard_regex = re.compile(r"REGEX_MATCH\(RECORD_ID\(\), '([^']+)'\)")
+
+    def _list_records(request, context):
+        pattern = shard_regex.search(request.qs["filterByFormula"][0])[1]
+        matches = sorted(id_ for id_ in records if re.match(pattern, id_))
+        offset = int(request.qs.get("offset", ["0"])[0])
+        page_size = int(request.qs.get("pageSize", ["100"])[0])
+        page = {"records": [records[id_] for id_ in matches][offset:][:page_size]}
+        if offset + page_size < len(matches):
+            page["offset"] = str(offset + page_size)
+        return page
+
+    requests_mock.get(table.urls.records, json=_list_records)
+    return records
+
+
+def _scanned_patterns(requests_mock):
+    return [
+        re.search(r"'(\^rec[^']+)'", r.qs["filterByFormula"][0])[1]
+        for r in requests_mock.request_history
+    ]
+
+
+def test_scan(table, scannable, requests_mock):
+    """
+    Test that Table.scan() returns every record exactly once.
+    """
+    scannable.update({(r := fake_record())["id"]: r for _ in range(300)})
+    pages = list(table.scan(shards=4, page_size=10))
+    ids = [record["id"] for page in pages for record in page]
+    assert sorted(ids) == sorted(scannable)
+    assert all(len(page) <= 10 for page in pages)
+    assert all(r.qs["pageSize"] == ["10"] for r in requests_mock.request_history)
+    # 4 initial slices, each of which could be split up to 12 times in total
+    assert 4 <= len(set(_scanned_patterns(requests_mock))) <= 4 + 12 * 2
+
+
+def test_scan__no_splits(table, scannable, requests_mock):
+    """
+    Test that if max_shards == shards, no slices are split and no pages are wasted.
+    """
+    scannable.update({(r := fake_record())["id"]: r for _ in range(100)})
+    pages = list(table.scan(shards=3, max_shards=3, page_size=10))
+    assert sorted(r["id"] for page in pages for r in page) == sorted(scannable)
+    assert len(set(_scanned_patterns(requests_mock))) == 3
+    assert len(requests_mock.request_history) == len(pages)
+
+
+def test_scan__skewed(table, scannable, requests_mock):
+    """
+    Test that a slice with many more records than the others gets split
+    into smaller slices, down to a longer record ID prefix.
+    """
+    for n in range(150):
+        record = fake_record(id="recA" + fake_id()[4:], n=n)
+        scannable[record["id"]] = record
+    scannable.update({(r := fake_record())["id"]: r for _ in range(20)})
+    pages = list(table.scan(shards=2, max_shards=16, page_size=10))
+    assert sorted(r["id"] for page in pages for r in page) == sorted(scannable)
+    patterns = _scanned_patterns(requests_mock)
+    assert any(pattern.startswith("^recA[") for pattern in patterns)
+
+
+def test_scan__formula(table, scannable, requests_mock):
+    """
+    Test that a formula passed to scan() is combined with each slice's formula,
+    and that use_field_ids from the Api is respected.
+    """
+    table.api.use_field_ids = True
+    list(table.scan(shards=1, formula=EQ(Field("Name"), "Alice")))
+    list(table.scan(shards=1, formula="{Name}='Bob'"))
+    formulas = [r.qs["filterByFormula"][0] for r in requests_mock.request_history]
+    assert formulas == [
+        "AND({Name}='Alice', REGEX_MATCH(RECORD_ID(), '^rec[%s]'))" % RECORD_ID_CHARS,
+        "AND({Name}='Bob', REGEX_MATCH(RECORD_ID(), '^rec[%s]'))" % RECORD_ID_CHARS,
+    ]
+    for request in requests_mock.request_history:
+        assert request.qs["returnFieldsByFieldId"] == ["1"]
+
+
+@pytest.mark.parametrize("shards", [0, 63])
+def test_scan__invalid_shards(table, shards):
+    with pytest.raises(ValueError):
+        next(table.scan(shards=shards))
+
+
+@pytest.mark.parametrize("kwargs", [{"max_records": 1}, {"sort": ["Name"]}])
+def test_scan__invalid_options(table, kwargs):
+    with pytest.raises(InvalidParameterError):
+        next(table.scan(**kwargs))
+
+
+def test_scan__error(table, requests_mock):
+    requests_mock.get(table.urls.records, status_code=500)
+    with pytest.raises(requests.exceptions.HTTPError):
+        list(table.scan(shards=2))
+
+
+def test_scan__cancel(table, scannable, requests_mock):
+    """
+    Test that threads stop retrieving pages once the caller stops iterating.
+    """
+    scannable.update({(r := fake_record())["id"]: r for _ in range(100)})
+    pages = table.scan(shards=2, max_shards=2, page_size=1)
+    next(pages)
+    # wait until both threads are blocked on a full buffer
+    for _ in range(500):
+        if len(requests_mock.request_history) >= 5:
+            break
+        time.sleep(0.01)
+    pages.close()
+    assert not [
+        t for t in threading.enumerate() if t.name.startswith("pyairtable-scan")
+    ]
+    # one page consumed, two pages buffered, and one page in flight per thread
+    assert len(requests_mock.request_history) == 5
+
+
 def test_iterate__formula_conversion(table):
     """
     Test that .iterate() will convert a Formula to a str.
@@ -305,6 +516,10 @@ def test_iterate__formula_conversion(table):
         options={
             "formula": "AND({Name}='Alice')",
         },
+        prefetch=0,
+        stream=None,
+        decode=table._decode_records,
+        raw=None,
     )
 
 
@@ -445,6 +660,104 @@ def test_batch_upsert__missing_field(table: Table, requests_mock):
         table.batch_upsert([{"fields": {"Name": "Alice"}}], key_fields=["Email"])
 
 
+@pytest.fixture
+def echo_records(table, requests_mock):
+    """
+    Responds to batch requests by echoing back the records they contain.
+    """
+
+    def _echo(request, context):
+        if request.method == "DELETE":
+            ids = request.qs["records[]"]
+            return {"records": [{"id": id_.upper(), "deleted": True} for id_ in ids]}
+        records = [
+            {"id": r.get("id") or fake_id(), "createdTime": NOW, "fields": r["fields"]}
+            for r in request.json()["records"]
+        ]
+        if "fail" in str(records):
+            context.status_code = 422
+            return {"error": {"type": "INVALID_VALUE_FOR_COLUMN"}}
+        if not request.json().get("performUpsert"):
+            return {"records": records}
+        return {
+            "records": records,
+            "createdRecords": [r["id"] for r in records],
+            "updatedRecords": [],
+        }
+
+    for method in ("POST", "PATCH", "DELETE"):
+        requests_mock.register_uri(method, table.urls.records, json=_echo)
+
+
+@pytest.mark.parametrize(
+    "method,records,kwargs",
+    [
+        ("batch_create", [{"n": n} for n in range(95)], {}),
+        ("batch_update", [fake_record(n=n) for n in range(95)], {}),
+        (
+            "batch_upsert",
+            [{"fields": {"n": n}} for n in range(95)],
+            {"key_fields": ["n"]},
+        ),
+        ("batch_delete", [fake_id() for _ in range(95)], {}),
+    ],
+)
+def test_batch__max_workers(table: Table, echo_records, method, records, kwargs):
+    """
+    Test that batch methods can send chunks concurrently,
+    and still return results in the same order as the input.
+    """
+    result = getattr(table, method)(records, max_workers=4, **kwargs)
+    if method == "batch_upsert":
+        result = result["records"]
+    if method == "batch_delete":
+        assert [r["id"] for r in result] == [id_.upper() for id_ in records]
+    else:
+        fields = [r["fields"] if "fields" in r else r for r in records]
+        assert [r["fields"] for r in result] == fields
+
+
+def test_batch__max_workers__concurrent(table: Table):
+    """
+    Test that max_workers=N sends N requests at the same time, and that
+    results are returned in input order even if they finish out of order.
+    """
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _post(url, json):
+        barrier.wait()
+        time.sleep(random.random() / 20)
+        return {
+            "records": [
+                {**r, "id": fake_id(), "createdTime": NOW} for r in json["records"]
+            ]
+        }
+
+    records = [{"n": n} for n in range(30)]
+    with mock.patch.object(table.api, "post", side_effect=_post):
+        result = table.batch_create(records, max_workers=3)
+    assert [r["fields"] for r in result] == records
+
+
+def test_batch__max_workers__errors(table: Table, echo_records):
+    """
+    Test that when some chunks fail, BatchError reports exactly which
+    input records failed, along with the results of the other chunks.
+    """
+    records = [{"n": n} for n in range(35)]
+    records[12] = records[31] = {"n": "fail"}
+    with pytest.raises(BatchError) as exc_info:
+        table.batch_create(records, max_workers=2)
+
+    exc = exc_info.value
+    assert str(exc) == "2 of 4 batches failed (records 10-19, 30-34)"
+    assert list(exc.errors) == [range(10, 20), range(30, 35)]
+    assert all(e.response.status_code == 422 for e in exc.errors.values())
+    assert exc.__cause__ is exc.errors[range(10, 20)]
+    assert list(exc.results) == [range(0, 10), range(20, 30)]
+    assert [r["fields"] for r in exc.results[range(20, 30)]] == records[20:30]
+
+
 def test_delete(table: Table, mock_response_single):
     id_ = mock_response_single["id"]
     expected = {"deleted": True, "id": id_}
@@ -0,0 +1,185 @@
+import asyncio
+
+import pytest
+import requests
+
+from pyairtable.api import tracing
+from pyairtable.models import Webhook
+from pyairtable.orm import Model
+from pyairtable.orm import fields as f
+from pyairtable.testing import fake_id, fake_meta, fake_record
+
+sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+sdk_export = pytest.importorskip("opentelemetry.sdk.trace.export")
+in_memory = pytest.importorskip(
+    "opentelemetry.sdk.trace.export.in_memory_span_exporter"
+)
+trace = pytest.importorskip("opentelemetry.trace")
+
+
+class Book(Model):
+    Meta = fake_meta(table_name="Books")
+    name = f.TextField("Name")
+    sequels = f.LinkField["Book"]("Sequels", "Book")
+
+
+@pytest.fixture(scope="session")
+def _exporter():
+    exporter = in_memory.InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(sdk_export.SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return exporter
+
+
+@pytest.fixture
+def spans(_exporter):
+    """
+    Returns a function which retrieves all spans that have ended during the test.
+    """
+    _exporter.clear()
+    yield _exporter.get_finished_spans
+    _exporter.clear()
+
+
+def _children(spans, parent):
+    return [
+        span
+        for span in spans
+        if span.parent and span.parent.span_id == parent.context.span_id
+    ]
+
+
+def test_enabled():
+    assert tracing.ENABLED
+    assert tracing.TRACER is not None
+
+
+def test_all(table, requests_mock, spans):
+    """
+    Test that Table.all() creates a parent span, with one child span per page.
+    """
+    pages = [{"records": [fake_record()], "offset": "x"}, {"records": [fake_record()]}]
+    requests_mock.get(table.urls.records, [{"json": page} for page in pages])
+    table.all()
+    *requests, parent = spans()
+    assert parent.name == "Table.all"
+    assert _children(requests, parent) == requests
+    assert [span.name for span in requests] == ["GET {base}/{table}"] * 2
+    assert [span.kind for span in requests] == [trace.SpanKind.CLIENT] * 2
+    assert [span.attributes["airtable.page"] for span in requests] == [1, 2]
+    assert requests[0].attributes["http.request.method"] == "GET"
+    assert requests[0].attributes["http.response.status_code"] == 200
+    assert requests[0].attributes["url.template"] == "{base}/{table}"
+    assert requests[0].attributes["url.full"].startswith(table.urls.records)
+    assert "http.request.resend_count" not in requests[0].attributes
+
+
+@pytest.mark.parametrize("prefetch", [0, 1])
+def test_all__prefetch(table, requests_mock, spans, prefetch):
+    """
+    Test that pages retrieved in a background thread still have the right parent.
+    """
+    requests_mock.get(table.urls.records, json={"records": [fake_record()]})
+    table.all(prefetch=prefetch)
+    request, parent = spans()
+    assert _children([request], parent) == [request]
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_batch(table, requests_mock, spans, max_workers):
+    """
+    Test that each chunk of a batch operation is a child of the operation's span.
+    """
+    records = [fake_record() for _ in range(25)]
+    requests_mock.post(
+        table.urls.records,
+        [{"json": {"records": records[n : n + 10]}} for n in range(0, 25, 10)],
+    )
+    table.batch_create([r["fields"] for r in records], max_workers=max_workers)
+    *requests, parent = spans()
+    assert parent.name == "Table.batch_create"
+    assert _children(requests, parent) == requests
+    assert sorted(span.attributes["airtable.chunk"] for span in requests) == [0, 1, 2]
+    assert all("airtable.page" not in span.attributes for span in requests)
+
+
+def test_error(table, requests_mock, spans):
+    requests_mock.get(table.urls.record("rec"), status_code=404, json={})
+    with pytest.raises(requests.HTTPError):
+        table.get("rec")
+    (span,) = spans()
+    assert span.status.status_code == trace.StatusCode.ERROR
+    assert span.attributes["http.response.status_code"] == 404
+    assert span.events[0].name == "exception"
+
+
+def test_retry_count(constants, spans, monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    from pyairtable.api.aio import AsyncApi
+
+    responses = [httpx.Response(429), httpx.Response(200, json=fake_record())]
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda r: responses.pop(0))
+    )
+    monkeypatch.setattr("pyairtable.api.retrying.random.uniform", lambda a, b: 0)
+    api = AsyncApi(constants["API_KEY"], client=client)
+    table = api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+    asyncio.run(table.get(fake_id()))
+    (span,) = spans()
+    assert span.attributes["http.request.resend_count"] == 1
+
+
+def test_orm(requests_mock, spans):
+    """
+    Test that LinkField.populate() and Model.from_ids() create nested spans.
+    """
+    sequel = fake_record(Name="Sequel")
+    book = Book.from_record(fake_record(Name="Book", Sequels=[sequel["id"]]))
+    requests_mock.get(Book.meta.table.urls.records, json={"records": [sequel]})
+    Book.sequels.populate(book)
+    assert book.sequels[0].name == "Sequel"
+    request, table_all, from_ids, populate = spans()
+    assert (table_all.name, from_ids.name, populate.name) == (
+        "Table.all",
+        "Model.from_ids",
+        "LinkField.populate",
+    )
+    assert _children([request], table_all) == [request]
+    assert _children([table_all], from_ids) == [table_all]
+    assert _children([from_ids], populate) == [from_ids]
+
+
+def test_webhook_payloads(base, requests_mock, sample_json, spans):
+    """
+    Test that the span for a generator only encloses the generator's own work,
+    and ends when the generator is closed.
+    """
+    webhook = Webhook.from_api(sample_json("Webhook"), base.api, context=base)
+    payload = sample_json("WebhookPayload")
+    requests_mock.get(
+        f"{webhook._url}/payloads",
+        json={"payloads": [payload, payload], "cursor": 3, "mightHaveMore": False},
+    )
+    payloads = webhook.payloads()
+    next(payloads)
+    assert trace.get_current_span() is trace.INVALID_SPAN
+    assert [span.name for span in spans()] == [
+        "GET bases/{base}/webhooks/{webhook}/payloads"
+    ]
+    payloads.close()
+    request, parent = spans()
+    assert parent.name == "Webhook.payloads"
+    assert _children([request], parent) == [request]
+
+
+def test_traced__no_opentelemetry(monkeypatch):
+    """
+    Test that functions are not wrapped if OpenTelemetry is not installed.
+    """
+
+    def func():
+        pass
+
+    monkeypatch.setattr(tracing, "TRACER", None)
+    assert tracing.traced("func")(func) is func
@@ -0,0 +1,162 @@
+import json
+
+import pydantic
+import pytest
+
+from pyairtable import Api
+from pyairtable.api.codecs import StdlibCodec
+from pyairtable.api.types import RecordDeletedDict, RecordDict
+from pyairtable.api.validation import (
+    FullValidation,
+    NoValidation,
+    SampledValidation,
+    StructuralValidation,
+    Validation,
+    get_validation,
+)
+from pyairtable.testing import fake_record
+
+INVALID = {"id": 1, "createdTime": None, "fields": {}}
+MISSING = {"id": "rec", "fields": {}}
+Deleted = RecordDeletedDict | RecordDict
+
+
+@pytest.fixture
+def records():
+    return [fake_record() for _ in range(7)]
+
+
+def test_get_validation():
+    assert repr(get_validation()) == "<FullValidation>"
+    assert repr(get_validation("structural")) == "<StructuralValidation>"
+    assert repr(get_validation("sampled")) == "<SampledValidation every=100>"
+    assert repr(get_validation("off")) == "<NoValidation>"
+    policy = SampledValidation(5)
+    assert get_validation(policy) is policy
+    with pytest.raises(ValueError, match="unknown validation policy"):
+        get_validation("strict")
+    with pytest.raises(NotImplementedError):
+        Validation().check(RecordDict, {})
+
+
+def test_api(api, table, requests_mock):
+    """
+    Test that the Api's validation policy is used for records returned by a Table.
+    """
+    assert isinstance(api.validation, FullValidation)
+    requests_mock.get(table.urls.records, json={"records": [MISSING]})
+    with pytest.raises(pydantic.ValidationError):
+        table.all()
+
+    table.api.validation = get_validation("off")
+    assert table.all() == [MISSING]
+    assert isinstance(Api("key", validation="structural").validation, Validation)
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [FullValidation(), StructuralValidation(), SampledValidation(1), NoValidation()],
+)
+def test_returns_originals(policy, records):
+    assert policy.check_all(RecordDict, records) is records
+    assert policy.check(RecordDict, records[0]) is records[0]
+    assert policy.check_all(Deleted, records) is records
+
+
+def test_full(records):
+    policy = FullValidation()
+    with pytest.raises(pydantic.ValidationError):
+        policy.check_all(RecordDict, [*records, INVALID])
+    with pytest.raises(pydantic.ValidationError):
+        policy.check(RecordDict, INVALID)
+    with pytest.raises(TypeError):
+        policy.check_all(RecordDict, {"records": records})
+    with pytest.raises(TypeError):
+        policy.check_all(RecordDict, [*records, None])
+    assert policy.check_all(Deleted, [{"id": "rec", "deleted": True}])
+
+
+def test_structural(records):
+    policy = StructuralValidation()
+    # values are not checked, only keys
+    assert policy.check_all(RecordDict, [*records, INVALID])
+    with pytest.raises(pydantic.ValidationError, match="createdTime"):
+        policy.check_all(RecordDict, [*records, MISSING])
+    with pytest.raises(pydantic.ValidationError, match="createdTime"):
+        policy.check_all(Deleted, [MISSING])
+    with pytest.raises(TypeError):
+        policy.check_all(RecordDict, [None])
+    with pytest.raises(TypeError):
+        policy.check(RecordDict, None)
+    assert policy.check_all(Deleted, [{"id": "rec", "deleted": True}])
+
+
+def test_sampled(records):
+    """
+    Test that SampledValidation checks one in every N objects,
+    counting across multiple calls.
+    """
+    policy = SampledValidation(3)
+    assert repr(policy) == "<SampledValidation every=3>"
+    invalid = [INVALID if n in (1, 2, 4, 5) else r for (n, r) in enumerate(records)]
+    policy.check_all(RecordDict, invalid)  # checks 0, 3, 6
+    policy.check_all(RecordDict, [INVALID, INVALID])  # 7, 8
+    with pytest.raises(pydantic.ValidationError):
+        policy.check_all(RecordDict, [INVALID])  # 9
+    policy.check(RecordDict, INVALID)  # 10
+    policy.check(RecordDict, INVALID)  # 11
+    with pytest.raises(pydantic.ValidationError):
+        policy.check(RecordDict, INVALID)  # 12
+    with pytest.raises(TypeError):
+        policy.check_all(RecordDict, None)
+    with pytest.raises(ValueError):
+        SampledValidation(0)
+
+
+def test_off():
+    policy = NoValidation()
+    assert policy.check(RecordDict, INVALID) is INVALID
+    assert policy.check_all(RecordDict, None) is None
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [FullValidation(), StructuralValidation(), SampledValidation(1), NoValidation()],
+)
+def test_decode_page(policy, records):
+    """
+    Test that every policy decodes the whole payload, including keys
+    which are not declared by the TypedDict.
+    """
+    payload = {
+        "records": [{**records[0], "commentCount": 1, "extra": [1.5, 2**70]}],
+        "offset": "itr/rec",
+        "other": None,
+    }
+    data = json.dumps(payload).encode()
+    assert policy.decode_page(RecordDict, "records", data, StdlibCodec()) == payload
+    assert policy.decode_page(RecordDict, "records", b"{}", StdlibCodec()) == {}
+    with pytest.raises(ValueError):
+        policy.decode_page(RecordDict, "records", b"{", StdlibCodec())
+
+
+@pytest.mark.parametrize(
+    "policy,record,exc",
+    [
+        (FullValidation(), INVALID, pydantic.ValidationError),
+        (FullValidation(), None, TypeError),
+        (StructuralValidation(), MISSING, pydantic.ValidationError),
+        (StructuralValidation(), None, TypeError),
+        (SampledValidation(1), INVALID, pydantic.ValidationError),
+    ],
+)
+def test_decode_page__invalid(policy, record, exc):
+    data = json.dumps({"records": [record]}).encode()
+    with pytest.raises(exc):
+        policy.decode_page(RecordDict, "records", data, StdlibCodec())
+
+
+@pytest.mark.parametrize("policy", [FullValidation(), NoValidation()])
+def test_decode_page__not_dict(policy):
+    with pytest.raises(TypeError):
+        policy.decode_page(RecordDict, "records", b"[]", StdlibCodec())
@@ -0,0 +1,233 @@
+import threading
+import urllib.parse
+
+import pytest
+import requests
+
+from pyairtable.api.writer import BatchWriter, BatchWriterStats
+from pyairtable.testing import fake_id, fake_record
+
+
+def _echo(request, context):
+    """
+    Respond to a batch create or update with the records it contained.
+    """
+    return {
+        "records": [
+            fake_record(record["fields"], id=record.get("id"))
+            for record in request.json()["records"]
+        ]
+    }
+
+
+def _deleted(request, context):
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+    return {"records": [{"id": id, "deleted": True} for id in query["records[]"]]}
+
+
+@pytest.fixture
+def m_create(table, requests_mock):
+    return requests_mock.post(table.urls.records, json=_echo)
+
+
+@pytest.fixture
+def m_update(table, requests_mock):
+    return requests_mock.patch(table.urls.records, json=_echo)
+
+
+@pytest.fixture
+def m_delete(table, requests_mock):
+    return requests_mock.delete(table.urls.records, json=_deleted)
+
+
+def test_create(table, m_create):
+    """
+    Test that creates are sent in batches of ten, and when the writer is closed.
+    """
+    with table.batch_writer(typecast=True) as writer:
+        futures = [writer.create({"Name": str(n)}) for n in range(25)]
+        assert m_create.call_count == 2
+        assert writer.pending == 5
+        assert repr(writer) == f"<BatchWriter table={table.name!r} pending=5>"
+
+    assert writer.closed
+    assert m_create.call_count == 3
+    assert [len(r.json()["records"]) for r in m_create.request_history] == [10, 10, 5]
+    assert m_create.last_request.json()["typecast"] is True
+    assert [f.result()["fields"]["Name"] for f in futures] == [
+        str(n) for n in range(25)
+    ]
+    assert writer.stats == BatchWriterStats(operations=25, merged=0, requests=3)
+
+
+def test_update(table, m_update, requests_mock):
+    """
+    Test that several updates to the same record are merged into one.
+    """
+    record_id = fake_id()
+    fields = {"Name": "Alice"}
+    with table.batch_writer() as writer:
+        first = writer.update(record_id, fields)
+        second = writer.update(record_id, {"Age": 30})
+        other = writer.update(fake_id(), {"Name": "Bob"})
+
+    assert first is second
+    assert fields == {"Name": "Alice"}
+    assert m_update.call_count == 1
+    assert m_update.last_request.json()["records"] == [
+        {"id": record_id, "fields": {"Name": "Alice", "Age": 30}},
+        {"id": other.result()["id"], "fields": {"Name": "Bob"}},
+    ]
+    assert first.result()["fields"] == {"Name": "Alice", "Age": 30}
+    assert writer.stats == BatchWriterStats(operations=3, merged=1, requests=1)
+
+    m_put = requests_mock.put(table.urls.records, json=_echo)
+    with table.batch_writer(replace=True) as writer:
+        writer.update(record_id, fields)
+    assert m_put.call_count == 1
+
+
+def test_delete(table, m_update, m_delete):
+    """
+    Test that deleting a record discards any pending updates to it.
+    """
+    record_id = fake_id()
+    with table.batch_writer() as writer:
+        update = writer.update(record_id, {"Name": "Alice"})
+        delete = writer.delete(record_id)
+        assert writer.delete(record_id) is delete
+        assert update.cancelled()
+        with pytest.raises(ValueError):
+            writer.update(record_id, {"Name": "Bob"})
+
+    assert m_update.call_count == 0
+    assert m_delete.call_count == 1
+    assert delete.result() == {"id": record_id, "deleted": True}
+
+
+def test_cancel(table, m_create):
+    """
+    Test that changes whose futures have been cancelled are not sent.
+    """
+    with table.batch_writer() as writer:
+        writer.create({"Name": "Alice"}).cancel()
+    assert m_create.call_count == 0
+
+
+def test_error(table, requests_mock, m_update):
+    """
+    Test that failures are passed to each future in the batch,
+    and raised once every batch has been attempted.
+    """
+    requests_mock.post(table.urls.records, status_code=422, json={})
+    writer = table.batch_writer()
+    created = writer.create({"Name": "Alice"})
+    updated = writer.update(fake_id(), {"Name": "Bob"})
+    with pytest.raises(requests.HTTPError) as exc_info:
+        writer.flush()
+    assert created.exception() is exc_info.value
+    assert updated.result()["fields"] == {"Name": "Bob"}
+
+    # errors are only raised once
+    writer.flush()
+
+
+def test_closed(table):
+    writer = table.batch_writer()
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.create({})
+    with pytest.raises(RuntimeError):
+        writer.update(fake_id(), {})
+    with pytest.raises(RuntimeError):
+        writer.delete(fake_id())
+    with pytest.raises(ValueError):
+        BatchWriter(table, flush_interval=0)
+
+
+def test_flush_interval(table, requests_mock, m_create):
+    """
+    Test that a writer with a flush interval sends changes in the background,
+    and that errors in the background are raised when the writer is closed.
+    """
+    writer = table.batch_writer(flush_interval=0.01)
+    assert writer.create({"Name": "Alice"}).result(timeout=5)["fields"] == {
+        "Name": "Alice"
+    }
+
+    requests_mock.post(table.urls.records, status_code=500, json={})
+    with pytest.raises(requests.HTTPError):
+        writer.create({"Name": "Bob"}).result(timeout=5)
+    with pytest.raises(requests.HTTPError):
+        writer.close()
+
+
+def test_threads(table, m_create):
+    """
+    Test that a writer can be shared between threads without
+    losing changes or sending partial batches.
+    """
+    futures = []
+
+    def _create(writer):
+        for n in range(25):
+            futures.append(writer.create({"Name": str(n)}))
+
+    with table.batch_writer() as writer:
+        threads = [threading.Thread(target=_create, args=[writer]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert m_create.call_count == 10
+    assert len({f.result()["id"] for f in futures}) == 100
+
+
+def test_callbacks(table, m_create, m_update, m_delete):
+    """
+    Test that callbacks can buffer more changes, even if that fills a batch.
+    """
+    writer = table.batch_writer()
+    children = []
+
+    def _create_child(future):
+        children.append(writer.create({"Parent": [future.result()["id"]]}))
+
+    parents = [writer.create({"Name": str(n)}) for n in range(10)]
+    for parent in parents:
+        parent.add_done_callback(_create_child)
+    for n in range(10, 20):
+        writer.create({"Name": str(n)}).add_done_callback(_create_child)
+    assert m_create.call_count == 4
+    assert len(children) == 20
+    assert [f.result(timeout=5)["fields"] for f in children[:10]] == [
+        {"Parent": [f.result()["id"]]} for f in parents
+    ]
+
+    # Cancelling a pending update runs its callbacks, too.
+    record_id = fake_id()
+    update = writer.update(record_id, {"Name": "Alice"})
+    update.add_done_callback(lambda _: writer.delete(fake_id()))
+    writer.delete(record_id)
+    writer.close()
+    assert update.cancelled()
+    assert m_update.call_count == 0
+    assert len(m_delete.last_request.qs["records[]"]) == 2
+
+
+@pytest.mark.parametrize("method", ["update", "delete"])
+def test_full_batch(table, m_update, m_delete, method):
+    """
+    Test that updates and deletes are sent as soon as there are ten of them.
+    """
+    writer = table.batch_writer()
+    for _ in range(10):
+        if method == "update":
+            writer.update(fake_id(), {"Name": "Alice"})
+        else:
+            writer.delete(fake_id())
+    assert writer.pending == 0
+    assert (m_update.call_count, m_delete.call_count) == (
+        (1, 0) if method == "update" else (0, 1)
+    )
@@ -1,3 +1,4 @@
+import gzip
 import json
 from unittest import mock
 
@@ -6,7 +7,7 @@ from click.testing import CliRunner
 
 import pyairtable.cli
 import pyairtable.orm.generate
-from pyairtable.testing import fake_id
+from pyairtable.testing import fake_id, fake_record
 
 
 @pytest.fixture
@@ -198,6 +199,78 @@ def test_base_table_records(
     assert set(record["id"] for record in result) == set(fake_ids)
 
 
+@pytest.mark.parametrize(
+    "extra_args,expected_args,expected_kwargs",
+    [
+        ([], ["ndjson"], {"compression": None}),
+        (["-o", "out.csv"], ["csv"], {"compression": None}),
+        (["-o", "out.JSONL.gz"], ["ndjson"], {"compression": "gzip"}),
+        (["-o", "out.parquet.zst"], ["parquet"], {"compression": "zstd"}),
+        (["-o", "out.txt", "--format", "csv"], ["csv"], {"compression": None}),
+        (["-o", "out.csv.gz", "-z", "zstd"], ["csv"], {"compression": "zstd"}),
+        (
+            ["-f", "$formula", "-v", "$view"],
+            ["ndjson"],
+            {"formula": "$formula", "view": "$view"},
+        ),
+        (
+            ["-n", 10, "-F", "$fld1", "-S", "-fld2"],
+            ["ndjson"],
+            {"max_records": 10, "fields": ["$fld1"], "sort": ["-fld2"]},
+        ),
+    ],
+)
+@mock.patch("pyairtable.cli.export_records", return_value=0)
+def test_base_table_export(
+    mock_export,
+    run,
+    base,
+    tmp_path,
+    monkeypatch,
+    extra_args,
+    expected_args,
+    expected_kwargs,
+):
+    monkeypatch.chdir(tmp_path)
+    run("base", base.id, "table", "Apartments", "export", *extra_args)
+    defaults = {
+        "compression": None,
+        "progress": mock.ANY,
+        "formula": None,
+        "view": None,
+        "max_records": None,
+        "fields": [],
+        "sort": [],
+    }
+    mock_export.assert_called_once_with(
+        mock.ANY, mock.ANY, *expected_args, **{**defaults, **expected_kwargs}
+    )
+
+
+@pytest.mark.parametrize("quiet", [True, False])
+def test_base_table_export__file(run, base, tmp_path, requests_mock, quiet):
+    records = [fake_record({"Name": "Alice"}), fake_record({"Name": "Bob"})]
+    requests_mock.get(
+        base.table("tbltp8DGLhqbUmjK1").urls.records,
+        [
+            {"json": {"records": records[:1], "offset": "page2"}},
+            {"json": {"records": records[1:]}},
+        ],
+    )
+    output = tmp_path / "apartments.csv.gz"
+    args = ["-o", str(output), "--field", "Name", *(["-q"] if quiet else [])]
+    result = run("base", base.id, "table", "Apartments", "export", *args)
+    assert gzip.decompress(output.read_bytes()).decode().splitlines() == [
+        "id,Name",
+        f"{records[0]['id']},Alice",
+        f"{records[1]['id']},Bob",
+    ]
+    assert result.stdout == ""
+    assert result.stderr == (
+        "" if quiet else "\rExported 1 records\rExported 2 records\n"
+    )
+
+
 @pytest.mark.parametrize("extra_args", [[], ["schema"]])
 def test_base_table_schema(run, base, extra_args):
     result = run.json("base", base.id, "table", "Apartments", *extra_args)
@@ -7,8 +7,11 @@ from pyairtable.models._base import (
     CanDeleteModel,
     CanUpdateModel,
     RestfulModel,
+    _cascade_fields,
     rebuild_models,
 )
+from pyairtable.models.audit import AuditLogResponse
+from pyairtable.models.schema import BaseSchema, TableSchema
 
 
 @pytest.fixture
@@ -266,13 +269,19 @@ def test_restfulmodel__set_url(api, base):
     d = Dummy.from_api(data, api, context={"base": base})
     assert d._url == api.build_url(f"{base.id}/1/2")
 
+    # models which were not created by from_api() have no URL
+    assert Dummy(**data)._url == ""
+
+    # the URL is not built until it is needed
+    d = Dummy.from_api(data, api)
     with pytest.raises(KeyError) as exc_info:
-        Dummy.from_api(data, api)
+        d._url
 
     assert exc_info.match(r"\('base', \{'dummy': .*\}\)")
 
+    d = Dummy.from_api(data, api, context={"base": None})
     with pytest.raises(AttributeError) as exc_info:
-        Dummy.from_api(data, api, context={"base": None})
+        d._url
 
     assert exc_info.match(
         r'"\'NoneType\' object has no attribute \'id\'"'
@@ -331,3 +340,13 @@ def test_datetime_models(attrpath, schema_obj):
     Test that specific models' fields are correctly converted to datetimes.
     """
     assert isinstance(schema_obj(attrpath), datetime)
+
+
+def test_cascade_api__skips_plain_fields():
+    """
+    Test that cascade_api only descends into fields which might contain a RestfulModel.
+    """
+    assert _cascade_fields(AuditLogResponse) == ()
+    assert _cascade_fields(BaseSchema) == ("tables",)
+    assert "fields" in _cascade_fields(TableSchema)
+    assert "description" not in _cascade_fields(TableSchema)
@@ -244,6 +244,10 @@ def test_from_ids(mock_api):
                 "OR(%s)" % ", ".join(f"RECORD_ID()='{id}'" for id in sorted(fake_ids))
             ),
         },
+        prefetch=0,
+        stream=None,
+        decode=mock.ANY,
+        raw=None,
     )
     assert len(contacts) == len(fake_records)
     assert {c.id for c in contacts} == {r["id"] for r in fake_records}
@@ -313,6 +317,36 @@ def test_passthrough(methodname, returns):
     )
 
 
+def test_to_arrow():
+    """
+    Test that .to_arrow() and .to_pandas() request the model's fields
+    and name each column after the model's attributes.
+    """
+    pa = pytest.importorskip("pyarrow")
+    pytest.importorskip("pandas")
+    arrow = pa.table(
+        {
+            "id": ["rec1", "rec2"],
+            "fld1VnoyuotSTyxW1": ["Alice", "Bob"],
+            "fld2VnoyuotSTy4g6": [30.0, None],
+        }
+    )
+    with mock.patch("pyairtable.Table.to_arrow", return_value=arrow) as m:
+        result = FakeModelByIds.to_arrow(view="Everyone")
+        df = FakeModelByIds.to_pandas()
+    m.assert_called_with(
+        fields=["fld1VnoyuotSTyxW1", "fld2VnoyuotSTy4g6"],
+        use_field_ids=True,
+        user_locale=None,
+        time_zone=None,
+        cell_format="json",
+    )
+    assert m.call_args_list[0].kwargs["view"] == "Everyone"
+    assert result.column_names == ["id", "name", "age"]
+    assert list(df.index) == ["rec1", "rec2"]
+    assert df.loc["rec1", "name"] == "Alice"
+
+
 @pytest.fixture
 def fake_records_by_id():
     return [
@@ -1,24 +1,24 @@
 import pytest
-from mock import Mock
 from requests import HTTPError
 
 
 def test_error_mesg_in_json(api, response):
     response.status_code = 400
-    response.json = Mock(return_value={"error": "here's what went wrong"})
-    with pytest.raises(HTTPError):
+    response.content = b'{"error": "here\'s what went wrong"}'
+    with pytest.raises(HTTPError) as exc_info:
         api._process_response(response)
+    assert exc_info.value.args[-1] == repr("here's what went wrong")
 
 
 def test_error_without_mesg_in_json(api, response):
     response.status_code = 404
-    response.json = Mock(return_value={})
+    response.content = b"{}"
     with pytest.raises(HTTPError):
         api._process_response(response)
 
 
 def test_non_422_error_with_json_decode_error(api, response):
     response.status_code = 400
-    response.json.side_effect = ValueError
+    response.content = b"<html>Bad Request</html>"
     with pytest.raises(HTTPError):
         api._process_response(response)
@@ -114,6 +114,7 @@ def test_set_records__kwarg(mock_airtable, mock_records, table):
     [
         ("all", "mock_records"),
         ("iterate", "[mock_records]"),
+        ("scan", "[mock_records]"),
         ("first", "mock_records[0]"),
     ],
 )
@@ -122,6 +123,10 @@ def test_table_iterate(mock_records, table, funcname, expected):
     assert getattr(table, funcname)() == expected
 
 
+def test_table_iterate__stream(mock_records, table):
+    assert list(table.iterate(stream=True)) == mock_records
+
+
 def test_table_get(mock_record, table):
     assert table.get(mock_record["id"]) == mock_record
 
@@ -255,3 +255,37 @@ def test_enterprise_docstring(docstring, expected):
         __doc__ = docstring
 
     assert Foo.__doc__ == expected
+
+
+def test_cache_unless_forced():
+    class Foo:
+        calls = 0
+
+        @utils.cache_unless_forced
+        def _private(self):
+            self.calls += 1
+            return self.calls
+
+    foo = Foo()
+    assert foo._private() == 1
+    assert foo._private() == 1
+    assert foo._cached_private == 1
+    assert foo._private(force=True) == 2
+
+
+def test_prefetched():
+    assert list(utils.prefetched(range(5), 2)) == [0, 1, 2, 3, 4]
+    assert list(utils.prefetched([], 1)) == []
+    with pytest.raises(ValueError):
+        list(utils.prefetched(range(5), 0))
+
+
+def test_prefetched__error():
+    def _items():
+        yield 1
+        raise RuntimeError("oops")
+
+    items = utils.prefetched(_items(), 1)
+    assert next(items) == 1
+    with pytest.raises(RuntimeError, match="oops"):
+        next(items)